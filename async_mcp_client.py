@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Asyncio client for the streamable-http transport.
+
+Unlike fixed_mcp_client.py, which buffers each response and splits it into
+lines, responses are parsed as they arrive with an incremental Server-Sent
+Events parser, and any number of MCP sessions share one pooled aiohttp
+connection set. benchmarks/load_mcp.py uses it to simulate hundreds of
+concurrent sessions.
+
+Usage:
+    async with aiohttp.ClientSession() as http:
+        async with AsyncMCPClient(http, "http://127.0.0.1:8000/mcp") as client:
+            tools = await client.list_tools()
+            result = await client.call_tool("get_job_details", {"job_id": "123"})
+"""
+
+import codecs
+import itertools
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+PROTOCOL_VERSION = "2025-03-26"
+
+
+@dataclass
+class SSEEvent:
+    """One dispatched Server-Sent Event."""
+
+    event: str = "message"
+    data: str = ""
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+
+class SSEParser:
+    """
+    Incremental Server-Sent Events parser.
+
+    Feed it the response body in chunks as they arrive; it returns the events
+    completed by each chunk. Handles CRLF, CR and LF line endings split across
+    chunks, multi-line data, comments and UTF-8 characters cut in half by a
+    chunk boundary, as the HTML event stream specification describes.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._scanned = 0  # The buffer holds no line terminator before this index
+        self._first = True
+        self._event = ""
+        self._data: List[str] = []
+        self._id: Optional[str] = None
+        self._retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        text = self._decoder.decode(chunk)
+        if self._first and text:
+            text = text.removeprefix("\ufeff")
+            self._first = False
+        self._buffer += text
+
+        events = []
+        start = 0
+        while True:
+            end = self._line_end(start)
+            if end is None:
+                break
+            event = self._line(self._buffer[start:end])
+            if event is not None:
+                events.append(event)
+            start = end + (2 if self._buffer.startswith("\r\n", end) else 1)
+            self._scanned = start
+        self._buffer = self._buffer[start:]
+        self._scanned = max(len(self._buffer) - 1, 0)
+        return events
+
+    def _line_end(self, start: int) -> Optional[int]:
+        """Index of the next line terminator, None if the line is incomplete."""
+        scan = max(start, self._scanned)
+        ends = [
+            i
+            for i in (self._buffer.find("\r", scan), self._buffer.find("\n", scan))
+            if i >= 0
+        ]
+        if not ends:
+            return None
+        end = min(ends)
+        # A CR at the very end may be the first half of a CRLF
+        if self._buffer[end] == "\r" and end == len(self._buffer) - 1:
+            return None
+        return end
+
+    def _line(self, line: str) -> Optional[SSEEvent]:
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):
+            return None
+        name, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if name == "event":
+            self._event = value
+        elif name == "data":
+            self._data.append(value)
+        elif name == "id" and "\0" not in value:
+            self._id = value
+        elif name == "retry" and value.isdigit():
+            self._retry = int(value)
+        return None
+
+    def _dispatch(self) -> Optional[SSEEvent]:
+        if not self._data:
+            self._event = ""
+            return None
+        event = SSEEvent(
+            event=self._event or "message",
+            data="\n".join(self._data),
+            id=self._id,
+            retry=self._retry,
+        )
+        self._event = ""
+        self._data = []
+        return event
+
+
+class MCPError(Exception):
+    """JSON-RPC error or unexpected HTTP response from the server."""
+
+
+@dataclass
+class Timing:
+    """Timing of one request, in seconds."""
+
+    first_byte: float = 0.0
+    total: float = 0.0
+    events: int = 0
+
+
+class AsyncMCPClient:
+    """
+    One MCP session over the streamable-http transport.
+
+    Args:
+        http: Shared aiohttp session; its connector pools the connections
+        url: MCP endpoint, e.g. http://127.0.0.1:8000/mcp
+        timeout: Seconds a single request may take
+    """
+
+    def __init__(self, http: aiohttp.ClientSession, url: str, timeout: float = 300.0):
+        self.http = http
+        self.url = url
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.session_id: Optional[str] = None
+        self.protocol_version = PROTOCOL_VERSION
+        self.server_info: Dict[str, Any] = {}
+        self._ids = itertools.count(1)
+
+    async def __aenter__(self) -> "AsyncMCPClient":
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream",
+        }
+        if self.session_id:
+            headers["Mcp-Session-Id"] = self.session_id
+            headers["Mcp-Protocol-Version"] = self.protocol_version
+        return headers
+
+    async def initialize(self) -> Dict[str, Any]:
+        """Open the session and send the initialized notification."""
+        result = await self.request(
+            "initialize",
+            {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "async-mcp-client", "version": "1.0.0"},
+            },
+        )
+        self.protocol_version = result.get("protocolVersion", PROTOCOL_VERSION)
+        self.server_info = result.get("serverInfo", {})
+        await self.notify("notifications/initialized")
+        return result
+
+    async def close(self) -> None:
+        """End the session on the server."""
+        if self.session_id is None:
+            return
+        try:
+            async with self.http.delete(
+                self.url, headers=self._headers(), timeout=self.timeout
+            ):
+                pass
+        except aiohttp.ClientError:
+            pass
+        self.session_id = None
+
+    async def notify(
+        self, method: str, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        message: Dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        async with self.http.post(
+            self.url, json=message, headers=self._headers(), timeout=self.timeout
+        ) as response:
+            await response.read()
+            if response.status >= 400:
+                raise MCPError(f"{method}: HTTP {response.status}")
+
+    async def request(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timing: Optional[Timing] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request and wait for its response.
+
+        Events of an event-stream response are parsed as they arrive, and the
+        request returns as soon as the response with its id is read.
+
+        Returns:
+            Dict[str, Any]: The JSON-RPC result
+
+        Raises:
+            MCPError: On a JSON-RPC error or an unexpected HTTP response
+        """
+        request_id = next(self._ids)
+        message: Dict[str, Any] = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+
+        timing = timing if timing is not None else Timing()
+        start = time.perf_counter()
+        async with self.http.post(
+            self.url, json=message, headers=self._headers(), timeout=self.timeout
+        ) as response:
+            if response.status != 200:
+                body = await response.text()
+                raise MCPError(f"{method}: HTTP {response.status}: {body[:200]}")
+            if session_id := response.headers.get("Mcp-Session-Id"):
+                self.session_id = session_id
+
+            reply = None
+            if response.content_type == "text/event-stream":
+                parser = SSEParser()
+                # Read to the end of the stream, which follows the response,
+                # so the connection goes back to the pool
+                async for chunk in response.content.iter_any():
+                    if not timing.first_byte:
+                        timing.first_byte = time.perf_counter() - start
+                    for event in parser.feed(chunk):
+                        timing.events += 1
+                        candidate = json.loads(event.data)
+                        if reply is None and candidate.get("id") == request_id:
+                            reply = candidate
+                            timing.total = time.perf_counter() - start
+            else:
+                reply = await response.json(content_type=None)
+                timing.first_byte = time.perf_counter() - start
+        if not timing.total:
+            timing.total = time.perf_counter() - start
+
+        if reply is None:
+            raise MCPError(f"{method}: stream ended without a response")
+        if "error" in reply:
+            raise MCPError(f"{method}: {reply['error'].get('message', reply['error'])}")
+        return reply.get("result", {})
+
+    async def list_tools(self) -> List[Dict[str, Any]]:
+        return (await self.request("tools/list")).get("tools", [])
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timing: Optional[Timing] = None,
+    ) -> Dict[str, Any]:
+        """Call a tool; the result holds "content" and, if the tool has an output schema, "structuredContent"."""
+        return await self.request(
+            "tools/call", {"name": name, "arguments": arguments or {}}, timing
+        )
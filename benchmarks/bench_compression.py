@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Benchmark: response compression of large tool results.
+
+Builds JSON payloads shaped like the largest tool results (a company profile
+with employees, a job search with full descriptions), wraps them the way the
+streamable-http transport sends them (a JSON-RPC result inside one SSE event),
+and reports for every available encoding and level:
+
+- compressed size and bytes saved
+- CPU time to compress (and for the client to decompress)
+- the same body compressed as a stream with a flush per chunk, as the
+  middleware does for event streams
+- transfer time saved on a few link speeds, against the CPU time spent
+
+Usage:
+    python benchmarks/bench_compression.py [--repeat 20] [--json]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linkedin_mcp_server.compression import (  # noqa: E402
+    Compressor,
+    available_encodings,
+    brotli,
+    zstandard,
+)
+
+# Levels measured per encoding; the first one is the server default
+LEVELS: Dict[str, List[int]] = {"gzip": [5, 1, 9], "br": [4, 1, 11], "zstd": [3, 1, 19]}
+
+# Link speeds in Mbit/s used to translate bytes saved into time
+LINK_SPEEDS = (1, 10, 100)
+
+# Chunk size of the streamed (flush per chunk) variant
+STREAM_CHUNK = 4096
+
+_WORDS = (
+    "python engineer team product data platform build scale customers cloud "
+    "experience design systems backend frontend services distributed remote "
+    "hybrid benefits growth mission develop deliver ownership collaborate "
+    "kubernetes aws security reliability analytics machine learning api "
+    "stakeholders roadmap agile mentor quality testing infrastructure"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def company_payload(rng: random.Random, employees: int = 400) -> Dict[str, Any]:
+    """A get_company_profile(get_employees=True) shaped result."""
+    return {
+        "name": "Example Corp",
+        "about_us": " ".join(_sentence(rng, 18) for _ in range(12)),
+        "website": "https://example.com",
+        "headquarters": "San Francisco, CA",
+        "industry": "Software Development",
+        "company_size": "1,001-5,000 employees",
+        "employees": [
+            {
+                "name": f"{rng.choice(['Alex', 'Sam', 'Kim', 'Jordan', 'Lee'])} "
+                f"{rng.choice(['Smith', 'Chen', 'Garcia', 'Patel', 'Müller'])} {i}",
+                "designation": _sentence(rng, 5),
+                "linkedin_url": f"https://www.linkedin.com/in/person-{rng.getrandbits(40):x}/",
+            }
+            for i in range(employees)
+        ],
+    }
+
+
+def job_search_payload(rng: random.Random, jobs: int = 50) -> List[Dict[str, Any]]:
+    """A search_jobs shaped result with full job descriptions."""
+    return [
+        {
+            "job_title": _sentence(rng, 4),
+            "company": f"Company {rng.randint(1, 500)}",
+            "location": rng.choice(["Remote", "New York, NY", "Berlin", "London"]),
+            "posted_date": f"{rng.randint(1, 30)} days ago",
+            "applicant_count": f"{rng.randint(1, 200)} applicants",
+            "job_description": " ".join(_sentence(rng, 20) for _ in range(25)),
+            "benefits": _sentence(rng, 12),
+            "linkedin_url": f"https://www.linkedin.com/jobs/view/{rng.getrandbits(32)}/",
+        }
+        for _ in range(jobs)
+    ]
+
+
+def as_sse_response(result: Any) -> bytes:
+    """Wrap a tool result like the streamable-http transport does."""
+    message = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {
+            "content": [{"type": "text", "text": json.dumps(result, indent=2)}],
+            "isError": False,
+        },
+    }
+    return f"event: message\ndata: {json.dumps(message)}\n\n".encode()
+
+
+def decompressor(encoding: str) -> Callable[[bytes], bytes]:
+    if encoding == "gzip":
+        return gzip.decompress
+    if encoding == "br":
+        return brotli.decompress
+    return lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def timed(function: Callable[[], bytes], repeat: int) -> Tuple[bytes, float]:
+    """Run a function repeatedly; return its result and median time in ms."""
+    times = []
+    result = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(times)
+
+
+def compress_whole(body: bytes, encoding: str, level: int) -> bytes:
+    compressor = Compressor(encoding, level)
+    return compressor.compress(body) + compressor.finish()
+
+
+def compress_streamed(body: bytes, encoding: str, level: int) -> bytes:
+    compressor = Compressor(encoding, level)
+    parts = []
+    for offset in range(0, len(body), STREAM_CHUNK):
+        parts.append(compressor.compress(body[offset : offset + STREAM_CHUNK]))
+        parts.append(compressor.flush())
+    parts.append(compressor.finish())
+    return b"".join(parts)
+
+
+def measure(
+    body: bytes, encoding: str, level: int, repeat: int
+) -> Dict[str, Optional[float]]:
+    compressed, compress_ms = timed(
+        lambda: compress_whole(body, encoding, level), repeat
+    )
+    streamed, streamed_ms = timed(
+        lambda: compress_streamed(body, encoding, level), repeat
+    )
+    decompress = decompressor(encoding)
+    restored, decompress_ms = timed(lambda: decompress(compressed), repeat)
+    assert restored == body, f"{encoding} round trip failed"
+
+    saved = len(body) - len(compressed)
+    return {
+        "bytes": len(compressed),
+        "saved_bytes": saved,
+        "ratio": len(body) / len(compressed),
+        "compress_ms": compress_ms,
+        "decompress_ms": decompress_ms,
+        "streamed_bytes": len(streamed),
+        "streamed_compress_ms": streamed_ms,
+        **{
+            f"net_ms_at_{speed}mbit": saved * 8 / (speed * 1000)
+            - compress_ms
+            - decompress_ms
+            for speed in LINK_SPEEDS
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    payloads = {
+        "company_with_employees": as_sse_response(company_payload(rng)),
+        "job_search_50": as_sse_response(job_search_payload(rng)),
+    }
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, body in payloads.items():
+        results[name] = {"bytes": len(body), "encodings": {}}
+        for encoding in available_encodings():
+            for level in LEVELS[encoding]:
+                results[name]["encodings"][f"{encoding}-{level}"] = measure(
+                    body, encoding, level, args.repeat
+                )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    missing = [e for e in ("zstd", "br") if e not in available_encodings()]
+    if missing:
+        print(f"Not installed, skipped: {', '.join(missing)}\n")
+    for name, result in results.items():
+        print(f"{name}: {result['bytes'] / 1024:.0f} KiB uncompressed")
+        print(
+            f"  {'encoding':<9} {'KiB':>7} {'ratio':>6} {'comp ms':>8} "
+            f"{'decomp ms':>9} {'stream KiB':>10} {'stream ms':>9} "
+            + " ".join(f"{f'net@{s}M ms':>11}" for s in LINK_SPEEDS)
+        )
+        for label, stats in result["encodings"].items():
+            print(
+                f"  {label:<9} {stats['bytes'] / 1024:>7.1f} {stats['ratio']:>6.1f} "
+                f"{stats['compress_ms']:>8.2f} {stats['decompress_ms']:>9.2f} "
+                f"{stats['streamed_bytes'] / 1024:>10.1f} "
+                f"{stats['streamed_compress_ms']:>9.2f} "
+                + " ".join(f"{stats[f'net_ms_at_{s}mbit']:>11.1f}" for s in LINK_SPEEDS)
+            )
+        print()
+    print(
+        "net@N ms: transfer time saved on an N Mbit/s link minus compress and "
+        "decompress CPU time"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cors-proxy.py against the previous single-threaded buffering proxy.
+
+Starts a stub MCP server, the legacy forwarder (the old HTTPServer + urlopen +
+response.read() implementation, embedded below as the baseline) and the current
+cors-proxy.py on local ports, then measures through each proxy:
+
+- request latency percentiles and throughput for concurrent JSON POSTs
+- time to first event of a Server-Sent Events stream
+
+Usage:
+    python benchmarks/bench_cors_proxy.py [--requests 400] [--concurrency 1 8 32]
+"""
+
+import argparse
+import http.client
+import importlib.util
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SSE_EVENTS = 5
+SSE_EVENT_INTERVAL = 0.05
+
+
+class StubMCPHandler(BaseHTTPRequestHandler):
+    """Upstream stand-in: JSON for POST, a paced event stream for GET."""
+
+    protocol_version = "HTTP/1.1"
+    # Like uvicorn, which sets TCP_NODELAY on its connections
+    disable_nagle_algorithm = True
+    delay = 0.005
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(self.delay)
+        body = json.dumps(
+            {"jsonrpc": "2.0", "id": request.get("id"), "result": {"ok": True}}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for index in range(SSE_EVENTS):
+            event = f'event: message\ndata: {{"n": {index}}}\n\n'.encode()
+            self.wfile.write(f"{len(event):X}\r\n".encode() + event + b"\r\n")
+            self.wfile.flush()
+            time.sleep(SSE_EVENT_INTERVAL)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class LegacyProxyHandler(BaseHTTPRequestHandler):
+    """The previous cors-proxy.py forwarder, kept as the benchmark baseline."""
+
+    upstream = ""
+
+    def do_GET(self) -> None:
+        self._proxy_request("GET")
+
+    def do_POST(self) -> None:
+        self._proxy_request("POST")
+
+    def _proxy_request(self, method: str) -> None:
+        content_length = int(self.headers.get("Content-Length", 0))
+        request_body = self.rfile.read(content_length) if content_length > 0 else None
+        target_headers = {
+            k: v
+            for k, v in self.headers.items()
+            if k.lower() not in ["host", "connection"]
+        }
+        request = urllib.request.Request(
+            self.upstream, data=request_body, headers=target_headers, method=method
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                response_data = response.read()
+                self.send_response(response.getcode())
+                self.send_header("Access-Control-Allow-Origin", "*")
+                for name, value in dict(response.headers).items():
+                    if name.lower() not in ["transfer-encoding", "connection"]:
+                        self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(response_data)
+        except urllib.error.HTTPError as e:
+            self.send_response(e.code)
+            self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def load_cors_proxy_module():
+    """Import cors-proxy.py (not importable by name because of the dash)."""
+    path = os.path.join(REPO_ROOT, "cors-proxy.py")
+    spec = importlib.util.spec_from_file_location("cors_proxy", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    logging.getLogger().setLevel(logging.WARNING)
+    return module
+
+
+def serve(server: HTTPServer) -> Tuple[str, int]:
+    """Run a server on a daemon thread and return its address."""
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return str(host), int(port)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_post_load(
+    host: str, port: int, requests: int, concurrency: int
+) -> Dict[str, float]:
+    """Send JSON POSTs from concurrent keep-alive clients; return latency stats in ms."""
+    per_worker = max(1, requests // concurrency)
+    body = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+
+    errors = 0
+    errors_lock = threading.Lock()
+
+    def worker(_: int) -> List[float]:
+        nonlocal errors
+        connection = http.client.HTTPConnection(host, port, timeout=60)
+        latencies = []
+        for _ in range(per_worker):
+            start = time.perf_counter()
+            try:
+                connection.request(
+                    "POST", "/", body=body, headers={"Content-Type": "application/json"}
+                )
+                response = connection.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException):
+                # e.g. connections reset when the legacy proxy's backlog overflows
+                with errors_lock:
+                    errors += 1
+                connection.close()
+                continue
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.will_close:
+                connection.close()
+        connection.close()
+        return latencies
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = [
+            ms for result in pool.map(worker, range(concurrency)) for ms in result
+        ]
+    elapsed = time.perf_counter() - start
+
+    return {
+        "p50_ms": statistics.median(latencies) if latencies else float("nan"),
+        "p95_ms": percentile(latencies, 95) if latencies else float("nan"),
+        "p99_ms": percentile(latencies, 99) if latencies else float("nan"),
+        "throughput_rps": len(latencies) / elapsed,
+        "errors": errors,
+    }
+
+
+def measure_sse_first_event(host: str, port: int) -> float:
+    """Time in ms until the first event of a stream arrives through the proxy."""
+    connection = http.client.HTTPConnection(host, port, timeout=60)
+    start = time.perf_counter()
+    connection.request("GET", "/", headers={"Accept": "text/event-stream"})
+    response = connection.getresponse()
+    first = response.read1(65536) if hasattr(response, "read1") else response.read(1)
+    elapsed = (time.perf_counter() - start) * 1000
+    assert first, "empty event stream"
+    response.read()
+    connection.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument(
+        "--upstream-delay",
+        type=float,
+        default=0.005,
+        help="Seconds the stub MCP server takes per request",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    cors_proxy = load_cors_proxy_module()
+    StubMCPHandler.delay = args.upstream_delay
+    upstream_server = cors_proxy.CORSProxyServer(("127.0.0.1", 0), StubMCPHandler)
+    upstream_host, upstream_port = serve(upstream_server)
+    upstream = f"http://{upstream_host}:{upstream_port}/mcp/"
+
+    LegacyProxyHandler.upstream = upstream
+    legacy_address = serve(HTTPServer(("127.0.0.1", 0), LegacyProxyHandler))
+
+    cors_proxy.CORSProxyHandler.pool = cors_proxy.UpstreamPool(upstream)
+    current_server = cors_proxy.CORSProxyServer(
+        ("127.0.0.1", 0), cors_proxy.CORSProxyHandler
+    )
+    current_address = serve(current_server)
+
+    results: Dict[str, Dict[str, object]] = {}
+    for name, (host, port) in (
+        ("legacy", legacy_address),
+        ("current", current_address),
+    ):
+        results[name] = {
+            "sse_first_event_ms": measure_sse_first_event(host, port),
+            "post": {
+                str(concurrency): run_post_load(host, port, args.requests, concurrency)
+                for concurrency in args.concurrency
+            },
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"Upstream delay {args.upstream_delay * 1000:.1f} ms, {args.requests} requests"
+    )
+    print(
+        f"{'proxy':<8} {'conc':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'req/s':>8} {'errors':>7}"
+    )
+    for name, result in results.items():
+        for concurrency, stats in result["post"].items():  # type: ignore[union-attr]
+            print(
+                f"{name:<8} {concurrency:>5} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} "
+                f"{stats['p99_ms']:>8.2f} {stats['throughput_rps']:>8.1f} "
+                f"{stats['errors']:>7}"
+            )
+    print()
+    for name, result in results.items():
+        print(f"{name:<8} SSE first event after {result['sse_first_event_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON encoding of tool results and JSON log records.
+
+Encodes payloads shaped like the largest tool results (a company profile with
+employees, a job search with full descriptions) the way FastMCP sends them as
+text content, and the fields MCPJSONFormatter writes for log records, with:
+
+- stdlib: json.dumps, which the log formatter used before jsonutil
+- pydantic-core: FastMCP's default tool result serializer
+- jsonutil with each installed backend (orjson, msgspec, json)
+
+Every output is decoded and compared with the stdlib encoding of the same
+value, so a backend that changes the document fails the run. The tool result
+serializer is also compared text for text with pydantic-core on values JSON has
+no type for (datetimes, bytes, NaN, ...); only the differences documented in
+jsonutil.serialize_tool_result are allowed.
+
+Usage:
+    python benchmarks/bench_json.py [--repeat 50] [--json]
+"""
+
+import argparse
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pydantic_core  # noqa: E402
+from bench_compression import company_payload, job_search_payload  # noqa: E402
+
+from linkedin_mcp_server import jsonutil  # noqa: E402
+from linkedin_mcp_server.logging_config import MCPJSONFormatter  # noqa: E402
+
+# Log records formatted per timing run
+LOG_RECORDS = 1000
+
+
+class _Kind(enum.Enum):
+    PERSON = "person"
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int = 1
+
+
+# Values JSON has no type for, compared with pydantic-core's encoding
+EDGE_VALUES: Dict[str, Any] = {
+    "datetime_utc": datetime.datetime(
+        2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+    ),
+    "datetime_offset": datetime.datetime(
+        2024, 1, 2, 3, 4, 5, 6, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+    ),
+    "datetime_naive": datetime.datetime(2024, 1, 2, 3, 4, 5),
+    "date": datetime.date(2024, 1, 2),
+    "time": datetime.time(3, 4, 5),
+    "timedelta": datetime.timedelta(seconds=90),
+    "bytes": b"xx",
+    "uuid": uuid.UUID(int=5),
+    "decimal": decimal.Decimal("1.10"),
+    "set": {1},
+    "tuple": (1, 2),
+    "enum": _Kind.PERSON,
+    "dataclass": _Point(),
+    "big_int": 2**70,
+    "int_keys": {1: "a"},
+    "bool_keys": {True: 1},
+    "nan": float("nan"),
+    "infinity": float("inf"),
+    "negative_infinity": float("-inf"),
+    "float_exponent": 1e300,
+    "none_key": {None: 1},
+}
+
+# Differences from pydantic-core documented in jsonutil.serialize_tool_result
+KNOWN_DIFFERENCES = {
+    "orjson": {"nan", "infinity", "negative_infinity", "float_exponent", "none_key"}
+}
+
+
+def check_tool_result_fidelity() -> List[str]:
+    """Edge values the tool result serializer encodes unlike pydantic-core."""
+    allowed = KNOWN_DIFFERENCES.get(jsonutil.BACKEND, set())
+    differing = []
+    for name, value in EDGE_VALUES.items():
+        expected = pydantic_core.to_json(value, fallback=str, indent=2).decode()
+        if jsonutil.serialize_tool_result(value) != expected and name not in allowed:
+            differing.append(name)
+    return differing
+
+
+def timed(function: Callable[[], Any], repeat: int) -> float:
+    """Median time of a function in ms."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def result_encoders() -> Dict[str, Callable[[Any], str]]:
+    encoders: Dict[str, Callable[[Any], str]] = {
+        "stdlib": lambda data: json.dumps(data, indent=2, ensure_ascii=False),
+        "pydantic-core": lambda data: pydantic_core.to_json(
+            data, fallback=str, indent=2
+        ).decode(),
+    }
+    for backend in jsonutil.available_backends():
+        encoders[f"jsonutil-{backend}"] = lambda data, backend=backend: (
+            jsonutil.dumps_bytes(data, indent=True, backend=backend).decode()
+        )
+    return encoders
+
+
+def log_records(rng: random.Random) -> List[logging.LogRecord]:
+    """Log records like the ones scraping produces, a few with non-ASCII text."""
+    records = []
+    for i in range(LOG_RECORDS):
+        name = rng.choice(["anistji", "stickerdaniel", "jürgen-müller", "ana-peña"])
+        record = logging.LogRecord(
+            "linkedin_mcp_server.tools.person",
+            logging.INFO,
+            __file__,
+            i,
+            f"Scraping profile: https://www.linkedin.com/in/{name}/",
+            None,
+            None,
+        )
+        record.error_type = "none"
+        records.append(record)
+    return records
+
+
+def log_encoders() -> Dict[str, Callable[[Dict[str, Any]], str]]:
+    encoders: Dict[str, Callable[[Dict[str, Any]], str]] = {
+        # What MCPJSONFormatter used before jsonutil
+        "stdlib": json.dumps
+    }
+    for backend in jsonutil.available_backends():
+        encoders[f"jsonutil-{backend}"] = lambda data, backend=backend: jsonutil.dumps(
+            data, ensure_ascii=True, backend=backend
+        )
+    return encoders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    differing = check_tool_result_fidelity()
+    assert not differing, (
+        f"serialize_tool_result ({jsonutil.BACKEND}) differs from pydantic-core "
+        f"on: {', '.join(differing)}"
+    )
+
+    rng = random.Random(42)
+    payloads = {
+        "company_with_employees": company_payload(rng),
+        "job_search_50": job_search_payload(rng),
+    }
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, payload in payloads.items():
+        results[name] = {}
+        for label, encode in result_encoders().items():
+            assert json.loads(encode(payload)) == payload, f"{label} changed {name}"
+            results[name][label] = {
+                "ms": timed(lambda: encode(payload), args.repeat),
+                "bytes": len(encode(payload).encode()),
+            }
+
+    # The formatter's own fields, encoded by each backend
+    formatter = MCPJSONFormatter()
+    records = [json.loads(formatter.format(r)) for r in log_records(rng)]
+    results["log_records"] = {}
+    for label, encode in log_encoders().items():
+        for record in records:
+            assert json.loads(encode(record)) == record, f"{label} changed a record"
+        results["log_records"][label] = {
+            "ms": timed(lambda: [encode(r) for r in records], args.repeat),
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    missing = [
+        b for b in ("orjson", "msgspec") if b not in jsonutil.available_backends()
+    ]
+    if missing:
+        print(f"Not installed, skipped: {', '.join(missing)}\n")
+    for name, result in results.items():
+        unit = f"{LOG_RECORDS} records" if name == "log_records" else "payload"
+        print(f"{name} (ms per {unit}):")
+        baseline = result["stdlib"]["ms"]
+        for label, stats in result.items():
+            print(
+                f"  {label:<18} {stats['ms']:>8.2f} ms  {baseline / stats['ms']:>5.1f}x"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
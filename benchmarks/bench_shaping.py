@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark: output shaping of tool results under token budgets.
+
+Shapes payloads like a person profile, a company profile with employees and a
+job search with every max_tokens budget given, and reports the time taken and
+the size of the shaped result. Each shaped result must fit its budget by the
+server's own estimate (JSON characters / 4) and list a continuation for what
+was cut, so a shaper that lets its metadata outgrow the budget fails the run.
+
+Usage:
+    python benchmarks/bench_shaping.py [--budgets 50 200 500 2000] [--repeat 20]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_compression import (  # noqa: E402
+    _sentence,
+    company_payload,
+    job_search_payload,
+)
+
+from linkedin_mcp_server.jsonutil import dumps  # noqa: E402
+from linkedin_mcp_server.shaping import (  # noqa: E402
+    CHARS_PER_TOKEN,
+    OutputShape,
+    shape_list,
+    shape_result,
+)
+
+
+def person_payload(rng: random.Random) -> Dict[str, Any]:
+    """A get_person_profile shaped result."""
+    return {
+        "name": "Jürgen Müller",
+        "about": " ".join(_sentence(rng, 16) for _ in range(10)),
+        "experiences": [
+            {
+                "position_title": _sentence(rng, 3),
+                "company": f"Company {i}",
+                "from_date": "Jan 2020",
+                "to_date": "Present",
+                "duration": "4 yrs",
+                "location": "Berlin",
+                "description": " ".join(_sentence(rng, 14) for _ in range(5)),
+            }
+            for i in range(8)
+        ],
+        "educations": [
+            {
+                "institution": f"University {i}",
+                "degree": "MSc Computer Science",
+                "from_date": "2010",
+                "to_date": "2015",
+                "description": _sentence(rng, 20),
+            }
+            for i in range(3)
+        ],
+        "interests": [_sentence(rng, 2) for _ in range(20)],
+        "accomplishments": [
+            {"category": "Publication", "title": _sentence(rng, 6)} for _ in range(10)
+        ],
+        "contacts": [],
+        "company": "Company 0",
+        "job_title": "Staff Engineer",
+        "open_to_work": False,
+    }
+
+
+def timed(function: Callable[[], Any], repeat: int) -> float:
+    """Median time of a function in ms."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--budgets", type=int, nargs="+", default=[50, 200, 500, 2000, 8000]
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    payloads: List[Any] = [
+        ("person", "person", person_payload(rng)),
+        ("company", "company", company_payload(rng)),
+        ("job_search", "job", job_search_payload(rng)),
+    ]
+
+    failures = []
+    for name, kind, payload in payloads:
+        shape_one = shape_list if isinstance(payload, list) else shape_result
+        print(f"{name}: {len(dumps(payload)) // CHARS_PER_TOKEN} tokens unshaped")
+        for budget in args.budgets:
+            shape = OutputShape(max_tokens=budget)
+            shaped = shape_one(payload, shape, kind)
+            tokens = len(dumps(shaped)) // CHARS_PER_TOKEN
+            ms = timed(lambda: shape_one(payload, shape, kind), args.repeat)
+            verdict = "ok" if tokens <= budget else "OVER BUDGET"
+            print(
+                f"  max_tokens {budget:>6}: {tokens:>6} tokens {ms:>8.2f} ms {verdict}"
+            )
+            if tokens > budget:
+                failures.append(f"{name}@{budget}")
+
+    if failures:
+        print(f"\nBudget exceeded for: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
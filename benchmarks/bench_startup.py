@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Benchmark: startup time of main.py and the modules it imports.
+
+MCP clients start a stdio server for every conversation, so its startup is paid
+over and over. This runs main.py in fresh interpreters under
+``python -X importtime`` for a few startup paths and measures:
+
+- help: ``main.py --help``, until the process exits
+- clear-keychain: ``main.py --clear-keychain`` against an empty keyring, until
+  the process exits
+- stdio: a stdio server with a cookie, until it answers the MCP initialize
+  request
+
+For each it reports the median wall time over --runs runs, the import time
+summed per top-level package and the packages that must not load on that path
+but did (e.g. selenium before any tool ran). The run exits non-zero when a
+path's median exceeds its budget or a forbidden package was imported. The
+keyring is replaced by keyring's null backend, so nothing real is read.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--paths help stdio]
+        [--budget stdio=2000] [--top 10] [--output bench_startup.json]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(REPO_ROOT, "main.py")
+
+# Arguments, stdin and packages that must stay unimported, by startup path
+PATHS: Dict[str, Dict[str, Any]] = {
+    "help": {
+        "args": ["--help"],
+        "stdin": "",
+        "forbidden": ["fastmcp", "mcp", "selenium", "linkedin_scraper", "inquirer"],
+    },
+    "clear-keychain": {
+        "args": ["--clear-keychain"],
+        "stdin": "n\n",
+        "forbidden": ["fastmcp", "mcp", "selenium", "linkedin_scraper", "inquirer"],
+    },
+    "stdio": {
+        "args": ["--transport", "stdio", "--cookie", "li_at=bench-startup"],
+        "stdin": None,
+        "forbidden": ["selenium", "linkedin_scraper", "inquirer", "keyring"],
+    },
+}
+
+# Median wall time allowed per path, in milliseconds
+DEFAULT_BUDGETS_MS = {"help": 500, "clear-keychain": 600, "stdio": 1500}
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-03-26",
+        "capabilities": {},
+        "clientInfo": {"name": "bench-startup", "version": "1.0.0"},
+    },
+}
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """Module, self and cumulative microseconds and nesting level of each import."""
+    imports = []
+    for line in stderr.splitlines():
+        if match := _IMPORT_LINE.match(line):
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return imports
+
+
+def _wait_for_initialize(
+    proc: subprocess.Popen, timeout: float
+) -> Optional[Dict[str, Any]]:
+    """Send initialize and read stdout until its response, None on timeout."""
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    try:
+        assert proc.stdin is not None and proc.stdout is not None
+        proc.stdin.write(json.dumps(INITIALIZE) + "\n")
+        proc.stdin.flush()
+        for line in proc.stdout:
+            # The server prints its banner lines to stdout too
+            if not line.startswith("{"):
+                continue
+            message = json.loads(line)
+            if message.get("id") == INITIALIZE["id"]:
+                return message
+        return None
+    finally:
+        timer.cancel()
+
+
+def run_once(path: str, env: Dict[str, str], timeout: float) -> Dict[str, Any]:
+    """Start main.py once on a startup path; wall time and imports of the run."""
+    spec = PATHS[path]
+    command = [sys.executable, "-X", "importtime", MAIN, *spec["args"]]
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as stderr:
+        start = time.perf_counter()
+        if spec["stdin"] is None:
+            proc = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                env=env,
+                cwd=REPO_ROOT,
+                text=True,
+                encoding="utf-8",
+            )
+            reply = _wait_for_initialize(proc, timeout)
+            wall = time.perf_counter() - start
+            assert proc.stdin is not None
+            proc.stdin.close()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            ok = reply is not None and "result" in reply
+        else:
+            try:
+                completed = subprocess.run(
+                    command,
+                    input=spec["stdin"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr,
+                    env=env,
+                    cwd=REPO_ROOT,
+                    text=True,
+                    timeout=timeout,
+                )
+                ok = completed.returncode == 0
+            except subprocess.TimeoutExpired:
+                ok = False
+            wall = time.perf_counter() - start
+        stderr.seek(0)
+        imports = parse_importtime(stderr.read())
+    return {"ok": ok, "wall_ms": wall * 1000, "imports": imports}
+
+
+def summarize(
+    path: str, runs: List[Dict[str, Any]], budget_ms: float, top: int
+) -> Dict[str, Any]:
+    """Median wall time, import time per package and budget verdict of a path."""
+    by_package: Counter = Counter()
+    # Imports are the same in every run; report the last one
+    imports = runs[-1]["imports"]
+    for module, self_us, _, _ in imports:
+        by_package[module.split(".")[0]] += self_us
+    loaded = {module.split(".")[0] for module, *_ in imports}
+    forbidden = sorted(loaded & set(PATHS[path]["forbidden"]))
+    median_ms = statistics.median(run["wall_ms"] for run in runs)
+    return {
+        "path": path,
+        "runs": len(runs),
+        "failed_runs": sum(not run["ok"] for run in runs),
+        "median_ms": round(median_ms, 1),
+        "min_ms": round(min(run["wall_ms"] for run in runs), 1),
+        "budget_ms": budget_ms,
+        "import_ms": round(sum(by_package.values()) / 1000, 1),
+        "modules": len(imports),
+        "top_packages": [
+            {"package": package, "import_ms": round(us / 1000, 1)}
+            for package, us in by_package.most_common(top)
+        ],
+        "forbidden_imports": forbidden,
+        "over_budget": median_ms > budget_ms,
+    }
+
+
+def print_report(results: List[Dict[str, Any]]) -> None:
+    for result in results:
+        verdict = "OVER BUDGET" if result["over_budget"] else "ok"
+        print(
+            f"\n{result['path']}: median {result['median_ms']} ms "
+            f"(min {result['min_ms']}, budget {result['budget_ms']}) {verdict}"
+        )
+        print(f"  imports: {result['import_ms']} ms across {result['modules']} modules")
+        for row in result["top_packages"]:
+            print(f"    {row['package']:<28} {row['import_ms']:>8.1f} ms")
+        if result["failed_runs"]:
+            print(f"  {result['failed_runs']} of {result['runs']} runs failed")
+        if result["forbidden_imports"]:
+            print(
+                f"  imported but should not be: {', '.join(result['forbidden_imports'])}"
+            )
+
+
+def parse_budgets(values: List[str]) -> Dict[str, float]:
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for value in values:
+        path, _, ms = value.partition("=")
+        if path not in PATHS or not ms:
+            raise argparse.ArgumentTypeError(f"Expected PATH=MS, got {value!r}")
+        budgets[path] = float(ms)
+    return budgets
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Measured runs per path")
+    parser.add_argument("--paths", nargs="+", choices=list(PATHS), default=list(PATHS))
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="PATH=MS",
+        help="Override the median wall time allowed for a path",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Packages listed per path")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+    budgets = parse_budgets(args.budget)
+
+    env = {
+        **os.environ,
+        "PYTHON_KEYRING_BACKEND": "keyring.backends.null.Keyring",
+        "PYTHONUNBUFFERED": "1",
+    }
+    results = []
+    for path in args.paths:
+        # One unmeasured run so bytecode caches are written
+        run_once(path, env, args.timeout)
+        runs = [run_once(path, env, args.timeout) for _ in range(args.runs)]
+        results.append(summarize(path, runs, budgets[path], args.top))
+
+    print_report(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    failed = [
+        r["path"]
+        for r in results
+        if r["over_budget"] or r["forbidden_imports"] or r["failed_runs"]
+    ]
+    if failed:
+        print(f"\nStartup budget failed for: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,850 @@
+#!/usr/bin/env python3
+"""
+Benchmark: tool latency and throughput of the MCP server under concurrency.
+
+Starts the LinkedIn stand-in (linkedin_mcp_server.fixtures) in-process and the
+real MCP server pointed at it with --linkedin-base-url, over stdio and
+streamable-http, and measures:
+
+- Chrome startup and cookie login time, and the memory of one driver
+  (ChromeDriver and its Chrome processes), over a few fresh browsers
+- per-tool p50/p95/p99 latency and calls per second at 1, 4 and 16 concurrent
+  clients; over streamable-http each client has its own session, over stdio
+  the clients share the server's single session
+- memory of the server's process tree after the load, per driver
+
+Browsers are warmed up before the measured calls, so tool latencies don't
+include Chrome startup. Results are written to a JSON file and compared with a
+saved baseline: a metric worse than the baseline by more than --tolerance is
+reported and the run exits non-zero. Needs Chrome and ChromeDriver; memory is
+only measured on Linux.
+
+With --soak it runs --soak-calls mixed tool calls instead, with allocations
+traced (PYTHONTRACEMALLOC), and samples the server's get_memory_stats report
+and its process tree every --sample-every calls. It reports how fast the
+server, its traced allocations, the browsers and tool latency grow per 1000
+calls and per hour, and the allocation sites and object types that grew most,
+to tell growth in Chrome, in MCP session state and in logging apart.
+
+Usage:
+    python benchmarks/bench_tools.py [--transports stdio streamable-http]
+        [--concurrency 1 4 16] [--calls 30] [--output bench_tools.json]
+        [--baseline benchmarks/bench_tools_baseline.json] [--save-baseline]
+    python benchmarks/bench_tools.py --soak --transports streamable-http
+        [--soak-calls 2000] [--sample-every 100] [--max-growth 5]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from fastmcp import Client  # noqa: E402
+from fastmcp.client.transports import StdioTransport  # noqa: E402
+
+from linkedin_mcp_server.fixtures import FixtureServer, FixtureSettings  # noqa: E402
+
+# Session cookie the server logs in to the stand-in with
+COOKIE = "bench-session"
+
+# Arguments of the i-th call of each tool; inputs rotate so the server can't
+# answer from a cache, and the stand-in has a page for every one of them
+TOOLS: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "get_person_profile": lambda i: {"linkedin_username": f"bench-user-{i % 50}"},
+    "get_company_profile": lambda i: {"company_name": f"bench-company-{i % 50}"},
+    "get_job_details": lambda i: {"job_id": str(3900000000 + i % 50)},
+    "search_jobs": lambda i: {"search_term": f"python developer {i % 10}"},
+    "get_recommended_jobs": lambda i: {},
+}
+DEFAULT_TOOLS = ["get_person_profile", "get_company_profile", "get_job_details"]
+
+# Seconds to wait for the HTTP server to answer /healthz
+SERVER_START_TIMEOUT = 60
+
+# Seconds a single tool call may take
+CALL_TIMEOUT = 300
+
+# Launches Chrome and logs in through the server's own code; run with the
+# repository root and the server's CLI arguments
+_STARTUP_PROBE = """
+import json, sys, time
+sys.path.insert(0, sys.argv.pop(1))
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.drivers.chrome import create_chrome_driver, login_to_linkedin
+from linkedin_mcp_server.urls import linkedin_url
+started = time.perf_counter()
+driver = create_chrome_driver()
+launched = time.perf_counter()
+login_to_linkedin(driver, get_config().linkedin.cookie)
+logged_in = time.perf_counter()
+driver.get(linkedin_url("in/bench-user/"))
+print(json.dumps({"launch_s": launched - started, "login_s": logged_in - launched}), flush=True)
+sys.stdin.readline()
+driver.quit()
+"""
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _proc_children() -> Dict[int, List[int]]:
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may hold spaces; fields resume after ")"
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def _proc_memory_mb(pid: int) -> float:
+    """Proportional set size of a process (resident size if PSS is unavailable)."""
+    for path, key in (
+        (f"/proc/{pid}/smaps_rollup", "Pss:"),
+        (f"/proc/{pid}/status", "VmRSS:"),
+    ):
+        try:
+            with open(path) as f:
+                for line in f:
+                    if line.startswith(key):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            continue
+    return 0.0
+
+
+def _proc_name(pid: int) -> str:
+    try:
+        with open(f"/proc/{pid}/comm") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def process_tree_memory(
+    root: int, include_root: bool = True
+) -> Optional[Dict[str, float]]:
+    """
+    Memory of a process and its descendants.
+
+    Args:
+        root: Process id at the top of the tree
+        include_root: Count the root process itself
+
+    Returns:
+        Optional[Dict[str, float]]: Total MB, MB of the ChromeDriver/Chrome
+            processes and the number of ChromeDriver processes; None off Linux
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    children = _proc_children()
+    total = chrome = 0.0
+    drivers = 0
+    pending = list(children.get(root, []))
+    if include_root:
+        total += _proc_memory_mb(root)
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        memory = _proc_memory_mb(pid)
+        total += memory
+        name = _proc_name(pid)
+        if "chrom" in name.lower():
+            chrome += memory
+        if name == "chromedriver":
+            drivers += 1
+    return {"total_mb": total, "browser_mb": chrome, "drivers": drivers}
+
+
+def server_args(
+    fixture_url: str, state_dir: str, pool_size: int, extra: List[str]
+) -> List[str]:
+    return [
+        "--linkedin-base-url",
+        fixture_url,
+        "--cookie",
+        COOKIE,
+        "--browser-pool-size",
+        str(pool_size),
+        "--state-dir",
+        state_dir,
+        "--log-level",
+        "WARNING",
+        *extra,
+    ]
+
+
+def measure_startup(args: List[str], runs: int) -> Dict[str, Any]:
+    """Launch and log in fresh browsers with the server's code; times and memory."""
+    launches: List[float] = []
+    logins: List[float] = []
+    memory: List[float] = []
+    for _ in range(runs):
+        probe = subprocess.Popen(
+            [sys.executable, "-c", _STARTUP_PROBE, REPO_ROOT, *args],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            cwd=REPO_ROOT,
+        )
+        assert probe.stdin is not None and probe.stdout is not None
+        line = probe.stdout.readline()
+        if not line:
+            probe.wait()
+            raise RuntimeError("Chrome could not be started, see the output above")
+        timings = json.loads(line)
+        launches.append(timings["launch_s"])
+        logins.append(timings["login_s"])
+        tree = process_tree_memory(probe.pid, include_root=False)
+        if tree is not None:
+            memory.append(tree["total_mb"])
+        probe.stdin.write("\n")
+        probe.stdin.flush()
+        probe.wait()
+    return {
+        "runs": runs,
+        "launch_s_p50": statistics.median(launches),
+        "launch_s_max": max(launches),
+        "login_s_p50": statistics.median(logins),
+        "login_s_max": max(logins),
+        "driver_memory_mb": statistics.median(memory) if memory else None,
+    }
+
+
+def _is_error(result: Any) -> bool:
+    if result.is_error:
+        return True
+    content = result.structured_content
+    if isinstance(content, dict) and "result" in content:
+        # FastMCP wraps list results
+        content = content["result"]
+    if isinstance(content, list) and content:
+        content = content[0]
+    return isinstance(content, dict) and "error" in content
+
+
+async def run_load(
+    clients: List[Client],
+    tools: List[str],
+    calls: int,
+    concurrency: int,
+    first_call: int = 0,
+) -> Dict[str, Any]:
+    """Run calls of the tool mix from concurrent clients; latency stats in ms."""
+    work = [
+        (tools[i % len(tools)], i // len(tools))
+        for i in range(first_call, first_call + calls)
+    ]
+    latencies: Dict[str, List[float]] = {tool: [] for tool in tools}
+    errors: Dict[str, int] = {tool: 0 for tool in tools}
+
+    async def worker(client: Client) -> None:
+        while work:
+            tool, index = work.pop(0)
+            start = time.perf_counter()
+            try:
+                result = await client.call_tool(
+                    tool, TOOLS[tool](index), timeout=CALL_TIMEOUT, raise_on_error=False
+                )
+                failed = _is_error(result)
+            except Exception:
+                failed = True
+            if failed:
+                errors[tool] += 1
+            else:
+                latencies[tool].append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(worker(clients[i % len(clients)]) for i in range(concurrency))
+    )
+    elapsed = time.perf_counter() - start
+
+    per_tool = {}
+    for tool in tools:
+        values = latencies[tool]
+        per_tool[tool] = {
+            "calls": len(values) + errors[tool],
+            "errors": errors[tool],
+            "p50_ms": statistics.median(values) if values else None,
+            "p95_ms": percentile(values, 95) if values else None,
+            "p99_ms": percentile(values, 99) if values else None,
+        }
+    return {
+        "calls_per_second": calls / elapsed,
+        "errors": sum(errors.values()),
+        "elapsed_s": elapsed,
+        "tools": per_tool,
+    }
+
+
+async def _warm_up(client: Client, tool: str, browsers: int) -> float:
+    """Start every browser of the pool with concurrent calls; seconds taken."""
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            client.call_tool(
+                tool, TOOLS[tool](i), timeout=CALL_TIMEOUT, raise_on_error=False
+            )
+            for i in range(browsers)
+        )
+    )
+    return time.perf_counter() - start
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_for_http(url: str, server: "subprocess.Popen[bytes]") -> None:
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"MCP server exited with code {server.returncode}")
+        try:
+            with urllib.request.urlopen(url, timeout=2):
+                return
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.2)
+    raise RuntimeError(
+        f"MCP server did not answer {url} within {SERVER_START_TIMEOUT} s"
+    )
+
+
+@contextlib.asynccontextmanager
+async def mcp_clients(
+    transport: str,
+    count: int,
+    common: List[str],
+    env: Optional[Dict[str, str]] = None,
+) -> AsyncIterator[Tuple[List[Client], Callable[[], Optional[Dict[str, float]]]]]:
+    """
+    Start the MCP server and connect clients to it.
+
+    Over streamable-http each of the count clients has its own session; over
+    stdio there is one client, as the server has a single session.
+
+    Yields:
+        The clients, and a function measuring the memory of the server's
+        process tree
+    """
+    main_py = os.path.join(REPO_ROOT, "main.py")
+    if transport == "stdio":
+        stdio = StdioTransport(
+            command=sys.executable,
+            args=[main_py, "--transport", "stdio", *common],
+            env=env,
+            cwd=REPO_ROOT,
+        )
+        async with Client(stdio, timeout=CALL_TIMEOUT) as client:
+            # The server is a child of this process; the stand-in runs in-process
+            yield [client], lambda: process_tree_memory(os.getpid(), False)
+        return
+
+    port = _free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            main_py,
+            "--transport",
+            "streamable-http",
+            "--port",
+            str(port),
+            *common,
+        ],
+        stdin=subprocess.DEVNULL,
+        env=env,
+        cwd=REPO_ROOT,
+    )
+    try:
+        base = f"http://127.0.0.1:{port}"
+        _wait_for_http(f"{base}/healthz", server)
+        clients = [Client(f"{base}/mcp", timeout=CALL_TIMEOUT) for _ in range(count)]
+        for client in clients:
+            await client.__aenter__()
+        try:
+            yield clients, lambda: process_tree_memory(server.pid)
+        finally:
+            for client in clients:
+                await client.__aexit__(None, None, None)
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+async def bench_transport(
+    transport: str, args: argparse.Namespace, common: List[str]
+) -> Dict[str, Any]:
+    """Latency and throughput at each concurrency level, then server memory."""
+    async with mcp_clients(transport, max(args.concurrency), common) as (
+        clients,
+        tree_memory,
+    ):
+        result: Dict[str, Any] = {
+            "warmup_s": await _warm_up(
+                clients[0], args.tools[0], max(args.concurrency)
+            ),
+            "concurrency": {},
+        }
+        for concurrency in args.concurrency:
+            result["concurrency"][str(concurrency)] = await run_load(
+                clients[:concurrency], args.tools, args.calls, concurrency
+            )
+        result["server_memory"] = tree_memory()
+    return result
+
+
+async def memory_stats(client: Client, **arguments: Any) -> Dict[str, Any]:
+    """The server's get_memory_stats report."""
+    result = await client.call_tool(
+        "get_memory_stats", arguments, timeout=CALL_TIMEOUT, raise_on_error=False
+    )
+    report = result.structured_content
+    if result.is_error or not isinstance(report, dict) or "error" in report:
+        raise RuntimeError(f"get_memory_stats failed: {report or result.content}")
+    return report
+
+
+def growth_rate(xs: List[float], ys: List[Optional[float]]) -> Optional[float]:
+    """Least-squares slope of ys over xs, None with fewer than two points."""
+    points = [(x, y) for x, y in zip(xs, ys) if y is not None]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+# Soak samples fitted for growth rates, with their unit
+SOAK_SERIES = {
+    "server_rss_mb": "MB",
+    "traced_mb": "MB",
+    "browsers_mb": "MB",
+    "tree_mb": "MB",
+    "renderers": "processes",
+    "gc_objects": "objects",
+}
+
+
+async def soak_transport(
+    transport: str, args: argparse.Namespace, common: List[str]
+) -> Dict[str, Any]:
+    """
+    Run thousands of mixed tool calls, sampling server and browser memory.
+
+    A baseline is taken once the browsers are warm; every --sample-every calls
+    the server's memory report and its process tree are sampled, and growth
+    rates are fitted over the samples.
+    """
+    env = dict(os.environ)
+    if args.tracemalloc_frames > 0:
+        env["PYTHONTRACEMALLOC"] = str(args.tracemalloc_frames)
+    concurrency = args.soak_concurrency
+
+    async with mcp_clients(transport, concurrency, common, env) as (
+        clients,
+        tree_memory,
+    ):
+        warmup = await _warm_up(clients[0], args.tools[0], concurrency)
+        await memory_stats(clients[0], top=0, reset_baseline=True)
+        samples: List[Dict[str, Any]] = []
+        done = 0
+        start = time.perf_counter()
+        while done < args.soak_calls:
+            block = min(args.sample_every, args.soak_calls - done)
+            load = await run_load(clients, args.tools, block, concurrency, done)
+            done += block
+            report = await memory_stats(clients[0], top=0)
+            tree = tree_memory()
+            samples.append(
+                {
+                    "calls": done,
+                    "elapsed_s": time.perf_counter() - start,
+                    "server_rss_mb": report["rss_mb"],
+                    "traced_mb": report.get("traced_mb"),
+                    "browsers_mb": report["browsers_mb"],
+                    "tree_mb": tree["total_mb"] if tree else None,
+                    "renderers": sum(
+                        b["renderers"] for b in report["browsers"].values()
+                    ),
+                    "gc_objects": report["gc_objects"],
+                    "calls_per_second": load["calls_per_second"],
+                    "errors": load["errors"],
+                    "p50_ms": {
+                        tool: stats["p50_ms"] for tool, stats in load["tools"].items()
+                    },
+                }
+            )
+            print(
+                f"  {done}/{args.soak_calls} calls, server {report['rss_mb']} MB, "
+                f"browsers {report['browsers_mb']} MB",
+                flush=True,
+            )
+        final = await memory_stats(clients[0], top=args.top)
+
+    # The first sample is still settling after the warm-up
+    fitted = samples[1:] if len(samples) > 2 else samples
+    calls = [sample["calls"] / 1000 for sample in fitted]
+    hours = [sample["elapsed_s"] / 3600 for sample in fitted]
+    growth: Dict[str, Dict[str, Optional[float]]] = {}
+    series: Dict[str, List[Optional[float]]] = {
+        name: [sample[name] for sample in fitted] for name in SOAK_SERIES
+    }
+    for tool in args.tools:
+        series[f"{tool}.p50_ms"] = [sample["p50_ms"][tool] for sample in fitted]
+    for name, values in series.items():
+        growth[name] = {
+            "per_1k_calls": growth_rate(calls, values),
+            "per_hour": growth_rate(hours, values),
+        }
+    return {
+        "warmup_s": warmup,
+        "calls": done,
+        "concurrency": concurrency,
+        "samples": samples,
+        "growth": growth,
+        "final": {
+            key: final.get(key)
+            for key in (
+                "rss_mb",
+                "peak_rss_mb",
+                "traced_mb",
+                "tracemalloc_overhead_mb",
+                "browsers",
+                "state",
+                "allocation_sites",
+                "object_types",
+            )
+        },
+    }
+
+
+def flatten(results: Dict[str, Any]) -> Dict[str, float]:
+    """The compared metrics of a results document, by dotted name."""
+    metrics: Dict[str, float] = {}
+    for key in ("launch_s_p50", "login_s_p50", "driver_memory_mb"):
+        value = results.get("startup", {}).get(key)
+        if value is not None:
+            metrics[f"startup.{key}"] = value
+    for transport, result in results.get("transports", {}).items():
+        memory = result.get("server_memory")
+        if memory and memory.get("drivers"):
+            metrics[f"{transport}.memory_per_driver_mb"] = (
+                memory["browser_mb"] / memory["drivers"]
+            )
+        for concurrency, load in result.get("concurrency", {}).items():
+            prefix = f"{transport}.c{concurrency}"
+            metrics[f"{prefix}.calls_per_second"] = load["calls_per_second"]
+            for tool, stats in load["tools"].items():
+                for key in ("p50_ms", "p95_ms", "p99_ms"):
+                    if stats[key] is not None:
+                        metrics[f"{prefix}.{tool}.{key}"] = stats[key]
+    return metrics
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[Tuple[str, float, float, float, bool]]:
+    """
+    Compare results with a baseline.
+
+    Returns:
+        List of (metric, baseline, current, relative change, regressed); the
+        change is positive when the metric got worse
+    """
+    rows = []
+    before, after = flatten(baseline), flatten(current)
+    for name in sorted(before.keys() & after.keys()):
+        old, new = before[name], after[name]
+        if old == 0:
+            continue
+        change = (new - old) / old
+        if name.endswith("calls_per_second"):
+            change = -change  # Higher is better
+        rows.append((name, old, new, change, change > tolerance))
+    return rows
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    startup = results.get("startup")
+    if startup:
+        memory = startup["driver_memory_mb"]
+        print(
+            f"Chrome launch {startup['launch_s_p50']:.2f} s (max {startup['launch_s_max']:.2f}), "
+            f"login {startup['login_s_p50']:.2f} s (max {startup['login_s_max']:.2f}), "
+            f"driver memory {f'{memory:.0f} MB' if memory is not None else 'n/a'}"
+        )
+    for transport, result in results["transports"].items():
+        print(f"\n{transport} (browser warm-up {result['warmup_s']:.1f} s)")
+        print(
+            f"  {'conc':>4} {'tool':<22} {'calls':>5} {'errors':>6} {'p50 ms':>9} "
+            f"{'p95 ms':>9} {'p99 ms':>9}"
+        )
+        for concurrency, load in result["concurrency"].items():
+            for tool, stats in load["tools"].items():
+                cells = " ".join(
+                    f"{stats[key]:>9.0f}" if stats[key] is not None else f"{'-':>9}"
+                    for key in ("p50_ms", "p95_ms", "p99_ms")
+                )
+                print(
+                    f"  {concurrency:>4} {tool:<22} {stats['calls']:>5} "
+                    f"{stats['errors']:>6} {cells}"
+                )
+            print(
+                f"  {concurrency:>4} {'calls/s':<22} {load['calls_per_second']:>5.2f}"
+            )
+        memory = result.get("server_memory")
+        if memory:
+            per_driver = (
+                f", {memory['browser_mb'] / memory['drivers']:.0f} MB per driver"
+                if memory["drivers"]
+                else ""
+            )
+            print(f"  server memory {memory['total_mb']:.0f} MB{per_driver}")
+
+
+def print_soak(soak: Dict[str, Any]) -> None:
+    for transport, result in soak.items():
+        print(
+            f"\n{transport} soak: {result['calls']} calls at concurrency "
+            f"{result['concurrency']} (browser warm-up {result['warmup_s']:.1f} s)"
+        )
+        print(
+            f"  {'calls':>6} {'min':>6} {'server MB':>9} {'traced MB':>9} "
+            f"{'browsers MB':>11} {'renderers':>9} {'objects':>9} {'calls/s':>7} {'errors':>6}"
+        )
+        for sample in result["samples"]:
+            traced = sample["traced_mb"]
+            print(
+                f"  {sample['calls']:>6} {sample['elapsed_s'] / 60:>6.1f} "
+                f"{sample['server_rss_mb'] or 0:>9.1f} "
+                f"{traced if traced is not None else '-':>9} "
+                f"{sample['browsers_mb']:>11.1f} {sample['renderers']:>9} "
+                f"{sample['gc_objects']:>9} {sample['calls_per_second']:>7.2f} "
+                f"{sample['errors']:>6}"
+            )
+
+        print(f"\n  {'growth':<36} {'per 1000 calls':>15} {'per hour':>12}")
+        for name, rates in result["growth"].items():
+            unit = SOAK_SERIES.get(name, "ms")
+            cells = " ".join(
+                f"{rates[key]:>+{width}.2f}"
+                if rates[key] is not None
+                else f"{'-':>{width}}"
+                for key, width in (("per_1k_calls", 15), ("per_hour", 12))
+            )
+            print(f"  {name + ' (' + unit + ')':<36} {cells}")
+
+        final = result["final"]
+        if final.get("allocation_sites"):
+            print("\n  allocation sites that grew most since the warm-up")
+            for site in final["allocation_sites"]:
+                print(
+                    f"  {site['size_diff_kb']:>+10.1f} KB {site['count_diff']:>+8} blocks  "
+                    f"{site['site']}"
+                )
+        if final.get("object_types"):
+            print("\n  object types that grew most since the warm-up")
+            for row in final["object_types"]:
+                print(f"  {row['count_diff']:>+10} {row['type']} ({row['count']})")
+        print(f"\n  server state: {json.dumps(final.get('state'))}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--transports",
+        nargs="+",
+        choices=["stdio", "streamable-http"],
+        default=["stdio", "streamable-http"],
+    )
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument(
+        "--calls", type=int, default=30, help="Tool calls per concurrency level"
+    )
+    parser.add_argument(
+        "--tools",
+        nargs="+",
+        choices=sorted(TOOLS),
+        default=DEFAULT_TOOLS,
+        help="Tool mix, called in turn",
+    )
+    parser.add_argument(
+        "--startup-runs", type=int, default=3, help="Fresh browsers for startup times"
+    )
+    parser.add_argument(
+        "--fixture-latency",
+        type=float,
+        default=0.0,
+        help="Seconds the stand-in adds per page",
+    )
+    parser.add_argument(
+        "--server-arg",
+        action="append",
+        default=[],
+        help="Extra MCP server argument, e.g. --server-arg=--perf-capture (repeatable)",
+    )
+    parser.add_argument(
+        "--soak",
+        action="store_true",
+        help="Run a long soak test tracking memory growth instead of the benchmark",
+    )
+    parser.add_argument(
+        "--soak-calls", type=int, default=2000, help="Tool calls of the soak test"
+    )
+    parser.add_argument(
+        "--soak-concurrency",
+        type=int,
+        default=4,
+        help="Concurrent calls (and browsers) of the soak test",
+    )
+    parser.add_argument(
+        "--sample-every", type=int, default=100, help="Calls between memory samples"
+    )
+    parser.add_argument(
+        "--tracemalloc-frames",
+        type=int,
+        default=1,
+        help="Frames tracemalloc keeps per allocation in the server (0: off)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, help="Allocation sites and object types listed"
+    )
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        help="Fail the soak test if server or browser memory grows faster "
+        "than this many MB per 1000 calls",
+    )
+    parser.add_argument("--output", default="bench_tools.json", help="Results file")
+    parser.add_argument("--baseline", help="Results file to compare with")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Also write the results to --baseline",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative change beyond which a metric counts as a regression",
+    )
+    args = parser.parse_args()
+
+    fixtures = FixtureServer(
+        FixtureSettings(latency=args.fixture_latency, session_cookie=COOKIE)
+    ).start()
+    results: Dict[str, Any] = {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "tools": args.tools,
+            "calls": args.soak_calls if args.soak else args.calls,
+            "fixture_latency": args.fixture_latency,
+            "server_args": args.server_arg,
+        },
+        "transports": {},
+    }
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench-tools-") as state_dir:
+            browsers = args.soak_concurrency if args.soak else max(args.concurrency)
+            common = server_args(fixtures.url, state_dir, browsers, args.server_arg)
+            if args.soak:
+                results["soak"] = {}
+                for transport in args.transports:
+                    print(f"Soaking {transport}...")
+                    results["soak"][transport] = asyncio.run(
+                        soak_transport(transport, args, common)
+                    )
+            else:
+                if args.startup_runs > 0:
+                    results["startup"] = measure_startup(common, args.startup_runs)
+                for transport in args.transports:
+                    results["transports"][transport] = asyncio.run(
+                        bench_transport(transport, args, common)
+                    )
+    finally:
+        results["meta"]["fixture_stats"] = fixtures.stats()
+        fixtures.stop()
+
+    if args.soak:
+        print_soak(results["soak"])
+    else:
+        print_results(results)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.soak:
+        if args.max_growth is None:
+            return
+        exceeded = [
+            f"{transport} {name} {rates['per_1k_calls']:+.2f} MB per 1000 calls"
+            for transport, result in results["soak"].items()
+            for name in ("server_rss_mb", "browsers_mb")
+            for rates in [result["growth"][name]]
+            if rates["per_1k_calls"] is not None
+            and rates["per_1k_calls"] > args.max_growth
+        ]
+        if exceeded:
+            print(f"\nMemory grew faster than {args.max_growth} MB per 1000 calls:")
+            for line in exceeded:
+                print(f"  {line}")
+            sys.exit(1)
+        return
+
+    if not args.baseline:
+        return
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline, args.tolerance)
+    print(f"\nAgainst {args.baseline} (tolerance {args.tolerance:.0%}):")
+    for name, old, new, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"  {name:<48} {old:>10.2f} -> {new:>10.2f} {change:>+7.1%}{flag}")
+    regressions = [row for row in rows if row[4]]
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Load generator: many concurrent MCP sessions against the streamable-http transport.
+
+Opens --sessions MCP sessions over one pooled aiohttp connector (at most
+--connections connections) and calls tools from a weighted mix, either
+
+- open loop (--rate): calls arrive at the given rate, Poisson or evenly
+  spaced, whether or not earlier calls finished, as independent users do.
+  Latency is measured from the scheduled arrival, so time spent waiting for
+  a pooled connection counts and a stalled server is not hidden; or
+- closed loop (no --rate): every session calls back to back.
+
+Reports per-operation latency distributions (percentiles and a histogram),
+time to first byte, errors by kind and achieved throughput, to size the
+server, its worker count and the CORS proxy in front of it. Point --url at
+the proxy to include it. "tools/list" and "ping" in the mix exercise the
+transport without starting browsers; run the server against the fixture site
+(--linkedin-base-url) for repeatable tool calls.
+
+Usage:
+    python benchmarks/load_mcp.py [--url http://127.0.0.1:8000/mcp]
+        [--sessions 200] [--rate 50] [--duration 60]
+        [--mix get_person_profile=2 --mix get_job_details=1 ...] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import aiohttp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_mcp_client import AsyncMCPClient, MCPError, Timing  # noqa: E402
+
+# Arguments of the i-th call of each operation; inputs rotate so the server
+# can't answer from a cache
+OPERATIONS: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "get_person_profile": lambda i: {"linkedin_username": f"load-user-{i % 500}"},
+    "get_company_profile": lambda i: {"company_name": f"load-company-{i % 200}"},
+    "get_job_details": lambda i: {"job_id": str(3900000000 + i % 1000)},
+    "search_jobs": lambda i: {"search_term": f"python developer {i % 20}"},
+    "get_recommended_jobs": lambda i: {},
+    "tools/list": lambda i: {},
+    "ping": lambda i: {},
+}
+DEFAULT_MIX = ["get_person_profile=2", "get_company_profile=1", "get_job_details=1"]
+
+PERCENTILES = (50, 90, 95, 99, 99.9)
+
+# Upper bounds in ms of the latency histogram buckets
+HISTOGRAM_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def parse_mix(entries: List[str]) -> List[Tuple[str, float]]:
+    """Parse name=weight entries of the operation mix."""
+    mix = []
+    for entry in entries:
+        name, _, weight = entry.partition("=")
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(
+                f"Unknown operation {name!r}, choose from {', '.join(OPERATIONS)}"
+            )
+        mix.append((name, float(weight or 1)))
+    return mix
+
+
+class Recorder:
+    """Latencies and errors by operation."""
+
+    def __init__(self) -> None:
+        self.latency: Dict[str, List[float]] = {}
+        self.service: Dict[str, List[float]] = {}
+        self.first_byte: Dict[str, List[float]] = {}
+        self.errors: Dict[str, Dict[str, int]] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.dropped = 0
+
+    def ok(self, name: str, latency: float, timing: Timing) -> None:
+        self.latency.setdefault(name, []).append(latency * 1000)
+        self.service.setdefault(name, []).append(timing.total * 1000)
+        self.first_byte.setdefault(name, []).append(timing.first_byte * 1000)
+
+    def error(self, name: str, kind: str) -> None:
+        errors = self.errors.setdefault(name, {})
+        errors[kind] = errors.get(kind, 0) + 1
+
+
+def _tool_error(result: Dict[str, Any]) -> bool:
+    if result.get("isError"):
+        return True
+    content = result.get("structuredContent")
+    if isinstance(content, dict) and "result" in content:
+        content = content["result"]
+    if isinstance(content, list) and content:
+        content = content[0]
+    return isinstance(content, dict) and "error" in content
+
+
+async def call(
+    client: AsyncMCPClient,
+    name: str,
+    index: int,
+    scheduled: float,
+    recorder: Recorder,
+) -> None:
+    """Run one operation; latency counts from its scheduled start."""
+    loop = asyncio.get_running_loop()
+    timing = Timing()
+    recorder.in_flight += 1
+    recorder.max_in_flight = max(recorder.max_in_flight, recorder.in_flight)
+    try:
+        if name == "tools/list" or name == "ping":
+            result = await client.request(name, timing=timing)
+        else:
+            result = await client.call_tool(name, OPERATIONS[name](index), timing)
+        if _tool_error(result):
+            recorder.error(name, "tool_error")
+        else:
+            recorder.ok(name, loop.time() - scheduled, timing)
+    except MCPError as e:
+        status = re.search(r"HTTP (\d+)", str(e))
+        recorder.error(name, f"http_{status.group(1)}" if status else "rpc_error")
+    except asyncio.TimeoutError:
+        recorder.error(name, "timeout")
+    except aiohttp.ClientError as e:
+        recorder.error(name, type(e).__name__)
+    finally:
+        recorder.in_flight -= 1
+
+
+async def open_loop(
+    clients: List[AsyncMCPClient],
+    pick: Callable[[], str],
+    args: argparse.Namespace,
+    rng: random.Random,
+    recorder: Recorder,
+) -> int:
+    """Start calls at the arrival rate for the run's duration; calls started."""
+    loop = asyncio.get_running_loop()
+    tasks = set()
+    start = next_at = loop.time()
+    started = 0
+    while next_at - start < args.duration:
+        delay = next_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if recorder.in_flight >= args.max_in_flight:
+            recorder.dropped += 1
+        else:
+            client = clients[started % len(clients)]
+            task = asyncio.ensure_future(
+                call(client, pick(), started, next_at, recorder)
+            )
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            started += 1
+        if args.arrivals == "poisson":
+            next_at += rng.expovariate(args.rate)
+        else:
+            next_at += 1 / args.rate
+    if tasks:
+        await asyncio.gather(*tasks)
+    return started
+
+
+async def closed_loop(
+    clients: List[AsyncMCPClient],
+    pick: Callable[[], str],
+    args: argparse.Namespace,
+    recorder: Recorder,
+) -> int:
+    """Call back to back from every session for the run's duration; calls made."""
+    loop = asyncio.get_running_loop()
+    end = loop.time() + args.duration
+    counter = iter(range(sys.maxsize))
+
+    async def session(client: AsyncMCPClient) -> None:
+        while loop.time() < end:
+            await call(client, pick(), next(counter), loop.time(), recorder)
+
+    await asyncio.gather(*(session(client) for client in clients))
+    return next(counter)
+
+
+def distribution(values: List[float]) -> Dict[str, Any]:
+    """Percentiles, mean, max and histogram of latencies in ms."""
+    if not values:
+        return {}
+    histogram: Dict[str, int] = {}
+    for value in values:
+        bucket = next((f"le_{b}" for b in HISTOGRAM_MS if value <= b), "le_inf")
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+    result: Dict[str, Any] = {
+        f"p{pct:g}_ms": percentile(values, pct) for pct in PERCENTILES
+    }
+    result.update(
+        mean_ms=sum(values) / len(values),
+        max_ms=max(values),
+        histogram={
+            bucket: histogram[bucket]
+            for bucket in [f"le_{b}" for b in HISTOGRAM_MS] + ["le_inf"]
+            if bucket in histogram
+        },
+    )
+    return result
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    mix = parse_mix(args.mix or DEFAULT_MIX)
+    names, weights = [name for name, _ in mix], [weight for _, weight in mix]
+
+    def pick() -> str:
+        return rng.choices(names, weights)[0]
+
+    connector = aiohttp.TCPConnector(limit=args.connections, keepalive_timeout=60)
+    async with aiohttp.ClientSession(connector=connector) as http:
+        clients = [
+            AsyncMCPClient(http, args.url, timeout=args.timeout)
+            for _ in range(args.sessions)
+        ]
+
+        # Open sessions a few at a time, as users arrive
+        init_times: List[float] = []
+        failed: List[str] = []
+        ramp = asyncio.Semaphore(args.ramp)
+
+        async def open_session(client: AsyncMCPClient) -> None:
+            async with ramp:
+                start = time.perf_counter()
+                try:
+                    await client.initialize()
+                    init_times.append((time.perf_counter() - start) * 1000)
+                except (MCPError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    failed.append(type(e).__name__)
+
+        await asyncio.gather(*(open_session(client) for client in clients))
+        clients = [client for client in clients if client.session_id]
+        if not clients:
+            raise SystemExit(f"No session could be opened at {args.url}: {failed[:3]}")
+
+        recorder = Recorder()
+        start = time.perf_counter()
+        if args.rate:
+            calls = await open_loop(clients, pick, args, rng, recorder)
+        else:
+            calls = await closed_loop(clients, pick, args, recorder)
+        elapsed = time.perf_counter() - start
+
+        await asyncio.gather(*(client.close() for client in clients))
+
+    operations = {}
+    for name in names:
+        latency = recorder.latency.get(name, [])
+        operations[name] = {
+            "ok": len(latency),
+            "errors": recorder.errors.get(name, {}),
+            "throughput_per_s": len(latency) / elapsed,
+            "latency": distribution(latency),
+            "service": distribution(recorder.service.get(name, [])),
+            "first_byte": distribution(recorder.first_byte.get(name, [])),
+        }
+    all_latency = [v for values in recorder.latency.values() for v in values]
+    return {
+        "url": args.url,
+        "mode": f"open loop, {args.arrivals} arrivals" if args.rate else "closed loop",
+        "sessions": len(clients),
+        "sessions_failed": len(failed),
+        "session_init": distribution(init_times),
+        "connections": args.connections,
+        "offered_rate_per_s": args.rate,
+        "calls": calls,
+        "dropped": recorder.dropped,
+        "max_in_flight": recorder.max_in_flight,
+        "elapsed_s": elapsed,
+        "throughput_per_s": len(all_latency) / elapsed,
+        "latency": distribution(all_latency),
+        "operations": operations,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{report['url']}: {report['mode']}, {report['sessions']} sessions "
+        f"({report['sessions_failed']} failed to open), {report['connections']} connections"
+    )
+    init = report["session_init"]
+    if init:
+        print(f"session init p50 {init['p50_ms']:.0f} ms, p99 {init['p99_ms']:.0f} ms")
+    offered = report["offered_rate_per_s"]
+    print(
+        f"{report['calls']} calls in {report['elapsed_s']:.1f} s"
+        + (f", offered {offered:g}/s" if offered else "")
+        + f", completed {report['throughput_per_s']:.1f}/s, dropped {report['dropped']}, "
+        f"max in flight {report['max_in_flight']}"
+    )
+    header = " ".join(f"{f'p{pct:g}':>8}" for pct in PERCENTILES)
+    print(f"\n{'operation':<22} {'ok':>6} {'errors':>6} {header} {'max':>8}  (ms)")
+    rows = list(report["operations"].items()) + [
+        ("all", {"latency": report["latency"]})
+    ]
+    for name, stats in rows:
+        latency = stats["latency"]
+        errors = sum(stats.get("errors", {}).values())
+        cells = (
+            " ".join(f"{latency[f'p{pct:g}_ms']:>8.0f}" for pct in PERCENTILES)
+            + f" {latency['max_ms']:>8.0f}"
+            if latency
+            else ""
+        )
+        ok = stats.get("ok", "")
+        print(f"{name:<22} {ok:>6} {errors if name != 'all' else '':>6} {cells}")
+    for name, stats in report["operations"].items():
+        if stats["errors"]:
+            kinds = ", ".join(
+                f"{kind} {count}" for kind, count in stats["errors"].items()
+            )
+            print(f"  {name} errors: {kinds}")
+    if report["latency"]:
+        print("\nlatency histogram (all operations)")
+        total = sum(report["latency"]["histogram"].values())
+        for bucket, count in report["latency"]["histogram"].items():
+            bar = "#" * max(1, round(40 * count / total))
+            print(f"  {bucket.removeprefix('le_'):>6} ms {count:>7} {bar}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000/mcp")
+    parser.add_argument("--sessions", type=int, default=100, help="MCP sessions")
+    parser.add_argument(
+        "--connections", type=int, default=100, help="Pooled HTTP connections"
+    )
+    parser.add_argument(
+        "--mix",
+        action="append",
+        help="Operation and weight, e.g. get_job_details=3 (repeatable; default "
+        + " ".join(DEFAULT_MIX)
+        + ")",
+    )
+    parser.add_argument(
+        "--rate", type=float, help="Calls started per second (open loop)"
+    )
+    parser.add_argument("--arrivals", choices=["poisson", "uniform"], default="poisson")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds of load")
+    parser.add_argument(
+        "--ramp", type=int, default=20, help="Sessions opened concurrently"
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=10000,
+        help="Arrivals beyond this many unfinished calls are dropped (open loop)",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=300, help="Seconds a call may take"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Also write the report as JSON to this file")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
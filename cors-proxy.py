@@ -3,24 +3,121 @@
 CORS Proxy for LinkedIn MCP Server
 
 This proxy adds CORS headers to allow web browsers to connect to the MCP server.
-Forwards all requests to the MCP server at http://127.0.0.1:8000/mcp/
+Forwards all requests to the MCP server (default http://127.0.0.1:8000/mcp/,
+override with --upstream or the MCP_SERVER_URL environment variable).
+
+Each browser request is handled on its own thread, upstream connections are kept
+alive and reused from a pool, and responses are streamed to the browser as they
+arrive - Server-Sent Events (text/event-stream) chunk by chunk - instead of being
+buffered until the MCP server finishes.
+
+Responses the MCP server sent uncompressed are compressed for the browser
+(gzip, or brotli/zstd when installed) if it accepts it; already compressed
+responses are passed through as they are. Like the server's own middleware,
+a response without a Content-Length is held until --compression-min-size
+bytes or its first complete event arrived before deciding.
 """
 
+import argparse
+import http.client
 import json
 import logging
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import urllib.request
+import os
+import queue
+import socket
 import urllib.parse
-import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from linkedin_mcp_server.compression import (
+        DEFAULT_MINIMUM_SIZE,
+        Compressor,
+        ends_event,
+        has_data_event,
+        is_compressible,
+        negotiate_encoding,
+    )
+except ImportError:
+    # Run outside the project environment: forward responses uncompressed
+    Compressor = None
+    DEFAULT_MINIMUM_SIZE = 1024
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+DEFAULT_UPSTREAM = "http://127.0.0.1:8000/mcp/"
+
+# Size of the reads forwarded to the browser; SSE events are forwarded as soon
+# as they arrive whatever their size
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Headers that describe a single connection and must not be forwarded
+HOP_BY_HOP_HEADERS = {
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailers', 'transfer-encoding', 'upgrade', 'host', 'content-length',
+}
+
+# CORS headers set by the proxy itself
+CORS_HEADERS = {'access-control-allow-origin', 'access-control-allow-methods'}
+
+
+class UpstreamPool:
+    """Pool of keep-alive HTTP connections to the MCP server."""
+
+    def __init__(self, upstream_url, max_idle=32, timeout=300):
+        parts = urllib.parse.urlsplit(upstream_url)
+        self.scheme = parts.scheme or 'http'
+        self.host = parts.hostname or '127.0.0.1'
+        self.port = parts.port or (443 if self.scheme == 'https' else 80)
+        self.path = parts.path or '/'
+        self.timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=max_idle)
+
+    def connect(self):
+        """Open a new connection to the MCP server."""
+        connection_class = (
+            http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+        )
+        return connection_class(self.host, self.port, timeout=self.timeout)
+
+    def acquire(self):
+        """Get an idle connection, or a new one. Returns (connection, reused)."""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self.connect(), False
+
+    def release(self, connection):
+        """Return a connection whose response was fully read to the pool."""
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
 class CORSProxyHandler(BaseHTTPRequestHandler):
-    
-    MCP_SERVER_URL = "http://127.0.0.1:8000/mcp/"
-    
+
+    # HTTP/1.1 keeps browser connections alive and allows chunked responses
+    protocol_version = 'HTTP/1.1'
+
+    # Headers and body chunks go out in separate writes; don't let Nagle's
+    # algorithm hold them back waiting for the browser's delayed ACK
+    disable_nagle_algorithm = True
+
+    # Set by run_cors_proxy
+    pool = None
+    compression = Compressor is not None
+    compression_min_size = DEFAULT_MINIMUM_SIZE
+
     def _add_cors_headers(self):
         """Add CORS headers to the response"""
         self.send_header('Access-Control-Allow-Origin', '*')
@@ -28,121 +125,247 @@ class CORSProxyHandler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type, Accept, mcp-session-id, X-MCP-Session-ID')
         self.send_header('Access-Control-Expose-Headers', 'mcp-session-id')
         self.send_header('Access-Control-Max-Age', '3600')
-    
+
     def do_OPTIONS(self):
         """Handle preflight CORS requests"""
         logger.info(f"CORS Preflight: {self.path}")
         self.send_response(200)
         self._add_cors_headers()
+        self.send_header('Content-Length', '0')
         self.end_headers()
-    
+
     def do_GET(self):
         """Handle GET requests"""
         self._proxy_request('GET')
-    
+
     def do_POST(self):
         """Handle POST requests"""
         self._proxy_request('POST')
-    
+
     def do_DELETE(self):
         """Handle DELETE requests"""
         self._proxy_request('DELETE')
-    
-    def _proxy_request(self, method):
-        """Proxy the request to the MCP server and return response with CORS headers"""
+
+    def _send_upstream(self, method, body, headers):
+        """Send the request upstream, retrying once if a pooled connection went stale."""
+        query = urllib.parse.urlsplit(self.path).query
+        target = self.pool.path + (f"?{query}" if query else '')
+
+        connection, reused = self.pool.acquire()
         try:
-            # Read request body if present
-            content_length = int(self.headers.get('Content-Length', 0))
-            request_body = self.rfile.read(content_length) if content_length > 0 else None
-            
-            # Prepare headers for the target server
-            target_headers = {}
-            for header_name, header_value in self.headers.items():
-                if header_name.lower() not in ['host', 'connection']:
-                    target_headers[header_name] = header_value
-            
-            # Create request to MCP server
-            request = urllib.request.Request(
-                self.MCP_SERVER_URL,
-                data=request_body,
-                headers=target_headers,
-                method=method
-            )
-            
-            logger.info(f"Proxying {method} request to {self.MCP_SERVER_URL}")
-            
-            # Forward request to MCP server
-            with urllib.request.urlopen(request) as response:
-                # Get response data
-                response_data = response.read()
-                response_headers = dict(response.headers)
-                
-                # Send response back to client with CORS headers
-                self.send_response(response.getcode())
-                self._add_cors_headers()
-                
-                # Forward response headers (except CORS-related ones)
-                for header_name, header_value in response_headers.items():
-                    if header_name.lower() not in ['access-control-allow-origin', 'access-control-allow-methods']:
-                        self.send_header(header_name, header_value)
-                
-                self.end_headers()
-                self.wfile.write(response_data)
-                
-                logger.info(f"Successfully proxied {method} request - Status: {response.getcode()}")
-        
-        except urllib.error.HTTPError as e:
-            logger.error(f"HTTP error from MCP server: {e.code} - {e.reason}")
-            self.send_response(e.code)
-            self._add_cors_headers()
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": "proxy-error",
-                "error": {
-                    "code": e.code,
-                    "message": f"MCP Server Error: {e.reason}"
-                }
+            connection.request(method, target, body=body, headers=headers)
+            return connection, connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionError, BrokenPipeError):
+            connection.close()
+            if not reused:
+                raise
+            # The server closed the idle connection; the request never reached it
+            connection = self.pool.connect()
+            connection.request(method, target, body=body, headers=headers)
+            return connection, connection.getresponse()
+        except Exception:
+            connection.close()
+            raise
+
+    def _choose_compressor(self, response):
+        """Compressor for an uncompressed upstream response the browser accepts compressed"""
+        if not self.compression or response.status in (204, 304):
+            return None
+        if response.getheader('Content-Encoding'):
+            return None
+        if not is_compressible(response.getheader('Content-Type', '')):
+            return None
+        content_length = response.getheader('Content-Length')
+        if content_length is not None and int(content_length) < self.compression_min_size:
+            return None
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding', ''))
+        return Compressor(encoding) if encoding else None
+
+    def _read_start(self, response, event_stream):
+        """Read the start of a body of unknown length until it is known whether to compress it
+
+        Returns (data read, whether the body ended, whether to compress).
+        """
+        held = b''
+        while True:
+            data = response.read1(STREAM_CHUNK_SIZE)
+            if not data:
+                return held, True, False
+            held += data
+            if len(held) >= self.compression_min_size:
+                return held, False, True
+            if event_stream and ends_event(held):
+                # A keep-alive before any event means a long-running call whose
+                # result is still to come; compress rather than hold it back
+                return held, False, not has_data_event(held)
+
+    def _stream_response(self, response):
+        """Forward the upstream response body as it arrives"""
+        content_type = response.getheader('Content-Type', '')
+        content_length = response.getheader('Content-Length')
+        event_stream = content_type.startswith('text/event-stream')
+        compressor = self._choose_compressor(response)
+        held, finished = b'', False
+        if compressor is not None and content_length is None:
+            held, finished, compress = self._read_start(response, event_stream)
+            if not compress:
+                compressor = None
+        # Without a length (SSE, chunked upstream, compressed here) forward with
+        # chunked encoding
+        chunked = content_length is None or event_stream or compressor is not None
+        if finished:
+            # The whole body was read while deciding
+            chunked, content_length = False, str(len(held))
+        if response.status in (204, 304):
+            # These responses never have a body
+            chunked, content_length = False, None
+
+        self.send_response(response.status, response.reason)
+        self._add_cors_headers()
+        for header_name, header_value in response.getheaders():
+            name = header_name.lower()
+            if name not in HOP_BY_HOP_HEADERS and name not in CORS_HEADERS:
+                self.send_header(header_name, header_value)
+        if compressor is not None:
+            self.send_header('Content-Encoding', compressor.encoding)
+            self.send_header('Vary', 'Accept-Encoding')
+        if chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        elif content_length is not None:
+            self.send_header('Content-Length', content_length)
+        self.end_headers()
+
+        # read1 returns as soon as some data arrived, so events are not held back
+        data = held or response.read1(STREAM_CHUNK_SIZE)
+        while data:
+            if compressor is not None:
+                data = compressor.compress(data)
+                if event_stream:
+                    # Let the browser decode this event now
+                    data += compressor.flush()
+            self._write_chunk(data, chunked)
+            data = response.read1(STREAM_CHUNK_SIZE)
+        if compressor is not None:
+            self._write_chunk(compressor.finish(), chunked)
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+
+    def _write_chunk(self, data, chunked):
+        """Write part of the response body"""
+        if not data:
+            # An empty chunk would end a chunked body
+            return
+        if chunked:
+            self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+        else:
+            self.wfile.write(data)
+        self.wfile.flush()
+
+    def _send_error_response(self, code, message):
+        """Send a JSON-RPC error with CORS headers"""
+        error_response = {
+            "jsonrpc": "2.0",
+            "id": "proxy-error",
+            "error": {
+                "code": code,
+                "message": message
             }
-            self.wfile.write(json.dumps(error_response).encode())
-        
+        }
+        body = json.dumps(error_response).encode()
+        self.send_response(code)
+        self._add_cors_headers()
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _proxy_request(self, method):
+        """Proxy the request to the MCP server and stream the response with CORS headers"""
+        # Read request body if present
+        content_length = int(self.headers.get('Content-Length', 0))
+        request_body = self.rfile.read(content_length) if content_length > 0 else None
+
+        # Prepare headers for the target server
+        target_headers = {
+            header_name: header_value
+            for header_name, header_value in self.headers.items()
+            if header_name.lower() not in HOP_BY_HOP_HEADERS
+        }
+
+        try:
+            connection, response = self._send_upstream(method, request_body, target_headers)
         except Exception as e:
             logger.error(f"Proxy error: {str(e)}")
-            self.send_response(500)
-            self._add_cors_headers()
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": "proxy-error", 
-                "error": {
-                    "code": 500,
-                    "message": f"Proxy Error: {str(e)}"
-                }
-            }
-            self.wfile.write(json.dumps(error_response).encode())
-    
+            self._send_error_response(502, f"Proxy Error: {str(e)}")
+            return
+
+        reusable = False
+        try:
+            self._stream_response(response)
+            reusable = not response.will_close
+            # Mark the response done so the connection can send the next request
+            response.close()
+            logger.info(f"Proxied {method} request - Status: {response.status}")
+        except (BrokenPipeError, ConnectionResetError, socket.timeout):
+            # Browser went away (e.g. closed an event stream); drop both sides
+            logger.info(f"Client disconnected during {method} response")
+            self.close_connection = True
+        finally:
+            if reusable:
+                self.pool.release(connection)
+            else:
+                connection.close()
+
     def log_message(self, format, *args):
         """Override to use our logger"""
-        logger.info(format % args)
+        logger.debug(format % args)
+
+
+class CORSProxyServer(ThreadingHTTPServer):
+    """Threaded server with a listen backlog sized for bursts of browser requests"""
 
-def run_cors_proxy(host='localhost', port=9000):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def run_cors_proxy(host='localhost', port=9000, upstream=DEFAULT_UPSTREAM, compression=True,
+                   compression_min_size=DEFAULT_MINIMUM_SIZE):
     """Run the CORS proxy server"""
-    server_address = (host, port)
-    httpd = HTTPServer(server_address, CORSProxyHandler)
-    
+    CORSProxyHandler.pool = UpstreamPool(upstream)
+    CORSProxyHandler.compression = compression and Compressor is not None
+    CORSProxyHandler.compression_min_size = compression_min_size
+    httpd = CORSProxyServer((host, port), CORSProxyHandler)
+
     logger.info(f"🚀 CORS Proxy Server starting on http://{host}:{port}")
-    logger.info(f"📡 Forwarding requests to {CORSProxyHandler.MCP_SERVER_URL}")
-    logger.info("🌐 Web app should connect to: http://localhost:9000")
-    
+    logger.info(f"📡 Forwarding requests to {upstream}")
+    logger.info(f"🌐 Web app should connect to: http://{host}:{port}")
+
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         logger.info("🛑 CORS Proxy Server stopped")
-        httpd.shutdown()
+    finally:
+        httpd.server_close()
+        CORSProxyHandler.pool.close()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="CORS proxy for the LinkedIn MCP server")
+    parser.add_argument('--host', default=os.environ.get('CORS_PROXY_HOST', 'localhost'),
+                        help="Address to listen on (default: localhost)")
+    parser.add_argument('--port', type=int, default=int(os.environ.get('CORS_PROXY_PORT', 9000)),
+                        help="Port to listen on (default: 9000)")
+    parser.add_argument('--upstream', default=os.environ.get('MCP_SERVER_URL', DEFAULT_UPSTREAM),
+                        help=f"MCP server URL to forward to (default: {DEFAULT_UPSTREAM})")
+    parser.add_argument('--no-compression', action='store_true',
+                        help="Forward uncompressed responses uncompressed")
+    parser.add_argument('--compression-min-size', type=int, default=DEFAULT_MINIMUM_SIZE,
+                        help=f"Smallest response body in bytes that is compressed (default: {DEFAULT_MINIMUM_SIZE})")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    run_cors_proxy() 
\ No newline at end of file
+    args = parse_args()
+    run_cors_proxy(args.host, args.port, args.upstream, not args.no_compression,
+                   args.compression_min_size)
@@ -5,9 +5,22 @@ Pure authentication logic for LinkedIn MCP Server.
 Handles LinkedIn session cookie management with secure storage and retrieval.
 Provides layered authentication resolution from configuration, keyring, and user input.
 Implements proper error handling with context-aware messaging.
+
+Every tool call resolves the cookie, so keyring lookups are cached in-process
+(a keyring round-trip costs milliseconds, and a desktop keyring can stall). The
+cache is updated when the cookie is stored or cleared through this module and,
+with keyring_cache_ttl set, expires to pick up changes made by other processes;
+a missing cookie is looked up again after NEGATIVE_CACHE_TTL by default. One
+lookup runs at a time on its own thread, and callers stop waiting for a stalled
+keyring after KEYRING_LOOKUP_TIMEOUT.
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Optional
 
 from linkedin_mcp_server.config import get_config
 from linkedin_mcp_server.config.messages import ErrorMessages, InfoMessages
@@ -16,7 +29,7 @@ from linkedin_mcp_server.config.providers import (
     get_cookie_from_keyring,
     save_cookie_to_keyring,
 )
-from linkedin_mcp_server.exceptions import CredentialsNotFoundError
+from linkedin_mcp_server.exceptions import CredentialsNotFoundError, KeyringTimeoutError
 
 # Constants for cookie validation
 MIN_RAW_COOKIE_LENGTH = 110
@@ -24,6 +37,99 @@ MIN_COOKIE_LENGTH = MIN_RAW_COOKIE_LENGTH + len("li_at=")
 
 logger = logging.getLogger(__name__)
 
+# Seconds a missing cookie is remembered when keyring_cache_ttl is not set, so
+# a cookie saved by another process (e.g. --get-cookie) is found soon after
+NEGATIVE_CACHE_TTL = 30.0
+
+# Seconds a caller waits for the keyring before giving up on the lookup
+KEYRING_LOOKUP_TIMEOUT = 10.0
+
+# Result of the last keyring cookie lookup (None if there was no cookie) and
+# when it was made, by time.monotonic(); None when nothing is cached
+_cache_lock = threading.Lock()
+_cached_cookie: Optional[str] = None
+_cached_at: Optional[float] = None
+# Lookup in flight, shared by every caller that needs it
+_lookup: Optional["Future[Optional[str]]"] = None
+# Bumped when the cache is set directly, so a lookup started before that does
+# not overwrite it
+_cache_generation = 0
+
+
+def _cache_is_fresh() -> bool:
+    """Whether the cached lookup may be reused; call with _cache_lock held."""
+    if _cached_at is None:
+        return False
+    ttl = get_config().linkedin.keyring_cache_ttl
+    if ttl is None:
+        if _cached_cookie is not None:
+            return True
+        ttl = NEGATIVE_CACHE_TTL
+    return time.monotonic() - _cached_at < ttl
+
+
+def _look_up(lookup: "Future[Optional[str]]", generation: int) -> None:
+    """Lookup thread body: query the keyring and cache the result."""
+    global _cached_cookie, _cached_at, _lookup
+    try:
+        cookie = get_cookie_from_keyring()
+    except BaseException as e:
+        with _cache_lock:
+            _lookup = None
+        lookup.set_exception(e)
+        return
+    with _cache_lock:
+        if generation == _cache_generation:
+            _cached_cookie, _cached_at = cookie, time.monotonic()
+        _lookup = None
+    lookup.set_result(cookie)
+
+
+def _cookie_from_keyring() -> Optional[str]:
+    """
+    Keyring cookie, from the cache while it is fresh.
+
+    Raises:
+        KeyringTimeoutError: If the keyring did not answer in time
+    """
+    global _lookup
+    with _cache_lock:
+        if _cache_is_fresh():
+            return _cached_cookie
+        lookup = _lookup
+        if lookup is None:
+            # The keyring is queried outside the lock, so a stalled keyring
+            # holds up only the callers that need a fresh lookup
+            lookup = _lookup = Future()
+            threading.Thread(
+                target=_look_up,
+                args=(lookup, _cache_generation),
+                name="keyring-lookup",
+                daemon=True,
+            ).start()
+    try:
+        return lookup.result(timeout=KEYRING_LOOKUP_TIMEOUT)
+    except FutureTimeoutError:
+        raise KeyringTimeoutError(
+            f"The system keyring did not return the LinkedIn cookie within "
+            f"{KEYRING_LOOKUP_TIMEOUT:.0f}s; unlock it or pass the cookie with "
+            "--cookie / LINKEDIN_COOKIE"
+        )
+
+
+def _set_cached_cookie(cookie: Optional[str], known: bool) -> None:
+    """Cache what the keyring now holds, or forget the lookup if unknown."""
+    global _cached_cookie, _cached_at, _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _cached_cookie = cookie if known else None
+        _cached_at = time.monotonic() if known else None
+
+
+def invalidate_authentication_cache() -> None:
+    """Make the next lookup query the keyring, e.g. after it was changed elsewhere."""
+    _set_cached_cookie(None, known=False)
+
 
 def get_authentication() -> str:
     """
@@ -34,6 +140,7 @@ def get_authentication() -> str:
 
     Raises:
         CredentialsNotFoundError: If no authentication is available
+        KeyringTimeoutError: If the keyring did not answer in time
     """
     config = get_config()
 
@@ -43,7 +150,7 @@ def get_authentication() -> str:
         return config.linkedin.cookie
 
     # Second, try keyring
-    cookie = get_cookie_from_keyring()
+    cookie = _cookie_from_keyring()
     if cookie:
         logger.info(InfoMessages.using_cookie_from("keyring"))
         return cookie
@@ -63,6 +170,8 @@ def store_authentication(cookie: str) -> bool:
         bool: True if storage was successful, False otherwise
     """
     success = save_cookie_to_keyring(cookie)
+    # On failure the keyring may hold either cookie
+    _set_cached_cookie(cookie, known=success)
     if success:
         logger.info(InfoMessages.cookie_stored_securely())
     else:
@@ -78,6 +187,7 @@ def clear_authentication() -> bool:
         bool: True if clearing was successful, False otherwise
     """
     success = clear_cookie_from_keyring()
+    _set_cached_cookie(None, known=success)
     if success:
         logger.info("Authentication cleared from keyring")
     else:
@@ -97,6 +207,8 @@ def ensure_authentication() -> str:
     """
     try:
         return get_authentication()
+    except KeyringTimeoutError:
+        raise
     except CredentialsNotFoundError:
         config = get_config()
 
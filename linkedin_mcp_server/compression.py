@@ -0,0 +1,330 @@
+# linkedin_mcp_server/compression.py
+"""
+Negotiated response compression for the HTTP transport and the CORS proxy.
+
+Supports gzip (always available) and, when the optional ``brotli`` or
+``zstandard`` packages are installed, brotli and zstd. The encoding is picked
+from the client's Accept-Encoding header, preferring zstd, then brotli, then gzip.
+
+Unlike Starlette's GZipMiddleware, Server-Sent Events responses are compressed
+too: streamable-http tool results are delivered as an event stream, so
+excluding it would leave the large responses uncompressed. An event stream is
+held until minimum_size bytes or its first complete event arrived; a stream
+whose first event is smaller is sent as is. Once compressed, each event is
+flushed through the compressor as it passes, so clients still receive every
+event as soon as it is sent.
+"""
+
+import logging
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Responses smaller than this are sent uncompressed; the encoding overhead and
+# CPU time are not worth it for a few hundred bytes
+DEFAULT_MINIMUM_SIZE = 1024
+
+# Levels chosen for speed over ratio: tool results are compressed once per
+# response, on the event loop
+DEFAULT_LEVELS: Dict[str, int] = {"zstd": 3, "br": 4, "gzip": 5}
+
+# Content types that are already compressed
+_INCOMPRESSIBLE_PREFIXES = ("image/", "video/", "audio/", "application/zip")
+
+
+def available_encodings() -> List[str]:
+    """
+    Encodings this installation can produce, in order of preference.
+
+    Returns:
+        List[str]: Content-Encoding tokens
+    """
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+def negotiate_encoding(
+    accept_encoding: str, encodings: Optional[List[str]] = None
+) -> Optional[str]:
+    """
+    Pick the response encoding for an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Value of the request's Accept-Encoding header
+        encodings: Encodings to choose from in order of preference, default all
+            available ones
+
+    Returns:
+        Optional[str]: Chosen encoding, None to send the response uncompressed
+    """
+    if not accept_encoding:
+        return None
+
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        token, _, params = item.strip().partition(";")
+        token = token.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            accepted[token] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    best: Tuple[float, Optional[str]] = (0.0, None)
+    for encoding in encodings or available_encodings():
+        quality = accepted.get(encoding, wildcard)
+        # Ties go to the earlier, preferred encoding
+        if quality > best[0]:
+            best = (quality, encoding)
+    return best[1]
+
+
+class Compressor:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str, level: Optional[int] = None):
+        """
+        Args:
+            encoding: "gzip", "br" or "zstd"
+            level: Compression level, default from DEFAULT_LEVELS
+
+        Raises:
+            ValueError: If the encoding is not available
+        """
+        if encoding not in available_encodings():
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+        self.encoding = encoding
+        level = DEFAULT_LEVELS[encoding] if level is None else level
+
+        if encoding == "gzip":
+            self._gzip = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        elif encoding == "br":
+            self._brotli = brotli.Compressor(quality=level)
+        else:
+            self._zstd = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        """Feed data; returns whatever compressed output is ready."""
+        if self.encoding == "gzip":
+            return self._gzip.compress(data)
+        if self.encoding == "br":
+            return self._brotli.process(data)
+        return self._zstd.compress(data)
+
+    def flush(self) -> bytes:
+        """Return output the client can decode up to all data fed so far."""
+        if self.encoding == "gzip":
+            return self._gzip.flush(zlib.Z_SYNC_FLUSH)
+        if self.encoding == "br":
+            return self._brotli.flush()
+        return self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        """End the stream; the compressor cannot be used afterwards."""
+        if self.encoding == "gzip":
+            return self._gzip.flush(zlib.Z_FINISH)
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zstd.flush()
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Compress a complete body.
+
+    Args:
+        data: Body to compress
+        encoding: "gzip", "br" or "zstd"
+        level: Compression level, default from DEFAULT_LEVELS
+
+    Returns:
+        bytes: Compressed body
+    """
+    compressor = Compressor(encoding, level)
+    return compressor.compress(data) + compressor.finish()
+
+
+def is_compressible(content_type: str) -> bool:
+    """Whether a response of this content type is worth compressing."""
+    return not content_type.lower().startswith(_INCOMPRESSIBLE_PREFIXES)
+
+
+def is_event_stream(content_type: str) -> bool:
+    """Whether a content type is a Server-Sent Events stream."""
+    return content_type.lower().startswith("text/event-stream")
+
+
+def ends_event(data: bytes) -> bool:
+    """Whether Server-Sent Events data ends at an event boundary."""
+    return data.endswith((b"\n\n", b"\r\r", b"\r\n\r\n"))
+
+
+def has_data_event(data: bytes) -> bool:
+    """Whether Server-Sent Events data holds more than comments (keep-alives)."""
+    return any(line and not line.startswith(b":") for line in data.splitlines())
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing HTTP responses the client accepts compressed."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        encodings: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            app: The wrapped ASGI application
+            minimum_size: Bodies smaller than this many bytes are sent as is
+            encodings: Encodings to offer in order of preference, default all
+                available ones
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = encodings or available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Send wrapper that compresses one response."""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self._encoding = encoding
+        self._minimum_size = minimum_size
+        self._start: Optional[Message] = None
+        self._compressor: Optional[Compressor] = None
+        self._streaming = False
+        self._passthrough = False
+        # Event stream data held until the size decision
+        self._held = b""
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            if (
+                "content-encoding" in headers
+                or message["status"] in (204, 304)
+                or not is_compressible(content_type)
+            ):
+                self._passthrough = True
+                await self._send(message)
+            elif is_event_stream(content_type):
+                # Decided once minimum_size bytes or the first event arrived,
+                # then every event is compressed and flushed as it passes
+                self._streaming = True
+                self._start = message
+            else:
+                # Decided on the first body chunk
+                self._start = message
+            return
+
+        if message_type != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start is not None and self._streaming:
+            held = self._held + body
+            if len(held) < self._minimum_size:
+                if more_body and not ends_event(held):
+                    self._held = held
+                    return
+                # A keep-alive before any event means a long-running call whose
+                # result is still to come; compress rather than hold it back
+                if not more_body or has_data_event(held):
+                    start, self._start, self._held = self._start, None, b""
+                    self._passthrough = True
+                    await self._send(start)
+                    await self._send({**message, "body": held})
+                    return
+            start, self._start, self._held = self._start, None, b""
+            body = held
+            self._compressor = Compressor(self._encoding)
+            await self._send(self._compressed_start(start))
+        elif self._start is not None:
+            start, self._start = self._start, None
+            if not more_body and len(body) < self._minimum_size:
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+            self._compressor = Compressor(self._encoding)
+            if not more_body:
+                data = self._compressor.compress(body) + self._compressor.finish()
+                start = self._compressed_start(start, content_length=len(data))
+                await self._send(start)
+                await self._send({"type": "http.response.body", "body": data})
+                return
+            await self._send(self._compressed_start(start))
+
+        assert self._compressor is not None
+        data = self._compressor.compress(body)
+        if not more_body:
+            data += self._compressor.finish()
+        elif self._streaming:
+            data += self._compressor.flush()
+        elif not data:
+            # Nothing to send until the compressor fills a block
+            return
+        await self._send(
+            {"type": "http.response.body", "body": data, "more_body": more_body}
+        )
+
+    def _compressed_start(
+        self, message: Message, content_length: Optional[int] = None
+    ) -> Message:
+        """Headers of the response start message rewritten for compression."""
+        headers = MutableHeaders(raw=list(message["headers"]))
+        headers["Content-Encoding"] = self._encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            if "content-length" in headers:
+                del headers["content-length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        return {**message, "headers": headers.raw}
@@ -19,7 +19,7 @@ import argparse
 import logging
 import os
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from .providers import (
     get_chromedriver_paths,
@@ -42,16 +42,45 @@ class EnvironmentKeys:
     LINKEDIN_EMAIL = "LINKEDIN_EMAIL"
     LINKEDIN_PASSWORD = "LINKEDIN_PASSWORD"
     LINKEDIN_COOKIE = "LINKEDIN_COOKIE"
+    LINKEDIN_BASE_URL = "LINKEDIN_BASE_URL"
+    KEYRING_CACHE_TTL = "KEYRING_CACHE_TTL"
 
     # Chrome configuration
     CHROMEDRIVER = "CHROMEDRIVER"
     HEADLESS = "HEADLESS"
     USER_AGENT = "USER_AGENT"
+    BROWSER_POOL_SIZE = "BROWSER_POOL_SIZE"
+    PERF_CAPTURE = "PERF_CAPTURE"
+    RECORD_NETWORK = "RECORD_NETWORK"
+    REPLAY_NETWORK = "REPLAY_NETWORK"
 
     # Server configuration
     LOG_LEVEL = "LOG_LEVEL"
     LAZY_INIT = "LAZY_INIT"
+    BACKGROUND_INIT = "BACKGROUND_INIT"
     TRANSPORT = "TRANSPORT"
+    STATE_DIR = "STATE_DIR"
+    CORS_ORIGINS = "CORS_ORIGINS"
+    SERVE_WEB_APP = "SERVE_WEB_APP"
+    COMPRESSION = "COMPRESSION"
+    COMPRESSION_MIN_SIZE = "COMPRESSION_MIN_SIZE"
+    WORKERS = "WORKERS"
+    POOL_SOCKET = "POOL_SOCKET"
+    TRACE_FILE = "TRACE_FILE"
+    TRACE_OTLP_ENDPOINT = "TRACE_OTLP_ENDPOINT"
+    TRACE_TIMINGS = "TRACE_TIMINGS"
+    LOG_QUEUE = "LOG_QUEUE"
+    LOG_QUEUE_SIZE = "LOG_QUEUE_SIZE"
+    PROFILE_CALLS = "PROFILE_CALLS"
+    PROFILE_DIR = "PROFILE_DIR"
+    FLIGHT_RECORDER_SIZE = "FLIGHT_RECORDER_SIZE"
+    FLIGHT_RECORDER_SNAPSHOTS = "FLIGHT_RECORDER_SNAPSHOTS"
+    SLOW_CALL_SECONDS = "SLOW_CALL_SECONDS"
+
+
+def parse_origins(value: str) -> List[str]:
+    """Split a comma-separated list of CORS origins."""
+    return [origin.strip().rstrip("/") for origin in value.split(",") if origin.strip()]
 
 
 def find_chromedriver() -> Optional[str]:
@@ -85,19 +114,26 @@ def is_interactive_environment() -> bool:
 
 
 def load_from_keyring(config: AppConfig) -> AppConfig:
-    """Load configuration from system keyring."""
+    """
+    Fill in LinkedIn authentication the environment and arguments left unset.
+
+    Runs after them, so the keyring (slow to open on some systems) is not
+    touched when a cookie was passed in, or at all for --help.
+    """
     # Load LinkedIn cookie first (higher priority)
-    if cookie := get_cookie_from_keyring():
+    if not config.linkedin.cookie and (cookie := get_cookie_from_keyring()):
         config.linkedin.cookie = cookie
         logger.debug("LinkedIn cookie loaded from keyring")
 
     # Load LinkedIn credentials if cookie not available
-    if not config.linkedin.cookie:
+    if not config.linkedin.cookie and not (
+        config.linkedin.email and config.linkedin.password
+    ):
         credentials = get_credentials_from_keyring()
-        if credentials["email"]:
+        if credentials["email"] and not config.linkedin.email:
             config.linkedin.email = credentials["email"]
             logger.debug("LinkedIn email loaded from keyring")
-        if credentials["password"]:
+        if credentials["password"] and not config.linkedin.password:
             config.linkedin.password = credentials["password"]
             logger.debug("LinkedIn password loaded from keyring")
 
@@ -117,6 +153,15 @@ def load_from_env(config: AppConfig) -> AppConfig:
     if cookie := os.environ.get(EnvironmentKeys.LINKEDIN_COOKIE):
         config.linkedin.cookie = cookie
 
+    if base_url := os.environ.get(EnvironmentKeys.LINKEDIN_BASE_URL):
+        config.linkedin.base_url = base_url.rstrip("/")
+
+    if keyring_ttl := os.environ.get(EnvironmentKeys.KEYRING_CACHE_TTL):
+        try:
+            config.linkedin.keyring_cache_ttl = float(keyring_ttl)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {EnvironmentKeys.KEYRING_CACHE_TTL}")
+
     # ChromeDriver configuration
     if chromedriver := os.environ.get(EnvironmentKeys.CHROMEDRIVER):
         config.chrome.chromedriver_path = chromedriver
@@ -124,6 +169,12 @@ def load_from_env(config: AppConfig) -> AppConfig:
     if user_agent := os.environ.get(EnvironmentKeys.USER_AGENT):
         config.chrome.user_agent = user_agent
 
+    if pool_size := os.environ.get(EnvironmentKeys.BROWSER_POOL_SIZE):
+        try:
+            config.chrome.pool_size = int(pool_size)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {EnvironmentKeys.BROWSER_POOL_SIZE}")
+
     # Log level
     if log_level_env := os.environ.get(EnvironmentKeys.LOG_LEVEL):
         log_level_upper = log_level_env.upper()
@@ -136,12 +187,30 @@ def load_from_env(config: AppConfig) -> AppConfig:
     elif os.environ.get(EnvironmentKeys.HEADLESS) in TRUTHY_VALUES:
         config.chrome.headless = True
 
+    # Per-navigation performance capture
+    if os.environ.get(EnvironmentKeys.PERF_CAPTURE) in TRUTHY_VALUES:
+        config.chrome.perf_capture = True
+    elif os.environ.get(EnvironmentKeys.PERF_CAPTURE) in FALSY_VALUES:
+        config.chrome.perf_capture = False
+
+    # Network traffic record/replay
+    if record_network := os.environ.get(EnvironmentKeys.RECORD_NETWORK):
+        config.chrome.record_network_dir = record_network
+
+    if replay_network := os.environ.get(EnvironmentKeys.REPLAY_NETWORK):
+        config.chrome.replay_network = replay_network
+
     # Lazy initialization
     if os.environ.get(EnvironmentKeys.LAZY_INIT) in TRUTHY_VALUES:
         config.server.lazy_init = True
     elif os.environ.get(EnvironmentKeys.LAZY_INIT) in FALSY_VALUES:
         config.server.lazy_init = False
 
+    if os.environ.get(EnvironmentKeys.BACKGROUND_INIT) in TRUTHY_VALUES:
+        config.server.background_init = True
+    elif os.environ.get(EnvironmentKeys.BACKGROUND_INIT) in FALSY_VALUES:
+        config.server.background_init = False
+
     # Transport mode
     if transport_env := os.environ.get(EnvironmentKeys.TRANSPORT):
         config.server.transport_explicitly_set = True
@@ -150,6 +219,92 @@ def load_from_env(config: AppConfig) -> AppConfig:
         elif transport_env == "streamable-http":
             config.server.transport = "streamable-http"
 
+    # State directory
+    if state_dir := os.environ.get(EnvironmentKeys.STATE_DIR):
+        config.server.state_dir = state_dir
+
+    # Browser access to the HTTP transport
+    if cors_origins := os.environ.get(EnvironmentKeys.CORS_ORIGINS):
+        config.server.cors_origins = parse_origins(cors_origins)
+
+    if os.environ.get(EnvironmentKeys.SERVE_WEB_APP) in TRUTHY_VALUES:
+        config.server.serve_web_app = True
+    elif os.environ.get(EnvironmentKeys.SERVE_WEB_APP) in FALSY_VALUES:
+        config.server.serve_web_app = False
+
+    # Response compression
+    if os.environ.get(EnvironmentKeys.COMPRESSION) in FALSY_VALUES:
+        config.server.compression = False
+    elif os.environ.get(EnvironmentKeys.COMPRESSION) in TRUTHY_VALUES:
+        config.server.compression = True
+
+    if min_size := os.environ.get(EnvironmentKeys.COMPRESSION_MIN_SIZE):
+        try:
+            config.server.compression_min_size = int(min_size)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {EnvironmentKeys.COMPRESSION_MIN_SIZE}")
+
+    # Multi-worker HTTP server
+    if workers := os.environ.get(EnvironmentKeys.WORKERS):
+        try:
+            config.server.workers = int(workers)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {EnvironmentKeys.WORKERS}")
+
+    if pool_socket := os.environ.get(EnvironmentKeys.POOL_SOCKET):
+        config.server.pool_socket = pool_socket
+
+    # Background logging
+    if os.environ.get(EnvironmentKeys.LOG_QUEUE) in TRUTHY_VALUES:
+        config.server.log_queue = True
+    elif os.environ.get(EnvironmentKeys.LOG_QUEUE) in FALSY_VALUES:
+        config.server.log_queue = False
+
+    if queue_size := os.environ.get(EnvironmentKeys.LOG_QUEUE_SIZE):
+        try:
+            config.server.log_queue_size = int(queue_size)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {EnvironmentKeys.LOG_QUEUE_SIZE}")
+
+    # Flight recorder
+    if recorder_size := os.environ.get(EnvironmentKeys.FLIGHT_RECORDER_SIZE):
+        try:
+            config.server.flight_recorder_size = int(recorder_size)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {EnvironmentKeys.FLIGHT_RECORDER_SIZE}")
+
+    if slow_seconds := os.environ.get(EnvironmentKeys.SLOW_CALL_SECONDS):
+        try:
+            config.server.slow_call_seconds = float(slow_seconds)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {EnvironmentKeys.SLOW_CALL_SECONDS}")
+
+    if os.environ.get(EnvironmentKeys.FLIGHT_RECORDER_SNAPSHOTS) in TRUTHY_VALUES:
+        config.server.flight_recorder_snapshots = True
+    elif os.environ.get(EnvironmentKeys.FLIGHT_RECORDER_SNAPSHOTS) in FALSY_VALUES:
+        config.server.flight_recorder_snapshots = False
+
+    # Profiling
+    if os.environ.get(EnvironmentKeys.PROFILE_CALLS) in TRUTHY_VALUES:
+        config.server.profile_calls = True
+    elif os.environ.get(EnvironmentKeys.PROFILE_CALLS) in FALSY_VALUES:
+        config.server.profile_calls = False
+
+    if profile_dir := os.environ.get(EnvironmentKeys.PROFILE_DIR):
+        config.server.profile_dir = profile_dir
+
+    # Tracing
+    if trace_file := os.environ.get(EnvironmentKeys.TRACE_FILE):
+        config.server.trace_file = trace_file
+
+    if otlp_endpoint := os.environ.get(EnvironmentKeys.TRACE_OTLP_ENDPOINT):
+        config.server.trace_otlp_endpoint = otlp_endpoint
+
+    if os.environ.get(EnvironmentKeys.TRACE_TIMINGS) in TRUTHY_VALUES:
+        config.server.trace_timings = True
+    elif os.environ.get(EnvironmentKeys.TRACE_TIMINGS) in FALSY_VALUES:
+        config.server.trace_timings = False
+
     return config
 
 
@@ -177,6 +332,13 @@ def load_from_args(config: AppConfig) -> AppConfig:
         help="Initialize Chrome driver and login immediately",
     )
 
+    parser.add_argument(
+        "--background-init",
+        action="store_true",
+        help="Initialize Chrome driver and login in the background while the server "
+        "starts; early tool calls wait for it",
+    )
+
     parser.add_argument(
         "--transport",
         choices=["stdio", "streamable-http"],
@@ -205,12 +367,152 @@ def load_from_args(config: AppConfig) -> AppConfig:
         help="HTTP server path (default: /mcp)",
     )
 
+    parser.add_argument(
+        "--cors-origins",
+        type=str,
+        default=None,
+        help="Comma-separated origins allowed to call the HTTP server from a browser, or '*'",
+    )
+
+    parser.add_argument(
+        "--serve-web-app",
+        action="store_true",
+        help="Serve the web frontend (linkedin-web-app.html) at / of the HTTP server",
+    )
+
+    parser.add_argument(
+        "--no-compression",
+        action="store_true",
+        help="Send HTTP responses uncompressed even if the client accepts gzip, br or zstd",
+    )
+
+    parser.add_argument(
+        "--compression-min-size",
+        type=int,
+        default=None,
+        help="Smallest HTTP response body in bytes that is compressed (default: 1024)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Stateless HTTP worker processes sharing one browser pool (default: 1)",
+    )
+
+    parser.add_argument(
+        "--pool-socket",
+        type=str,
+        default=None,
+        help="Unix socket of the browser-pool service used with --workers (default: <state-dir>/pool.sock)",
+    )
+
+    parser.add_argument(
+        "--log-queue",
+        action="store_true",
+        help="Write logs from a background thread so a slow log sink never delays tool calls",
+    )
+
+    parser.add_argument(
+        "--log-queue-size",
+        type=int,
+        default=None,
+        help="Log records buffered by --log-queue before new ones are dropped (default: 10000)",
+    )
+
+    parser.add_argument(
+        "--flight-recorder-size",
+        type=int,
+        default=None,
+        help="Slow, partial and failed tool calls kept for get_flight_records (default: 50, 0 disables)",
+    )
+
+    parser.add_argument(
+        "--slow-call-seconds",
+        type=float,
+        default=None,
+        help="Tool calls taking at least this long are flight-recorded as slow (default: 20)",
+    )
+
+    parser.add_argument(
+        "--flight-recorder-snapshots",
+        action="store_true",
+        help="Keep a compressed snapshot of the page each flight-recorded call ended on",
+    )
+
+    parser.add_argument(
+        "--profile-calls",
+        action="store_true",
+        help="Profile every tool call (cProfile and sampled stacks); see list_profiles",
+    )
+
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        default=None,
+        help="Directory for profiles (default: <state-dir>/profiles)",
+    )
+
+    parser.add_argument(
+        "--trace-file",
+        type=str,
+        default=None,
+        help="Append a span per tool call phase (driver wait, navigation, extraction...) to this JSONL file",
+    )
+
+    parser.add_argument(
+        "--trace-otlp-endpoint",
+        type=str,
+        default=None,
+        help="Send tool call spans to an OTLP/HTTP collector (e.g. http://localhost:4318)",
+    )
+
+    parser.add_argument(
+        "--trace-timings",
+        action="store_true",
+        help="Append the per-phase timing breakdown of each call to tool results",
+    )
+
+    parser.add_argument(
+        "--state-dir",
+        type=str,
+        default=None,
+        help="Directory for crawl checkpoints and other server state (default: ~/.linkedin_mcp_server)",
+    )
+
     parser.add_argument(
         "--chromedriver",
         type=str,
         help="Specify the path to the ChromeDriver executable",
     )
 
+    parser.add_argument(
+        "--browser-pool-size",
+        type=int,
+        default=None,
+        help="Number of Chrome browsers shared by tool calls and crawls (default: 1)",
+    )
+
+    parser.add_argument(
+        "--perf-capture",
+        action="store_true",
+        help="Record requests, bytes, main-thread time, JS heap and load events of every page load",
+    )
+
+    parser.add_argument(
+        "--record-network",
+        type=str,
+        metavar="DIR",
+        help="Save every browser response of each tool call to a HAR archive in DIR",
+    )
+
+    parser.add_argument(
+        "--replay-network",
+        type=str,
+        metavar="PATH",
+        help="Answer browser requests from the HAR archive(s) at PATH instead of the network",
+    )
+
     parser.add_argument(
         "--get-cookie",
         action="store_true",
@@ -229,6 +531,22 @@ def load_from_args(config: AppConfig) -> AppConfig:
         help="Specify LinkedIn cookie directly",
     )
 
+    parser.add_argument(
+        "--linkedin-base-url",
+        type=str,
+        help="Scrape this site instead of https://www.linkedin.com, e.g. a local fixture server",
+    )
+
+    parser.add_argument(
+        "--keyring-cache-ttl",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Query the keyring for the cookie again after this many seconds "
+        "(default: only after it is stored or cleared by this server, or after "
+        "30 seconds while no cookie is found; 0: every call)",
+    )
+
     parser.add_argument(
         "--user-agent",
         type=str,
@@ -248,6 +566,9 @@ def load_from_args(config: AppConfig) -> AppConfig:
     if args.no_lazy_init:
         config.server.lazy_init = False
 
+    if args.background_init:
+        config.server.background_init = True
+
     if args.transport:
         config.server.transport = args.transport
         config.server.transport_explicitly_set = True
@@ -261,15 +582,82 @@ def load_from_args(config: AppConfig) -> AppConfig:
     if args.path:
         config.server.path = args.path
 
+    if args.cors_origins:
+        config.server.cors_origins = parse_origins(args.cors_origins)
+
+    if args.serve_web_app:
+        config.server.serve_web_app = True
+
+    if args.no_compression:
+        config.server.compression = False
+
+    if args.compression_min_size is not None:
+        config.server.compression_min_size = args.compression_min_size
+
+    if args.workers is not None:
+        config.server.workers = args.workers
+
+    if args.pool_socket:
+        config.server.pool_socket = args.pool_socket
+
+    if args.log_queue:
+        config.server.log_queue = True
+
+    if args.log_queue_size is not None:
+        config.server.log_queue_size = args.log_queue_size
+
+    if args.flight_recorder_size is not None:
+        config.server.flight_recorder_size = args.flight_recorder_size
+
+    if args.slow_call_seconds is not None:
+        config.server.slow_call_seconds = args.slow_call_seconds
+
+    if args.flight_recorder_snapshots:
+        config.server.flight_recorder_snapshots = True
+
+    if args.profile_calls:
+        config.server.profile_calls = True
+
+    if args.profile_dir:
+        config.server.profile_dir = args.profile_dir
+
+    if args.trace_file:
+        config.server.trace_file = args.trace_file
+
+    if args.trace_otlp_endpoint:
+        config.server.trace_otlp_endpoint = args.trace_otlp_endpoint
+
+    if args.trace_timings:
+        config.server.trace_timings = True
+
+    if args.state_dir:
+        config.server.state_dir = args.state_dir
+
     if args.chromedriver:
         config.chrome.chromedriver_path = args.chromedriver
 
+    if args.browser_pool_size:
+        config.chrome.pool_size = args.browser_pool_size
+
+    if args.perf_capture:
+        config.chrome.perf_capture = True
+
+    if args.record_network:
+        config.chrome.record_network_dir = args.record_network
+
+    if args.replay_network:
+        config.chrome.replay_network = args.replay_network
+
     if args.get_cookie:
         config.server.get_cookie = True
     if args.clear_keychain:
         config.server.clear_keychain = True
     if args.cookie:
         config.linkedin.cookie = args.cookie
+    if args.linkedin_base_url:
+        config.linkedin.base_url = args.linkedin_base_url.rstrip("/")
+    if args.keyring_cache_ttl is not None:
+        config.linkedin.keyring_cache_ttl = args.keyring_cache_ttl
 
     if args.user_agent:
         config.chrome.user_agent = args.user_agent
@@ -323,13 +711,13 @@ def load_config() -> AppConfig:
     config.is_interactive = env_settings["is_interactive"]
     logger.debug(f"Auto-detected interactive mode: {config.is_interactive}")
 
-    # Load from keyring (lowest override priority)
-    config = load_from_keyring(config)
-
     # Override with environment variables
     config = load_from_env(config)
 
     # Override with command line arguments (highest priority)
     config = load_from_args(config)
 
+    # Keyring values only fill what is still unset (lowest priority)
+    config = load_from_keyring(config)
+
     return config
@@ -13,13 +13,14 @@ Key Functions:
 - Cross-platform compatibility with appropriate keyring backends
 """
 
+import functools
 import logging
 import os
 import platform
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-import keyring
-from keyring.errors import KeyringError
+if TYPE_CHECKING:
+    from keyring.backend import KeyringBackend
 
 # Constants
 SERVICE_NAME = "linkedin_mcp_server"
@@ -30,6 +31,15 @@ COOKIE_KEY = "linkedin_cookie"
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _keyring_backend() -> "KeyringBackend":
+    """The keyring backend, resolved once per process."""
+    import keyring
+
+    return keyring.get_keyring()
+
+
+@functools.lru_cache(maxsize=None)
 def get_keyring_name() -> str:
     """Get the name of the current keyring backend."""
     system = platform.system()
@@ -38,13 +48,15 @@ def get_keyring_name() -> str:
     elif system == "Windows":
         return "Windows Credential Locker"
     else:
-        return keyring.get_keyring().__class__.__name__
+        return _keyring_backend().__class__.__name__
 
 
 def get_secret_from_keyring(key: str) -> Optional[str]:
     """Retrieve a secret from system keyring."""
+    from keyring.errors import KeyringError
+
     try:
-        secret = keyring.get_password(SERVICE_NAME, key)
+        secret = _keyring_backend().get_password(SERVICE_NAME, key)
         return secret
     except KeyringError as e:
         logger.error(f"Error accessing keyring for {key}: {e}")
@@ -53,8 +65,10 @@ def get_secret_from_keyring(key: str) -> Optional[str]:
 
 def set_secret_in_keyring(key: str, value: str) -> bool:
     """Store a secret in system keyring."""
+    from keyring.errors import KeyringError
+
     try:
-        keyring.set_password(SERVICE_NAME, key, value)
+        _keyring_backend().set_password(SERVICE_NAME, key, value)
         logger.debug(f"Secret '{key}' stored successfully in {get_keyring_name()}")
         return True
     except KeyringError as e:
@@ -80,9 +94,11 @@ def save_credentials_to_keyring(email: str, password: str) -> bool:
 
 def clear_credentials_from_keyring() -> bool:
     """Clear stored credentials from the keyring."""
+    from keyring.errors import KeyringError
+
     try:
-        keyring.delete_password(SERVICE_NAME, EMAIL_KEY)
-        keyring.delete_password(SERVICE_NAME, PASSWORD_KEY)
+        _keyring_backend().delete_password(SERVICE_NAME, EMAIL_KEY)
+        _keyring_backend().delete_password(SERVICE_NAME, PASSWORD_KEY)
         logger.info(f"Credentials removed from {get_keyring_name()}")
         return True
     except KeyringError as e:
@@ -102,8 +118,10 @@ def save_cookie_to_keyring(cookie: str) -> bool:
 
 def clear_cookie_from_keyring() -> bool:
     """Clear stored cookie from the keyring."""
+    from keyring.errors import KeyringError
+
     try:
-        keyring.delete_password(SERVICE_NAME, COOKIE_KEY)
+        _keyring_backend().delete_password(SERVICE_NAME, COOKIE_KEY)
         logger.info(f"Cookie removed from {get_keyring_name()}")
         return True
     except KeyringError as e:
@@ -130,6 +148,8 @@ def check_keychain_data_exists() -> Dict[str, bool]:
 
 def clear_existing_keychain_data() -> Dict[str, bool]:
     """Clear only existing LinkedIn data from the keyring."""
+    from keyring.errors import KeyringError
+
     existing = check_keychain_data_exists()
     results = {"credentials_cleared": False, "cookie_cleared": False}
 
@@ -137,9 +157,9 @@ def clear_existing_keychain_data() -> Dict[str, bool]:
     if existing["has_credentials"]:
         try:
             if existing["has_email"]:
-                keyring.delete_password(SERVICE_NAME, EMAIL_KEY)
+                _keyring_backend().delete_password(SERVICE_NAME, EMAIL_KEY)
             if existing["has_password"]:
-                keyring.delete_password(SERVICE_NAME, PASSWORD_KEY)
+                _keyring_backend().delete_password(SERVICE_NAME, PASSWORD_KEY)
             results["credentials_cleared"] = True
             logger.info(f"Credentials removed from {get_keyring_name()}")
         except KeyringError as e:
@@ -150,7 +170,7 @@ def clear_existing_keychain_data() -> Dict[str, bool]:
     # Only try to clear cookie if it exists
     if existing["has_cookie"]:
         try:
-            keyring.delete_password(SERVICE_NAME, COOKIE_KEY)
+            _keyring_backend().delete_password(SERVICE_NAME, COOKIE_KEY)
             results["cookie_cleared"] = True
             logger.info(f"Cookie removed from {get_keyring_name()}")
         except KeyringError as e:
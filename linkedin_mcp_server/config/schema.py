@@ -14,9 +14,14 @@ Key Components:
 - AppConfig: Main application configuration combining all components
 """
 
+import os
 from dataclasses import dataclass, field
 from typing import List, Literal, Optional
 
+DEFAULT_STATE_DIR = os.path.join(os.path.expanduser("~"), ".linkedin_mcp_server")
+
+DEFAULT_LINKEDIN_BASE_URL = "https://www.linkedin.com"
+
 
 class ConfigurationError(Exception):
     """Raised when configuration validation fails."""
@@ -32,6 +37,13 @@ class ChromeConfig:
     chromedriver_path: Optional[str] = None
     browser_args: List[str] = field(default_factory=list)
     user_agent: Optional[str] = None
+    pool_size: int = 1  # Number of browsers tool calls and crawls share
+    # Record network and Performance metrics of every navigation (CDP)
+    perf_capture: bool = False
+    # Save the network traffic of every driver lease as HAR archives in this directory
+    record_network_dir: Optional[str] = None
+    # Answer every browser request from these HAR archives (file or directory)
+    replay_network: Optional[str] = None
 
 
 @dataclass
@@ -41,6 +53,12 @@ class LinkedInConfig:
     email: Optional[str] = None
     password: Optional[str] = None
     cookie: Optional[str] = None
+    # Site the scrapers navigate, e.g. a local fixture server for offline runs
+    base_url: str = DEFAULT_LINKEDIN_BASE_URL
+    # Seconds a keyring cookie lookup is reused; None until the cookie is
+    # stored or cleared through this process (a missing cookie is looked up
+    # again after 30 s), 0 to query the keyring every time
+    keyring_cache_ttl: Optional[float] = None
 
 
 @dataclass
@@ -50,13 +68,44 @@ class ServerConfig:
     transport: Literal["stdio", "streamable-http"] = "stdio"
     transport_explicitly_set: bool = False  # Track if transport was explicitly set
     lazy_init: bool = True
+    # Start the first browser in the background while the server starts serving
+    background_init: bool = False
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "WARNING"
+    # Write logs from a background thread through a bounded queue
+    log_queue: bool = False
+    log_queue_size: int = 10000  # Records buffered before new ones are dropped
     get_cookie: bool = False
     clear_keychain: bool = False
     # HTTP transport configuration
     host: str = "127.0.0.1"
     port: int = 8000
     path: str = "/mcp"
+    # Origins allowed to call the HTTP transport from a browser ("*" for any)
+    cors_origins: List[str] = field(default_factory=list)
+    # Serve the web frontend from the HTTP transport at "/"
+    serve_web_app: bool = False
+    # Negotiated gzip/brotli/zstd compression of HTTP responses
+    compression: bool = True
+    compression_min_size: int = 1024  # Smaller responses are sent uncompressed
+    # Stateless HTTP worker processes sharing one browser-pool service (1: single process)
+    workers: int = 1
+    # Unix socket of the browser-pool service, default <state_dir>/pool.sock
+    pool_socket: Optional[str] = None
+    # Tracing of tool call phases: JSONL file and/or OTLP/HTTP collector URL
+    trace_file: Optional[str] = None
+    trace_otlp_endpoint: Optional[str] = None
+    # Append each call's per-phase timing breakdown to tool results
+    trace_timings: bool = False
+    # CPU profiles of tool calls: profile every call; directory, default <state_dir>/profiles
+    profile_calls: bool = False
+    profile_dir: Optional[str] = None
+    # Ring buffer of the last slow, partial and failed tool calls (0: off)
+    flight_recorder_size: int = 50
+    slow_call_seconds: float = 20.0  # Calls taking longer are recorded as slow
+    # Keep a compressed snapshot of the page a recorded call ended on
+    flight_recorder_snapshots: bool = False
+    # Directory for durable server state (crawl checkpoints etc.)
+    state_dir: str = DEFAULT_STATE_DIR
 
 
 @dataclass
@@ -73,6 +122,14 @@ class AppConfig:
         self._validate_transport_config()
         self._validate_port_range()
         self._validate_path_format()
+        self._validate_pool_size()
+        self._validate_compression_min_size()
+        self._validate_workers()
+        self._validate_log_queue_size()
+        self._validate_flight_recorder()
+        self._validate_base_url()
+        self._validate_network_archive()
+        self._validate_keyring_cache_ttl()
 
     def _validate_transport_config(self) -> None:
         """Validate transport configuration is consistent."""
@@ -100,3 +157,62 @@ class AppConfig:
                 raise ConfigurationError(
                     f"HTTP path '{self.server.path}' must be at least 2 characters"
                 )
+
+    def _validate_pool_size(self) -> None:
+        """Validate the browser pool has at least one browser."""
+        if self.chrome.pool_size < 1:
+            raise ConfigurationError(
+                f"Browser pool size {self.chrome.pool_size} must be at least 1"
+            )
+
+    def _validate_compression_min_size(self) -> None:
+        """Validate the compression threshold is not negative."""
+        if self.server.compression_min_size < 0:
+            raise ConfigurationError(
+                f"Compression minimum size {self.server.compression_min_size} must not be negative"
+            )
+
+    def _validate_workers(self) -> None:
+        """Validate the HTTP server has at least one worker."""
+        if self.server.workers < 1:
+            raise ConfigurationError(
+                f"Worker count {self.server.workers} must be at least 1"
+            )
+
+    def _validate_log_queue_size(self) -> None:
+        """Validate the log queue can hold at least one record."""
+        if self.server.log_queue_size < 1:
+            raise ConfigurationError(
+                f"Log queue size {self.server.log_queue_size} must be at least 1"
+            )
+
+    def _validate_flight_recorder(self) -> None:
+        """Validate the flight recorder size and slow call threshold."""
+        if self.server.flight_recorder_size < 0:
+            raise ConfigurationError(
+                f"Flight recorder size {self.server.flight_recorder_size} must not be negative"
+            )
+        if self.server.slow_call_seconds <= 0:
+            raise ConfigurationError(
+                f"Slow call threshold {self.server.slow_call_seconds} must be positive"
+            )
+
+    def _validate_base_url(self) -> None:
+        """Validate the LinkedIn base URL is an absolute http(s) URL."""
+        if not self.linkedin.base_url.startswith(("http://", "https://")):
+            raise ConfigurationError(
+                f"LinkedIn base URL '{self.linkedin.base_url}' must start with http:// or https://"
+            )
+
+    def _validate_network_archive(self) -> None:
+        """Validate network traffic is not recorded and replayed at once."""
+        if self.chrome.record_network_dir and self.chrome.replay_network:
+            raise ConfigurationError(
+                "Network traffic can be recorded or replayed, not both"
+            )
+
+    def _validate_keyring_cache_ttl(self) -> None:
+        """Validate the keyring cache lifetime is not negative."""
+        ttl = self.linkedin.keyring_cache_ttl
+        if ttl is not None and ttl < 0:
+            raise ConfigurationError(f"Keyring cache TTL {ttl} must not be negative")
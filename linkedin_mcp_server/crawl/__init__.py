@@ -0,0 +1,15 @@
+# linkedin_mcp_server/crawl/__init__.py
+"""
+Long-running, resumable crawls for LinkedIn data.
+
+This package holds the pieces for scrapes that take too long to finish inside a
+single tool call. Progress is written to durable checkpoints in the server's state
+directory so a crash, captcha or deadline only loses the page in flight, and the
+next call picks up where the previous one stopped.
+
+Key Components:
+- Atomic JSON checkpoint storage in the configured state directory
+- Paged company employee crawl with per-page checkpoints
+- Company/person graph crawl over a SQLite frontier with a Bloom filter seen-set
+- Node-link JSON and GraphML export of crawled graphs
+"""
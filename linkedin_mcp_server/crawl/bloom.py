@@ -0,0 +1,81 @@
+# linkedin_mcp_server/crawl/bloom.py
+"""
+Fixed-size Bloom filter for the crawl seen-set.
+
+The filter is sized once from the expected number of URLs and the acceptable
+false positive rate, so its memory cost stays flat however many URLs are added
+(about 1.8 MB per million URLs at a 0.1% false positive rate). Bit positions come
+from double hashing over a single BLAKE2b digest.
+"""
+
+import hashlib
+import math
+from typing import Iterator
+
+
+class BloomFilter:
+    """Probabilistic set of strings with no false negatives."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """
+        Create an empty filter.
+
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: False positive rate once capacity items were added
+
+        Raises:
+            ValueError: If capacity or error_rate is out of range
+        """
+        if capacity < 1:
+            raise ValueError(f"Bloom filter capacity {capacity} must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"Bloom filter error rate {error_rate} must be in (0, 1)")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """Yield the bit positions of an item."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item to the filter.
+
+        Args:
+            item: Item to add
+
+        Returns:
+            bool: True if the item was not in the filter before
+        """
+        added = False
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not self._bits[byte] & mask:
+                self._bits[byte] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    @property
+    def size_bytes(self) -> int:
+        """Memory used by the filter's bit array."""
+        return len(self._bits)
@@ -0,0 +1,152 @@
+# linkedin_mcp_server/crawl/checkpoints.py
+"""
+Durable JSON checkpoints for resumable crawls.
+
+Checkpoints are small JSON documents stored one per file under the server's state
+directory. Writes go to a temporary file that is atomically renamed over the old
+checkpoint, so a crash mid-write never leaves a truncated checkpoint behind.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.exceptions import CrawlInProgressError
+
+logger = logging.getLogger(__name__)
+
+# Checkpoint files claimed by a running crawl, shared by every store instance
+_claimed: Set[str] = set()
+_claimed_lock = threading.Lock()
+
+
+class CheckpointStore:
+    """Directory of named JSON checkpoints."""
+
+    def __init__(self, directory: str) -> None:
+        """
+        Create a checkpoint store.
+
+        Args:
+            directory: Directory holding the checkpoint files (created on first save)
+        """
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        """Map a checkpoint key to a safe file name."""
+        safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+        return os.path.join(self.directory, f"{safe_key}.json")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a checkpoint.
+
+        Args:
+            key: Checkpoint name
+
+        Returns:
+            Optional[Dict[str, Any]]: Checkpoint data, None if missing or unreadable
+        """
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {key}: {e}")
+            return None
+
+    def save(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        Atomically write a checkpoint.
+
+        Args:
+            key: Checkpoint name
+            data: JSON-serializable checkpoint data
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @contextmanager
+    def claim(self, key: str) -> Iterator[None]:
+        """
+        Mark a checkpoint in use by one crawl for the duration of the block.
+
+        Two crawls continuing the same checkpoint would read the same pages and
+        overwrite each other's progress, so the second one is refused.
+
+        Args:
+            key: Checkpoint name
+
+        Raises:
+            CrawlInProgressError: If another crawl holds the checkpoint
+        """
+        path = self._path(key)
+        with _claimed_lock:
+            if path in _claimed:
+                raise CrawlInProgressError(
+                    f"A crawl of {key} is already running; its progress is "
+                    "saved to the same checkpoint"
+                )
+            _claimed.add(path)
+        try:
+            yield
+        finally:
+            with _claimed_lock:
+                _claimed.discard(path)
+
+    def keys(self) -> List[str]:
+        """
+        List the names of the stored checkpoints.
+
+        Returns:
+            List[str]: Checkpoint names, as sanitized for their file names
+        """
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(name[:-5] for name in names if name.endswith(".json"))
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a checkpoint if it exists.
+
+        Args:
+            key: Checkpoint name
+        """
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+def get_checkpoint_store(namespace: str) -> CheckpointStore:
+    """
+    Get the checkpoint store for a crawl type inside the configured state directory.
+
+    Args:
+        namespace: Sub-directory name (e.g. "employees")
+
+    Returns:
+        CheckpointStore: Store rooted at <state_dir>/checkpoints/<namespace>
+    """
+    config = get_config()
+    return CheckpointStore(
+        os.path.join(config.server.state_dir, "checkpoints", namespace)
+    )
@@ -0,0 +1,252 @@
+# linkedin_mcp_server/crawl/employees.py
+"""
+Resumable company employee crawl with durable per-page checkpoints.
+
+Employees are read from LinkedIn's people search filtered on the company
+(the "See all employees" link on the company page), which is addressable page by
+page. After every page the crawl position and the employees collected so far are
+written to a checkpoint, so an interrupted crawl resumes at the next unread page
+instead of starting over, and callers can consume the list stage by stage.
+"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from linkedin_mcp_server.crawl.checkpoints import CheckpointStore
+from linkedin_mcp_server.exceptions import LinkedInMCPError
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+# LinkedIn stops serving people search results after 100 pages
+MAX_SEARCH_PAGES = 100
+
+# Seconds to wait for search results to render on a page
+RESULTS_WAIT_TIMEOUT = 10
+
+_FIND_SEARCH_URL_JS = """
+const link = document.querySelector(
+  'a[href*="/search/results/people/"][href*="currentCompany"]'
+);
+return link ? link.href : null;
+"""
+
+# One round trip per page instead of one WebDriver call per element
+_EXTRACT_EMPLOYEES_JS = """
+const employees = [];
+const seen = new Set();
+for (const item of document.querySelectorAll('main li')) {
+  const link = item.querySelector('a[href*="/in/"]');
+  if (!link) continue;
+  const url = link.href.split('?')[0];
+  if (seen.has(url)) continue;
+  seen.add(url);
+  const nameNode = link.querySelector('span[aria-hidden="true"]') || link;
+  const subtitle = item.querySelector(
+    '.entity-result__primary-subtitle, .artdeco-entity-lockup__subtitle'
+  );
+  employees.push({
+    name: nameNode.innerText.split('\\n')[0].trim() || null,
+    designation: subtitle ? subtitle.innerText.trim() : null,
+    linkedin_url: url,
+  });
+}
+const next = document.querySelector('button[aria-label="Next"]');
+return {employees: employees, has_next: !!next && !next.disabled};
+"""
+
+
+@dataclass
+class EmployeeCheckpoint:
+    """Crawl position and employees collected so far for one company."""
+
+    company_name: str
+    search_url: Optional[str] = None
+    next_page: int = 1
+    employees: List[Dict[str, Optional[str]]] = field(default_factory=list)
+    complete: bool = False
+    updated_at: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EmployeeCheckpoint":
+        """Restore a checkpoint from its stored form."""
+        return cls(
+            company_name=data["company_name"],
+            search_url=data.get("search_url"),
+            next_page=data.get("next_page", 1),
+            employees=data.get("employees", []),
+            complete=data.get("complete", False),
+            updated_at=data.get("updated_at"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the checkpoint to its stored form."""
+        return asdict(self)
+
+
+def load_employee_checkpoint(
+    store: CheckpointStore, company_name: str, restart: bool = False
+) -> EmployeeCheckpoint:
+    """
+    Load the checkpoint of a company's employee crawl.
+
+    A finished crawl is not resumed: the next crawl starts over so the
+    list reflects the company's current employees.
+
+    Args:
+        store: Checkpoint store for employee crawls
+        company_name: LinkedIn company name
+        restart: Discard any existing checkpoint
+
+    Returns:
+        EmployeeCheckpoint: Checkpoint to continue from
+    """
+    data = None if restart else store.load(company_name)
+    if data is None or data.get("complete"):
+        return EmployeeCheckpoint(company_name=company_name)
+
+    checkpoint = EmployeeCheckpoint.from_dict(data)
+    logger.info(
+        f"Resuming employee crawl for {company_name} at page {checkpoint.next_page} "
+        f"({len(checkpoint.employees)} employees collected)"
+    )
+    return checkpoint
+
+
+def _page_url(search_url: str, page: int) -> str:
+    """Build the URL of one page of the employee search."""
+    parts = urlsplit(search_url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != "page"]
+    query.append(("page", str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def raise_if_challenged(driver: "webdriver.Chrome") -> None:
+    """Stop the crawl when LinkedIn redirected to a security checkpoint."""
+    from linkedin_scraper.exceptions import CaptchaRequiredError
+
+    current_url = driver.current_url
+    if "checkpoint/challenge" in current_url or "/authwall" in current_url:
+        raise CaptchaRequiredError(captcha_url=current_url)
+
+
+def _results_loaded(driver: "webdriver.Chrome") -> Any:
+    """WebDriverWait condition: the page's results once at least one rendered."""
+    page = driver.execute_script(_EXTRACT_EMPLOYEES_JS)
+    return page if page["employees"] else False
+
+
+def find_employee_search_url(driver: "webdriver.Chrome", company_url: str) -> str:
+    """
+    Find the people search URL listing a company's employees.
+
+    Args:
+        driver: Chrome WebDriver instance
+        company_url: LinkedIn company page URL
+
+    Returns:
+        str: URL of the employee search
+
+    Raises:
+        LinkedInMCPError: If the company page has no employee link
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    if driver.current_url.rstrip("/") != company_url.rstrip("/"):
+        driver.get(company_url)
+    raise_if_challenged(driver)
+
+    try:
+        search_url = WebDriverWait(driver, RESULTS_WAIT_TIMEOUT).until(
+            lambda d: d.execute_script(_FIND_SEARCH_URL_JS)
+        )
+    except TimeoutException:
+        raise LinkedInMCPError(
+            f"No employee list link found on {company_url} - "
+            "the company may hide its employees"
+        )
+    return search_url
+
+
+def crawl_employees(
+    driver: "webdriver.Chrome",
+    company_url: str,
+    checkpoint: EmployeeCheckpoint,
+    store: CheckpointStore,
+    max_pages: Optional[int] = None,
+    on_page: Optional[
+        Callable[[EmployeeCheckpoint, List[Dict[str, Any]]], None]
+    ] = None,
+) -> List[Dict[str, Optional[str]]]:
+    """
+    Crawl employee search pages, checkpointing after each page.
+
+    Args:
+        driver: Chrome WebDriver instance
+        company_url: LinkedIn company page URL
+        checkpoint: Checkpoint to continue from; updated in place
+        store: Store the checkpoint is saved to after each page
+        max_pages: Stop after this many pages (None crawls to the end)
+        on_page: Called with the checkpoint and the new employees after each page
+
+    Returns:
+        List[Dict[str, Optional[str]]]: Employees discovered by this call
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    if checkpoint.search_url is None:
+        checkpoint.search_url = find_employee_search_url(driver, company_url)
+        checkpoint.updated_at = time.time()
+        store.save(checkpoint.company_name, checkpoint.to_dict())
+
+    seen = {employee["linkedin_url"] for employee in checkpoint.employees}
+    discovered: List[Dict[str, Optional[str]]] = []
+    pages = 0
+
+    while not checkpoint.complete and (max_pages is None or pages < max_pages):
+        logger.info(
+            "Crawling employees of %s, page %s",
+            checkpoint.company_name,
+            checkpoint.next_page,
+        )
+        driver.get(_page_url(checkpoint.search_url, checkpoint.next_page))
+        raise_if_challenged(driver)
+
+        WebDriverWait(driver, RESULTS_WAIT_TIMEOUT).until(
+            EC.presence_of_element_located((By.TAG_NAME, "main"))
+        )
+        # Results and pagination controls render lazily as the page scrolls
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            page = WebDriverWait(driver, RESULTS_WAIT_TIMEOUT).until(_results_loaded)
+        except TimeoutException:
+            page = {"employees": [], "has_next": False}
+
+        new_employees = [e for e in page["employees"] if e["linkedin_url"] not in seen]
+        seen.update(e["linkedin_url"] for e in new_employees)
+        checkpoint.employees.extend(new_employees)
+        discovered.extend(new_employees)
+
+        checkpoint.next_page += 1
+        checkpoint.complete = (
+            not page["employees"]
+            or not page["has_next"]
+            or checkpoint.next_page > MAX_SEARCH_PAGES
+        )
+        checkpoint.updated_at = time.time()
+        store.save(checkpoint.company_name, checkpoint.to_dict())
+        pages += 1
+
+        if on_page:
+            on_page(checkpoint, new_employees)
+
+    return discovered
@@ -0,0 +1,546 @@
+# linkedin_mcp_server/crawl/engine.py
+"""
+Server-side company → employees → person → company graph crawl.
+
+A crawl starts from seed companies and people and expands breadth-first: a
+company node yields its employees (read page by page through the resumable
+employee crawl), a person node yields the companies in their experience. Each
+URL is scraped at most once per crawl thanks to the frontier's seen-set, and
+expansion stops at the depth and node budgets. Worker threads share the browser
+pool with regular tool calls, leasing a browser for one node at a time.
+
+Crawl state lives in <state_dir>/crawls/<crawl_id>/, so a crawl stopped by the
+user, a captcha or a server restart continues where it left off when started
+again with the same id. A node-link JSON graph export is written when the
+frontier is exhausted.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.crawl.checkpoints import CheckpointStore
+from linkedin_mcp_server.crawl.employees import (
+    crawl_employees,
+    load_employee_checkpoint,
+)
+from linkedin_mcp_server.crawl.frontier import (
+    Frontier,
+    FrontierNode,
+    read_frontier_meta,
+)
+from linkedin_mcp_server.crawl.graph import export_graph
+from linkedin_mcp_server.deadline import Deadline
+from linkedin_mcp_server.exceptions import (
+    CredentialsNotFoundError,
+    DeadlineExceededError,
+    DriverInitializationError,
+    LinkedInMCPError,
+)
+from linkedin_mcp_server.urls import is_linkedin_host, linkedin_url
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+# Attempts per node before it is marked failed
+MAX_NODE_ATTEMPTS = 3
+
+# Seconds an idle worker waits before checking the frontier again
+IDLE_POLL_INTERVAL = 0.5
+
+_NODE_PATH = re.compile(r"^/(in|company)/([^/?#]+)")
+_CRAWL_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+RUNNING = "running"
+STOPPING = "stopping"
+STOPPED = "stopped"
+PAUSED = "paused"
+FINISHED = "finished"
+
+# Errors that affect every node, so the whole crawl pauses instead of failing
+# nodes; linkedin_scraper's own errors pause it too
+_PAUSING_ERRORS = (
+    CredentialsNotFoundError,
+    DriverInitializationError,
+)
+
+
+def normalize_linkedin_url(url: str) -> Optional[Tuple[str, str]]:
+    """
+    Map a LinkedIn profile or company URL to its crawl node.
+
+    LinkedIn slugs are case-insensitive, so the canonical slug is lowercased
+    and percent-encoded once, whatever encoding the link used.
+
+    Args:
+        url: Any URL found on a LinkedIn page
+
+    Returns:
+        Optional[Tuple[str, str]]: Node kind ("person" or "company") and canonical
+            URL, None if the URL is not a person or company page
+
+    Examples:
+        >>> normalize_linkedin_url("https://www.linkedin.com/in/Jane-Doe?trk=x")
+        ('person', 'https://www.linkedin.com/in/jane-doe/')
+        >>> normalize_linkedin_url("/in/j%C3%BCrgen-m%C3%BCller/")
+        ('person', 'https://www.linkedin.com/in/j%C3%BCrgen-m%C3%BCller/')
+        >>> normalize_linkedin_url("https://de.linkedin.com/in/Jürgen-Müller/")
+        ('person', 'https://www.linkedin.com/in/j%C3%BCrgen-m%C3%BCller/')
+        >>> normalize_linkedin_url("/in/foo%20bar/")
+        ('person', 'https://www.linkedin.com/in/foo%20bar/')
+        >>> normalize_linkedin_url("/company/a%2Fb/")
+        ('company', 'https://www.linkedin.com/company/a%2Fb/')
+    """
+    parts = urlsplit(url)
+    if parts.netloc and not is_linkedin_host(parts.netloc):
+        return None
+    match = _NODE_PATH.match(parts.path)
+    if match is None:
+        return None
+    section = match.group(1)
+    slug = quote(unquote(match.group(2)).lower(), safe="-_.~")
+    kind = "person" if section == "in" else "company"
+    return kind, linkedin_url(f"{section}/{slug}/")
+
+
+def _slug(url: str) -> str:
+    """Last path segment of a canonical node URL."""
+    return url.rstrip("/").rsplit("/", 1)[-1]
+
+
+@dataclass
+class CrawlSettings:
+    """Limits of a crawl, stored with it so a resumed crawl keeps them."""
+
+    seeds: List[str] = field(default_factory=list)
+    max_depth: int = 2
+    max_nodes: int = 500
+    workers: int = 1
+    employee_pages: int = 1
+    delay_seconds: float = 2.0
+    expected_nodes: int = 1_000_000
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CrawlSettings":
+        """Restore settings from their stored form, ignoring unknown keys."""
+        known = cls.__dataclass_fields__.keys()
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+class Crawl:
+    """A crawl's frontier and the worker threads expanding it."""
+
+    def __init__(self, crawl_id: str, directory: str, settings: CrawlSettings) -> None:
+        """
+        Open a crawl's state, creating it if needed.
+
+        Args:
+            crawl_id: Identifier of the crawl
+            directory: Directory holding the crawl's state
+            settings: Limits of the crawl
+        """
+        self.crawl_id = crawl_id
+        self.directory = directory
+        self.settings = settings
+
+        os.makedirs(directory, exist_ok=True)
+        self.frontier = Frontier(
+            os.path.join(directory, "frontier.sqlite3"),
+            capacity=settings.expected_nodes,
+        )
+        self.frontier.set_meta("settings", asdict(settings))
+        self.employee_store = CheckpointStore(os.path.join(directory, "employees"))
+        self.graph_path = os.path.join(directory, "graph.json")
+
+        self.state: str = self.frontier.get_meta("state") or STOPPED
+        self.error: Optional[str] = self.frontier.get_meta("error")
+        self.started_at: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._live = 0
+        self._busy = 0
+        # Deadline and driver of each node in flight, by worker thread id
+        self._in_flight: Dict[int, Tuple[Deadline, Optional["webdriver.Chrome"]]] = {}
+
+    def _set_state(self, state: str, error: Optional[str] = None) -> None:
+        self.state = state
+        self.error = error
+        self.frontier.set_meta("state", state)
+        self.frontier.set_meta("error", error)
+
+    def seed(self, urls: List[str]) -> int:
+        """
+        Add seed URLs at depth 0.
+
+        Args:
+            urls: LinkedIn person or company URLs
+
+        Returns:
+            int: Number of seeds that were new to the crawl
+        """
+        added = 0
+        for url in urls:
+            node = normalize_linkedin_url(url)
+            if node is None:
+                logger.warning(f"Ignoring crawl seed that is not a profile: {url}")
+                continue
+            kind, canonical = node
+            added += self.frontier.add(canonical, kind, 0)
+        return added
+
+    def start(self) -> None:
+        """Start the worker threads, resuming from the stored frontier."""
+        with self._lock:
+            if self._live:
+                if self.state == RUNNING:
+                    return
+                raise LinkedInMCPError(
+                    f"Crawl {self.crawl_id} is still stopping, try again shortly"
+                )
+            self._stop.clear()
+            self._busy = 0
+            self.started_at = time.time()
+            self._set_state(RUNNING)
+            workers = max(1, min(self.settings.workers, get_config().chrome.pool_size))
+            self._threads = [
+                threading.Thread(
+                    target=self._worker,
+                    name=f"crawl-{self.crawl_id}-{index}",
+                    daemon=True,
+                )
+                for index in range(workers)
+            ]
+            self._live = len(self._threads)
+            threads = list(self._threads)
+        logger.info(f"Starting crawl {self.crawl_id} with {len(threads)} workers")
+        for thread in threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Ask the workers to stop, interrupting the nodes they are scraping."""
+        from linkedin_mcp_server.drivers.cdp import stop_page_load
+
+        with self._lock:
+            if self.state != RUNNING:
+                return
+            self._set_state(STOPPING)
+            self._stop.set()
+            in_flight = list(self._in_flight.values())
+        for deadline, driver in in_flight:
+            deadline.cancel()
+            if driver is not None:
+                stop_page_load(driver)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the worker threads to exit.
+
+        Args:
+            timeout: Seconds to wait in total, None to wait indefinitely
+
+        Returns:
+            bool: True if all workers exited
+        """
+        deadline = Deadline(timeout)
+        for thread in list(self._threads):
+            thread.join(deadline.remaining())
+        return self._live == 0
+
+    def _pause(self, error: Exception) -> None:
+        """Stop the crawl because of an error no other node would get past."""
+        logger.warning(f"Pausing crawl {self.crawl_id}: {error}")
+        with self._lock:
+            self._set_state(PAUSED, f"{type(error).__name__}: {error}")
+            self._stop.set()
+
+    def _worker(self) -> None:
+        """Worker thread body: claim and expand nodes until the frontier is empty."""
+        from linkedin_mcp_server.authentication import ensure_authentication
+
+        try:
+            authentication = ensure_authentication()
+        except Exception as e:
+            self._pause(e)
+            self._worker_exited()
+            return
+
+        while not self._stop.is_set():
+            with self._lock:
+                node = self.frontier.claim()
+                if node is None and self._busy == 0:
+                    break  # Nothing queued and nothing in flight can add more
+                if node is not None:
+                    self._busy += 1
+            if node is None:
+                self._stop.wait(IDLE_POLL_INTERVAL)
+                continue
+
+            try:
+                self._process(authentication, node)
+            finally:
+                with self._lock:
+                    self._busy -= 1
+            self._stop.wait(self.settings.delay_seconds)
+
+        self._worker_exited()
+
+    def _worker_exited(self) -> None:
+        """Record the final state once the last worker exits."""
+        with self._lock:
+            self._live -= 1
+            if self._live:
+                return
+            if self.state == STOPPING:
+                self._set_state(STOPPED)
+            elif self.state == RUNNING:
+                self._set_state(FINISHED)
+            state = self.state
+
+        if state == FINISHED:
+            counts = export_graph(self.frontier, self.graph_path)
+            logger.info(
+                f"Crawl {self.crawl_id} finished: {counts['nodes']} nodes, "
+                f"{counts['edges']} edges written to {self.graph_path}"
+            )
+
+    def _process(self, authentication: str, node: FrontierNode) -> None:
+        """Scrape one node, record it and queue its links."""
+        from linkedin_scraper.exceptions import LinkedInScraperException
+
+        from linkedin_mcp_server.drivers.chrome import driver_lease
+
+        worker = threading.get_ident()
+        deadline = Deadline()
+        with self._lock:
+            self._in_flight[worker] = (deadline, None)
+
+        try:
+            with driver_lease(authentication, deadline) as driver:
+                with self._lock:
+                    self._in_flight[worker] = (deadline, driver)
+                logger.info("Crawl %s: %s %s", self.crawl_id, node.kind, node.url)
+                if node.kind == "company":
+                    data, links = self._expand_company(driver, node)
+                else:
+                    data, links = self._expand_person(driver, node)
+        except DeadlineExceededError:
+            # Interrupted by stop_crawl; scrape it again on resume
+            self.frontier.requeue(node.url)
+            return
+        except (LinkedInScraperException, *_PAUSING_ERRORS) as e:
+            self.frontier.requeue(node.url, str(e))
+            self._pause(e)
+            return
+        except Exception as e:
+            if self._stop.is_set():
+                self.frontier.requeue(node.url)
+            elif node.attempts < MAX_NODE_ATTEMPTS:
+                logger.warning("Crawl %s: retrying %s: %s", self.crawl_id, node.url, e)
+                self.frontier.requeue(node.url, str(e))
+            else:
+                logger.error(f"Crawl {self.crawl_id}: giving up on {node.url}: {e}")
+                self.frontier.fail(node.url, str(e))
+            return
+        finally:
+            with self._lock:
+                self._in_flight.pop(worker, None)
+
+        if node.depth < self.settings.max_depth:
+            for url, relation in links:
+                target = normalize_linkedin_url(url)
+                if target is None:
+                    continue
+                kind, canonical = target
+                self.frontier.add(
+                    canonical,
+                    kind,
+                    node.depth + 1,
+                    source=node.url,
+                    relation=relation,
+                    max_nodes=self.settings.max_nodes,
+                )
+        self.frontier.complete(node.url, data)
+
+    def _expand_company(
+        self, driver: "webdriver.Chrome", node: FrontierNode
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+        """Scrape a company and read its employee pages."""
+        from linkedin_scraper import Company
+
+        from linkedin_mcp_server.tools.company import company_to_dict
+
+        company = Company(
+            node.url,
+            driver=driver,
+            scrape=False,
+            get_employees=False,
+            close_on_complete=False,
+        )
+        company.scrape(get_employees=False, close_on_complete=False)
+        data = company_to_dict(company)
+
+        links: List[Tuple[str, str]] = []
+        if node.depth < self.settings.max_depth and self.settings.employee_pages > 0:
+            checkpoint = load_employee_checkpoint(self.employee_store, _slug(node.url))
+            pages_left = self.settings.employee_pages - (checkpoint.next_page - 1)
+            if pages_left > 0:
+                crawl_employees(
+                    driver,
+                    node.url,
+                    checkpoint,
+                    self.employee_store,
+                    max_pages=pages_left,
+                )
+            links = [
+                (employee["linkedin_url"], "employee")
+                for employee in checkpoint.employees
+                if employee.get("linkedin_url")
+            ]
+        return data, links
+
+    def _expand_person(
+        self, driver: "webdriver.Chrome", node: FrontierNode
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+        """Scrape a person and collect the companies they worked at."""
+        from linkedin_scraper import Person
+
+        from linkedin_mcp_server.tools.person import person_to_dict
+
+        person = Person(node.url, driver=driver, scrape=False, close_on_complete=False)
+        person.scrape(close_on_complete=False)
+        links = [
+            (exp.linkedin_url, "worked_at")
+            for exp in list(person.experiences)
+            if getattr(exp, "linkedin_url", None)
+        ]
+        return person_to_dict(person), links
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Summarize the crawl's progress.
+
+        Returns:
+            Dict[str, Any]: State, node counts by status, edges and limits
+        """
+        counts = self.frontier.counts()
+        elapsed = time.time() - self.started_at if self.started_at else None
+        return {
+            "crawl_id": self.crawl_id,
+            "state": self.state,
+            "error": self.error,
+            "nodes": {k: v for k, v in counts.items() if k != "edges"},
+            "edges": counts["edges"],
+            "elapsed_seconds": round(elapsed, 1) if elapsed is not None else None,
+            "settings": asdict(self.settings),
+            "graph_path": self.graph_path if os.path.exists(self.graph_path) else None,
+        }
+
+
+_crawls: Dict[str, Crawl] = {}
+_crawls_lock = threading.Lock()
+
+
+def _crawl_directory(crawl_id: str) -> str:
+    return os.path.join(get_config().server.state_dir, "crawls", crawl_id)
+
+
+def _check_crawl_id(crawl_id: str) -> None:
+    if not _CRAWL_ID.match(crawl_id):
+        raise LinkedInMCPError(
+            f"Invalid crawl id {crawl_id!r}: use letters, digits, '-' and '_'"
+        )
+
+
+def get_crawl(crawl_id: str) -> Crawl:
+    """
+    Get a crawl by id, opening its stored state if it is not loaded.
+
+    Args:
+        crawl_id: Identifier of the crawl
+
+    Returns:
+        Crawl: The crawl
+
+    Raises:
+        LinkedInMCPError: If no crawl with this id exists
+    """
+    _check_crawl_id(crawl_id)
+    with _crawls_lock:
+        crawl = _crawls.get(crawl_id)
+        if crawl is not None:
+            return crawl
+
+        directory = _crawl_directory(crawl_id)
+        if not os.path.exists(os.path.join(directory, "frontier.sqlite3")):
+            raise LinkedInMCPError(f"No crawl with id {crawl_id!r}")
+        path = os.path.join(directory, "frontier.sqlite3")
+        stored = read_frontier_meta(path, "settings") or {}
+        crawl = Crawl(crawl_id, directory, CrawlSettings.from_dict(stored))
+        # A crawl loaded from disk has no workers; a "running" state is stale
+        if crawl.state in (RUNNING, STOPPING):
+            crawl._set_state(STOPPED)
+        _crawls[crawl_id] = crawl
+        return crawl
+
+
+def start_crawl(
+    seeds: List[str],
+    settings: Optional[CrawlSettings] = None,
+    crawl_id: Optional[str] = None,
+) -> Crawl:
+    """
+    Start a new crawl, or resume an existing one.
+
+    Args:
+        seeds: LinkedIn person or company URLs to start from
+        settings: Limits of a new crawl; a resumed crawl keeps its stored limits
+        crawl_id: Id of the crawl to resume, None to start a new one
+
+    Returns:
+        Crawl: The running crawl
+
+    Raises:
+        LinkedInMCPError: If the crawl id is invalid or a new crawl has no seeds
+    """
+    if crawl_id is None:
+        crawl_id = uuid.uuid4().hex[:12]
+        settings = settings or CrawlSettings()
+        settings.seeds = list(seeds)
+        with _crawls_lock:
+            crawl = Crawl(crawl_id, _crawl_directory(crawl_id), settings)
+            _crawls[crawl_id] = crawl
+        if not crawl.seed(seeds):
+            raise LinkedInMCPError("A new crawl needs at least one valid seed")
+    else:
+        crawl = get_crawl(crawl_id)
+        crawl.seed(seeds)
+
+    crawl.start()
+    return crawl
+
+
+def stop_all_crawls(timeout: float = 10.0) -> None:
+    """
+    Stop all running crawls and close their frontiers.
+
+    Args:
+        timeout: Seconds to wait for each crawl's workers to exit
+    """
+    with _crawls_lock:
+        crawls = list(_crawls.values())
+        _crawls.clear()
+    for crawl in crawls:
+        crawl.stop()
+        if crawl.join(timeout):
+            crawl.frontier.close()
@@ -0,0 +1,306 @@
+# linkedin_mcp_server/crawl/frontier.py
+"""
+Persistent crawl frontier and graph store backed by SQLite.
+
+Every URL admitted to a crawl becomes a node row with its depth and status
+(queued, in_progress, done or failed); discovered links are edge rows. Queued
+nodes live on disk rather than in memory, and an in-memory Bloom filter answers
+"seen before?" for the common case of a new URL without touching the database,
+so memory use stays flat as the crawl grows. Opening an existing frontier
+requeues nodes that were in progress when the previous run stopped and rebuilds
+the Bloom filter from the node table.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from linkedin_mcp_server.crawl.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    data TEXT,
+    error TEXT,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS nodes_queue ON nodes (status, depth, id);
+CREATE TABLE IF NOT EXISTS edges (
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    relation TEXT NOT NULL,
+    PRIMARY KEY (source, target, relation)
+) WITHOUT ROWID;
+"""
+
+
+def read_frontier_meta(path: str, key: str) -> Any:
+    """
+    Read a JSON value stored with a crawl without opening its frontier.
+
+    Args:
+        path: SQLite database file of the frontier
+        key: Metadata key
+
+    Returns:
+        Any: Stored value, None if missing
+    """
+    conn = sqlite3.connect(path)
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    except sqlite3.OperationalError:
+        return None  # Database created but schema not written yet
+    finally:
+        conn.close()
+    return json.loads(row[0]) if row else None
+
+
+@dataclass
+class FrontierNode:
+    """A node claimed from the frontier for processing."""
+
+    url: str
+    kind: str
+    depth: int
+    attempts: int
+
+
+class Frontier:
+    """Breadth-first crawl frontier with a Bloom filter seen-set."""
+
+    def __init__(
+        self, path: str, capacity: int = 1_000_000, error_rate: float = 0.001
+    ) -> None:
+        """
+        Open or create a frontier database.
+
+        Args:
+            path: SQLite database file
+            capacity: Expected number of nodes, used to size the Bloom filter
+            error_rate: Bloom filter false positive rate at capacity
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        self._seen = BloomFilter(capacity, error_rate)
+        with self._lock, self._conn:
+            requeued = self._conn.execute(
+                "UPDATE nodes SET status = ? WHERE status = ?", (QUEUED, IN_PROGRESS)
+            ).rowcount
+            for (url,) in self._conn.execute("SELECT url FROM nodes"):
+                self._seen.add(url)
+            (self._total,) = self._conn.execute("SELECT COUNT(*) FROM nodes").fetchone()
+        if requeued:
+            logger.info(f"Requeued {requeued} interrupted crawl nodes")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get_meta(self, key: str) -> Any:
+        """
+        Read a JSON value stored with the crawl.
+
+        Args:
+            key: Metadata key
+
+        Returns:
+            Any: Stored value, None if missing
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_meta(self, key: str, value: Any) -> None:
+        """
+        Store a JSON value with the crawl.
+
+        Args:
+            key: Metadata key
+            value: JSON-serializable value
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (key, json.dumps(value)),
+            )
+
+    def _known(self, url: str) -> bool:
+        """Exact membership test; the Bloom filter skips the query for new URLs."""
+        if url not in self._seen:
+            return False
+        row = self._conn.execute("SELECT 1 FROM nodes WHERE url = ?", (url,))
+        return row.fetchone() is not None
+
+    def add(
+        self,
+        url: str,
+        kind: str,
+        depth: int,
+        source: Optional[str] = None,
+        relation: Optional[str] = None,
+        max_nodes: Optional[int] = None,
+    ) -> bool:
+        """
+        Admit a URL to the frontier and record the link it was found through.
+
+        Args:
+            url: Normalized node URL
+            kind: Node type ("company" or "person")
+            depth: Distance from the crawl seeds
+            source: URL of the node the link was found on
+            relation: Type of the link (e.g. "employee", "worked_at")
+            max_nodes: Do not admit new nodes beyond this many in total
+
+        Returns:
+            bool: True if the URL was new and queued
+        """
+        with self._lock, self._conn:
+            known = self._known(url)
+            queued = False
+            if not known and (max_nodes is None or self._total < max_nodes):
+                self._conn.execute(
+                    "INSERT INTO nodes (url, kind, depth, status, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (url, kind, depth, QUEUED, time.time()),
+                )
+                self._seen.add(url)
+                self._total += 1
+                known = queued = True
+            if known and source is not None and source != url:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO edges (source, target, relation) "
+                    "VALUES (?, ?, ?)",
+                    (source, url, relation or "link"),
+                )
+        return queued
+
+    def claim(self) -> Optional[FrontierNode]:
+        """
+        Take the shallowest queued node and mark it in progress.
+
+        Returns:
+            Optional[FrontierNode]: Node to process, None if nothing is queued
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT url, kind, depth, attempts FROM nodes WHERE status = ? "
+                "ORDER BY depth, id LIMIT 1",
+                (QUEUED,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE nodes SET status = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE url = ?",
+                (IN_PROGRESS, time.time(), row[0]),
+            )
+        return FrontierNode(url=row[0], kind=row[1], depth=row[2], attempts=row[3] + 1)
+
+    def _set_status(
+        self,
+        url: str,
+        status: str,
+        data: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE nodes SET status = ?, data = COALESCE(?, data), error = ?, "
+                "updated_at = ? WHERE url = ?",
+                (
+                    status,
+                    json.dumps(data) if data is not None else None,
+                    error,
+                    time.time(),
+                    url,
+                ),
+            )
+
+    def complete(self, url: str, data: Dict[str, Any]) -> None:
+        """Mark a node done and store its scraped data."""
+        self._set_status(url, DONE, data=data)
+
+    def fail(self, url: str, error: str) -> None:
+        """Mark a node failed."""
+        self._set_status(url, FAILED, error=error)
+
+    def requeue(self, url: str, error: Optional[str] = None) -> None:
+        """Put an in-progress node back in the queue."""
+        self._set_status(url, QUEUED, error=error)
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count nodes by status, and edges.
+
+        Returns:
+            Dict[str, int]: Number of nodes per status plus "edges"
+        """
+        result = {QUEUED: 0, IN_PROGRESS: 0, DONE: 0, FAILED: 0}
+        with self._lock:
+            for status, count in self._conn.execute(
+                "SELECT status, COUNT(*) FROM nodes GROUP BY status"
+            ):
+                result[status] = count
+            result["edges"] = self._conn.execute(
+                "SELECT COUNT(*) FROM edges"
+            ).fetchone()[0]
+        return result
+
+    def iter_nodes(self) -> Iterator[Tuple[str, str, int, str, Optional[str]]]:
+        """
+        Iterate over all nodes without loading them into memory at once.
+
+        Yields:
+            Tuple of url, kind, depth, status and display name
+        """
+        # A separate connection so a long export doesn't hold the lock
+        conn = sqlite3.connect(self.path)
+        try:
+            for url, kind, depth, status, name in conn.execute(
+                "SELECT url, kind, depth, status, json_extract(data, '$.name') "
+                "FROM nodes ORDER BY id"
+            ):
+                yield url, kind, depth, status, name
+        finally:
+            conn.close()
+
+    def iter_edges(self) -> Iterator[Tuple[str, str, str]]:
+        """
+        Iterate over all edges without loading them into memory at once.
+
+        Yields:
+            Tuple of source URL, target URL and relation
+        """
+        conn = sqlite3.connect(self.path)
+        try:
+            yield from conn.execute("SELECT source, target, relation FROM edges")
+        finally:
+            conn.close()
@@ -0,0 +1,110 @@
+# linkedin_mcp_server/crawl/graph.py
+"""
+Graph export of a crawl frontier.
+
+Writes the crawled company/person graph as node-link JSON (the format read by
+networkx.node_link_graph and d3) or GraphML (Gephi, yEd, networkx.read_graphml).
+Nodes and edges are streamed from the frontier database to the output file, so
+exporting a large crawl does not load the graph into memory.
+"""
+
+import json
+import os
+import tempfile
+from typing import Dict, Optional, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+from linkedin_mcp_server.crawl.frontier import Frontier
+
+GRAPH_FORMATS = ("json", "graphml")
+
+
+def _write_node_link_json(frontier: Frontier, f: TextIO) -> Dict[str, int]:
+    counts = {"nodes": 0, "edges": 0}
+    f.write('{"directed": true, "multigraph": false, "graph": {}, "nodes": [')
+    for url, kind, depth, status, name in frontier.iter_nodes():
+        node = {"id": url, "kind": kind, "depth": depth, "status": status}
+        if name is not None:
+            node["name"] = name
+        f.write(("," if counts["nodes"] else "") + json.dumps(node))
+        counts["nodes"] += 1
+    f.write('], "links": [')
+    for source, target, relation in frontier.iter_edges():
+        link = {"source": source, "target": target, "relation": relation}
+        f.write(("," if counts["edges"] else "") + json.dumps(link))
+        counts["edges"] += 1
+    f.write("]}\n")
+    return counts
+
+
+def _write_graphml(frontier: Frontier, f: TextIO) -> Dict[str, int]:
+    counts = {"nodes": 0, "edges": 0}
+    f.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+        '  <key id="kind" for="node" attr.name="kind" attr.type="string"/>\n'
+        '  <key id="depth" for="node" attr.name="depth" attr.type="int"/>\n'
+        '  <key id="status" for="node" attr.name="status" attr.type="string"/>\n'
+        '  <key id="name" for="node" attr.name="name" attr.type="string"/>\n'
+        '  <key id="relation" for="edge" attr.name="relation" attr.type="string"/>\n'
+        '  <graph edgedefault="directed">\n'
+    )
+    for url, kind, depth, status, name in frontier.iter_nodes():
+        f.write(f"    <node id={quoteattr(url)}>")
+        f.write(f'<data key="kind">{kind}</data><data key="depth">{depth}</data>')
+        f.write(f'<data key="status">{status}</data>')
+        if name is not None:
+            f.write(f'<data key="name">{escape(name)}</data>')
+        f.write("</node>\n")
+        counts["nodes"] += 1
+    for source, target, relation in frontier.iter_edges():
+        f.write(
+            f"    <edge source={quoteattr(source)} target={quoteattr(target)}>"
+            f'<data key="relation">{relation}</data></edge>\n'
+        )
+        counts["edges"] += 1
+    f.write("  </graph>\n</graphml>\n")
+    return counts
+
+
+def export_graph(
+    frontier: Frontier, path: str, graph_format: Optional[str] = None
+) -> Dict[str, int]:
+    """
+    Write the crawl graph to a file.
+
+    The file is written next to its destination and renamed into place, so a
+    reader never sees a half-written export.
+
+    Args:
+        frontier: Frontier of the crawl
+        path: Output file
+        graph_format: "json" or "graphml"; inferred from the file extension if None
+
+    Returns:
+        Dict[str, int]: Number of nodes and edges written
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if graph_format is None:
+        graph_format = "graphml" if path.endswith(".graphml") else "json"
+    if graph_format not in GRAPH_FORMATS:
+        raise ValueError(
+            f"Unsupported graph format {graph_format!r}, use one of {GRAPH_FORMATS}"
+        )
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            if graph_format == "graphml":
+                counts = _write_graphml(frontier, f)
+            else:
+                counts = _write_node_link_json(frontier, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return counts
@@ -0,0 +1,69 @@
+# linkedin_mcp_server/deadline.py
+"""
+Per-call deadlines for LinkedIn scraping tools.
+
+A Deadline is created when a tool call starts and travels with the WebDriver
+for the rest of the call. Every navigation and element wait is clamped to the
+time that is left, and the deadline can be cancelled from the event loop when
+the client goes away, which makes all further browser commands fail fast.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from linkedin_mcp_server.exceptions import DeadlineExceededError
+
+
+class Deadline:
+    """Absolute point in time by which a tool call has to finish."""
+
+    def __init__(self, seconds: Optional[float] = None) -> None:
+        """
+        Create a deadline.
+
+        Args:
+            seconds: Time budget from now, or None for no limit
+        """
+        self.expires_at: Optional[float] = (
+            time.monotonic() + max(seconds, 0.0) if seconds is not None else None
+        )
+        self._cancelled = threading.Event()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None when unlimited."""
+        if self._cancelled.is_set():
+            return 0.0
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def clamp(self, timeout: float) -> float:
+        """Clamp a timeout in seconds to the time left before the deadline."""
+        remaining = self.remaining()
+        return timeout if remaining is None else min(timeout, remaining)
+
+    def expired(self) -> bool:
+        """Whether the deadline has passed or was cancelled."""
+        return self.remaining() == 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the deadline was cancelled explicitly."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Expire the deadline immediately (e.g. when the client disconnected)."""
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """
+        Raise if the deadline has passed.
+
+        Raises:
+            DeadlineExceededError: If the deadline expired or was cancelled
+        """
+        if self._cancelled.is_set():
+            raise DeadlineExceededError("Tool call was cancelled")
+        if self.expired():
+            raise DeadlineExceededError("Tool call exceeded its deadline")
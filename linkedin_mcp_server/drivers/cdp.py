@@ -0,0 +1,176 @@
+# linkedin_mcp_server/drivers/cdp.py
+"""
+Out-of-band Chrome DevTools Protocol access for running WebDriver sessions.
+
+ChromeDriver executes commands for a session one at a time, so a CDP command sent
+through Selenium while a navigation is in flight would queue behind it. This module
+talks to the browser's DevTools endpoint directly over its own WebSocket, which lets
+the server interrupt a page load (``Page.stopLoading``, the CDP form of
+``window.stop()``) while the scraping thread is still blocked on it. ChromeDriver
+also never forwards CDP events, so features that react to them (see
+network_archive.py) hold a connection of their own.
+"""
+
+import itertools
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+_message_ids = itertools.count(1)
+
+
+def get_debugger_address(driver: webdriver.Chrome) -> Optional[str]:
+    """
+    Get the host:port of the DevTools endpoint of a Chrome session.
+
+    Args:
+        driver: Chrome WebDriver instance
+
+    Returns:
+        Optional[str]: Debugger address if ChromeDriver exposed one, None otherwise
+    """
+    capabilities = getattr(driver, "capabilities", None) or {}
+    return capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+
+
+def send_devtools_command(
+    debugger_address: str,
+    target_id: str,
+    method: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: float = 5.0,
+) -> Dict[str, Any]:
+    """
+    Send a single CDP command to a page target over a dedicated WebSocket.
+
+    Args:
+        debugger_address: host:port of the browser's DevTools endpoint
+        target_id: DevTools target id of the page
+        method: CDP method name (e.g. "Page.stopLoading")
+        params: CDP method parameters
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Dict[str, Any]: The CDP result object
+
+    Raises:
+        RuntimeError: If the browser answered with a CDP error
+    """
+    # websocket-client is a Selenium dependency; only needed on this path
+    import websocket  # type: ignore
+
+    url = f"ws://{debugger_address}/devtools/page/{target_id}"
+    message_id = next(_message_ids)
+    # Chrome rejects DevTools connections with an Origin header unless
+    # --remote-allow-origins is set, so don't send one
+    ws = websocket.create_connection(url, timeout=timeout, suppress_origin=True)
+    try:
+        ws.send(
+            json.dumps({"id": message_id, "method": method, "params": params or {}})
+        )
+        while True:
+            message = json.loads(ws.recv())
+            if message.get("id") != message_id:
+                continue  # Event or unrelated reply
+            if "error" in message:
+                raise RuntimeError(f"{method} failed: {message['error']}")
+            return message.get("result", {})
+    finally:
+        ws.close()
+
+
+def connect_to_page(driver: webdriver.Chrome, timeout: Optional[float] = None) -> Any:
+    """
+    Open a DevTools WebSocket to a driver's page that stays open for events.
+
+    Args:
+        driver: Chrome WebDriver instance
+        timeout: Socket timeout in seconds, None to block until a message arrives
+
+    Returns:
+        websocket.WebSocket: Connection sending commands and receiving their
+            replies and the events of domains enabled through it
+
+    Raises:
+        RuntimeError: If the DevTools endpoint is unknown
+    """
+    import websocket  # type: ignore
+
+    debugger_address = get_debugger_address(driver)
+    target_id = getattr(driver, "devtools_target_id", None)
+    if not debugger_address or not target_id:
+        raise RuntimeError("DevTools endpoint unknown")
+
+    return websocket.create_connection(
+        f"ws://{debugger_address}/devtools/page/{target_id}",
+        timeout=timeout,
+        suppress_origin=True,
+    )
+
+
+def evaluate_in_page(
+    driver: webdriver.Chrome, expression: str, timeout: float = 5.0
+) -> Any:
+    """
+    Evaluate a JavaScript expression in a driver's page without going through ChromeDriver.
+
+    Safe to call from any thread, and not subject to the deadline of the call
+    holding the driver.
+
+    Args:
+        driver: Chrome WebDriver instance
+        expression: JavaScript expression with a JSON-serializable value
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Any: The value of the expression
+
+    Raises:
+        RuntimeError: If the DevTools endpoint is unknown or evaluation failed
+    """
+    debugger_address = get_debugger_address(driver)
+    target_id = getattr(driver, "devtools_target_id", None)
+    if not debugger_address or not target_id:
+        raise RuntimeError("DevTools endpoint unknown")
+
+    result = send_devtools_command(
+        debugger_address,
+        target_id,
+        "Runtime.evaluate",
+        {"expression": expression, "returnByValue": True},
+        timeout,
+    )
+    if "exceptionDetails" in result:
+        raise RuntimeError(f"Evaluation failed: {result['exceptionDetails']}")
+    return result.get("result", {}).get("value")
+
+
+def stop_page_load(driver: webdriver.Chrome) -> bool:
+    """
+    Stop the in-progress navigation of a driver without going through ChromeDriver.
+
+    Safe to call from any thread while another thread is blocked on the driver.
+
+    Args:
+        driver: Chrome WebDriver instance
+
+    Returns:
+        bool: True if the stop command was delivered, False otherwise
+    """
+    debugger_address = get_debugger_address(driver)
+    target_id = getattr(driver, "devtools_target_id", None)
+    if not debugger_address or not target_id:
+        logger.debug("DevTools endpoint unknown, cannot stop page load")
+        return False
+
+    try:
+        send_devtools_command(debugger_address, target_id, "Page.stopLoading")
+        logger.info("Stopped in-progress page load")
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to stop page load: {e}")
+        return False
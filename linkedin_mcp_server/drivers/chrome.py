@@ -3,14 +3,22 @@
 Chrome WebDriver management for LinkedIn scraping with session persistence.
 
 Handles Chrome WebDriver creation, configuration, authentication, and lifecycle management.
-Implements singleton pattern for driver reuse across tools with automatic cleanup.
+Keeps a pool of logged-in drivers leased to tools one call at a time, with automatic cleanup.
 Provides cookie-based authentication and comprehensive error handling.
 """
 
+import json
 import logging
 import os
 import platform
-from typing import Dict, Optional
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import wait as wait_for_futures
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set
+from urllib.parse import urlparse
 
 from linkedin_scraper.exceptions import (
     CaptchaRequiredError,
@@ -24,9 +32,57 @@ from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote.command import Command
 
 from linkedin_mcp_server.config import get_config
-from linkedin_mcp_server.exceptions import DriverInitializationError
+from linkedin_mcp_server.config.schema import DEFAULT_LINKEDIN_BASE_URL
+from linkedin_mcp_server.deadline import Deadline
+from linkedin_mcp_server.exceptions import (
+    DeadlineExceededError,
+    DriverInitializationError,
+)
+from linkedin_mcp_server.metrics import (
+    BROWSER_BUSY,
+    BROWSER_IDLE,
+    BROWSER_LAUNCH,
+    BROWSER_LOGIN,
+    PAGE_BYTES,
+    PAGE_EVENT,
+    PAGE_JS_HEAP,
+    PAGE_MAIN_THREAD,
+    PAGE_REQUESTS,
+    QUEUE_WAIT,
+)
+from linkedin_mcp_server.tracing import Span, phase, span
+from linkedin_mcp_server.urls import is_live_linkedin, linkedin_url
+
+if TYPE_CHECKING:
+    from linkedin_mcp_server.drivers.network_archive import NetworkInterceptor
+
+# Default WebDriver timeouts (seconds)
+DEFAULT_PAGE_LOAD_TIMEOUT = 60
+DEFAULT_IMPLICIT_WAIT = 10
+
+# Tolerated overrun before a clamped timeout is re-sent (milliseconds)
+_TIMEOUT_SLACK_MS = 1000
+
+# Commands that never count against a deadline
+_UNBOUNDED_COMMANDS = frozenset({Command.QUIT, Command.SET_TIMEOUTS})
+
+# Commands whose duration is governed by the implicit wait
+_FIND_COMMANDS = frozenset(
+    {
+        Command.FIND_ELEMENT,
+        Command.FIND_ELEMENTS,
+        Command.FIND_CHILD_ELEMENT,
+        Command.FIND_CHILD_ELEMENTS,
+    }
+)
+
+# First path segments of LinkedIn URLs used as the page label of page metrics
+_PAGE_TYPES = frozenset(
+    {"in", "company", "jobs", "search", "feed", "login", "checkpoint", "uas"}
+)
 
 
 # Constants
@@ -42,9 +98,243 @@ def get_default_user_agent() -> str:
         return "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
 
 
+class LinkedInChrome(webdriver.Chrome):
+    """
+    Chrome WebDriver that honours a per-call deadline.
+
+    While a deadline is attached, every command first checks that time is left,
+    navigations get a page load timeout clamped to the remaining time and element
+    lookups get a clamped implicit wait. Timeouts requested explicitly through
+    set_page_load_timeout/implicitly_wait are remembered and restored once the
+    deadline is detached.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # Set before super().__init__, which already executes commands
+        self.deadline: Optional[Deadline] = None
+        self.devtools_target_id: Optional[str] = None
+        self.perf_capture = False
+        self.network_archive: Optional["NetworkInterceptor"] = None
+        self._requested_timeouts: Dict[str, int] = {}
+        self._sent_timeouts: Dict[str, int] = {}
+        super().__init__(*args, **kwargs)
+
+        try:
+            # ChromeDriver window handles are DevTools target ids
+            self.devtools_target_id = self.current_window_handle
+        except WebDriverException as e:
+            logger.debug("Could not resolve DevTools target id: %s", e)
+
+    def execute(
+        self, driver_command: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute a WebDriver command, enforcing the attached deadline."""
+        if driver_command == Command.SET_TIMEOUTS and params:
+            self._requested_timeouts.update(params)
+            self._sent_timeouts.update(params)
+        elif driver_command not in _UNBOUNDED_COMMANDS:
+            if self.deadline is not None:
+                self.deadline.check()
+            if driver_command == Command.GET:
+                self._sync_timeout("pageLoad")
+            elif driver_command in _FIND_COMMANDS:
+                self._sync_timeout("implicit")
+
+        if driver_command == Command.GET:
+            url = (params or {}).get("url")
+            with span("navigate", url=url) as navigate:
+                if self.perf_capture:
+                    return self._captured_get(url, navigate, params)
+                return super().execute(driver_command, params)
+        if driver_command in _FIND_COMMANDS:
+            with phase("wait"):
+                return super().execute(driver_command, params)
+        return super().execute(driver_command, params)
+
+    def quit(self) -> None:
+        """Close the browser, saving network traffic recorded since the last lease."""
+        if self.network_archive is not None:
+            save_network_archive(self, "shutdown")
+            self.network_archive.close()
+        super().quit()
+
+    def enable_perf_capture(self) -> None:
+        """
+        Record a performance summary of every following navigation.
+
+        Requires the "performance" log to have been enabled in the driver's
+        capabilities (see create_chrome_driver).
+        """
+        self.execute_cdp_cmd("Performance.enable", {})
+        self.perf_capture = True
+
+    def _performance_metrics(self) -> Dict[str, float]:
+        result = self.execute_cdp_cmd("Performance.getMetrics", {})
+        return {m["name"]: m["value"] for m in result.get("metrics", [])}
+
+    def _captured_get(
+        self, url: Optional[str], navigate: Optional[Span], params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Navigate and record the page's performance summary."""
+        try:
+            before = self._performance_metrics()
+            # Drop events of the previous page so only this load is counted
+            self.get_log("performance")
+        except WebDriverException as e:
+            logger.debug("Performance capture unavailable: %s", e)
+            return super().execute(Command.GET, params)
+
+        response = super().execute(Command.GET, params)
+
+        try:
+            summary = summarize_page_load(
+                self.get_log("performance"), before, self._performance_metrics()
+            )
+        except WebDriverException as e:
+            logger.debug("Could not read performance of %s: %s", url, e)
+            return response
+        record_page_load(url, summary, navigate)
+        return response
+
+    def _sync_timeout(self, name: str) -> None:
+        """Send the deadline-clamped value of a timeout if it changed."""
+        requested = self._requested_timeouts.get(name)
+        if requested is None:
+            return
+
+        desired = requested
+        if self.deadline is not None:
+            desired = int(self.deadline.clamp(requested / 1000) * 1000)
+            if name == "pageLoad":
+                desired = max(desired, 1)  # 0 would mean "fail immediately"
+
+        sent = self._sent_timeouts.get(name)
+        # Re-clamping on every lookup would double the command count, so only
+        # shrink once the browser could overrun the deadline noticeably
+        if sent is None or desired > sent or sent - desired > _TIMEOUT_SLACK_MS:
+            super().execute(Command.SET_TIMEOUTS, {name: desired})
+            self._sent_timeouts[name] = desired
+
+
+def summarize_page_load(
+    entries: List[Dict[str, Any]], before: Dict[str, float], after: Dict[str, float]
+) -> Dict[str, Any]:
+    """
+    Summarize one navigation from CDP Network/Page events and Performance metrics.
+
+    Args:
+        entries: ChromeDriver "performance" log entries recorded during the load
+        before: Performance.getMetrics values before the navigation
+        after: Performance.getMetrics values after it
+
+    Returns:
+        Dict[str, Any]: Requests, failed and cached requests, encoded bytes
+            transferred, main-thread/script/layout time, used JS heap, DOM nodes
+            and the DOMContentLoaded and load times from the document request
+            (None when the event was not seen)
+    """
+    requests = failed = cached = transferred = 0
+    started = dom_content_loaded = loaded = None
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            requests += 1
+            if started is None and params.get("type") == "Document":
+                started = params.get("timestamp")
+        elif method == "Network.loadingFinished":
+            transferred += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed":
+            failed += 1
+        elif method == "Network.requestServedFromCache":
+            cached += 1
+        elif method == "Page.domContentEventFired":
+            dom_content_loaded = params.get("timestamp")
+        elif method == "Page.loadEventFired":
+            loaded = params.get("timestamp")
+
+    def since_request(timestamp: Optional[float]) -> Optional[float]:
+        if started is None or timestamp is None:
+            return None
+        return round((timestamp - started) * 1000, 1)
+
+    def duration_ms(name: str) -> float:
+        # Counters restart when the navigation swaps the renderer process
+        value = after.get(name, 0.0)
+        if value >= before.get(name, 0.0):
+            value -= before.get(name, 0.0)
+        return round(value * 1000, 1)
+
+    return {
+        "requests": requests,
+        "failed_requests": failed,
+        "cached_requests": cached,
+        "bytes": transferred,
+        "main_thread_ms": duration_ms("TaskDuration"),
+        "script_ms": duration_ms("ScriptDuration"),
+        "layout_ms": duration_ms("LayoutDuration"),
+        "js_heap_bytes": int(after.get("JSHeapUsedSize", 0)),
+        "dom_nodes": int(after.get("Nodes", 0)),
+        "dom_content_loaded_ms": since_request(dom_content_loaded),
+        "load_ms": since_request(loaded),
+    }
+
+
+def page_type(url: Optional[str]) -> str:
+    """Low-cardinality label of a URL for page metrics (e.g. "in", "company")."""
+    segments = [s for s in urlparse(url or "").path.split("/") if s]
+    if not segments:
+        return "home"
+    return segments[0] if segments[0] in _PAGE_TYPES else "other"
+
+
+def record_page_load(
+    url: Optional[str], summary: Dict[str, Any], navigate: Optional[Span]
+) -> None:
+    """Add a page load summary to the page metrics and its navigate span."""
+    page = page_type(url)
+    PAGE_REQUESTS.observe(summary["requests"], page=page)
+    PAGE_BYTES.observe(summary["bytes"], page=page)
+    PAGE_MAIN_THREAD.observe(summary["main_thread_ms"] / 1000, page=page)
+    PAGE_JS_HEAP.observe(summary["js_heap_bytes"], page=page)
+    for event in ("dom_content_loaded", "load"):
+        if summary[f"{event}_ms"] is not None:
+            PAGE_EVENT.observe(summary[f"{event}_ms"] / 1000, page=page, event=event)
+    if navigate is not None:
+        navigate.attributes.update({f"page.{k}": v for k, v in summary.items()})
+    logger.debug("Page load %s: %s", url, summary)
+
+
 # Global driver storage to reuse sessions
 active_drivers: Dict[str, webdriver.Chrome] = {}
 
+# Session id of the first browser in the pool
+DEFAULT_SESSION_ID = "default"
+
+# Session ids of the browser pool not currently leased (created on first lease)
+_free_sessions: Optional["queue.LifoQueue[str]"] = None
+_free_sessions_lock = threading.Lock()
+
+# Pool activity for status reporting, kept so it can be read without the browsers
+_activity_lock = threading.Lock()
+_waiting_leases = 0
+_last_successful_lease: Optional[float] = None
+_last_login: Dict[str, Any] = {}
+# When each started browser was last returned to the pool, for idle time
+_released_at: Dict[str, float] = {}
+# Leased sessions to quit when their lease ends, see close_idle_drivers
+_quit_on_release: Set[str] = set()
+
+# Launch and login of the first browser on a background thread, see
+# start_driver_warmup
+_warmup: Optional["Future[webdriver.Chrome]"] = None
+_warmup_lock = threading.Lock()
+# Seconds shutdown waits for a warm-up in flight, so its browser gets closed
+WARMUP_SHUTDOWN_WAIT = 60.0
+# Set by close_all_drivers; a warm-up finishing later quits its browser
+_shutting_down = threading.Event()
+
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +352,8 @@ def create_chrome_options(config) -> Options:
     chrome_options = Options()
 
     logger.info(
-        f"Running browser in {'headless' if config.chrome.headless else 'visible'} mode"
+        "Running browser in %s mode",
+        "headless" if config.chrome.headless else "visible",
     )
     if config.chrome.headless:
         chrome_options.add_argument("--headless=new")
@@ -88,6 +379,13 @@ def create_chrome_options(config) -> Options:
     user_agent = config.chrome.user_agent or get_default_user_agent()
     chrome_options.add_argument(f"--user-agent={user_agent}")
 
+    # Against a stand-in site, the scraper library's hardcoded linkedin.com
+    # URLs fail fast instead of reaching the network
+    if config.linkedin.base_url.rstrip("/") != DEFAULT_LINKEDIN_BASE_URL:
+        chrome_options.add_argument(
+            "--host-resolver-rules=MAP linkedin.com ~NOTFOUND, MAP *.linkedin.com ~NOTFOUND"
+        )
+
     # Add any custom browser arguments from config
     for arg in config.chrome.browser_args:
         chrome_options.add_argument(arg)
@@ -111,7 +409,7 @@ def create_chrome_service(config):
     )
 
     if chromedriver_path:
-        logger.info(f"Using ChromeDriver at path: {chromedriver_path}")
+        logger.info("Using ChromeDriver at path: %s", chromedriver_path)
         return Service(executable_path=chromedriver_path)
     else:
         logger.info("Using auto-detected ChromeDriver")
@@ -143,17 +441,17 @@ def create_temporary_chrome_driver() -> webdriver.Chrome:
 
     # Initialize Chrome driver
     if service:
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver = LinkedInChrome(service=service, options=chrome_options)
     else:
-        driver = webdriver.Chrome(options=chrome_options)
+        driver = LinkedInChrome(options=chrome_options)
 
     logger.info("Temporary Chrome WebDriver created successfully")
 
     # Add a page load timeout for safety
-    driver.set_page_load_timeout(60)
+    driver.set_page_load_timeout(DEFAULT_PAGE_LOAD_TIMEOUT)
 
     # Set shorter implicit wait for faster operations
-    driver.implicitly_wait(10)
+    driver.implicitly_wait(DEFAULT_IMPLICIT_WAIT)
 
     return driver
 
@@ -174,27 +472,80 @@ def create_chrome_driver() -> webdriver.Chrome:
 
     # Create Chrome options using shared function
     chrome_options = create_chrome_options(config)
+    if config.chrome.perf_capture:
+        # Network and Page events of each load, read back with get_log
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
     # Create Chrome service using shared function
     service = create_chrome_service(config)
 
     # Initialize Chrome driver
     if service:
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver = LinkedInChrome(service=service, options=chrome_options)
     else:
-        driver = webdriver.Chrome(options=chrome_options)
+        driver = LinkedInChrome(options=chrome_options)
 
     logger.info("Chrome WebDriver initialized successfully")
 
+    if config.chrome.perf_capture:
+        driver.enable_perf_capture()
+
+    if config.chrome.record_network_dir or config.chrome.replay_network:
+        start_network_archive(driver, config)
+
     # Add a page load timeout for safety
-    driver.set_page_load_timeout(60)
+    driver.set_page_load_timeout(DEFAULT_PAGE_LOAD_TIMEOUT)
 
     # Set shorter implicit wait for faster cookie validation
-    driver.implicitly_wait(10)
+    driver.implicitly_wait(DEFAULT_IMPLICIT_WAIT)
 
     return driver
 
 
+def start_network_archive(driver: LinkedInChrome, config) -> None:
+    """
+    Record the driver's network traffic to archives, or replay it from them.
+
+    Args:
+        driver: Chrome WebDriver instance
+        config: AppConfig instance with Chrome configuration
+
+    Raises:
+        DriverInitializationError: If replay could not be set up; the browser
+            would otherwise reach the network
+    """
+    from linkedin_mcp_server.drivers.network_archive import (
+        NetworkInterceptor,
+        get_replay_archive,
+    )
+
+    try:
+        if config.chrome.replay_network:
+            replay = get_replay_archive(config.chrome.replay_network)
+            driver.network_archive = NetworkInterceptor(driver, replay=replay).start()
+        else:
+            driver.network_archive = NetworkInterceptor(
+                driver, record_dir=config.chrome.record_network_dir
+            ).start()
+    except Exception as e:
+        if not config.chrome.replay_network:
+            logger.warning("Network recording unavailable: %s", e)
+            return
+        driver.quit()
+        raise DriverInitializationError(f"Could not replay network archive: {e}")
+
+
+def save_network_archive(driver: webdriver.Chrome, label: str) -> None:
+    """Write the traffic a recording driver saw since the last save to an archive."""
+    archive = getattr(driver, "network_archive", None)
+    if archive is None or not archive.record_dir:
+        return
+    try:
+        archive.save(label)
+    except OSError as e:
+        logger.warning("Could not save network archive: %s", e)
+
+
 def login_with_cookie(driver: webdriver.Chrome, cookie: str) -> bool:
     """
     Log in to LinkedIn using session cookie.
@@ -214,7 +565,14 @@ def login_with_cookie(driver: webdriver.Chrome, cookie: str) -> bool:
         # Set timeout for cookie authentication - longer to handle LinkedIn's slow redirects
         driver.set_page_load_timeout(30)
 
-        actions.login(driver, cookie=cookie)
+        if is_live_linkedin():
+            actions.login(driver, cookie=cookie)
+        else:
+            # The library's login goes to linkedin.com; set the cookie on the
+            # configured site and open the feed, which needs a session
+            driver.get(linkedin_url("login"))
+            driver.add_cookie({"name": "li_at", "value": cookie})
+            driver.get(linkedin_url("feed/"))
 
         # Quick check - if we're on login page, cookie is invalid
         current_url = driver.current_url
@@ -224,7 +582,7 @@ def login_with_cookie(driver: webdriver.Chrome, cookie: str) -> bool:
         elif (
             "feed" in current_url
             or "mynetwork" in current_url
-            or "linkedin.com/in/" in current_url
+            or "/in/" in urlparse(current_url).path
         ):
             logger.info("Cookie authentication successful")
             return True
@@ -233,11 +591,11 @@ def login_with_cookie(driver: webdriver.Chrome, cookie: str) -> bool:
             return False
 
     except Exception as e:
-        logger.warning(f"Cookie authentication failed: {e}")
+        logger.warning("Cookie authentication failed: %s", e)
         return False
     finally:
         # Restore normal timeout
-        driver.set_page_load_timeout(60)
+        driver.set_page_load_timeout(DEFAULT_PAGE_LOAD_TIMEOUT)
 
 
 def login_to_linkedin(driver: webdriver.Chrome, authentication: str) -> None:
@@ -287,12 +645,15 @@ def login_to_linkedin(driver: webdriver.Chrome, authentication: str) -> None:
         raise LoginTimeoutError(f"Login failed: {str(e)}")
 
 
-def get_or_create_driver(authentication: str) -> webdriver.Chrome:
+def get_or_create_driver(
+    authentication: str, session_id: str = DEFAULT_SESSION_ID
+) -> webdriver.Chrome:
     """
     Get existing driver or create a new one and login.
 
     Args:
         authentication: LinkedIn session cookie for login
+        session_id: Browser pool slot the driver belongs to
 
     Returns:
         webdriver.Chrome: Chrome WebDriver instance, logged in and ready
@@ -301,22 +662,28 @@ def get_or_create_driver(authentication: str) -> webdriver.Chrome:
         DriverInitializationError: If driver creation fails
         Various login-related errors: If login fails
     """
-    session_id = "default"  # We use a single session for simplicity
-
     # Return existing driver if available
     if session_id in active_drivers:
-        logger.info("Using existing Chrome WebDriver session")
+        logger.info("Using existing Chrome WebDriver session: %s", session_id)
         return active_drivers[session_id]
 
+    driver: Optional[webdriver.Chrome] = None
+    login_started: Optional[float] = None
     try:
         # Create new driver
-        driver = create_chrome_driver()
+        launch_started = time.perf_counter()
+        with span("browser.launch", session=session_id):
+            driver = create_chrome_driver()
+        BROWSER_LAUNCH.observe(time.perf_counter() - launch_started)
 
         # Login to LinkedIn
-        login_to_linkedin(driver, authentication)
+        login_started = time.perf_counter()
+        with span("login", session=session_id):
+            login_to_linkedin(driver, authentication)
 
         # Store successful driver
         active_drivers[session_id] = driver
+        _record_login(None, time.perf_counter() - login_started)
         logger.info("Chrome WebDriver session created and authenticated successfully")
 
         return driver
@@ -334,24 +701,287 @@ def get_or_create_driver(authentication: str) -> webdriver.Chrome:
         LoginTimeoutError,
     ) as e:
         # Login-related errors - clean up driver if it was created
-        if session_id in active_drivers:
-            active_drivers[session_id].quit()
-            del active_drivers[session_id]
+        _record_login(e, time.perf_counter() - login_started if login_started else None)
+        if driver is not None:
+            driver.quit()
+        active_drivers.pop(session_id, None)
         raise e
 
 
+def _record_login(error: Optional[Exception], seconds: Optional[float]) -> None:
+    """Remember the outcome of the latest LinkedIn login."""
+    if seconds is not None:
+        BROWSER_LOGIN.observe(seconds, outcome=type(error).__name__ if error else "ok")
+    with _activity_lock:
+        _last_login.clear()
+        _last_login.update(
+            at=time.time(),
+            ok=error is None,
+            error=type(error).__name__ if error else None,
+        )
+
+
+def start_driver_warmup(authentication: str) -> "Future[webdriver.Chrome]":
+    """
+    Launch the first browser of the pool and log in on a background thread.
+
+    The server can accept requests while Chrome starts. Leases made before the
+    warm-up finished wait for it instead of launching a browser of their own,
+    then get the warm browser; if the warm-up failed they launch one as usual.
+    Calling it again returns the warm-up already started.
+
+    Args:
+        authentication: LinkedIn session cookie for login
+
+    Returns:
+        Future[webdriver.Chrome]: Completes with the logged-in driver, or with
+            the launch or login error
+    """
+    global _warmup
+    with _warmup_lock:
+        if _warmup is None:
+            _warmup = Future()
+            threading.Thread(
+                target=_warm_up,
+                args=(authentication, _warmup),
+                name="driver-warmup",
+                daemon=True,
+            ).start()
+        return _warmup
+
+
+def _warm_up(authentication: str, future: "Future[webdriver.Chrome]") -> None:
+    started = time.perf_counter()
+    try:
+        driver = get_or_create_driver(authentication)
+    except Exception as e:
+        logger.warning("Background driver warm-up failed: %s", e)
+        future.set_exception(e)
+        return
+    if _shutting_down.is_set():
+        # Shutdown gave up waiting for us; don't leave the browser running
+        logger.info("Closing browser of a warm-up that finished after shutdown")
+        if active_drivers.get(DEFAULT_SESSION_ID) is driver:
+            active_drivers.pop(DEFAULT_SESSION_ID, None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Error closing warm-up driver: %s", e)
+        future.set_exception(DriverInitializationError("Server is shutting down"))
+        return
+    logger.info(
+        "Background driver warm-up finished in %.1fs", time.perf_counter() - started
+    )
+    future.set_result(driver)
+
+
+def _wait_for_warmup(deadline: Deadline) -> None:
+    """Wait for a warm-up in flight rather than launch a second browser."""
+    warmup = _warmup
+    if warmup is None or warmup.done():
+        return
+    with span("driver.warmup_wait"):
+        wait_for_futures([warmup], timeout=deadline.remaining())
+    if not warmup.done():
+        raise DeadlineExceededError("Timed out waiting for the browser to start")
+
+
+def get_pool_size() -> int:
+    """Get the configured number of browsers in the pool."""
+    return max(get_config().chrome.pool_size, 1)
+
+
+def _get_free_sessions() -> "queue.LifoQueue[str]":
+    """Get the queue of free pool slots, creating it on first use."""
+    global _free_sessions
+    with _free_sessions_lock:
+        if _free_sessions is None:
+            _free_sessions = queue.LifoQueue()
+            # LIFO hands out the most recently used (warm) browser first
+            for index in reversed(range(get_pool_size())):
+                _free_sessions.put(
+                    DEFAULT_SESSION_ID if index == 0 else f"pool-{index}"
+                )
+        return _free_sessions
+
+
+@contextmanager
+def driver_lease(
+    authentication: str, deadline: Optional[Deadline] = None
+) -> Iterator[webdriver.Chrome]:
+    """
+    Get exclusive use of a pooled driver for the duration of one tool call.
+
+    Waits for a free browser if all of them are leased, and for the background
+    warm-up if one is still starting the first browser. The deadline is
+    attached to the driver while it is leased, so every navigation and wait
+    made through it is bounded by the time left.
+
+    Args:
+        authentication: LinkedIn session cookie for login
+        deadline: Deadline of the tool call, None for no limit
+
+    Yields:
+        webdriver.Chrome: Chrome WebDriver instance, logged in and ready
+
+    Raises:
+        DeadlineExceededError: If no driver became free or started in time
+    """
+    global _waiting_leases, _last_successful_lease
+    deadline = deadline or Deadline()
+    free_sessions = _get_free_sessions()
+    with _activity_lock:
+        _waiting_leases += 1
+    wait_started = time.perf_counter()
+    try:
+        _wait_for_warmup(deadline)
+        with span("driver.acquire"):
+            session_id = free_sessions.get(timeout=deadline.remaining())
+    except queue.Empty:
+        raise DeadlineExceededError("Timed out waiting for a browser to become free")
+    finally:
+        QUEUE_WAIT.observe(time.perf_counter() - wait_started)
+        with _activity_lock:
+            _waiting_leases -= 1
+
+    driver: Optional[webdriver.Chrome] = None
+    leased_at = time.perf_counter()
+    released_at = _released_at.pop(session_id, None)
+    if released_at is not None:
+        BROWSER_IDLE.inc(leased_at - released_at, session=session_id)
+    try:
+        deadline.check()
+        driver = get_or_create_driver(authentication, session_id)
+        if isinstance(driver, LinkedInChrome):
+            driver.deadline = deadline
+        yield driver
+        # Only reached when the work using the driver did not raise
+        _last_successful_lease = time.time()
+    finally:
+        if isinstance(driver, LinkedInChrome):
+            driver.deadline = None
+            save_network_archive(driver, session_id)
+        now = time.perf_counter()
+        # Launch and login of a new browser count as busy time
+        BROWSER_BUSY.inc(now - leased_at, session=session_id)
+        # The slot goes back under the lock close_idle_drivers holds while it
+        # takes the free slots and marks the leased ones, so it is always one
+        # or the other
+        with _activity_lock:
+            retire = session_id in _quit_on_release
+            _quit_on_release.discard(session_id)
+            if retire:
+                retired = active_drivers.pop(session_id, None)
+                _released_at.pop(session_id, None)
+            else:
+                if session_id in active_drivers:
+                    _released_at[session_id] = now
+                free_sessions.put(session_id)
+        if retire:
+            _quit_driver(session_id, retired)
+            free_sessions.put(session_id)
+
+
+def get_pool_status() -> Dict[str, Any]:
+    """
+    Describe the browser pool without touching the browsers.
+
+    Reads bookkeeping only, so it answers immediately even while every browser
+    is busy or being created.
+
+    Returns:
+        Dict[str, Any]: Pool size, started browsers, leased browsers, callers
+            waiting for a browser, whether the first browser is still starting
+            in the background, the last successful lease and the last login
+    """
+    size = get_pool_size()
+    warmup = _warmup
+    free_sessions = _free_sessions
+    free = free_sessions.qsize() if free_sessions is not None else size
+    with _activity_lock:
+        return {
+            "size": size,
+            "started": len(active_drivers),
+            "sessions": sorted(active_drivers),
+            "leased": size - free,
+            "waiting": _waiting_leases,
+            "warming_up": warmup is not None and not warmup.done(),
+            "last_successful_scrape_at": _last_successful_lease,
+            "last_login": dict(_last_login) or None,
+        }
+
+
+def _quit_driver(session_id: str, driver: Optional[webdriver.Chrome]) -> None:
+    """Quit the browser of a pool slot already removed from active_drivers."""
+    if driver is None:
+        return
+    try:
+        logger.info("Closing Chrome WebDriver session: %s", session_id)
+        driver.quit()
+    except Exception as e:
+        logger.warning("Error closing driver %s: %s", session_id, e)
+
+
+def close_idle_drivers() -> Dict[str, List[str]]:
+    """
+    Close the browsers of the pool without disturbing the ones in use.
+
+    Browsers not leased are quit right away. Leased ones keep running until the
+    tool call, crawl worker or scheduled run using them returns its lease, and
+    are quit then, so the next lease of that slot starts a fresh session.
+
+    Returns:
+        Dict[str, List[str]]: Session ids quit now ("closed") and on release
+            ("deferred")
+    """
+    free_sessions = _get_free_sessions()
+    taken: List[str] = []
+    # driver_lease returns slots under this lock: each started browser is either
+    # free and taken here, or leased and marked to quit on release
+    with _activity_lock:
+        while True:
+            try:
+                taken.append(free_sessions.get_nowait())
+            except queue.Empty:
+                break
+        closed = [session_id for session_id in taken if session_id in active_drivers]
+        retired = [active_drivers.pop(session_id) for session_id in closed]
+        for session_id in closed:
+            _released_at.pop(session_id, None)
+        deferred = sorted(active_drivers)
+        _quit_on_release.update(deferred)
+    try:
+        for session_id, driver in zip(closed, retired):
+            _quit_driver(session_id, driver)
+    finally:
+        for session_id in reversed(taken):
+            free_sessions.put(session_id)
+    return {"closed": closed, "deferred": deferred}
+
+
 def close_all_drivers() -> None:
     """Close all active drivers and clean up resources."""
     global active_drivers
 
-    for session_id, driver in active_drivers.items():
+    _shutting_down.set()
+    warmup = _warmup
+    if warmup is not None and not warmup.done():
+        # Otherwise its browser would start after the others were closed
+        logger.info("Waiting for the background driver warm-up to finish")
+        wait_for_futures([warmup], timeout=WARMUP_SHUTDOWN_WAIT)
+
+    # A warm-up still running may add its browser meanwhile
+    for session_id, driver in list(active_drivers.items()):
         try:
-            logger.info(f"Closing Chrome WebDriver session: {session_id}")
+            logger.info("Closing Chrome WebDriver session: %s", session_id)
             driver.quit()
         except Exception as e:
-            logger.warning(f"Error closing driver {session_id}: {e}")
+            logger.warning("Error closing driver %s: %s", session_id, e)
 
     active_drivers.clear()
+    _released_at.clear()
+    with _activity_lock:
+        _quit_on_release.clear()
     logger.info("All Chrome WebDriver sessions closed")
 
 
@@ -362,8 +992,7 @@ def get_active_driver() -> Optional[webdriver.Chrome]:
     Returns:
         Optional[webdriver.Chrome]: Active driver if available, None otherwise
     """
-    session_id = "default"
-    return active_drivers.get(session_id)
+    return active_drivers.get(DEFAULT_SESSION_ID)
 
 
 def capture_session_cookie(driver: webdriver.Chrome) -> Optional[str]:
@@ -383,5 +1012,5 @@ def capture_session_cookie(driver: webdriver.Chrome) -> Optional[str]:
             return f"li_at={cookie['value']}"
         return None
     except Exception as e:
-        logger.warning(f"Failed to capture session cookie: {e}")
+        logger.warning("Failed to capture session cookie: %s", e)
         return None
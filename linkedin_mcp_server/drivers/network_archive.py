@@ -0,0 +1,423 @@
+# linkedin_mcp_server/drivers/network_archive.py
+"""
+Recording and replay of the network traffic of browser sessions.
+
+In record mode every response the browser receives is paused through the CDP
+Fetch domain, its body read, and the exchange added to a HAR 1.2 archive. Each
+driver lease (one tool call, crawl or saved search run) is written to its own
+file, so the traffic behind a slow or failed call can be kept and replayed.
+
+In replay mode requests are paused before they are sent and answered from the
+archives with Fetch.fulfillRequest. Requests the archives hold no response for
+fail as if offline, so a replay never reaches the network and runs at full
+speed, and the same traffic can be replayed against every code change.
+
+Each driver gets its own DevTools connection, served by a background thread,
+because ChromeDriver does not forward CDP events. The values of Cookie,
+Set-Cookie, Authorization and Csrf-Token headers are redacted and archives are
+created readable by their owner only, but page bodies hold the scraped
+profiles: keep archives as private as the session cookie.
+"""
+
+import base64
+import glob
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from selenium import webdriver
+
+from linkedin_mcp_server.drivers.cdp import connect_to_page
+
+logger = logging.getLogger(__name__)
+
+# Headers that carry credentials; their values are never written to archives
+_SECRET_HEADERS = frozenset({"cookie", "set-cookie", "authorization", "csrf-token"})
+
+# Value archived in place of a secret header's
+REDACTED = "[redacted]"
+
+# Response headers that no longer describe a replayed body, which is stored decoded
+_STALE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+# Seconds to wait for the browser to confirm interception is on
+_ENABLE_TIMEOUT = 10.0
+
+
+def _header_list(headers: Any) -> List[Dict[str, str]]:
+    """HAR headers from a CDP header object or list, with credentials redacted."""
+    if isinstance(headers, dict):
+        headers = [{"name": k, "value": v} for k, v in headers.items()]
+    return [
+        {
+            "name": h["name"],
+            "value": REDACTED
+            if h["name"].lower() in _SECRET_HEADERS
+            else str(h["value"]),
+        }
+        for h in headers or []
+    ]
+
+
+def _header(headers: List[Dict[str, str]], name: str) -> str:
+    for header in headers:
+        if header["name"].lower() == name:
+            return header["value"]
+    return ""
+
+
+def _replay_key(method: str, url: str) -> Tuple[str, str]:
+    return method.upper(), url.split("#", 1)[0]
+
+
+class HarArchive:
+    """
+    Responses of one or more HAR files, looked up by method and URL.
+
+    Repeated requests for the same URL get the recorded responses in recorded
+    order, then the last one again. A URL never recorded is matched without
+    its query string, which varies in tracking parameters.
+    """
+
+    def __init__(self, entries: List[Dict[str, Any]]) -> None:
+        self._lock = threading.Lock()
+        self._exact: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._by_path: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._served: Dict[Tuple[str, Tuple[str, str]], int] = {}
+        for entry in entries:
+            method, url = _replay_key(
+                entry["request"]["method"], entry["request"]["url"]
+            )
+            self._exact.setdefault((method, url), []).append(entry)
+            self._by_path.setdefault((method, url.split("?", 1)[0]), []).append(entry)
+
+    @classmethod
+    def load(cls, path: str) -> "HarArchive":
+        """
+        Load a HAR file, or every .har file in a directory.
+
+        Raises:
+            FileNotFoundError: If the path holds no HAR file
+        """
+        paths = (
+            sorted(glob.glob(os.path.join(path, "*.har")))
+            if os.path.isdir(path)
+            else [path]
+        )
+        if not paths or not os.path.exists(paths[0]):
+            raise FileNotFoundError(f"No HAR archive at {path}")
+        entries: List[Dict[str, Any]] = []
+        for har_path in paths:
+            with open(har_path, encoding="utf-8") as f:
+                entries.extend(json.load(f)["log"]["entries"])
+        logger.info(
+            "Replaying %d responses from %d archive(s) at %s",
+            len(entries),
+            len(paths),
+            path,
+        )
+        return cls(entries)
+
+    def lookup(self, method: str, url: str) -> Optional[Dict[str, Any]]:
+        """Next recorded response to a request, None if none was recorded."""
+        key = _replay_key(method, url)
+        with self._lock:
+            for kind, index, lookup_key in (
+                ("exact", self._exact, key),
+                ("path", self._by_path, (key[0], key[1].split("?", 1)[0])),
+            ):
+                entries = index.get(lookup_key)
+                if entries:
+                    served = self._served.get((kind, lookup_key), 0)
+                    self._served[(kind, lookup_key)] = served + 1
+                    return entries[min(served, len(entries) - 1)]
+        return None
+
+
+_replay_archive: Optional[HarArchive] = None
+_replay_archive_lock = threading.Lock()
+
+
+def get_replay_archive(path: str) -> HarArchive:
+    """Get the archive replayed to every browser, loading it on first use."""
+    global _replay_archive
+    with _replay_archive_lock:
+        if _replay_archive is None:
+            _replay_archive = HarArchive.load(path)
+        return _replay_archive
+
+
+class NetworkInterceptor:
+    """
+    Records or replays the network traffic of one driver's page.
+
+    Args:
+        driver: Chrome WebDriver instance (its DevTools endpoint must be known)
+        record_dir: Directory archives are written to (record mode)
+        replay: Archive requests are answered from (replay mode)
+    """
+
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        record_dir: Optional[str] = None,
+        replay: Optional[HarArchive] = None,
+    ) -> None:
+        self.record_dir = record_dir
+        self.replay = replay
+        self.replayed = 0
+        self.missed = 0
+        self._ws = connect_to_page(driver)
+        self._ids = itertools.count(1)
+        self._enabled = threading.Event()
+        self._enable_id = next(self._ids)
+        self._lock = threading.Lock()
+        self._entries: List[Dict[str, Any]] = []
+        self._started: Dict[str, float] = {}  # Request start times by request id
+        self._bodies: Dict[
+            int, Dict[str, Any]
+        ] = {}  # Paused responses by body request id
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="network-archive", daemon=True
+        )
+
+    def start(self) -> "NetworkInterceptor":
+        """
+        Turn interception on; returns once the browser confirmed it.
+
+        Raises:
+            RuntimeError: If the browser did not confirm in time
+        """
+        if self.replay is not None:
+            patterns = [{"urlPattern": "*", "requestStage": "Request"}]
+        else:
+            patterns = [
+                {"urlPattern": "*", "requestStage": "Request"},
+                {"urlPattern": "*", "requestStage": "Response"},
+            ]
+        self._thread.start()
+        self._send("Fetch.enable", {"patterns": patterns}, self._enable_id)
+        if not self._enabled.wait(_ENABLE_TIMEOUT):
+            self.close()
+            raise RuntimeError("Browser did not enable request interception")
+        logger.info(
+            "Network %s on", "replay" if self.replay is not None else "recording"
+        )
+        return self
+
+    def close(self) -> None:
+        """Stop intercepting; the browser drops the interception with the connection."""
+        if self.replay is not None:
+            logger.info(
+                "Replayed %d responses, %d requests were not in the archive",
+                self.replayed,
+                self.missed,
+            )
+        self._closed = True
+        try:
+            self._ws.shutdown()
+        except Exception:
+            pass
+
+    def _send(
+        self, method: str, params: Dict[str, Any], message_id: Optional[int] = None
+    ) -> int:
+        message_id = message_id or next(self._ids)
+        self._ws.send(
+            json.dumps({"id": message_id, "method": method, "params": params})
+        )
+        return message_id
+
+    def _run(self) -> None:
+        while not self._closed:
+            try:
+                message = json.loads(self._ws.recv())
+            except Exception as e:
+                if not self._closed:
+                    logger.warning("Network archive connection lost: %s", e)
+                return
+            try:
+                if "id" in message:
+                    self._on_reply(message)
+                elif message.get("method") == "Fetch.requestPaused":
+                    self._on_paused(message["params"])
+            except Exception as e:
+                # The browser waits for every paused request; never leave one hanging
+                logger.warning(
+                    "Network archive failed on %s: %s", message.get("method"), e
+                )
+
+    def _on_reply(self, message: Dict[str, Any]) -> None:
+        if message["id"] == self._enable_id:
+            if "error" in message:
+                logger.warning("Fetch.enable failed: %s", message["error"])
+            else:
+                self._enabled.set()
+            return
+        paused = self._bodies.pop(message["id"], None)
+        if paused is None:
+            return  # Reply to a continue or fulfill
+        # Redirects and failed loads have no body
+        result = message.get("result", {})
+        self._record(paused, result.get("body", ""), result.get("base64Encoded", False))
+        self._send("Fetch.continueRequest", {"requestId": paused["requestId"]})
+
+    def _on_paused(self, params: Dict[str, Any]) -> None:
+        request_id = params["requestId"]
+        at_response = "responseStatusCode" in params or "responseErrorReason" in params
+        if self.replay is not None:
+            self._fulfill(params)
+        elif not at_response:
+            self._started[request_id] = time.time()
+            self._send("Fetch.continueRequest", {"requestId": request_id})
+        elif "responseErrorReason" in params:
+            self._started.pop(request_id, None)
+            self._send("Fetch.continueRequest", {"requestId": request_id})
+        else:
+            body_id = self._send("Fetch.getResponseBody", {"requestId": request_id})
+            self._bodies[body_id] = params
+
+    def _fulfill(self, params: Dict[str, Any]) -> None:
+        assert self.replay is not None
+        request = params["request"]
+        entry = self.replay.lookup(request["method"], request["url"])
+        if entry is None:
+            self.missed += 1
+            logger.debug("Not in archive: %s %s", request["method"], request["url"])
+            self._send(
+                "Fetch.failRequest",
+                {
+                    "requestId": params["requestId"],
+                    "errorReason": "InternetDisconnected",
+                },
+            )
+            return
+        self.replayed += 1
+        response = entry["response"]
+        content = response.get("content", {})
+        body = content.get("text", "")
+        if content.get("encoding") != "base64":
+            body = base64.b64encode(body.encode("utf-8")).decode("ascii")
+        fulfill: Dict[str, Any] = {
+            "requestId": params["requestId"],
+            "responseCode": response["status"],
+            "responseHeaders": [
+                h
+                for h in response.get("headers", [])
+                # Redacted cookies would replace the session's real ones
+                if h["name"].lower() not in _STALE_HEADERS | _SECRET_HEADERS
+            ],
+            "body": body,
+        }
+        if response.get("statusText"):
+            fulfill["responsePhrase"] = response["statusText"]
+        self._send("Fetch.fulfillRequest", fulfill)
+
+    def _record(self, paused: Dict[str, Any], body: str, base64_encoded: bool) -> None:
+        """Add a paused response and its body to the archive."""
+        request = paused["request"]
+        now = time.time()
+        started = self._started.pop(paused["requestId"], now)
+        if not base64_encoded:
+            body = base64.b64encode(body.encode("utf-8")).decode("ascii")
+        size = len(body) * 3 // 4 - body[-2:].count("=")
+        request_headers = _header_list(request.get("headers"))
+        response_headers = _header_list(paused.get("responseHeaders"))
+        har_request: Dict[str, Any] = {
+            "method": request["method"],
+            "url": request["url"],
+            "httpVersion": "HTTP/1.1",
+            "headers": request_headers,
+            "queryString": [
+                {"name": k, "value": v}
+                for k, v in parse_qsl(urlsplit(request["url"]).query)
+            ],
+            "cookies": [],
+            "headersSize": -1,
+            "bodySize": len(request.get("postData", "")),
+        }
+        if "postData" in request:
+            har_request["postData"] = {
+                "mimeType": _header(request_headers, "content-type"),
+                "text": request["postData"],
+            }
+        entry = {
+            "startedDateTime": datetime.fromtimestamp(
+                started, timezone.utc
+            ).isoformat(),
+            "time": round((now - started) * 1000, 1),
+            "request": har_request,
+            "response": {
+                "status": paused["responseStatusCode"],
+                "statusText": paused.get("responseStatusText", ""),
+                "httpVersion": "HTTP/1.1",
+                "headers": response_headers,
+                "cookies": [],
+                "content": {
+                    "size": size,
+                    "mimeType": _header(response_headers, "content-type"),
+                    "text": body,
+                    "encoding": "base64",
+                },
+                "redirectURL": _header(response_headers, "location"),
+                "headersSize": -1,
+                "bodySize": size,
+            },
+            "cache": {},
+            "timings": {
+                "send": 0,
+                "wait": round((now - started) * 1000, 1),
+                "receive": 0,
+            },
+            "_resourceType": paused.get("resourceType", ""),
+        }
+        with self._lock:
+            self._entries.append(entry)
+
+    def save(self, label: str) -> Optional[str]:
+        """
+        Write the responses recorded since the last save to a new archive.
+
+        Args:
+            label: Part of the file name, e.g. the browser's pool slot
+
+        Returns:
+            Optional[str]: Path of the archive, None if nothing was recorded
+        """
+        from linkedin_mcp_server.drivers.chrome import page_type
+
+        with self._lock:
+            entries, self._entries = self._entries, []
+        if not entries or not self.record_dir:
+            return None
+
+        first_page = next(
+            (e["request"]["url"] for e in entries if e["_resourceType"] == "Document"),
+            entries[0]["request"]["url"],
+        )
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        path = os.path.join(
+            self.record_dir, f"{stamp}-{label}-{page_type(first_page)}.har"
+        )
+        har = {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "linkedin-mcp-server", "version": "1.0"},
+                "pages": [],
+                "entries": entries,
+            }
+        }
+        os.makedirs(self.record_dir, mode=0o700, exist_ok=True)
+        # Bodies hold scraped profiles; readable by the server's user only
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(har, f)
+        logger.info("Recorded %d responses to %s", len(entries), path)
+        return path
@@ -10,19 +10,15 @@ Eliminates code duplication while ensuring user-friendly error messages.
 import logging
 from typing import Any, Dict, List
 
-from linkedin_scraper.exceptions import (
-    CaptchaRequiredError,
-    InvalidCredentialsError,
-    LoginTimeoutError,
-    RateLimitError,
-    SecurityChallengeError,
-    TwoFactorAuthError,
-)
-
 from linkedin_mcp_server.exceptions import (
+    CrawlInProgressError,
     CredentialsNotFoundError,
+    DeadlineExceededError,
+    KeyringTimeoutError,
     LinkedInMCPError,
+    PoolOperationError,
 )
+from linkedin_mcp_server.metrics import note_tool_error
 
 
 def handle_tool_error(exception: Exception, context: str = "") -> Dict[str, Any]:
@@ -36,7 +32,9 @@ def handle_tool_error(exception: Exception, context: str = "") -> Dict[str, Any]
     Returns:
         Structured error response dictionary
     """
-    return convert_exception_to_response(exception, context)
+    response = convert_exception_to_response(exception, context)
+    note_tool_error(response.get("error"))
+    return response
 
 
 def handle_tool_error_list(
@@ -52,7 +50,9 @@ def handle_tool_error_list(
     Returns:
         List containing structured error response dictionary
     """
-    return convert_exception_to_list_response(exception, context)
+    response = convert_exception_to_list_response(exception, context)
+    note_tool_error(response[0].get("error"))
+    return response
 
 
 def convert_exception_to_response(
@@ -68,7 +68,28 @@ def convert_exception_to_response(
     Returns:
         Structured error response dictionary
     """
-    if isinstance(exception, CredentialsNotFoundError):
+    from linkedin_scraper.exceptions import (
+        CaptchaRequiredError,
+        InvalidCredentialsError,
+        LoginTimeoutError,
+        RateLimitError,
+        SecurityChallengeError,
+        TwoFactorAuthError,
+    )
+
+    if isinstance(exception, PoolOperationError):
+        # Already converted by the browser-pool service
+        return dict(exception.response)
+
+    elif isinstance(exception, KeyringTimeoutError):
+        return {
+            "error": "keyring_timeout",
+            "message": str(exception),
+            "resolution": "Unlock the system keyring, or provide the LinkedIn cookie "
+            "via LINKEDIN_COOKIE environment variable",
+        }
+
+    elif isinstance(exception, CredentialsNotFoundError):
         return {
             "error": "authentication_not_found",
             "message": str(exception),
@@ -119,6 +140,21 @@ def convert_exception_to_response(
             "resolution": "Check network connection and try again",
         }
 
+    elif isinstance(exception, DeadlineExceededError):
+        return {
+            "error": "deadline_exceeded",
+            "message": str(exception),
+            "resolution": "Retry with a larger deadline_seconds value",
+        }
+
+    elif isinstance(exception, CrawlInProgressError):
+        return {
+            "error": "crawl_in_progress",
+            "message": str(exception),
+            "resolution": "Wait for the running crawl to finish, then call again "
+            "to continue from its checkpoint",
+        }
+
     elif isinstance(exception, LinkedInMCPError):
         return {"error": "linkedin_error", "message": str(exception)}
 
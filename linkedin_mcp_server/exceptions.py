@@ -7,6 +7,8 @@ authentication failures, driver initialization issues, and MCP client reporting.
 Provides structured error handling for better debugging and user experience.
 """
 
+from typing import Any, Dict
+
 
 class LinkedInMCPError(Exception):
     """Base exception for LinkedIn MCP Server."""
@@ -20,7 +22,43 @@ class CredentialsNotFoundError(LinkedInMCPError):
     pass
 
 
+class KeyringTimeoutError(CredentialsNotFoundError):
+    """The system keyring did not answer the cookie lookup in time."""
+
+    pass
+
+
 class DriverInitializationError(LinkedInMCPError):
     """Failed to initialize Chrome WebDriver."""
 
     pass
+
+
+class DeadlineExceededError(LinkedInMCPError):
+    """Tool call ran past its deadline or was cancelled by the client."""
+
+    pass
+
+
+class CrawlInProgressError(LinkedInMCPError):
+    """Another call is already running the crawl of the same checkpoint."""
+
+    pass
+
+
+class BrowserPoolUnavailableError(LinkedInMCPError):
+    """The browser-pool service of a multi-worker server cannot be reached."""
+
+    pass
+
+
+class PoolOperationError(LinkedInMCPError):
+    """An operation failed in the browser-pool service."""
+
+    def __init__(self, response: Dict[str, Any]) -> None:
+        """
+        Args:
+            response: Structured error response produced by the service
+        """
+        super().__init__(response.get("message", "Operation failed"))
+        self.response = response
@@ -0,0 +1,217 @@
+# linkedin_mcp_server/execution.py
+"""
+Execution of blocking scraper work for MCP tools under per-call deadlines.
+
+Selenium and linkedin_scraper are synchronous, so tool bodies hand their scraping
+work to a worker thread that holds a lease on the shared driver. The event loop
+stays free while the browser works, and the tool call can be abandoned when the
+deadline passes or the client disconnects: the in-progress page load is stopped
+through DevTools, the driver rejects further commands, and whatever the scraper
+extracted up to that point is returned as a partial result.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, TypeVar
+
+from fastmcp import Context
+
+from linkedin_mcp_server.deadline import Deadline
+from linkedin_mcp_server.exceptions import DeadlineExceededError
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds a call waits for its worker to stop after the deadline, before the
+# partial result is built; the driver rejects commands by then, so it is quick.
+# A worker still running after that gets no partial result.
+WORKER_SETTLE_TIMEOUT = 5.0
+
+
+class _Call:
+    """Bookkeeping shared between a tool coroutine and its worker thread."""
+
+    def __init__(self, context: str, deadline: Deadline) -> None:
+        self.context = context
+        self.deadline = deadline
+        self.driver: Optional["webdriver.Chrome"] = None
+        self.started = time.perf_counter()
+        # Page the call ended on, captured for the flight recorder if it went wrong
+        self.page: Optional[Dict[str, Any]] = None
+
+
+def _run_with_lease(call: _Call, work: Callable[["webdriver.Chrome"], T]) -> T:
+    """Worker thread body: lease the driver and run the scraper work."""
+    from linkedin_mcp_server.authentication import ensure_authentication
+    from linkedin_mcp_server.drivers.chrome import driver_lease
+
+    authentication = ensure_authentication()
+    with driver_lease(authentication, call.deadline) as driver:
+        call.driver = driver
+        failed = True
+        try:
+            result = work(driver)
+            failed = False
+            return result
+        finally:
+            if failed or _is_slow(call):
+                _capture_page(call)
+            call.driver = None
+
+
+def _is_slow(call: _Call) -> bool:
+    from linkedin_mcp_server.flight_recorder import is_slow
+
+    return is_slow(time.perf_counter() - call.started)
+
+
+def _capture_page(call: _Call) -> None:
+    """Remember the page of a call that failed, ran late or was slow."""
+    from linkedin_mcp_server.flight_recorder import capture_page
+
+    driver = call.driver
+    if driver is not None and call.page is None:
+        call.page = capture_page(driver)
+
+
+def _interrupt(call: _Call) -> None:
+    """Expire the call's deadline and stop the page the browser is loading."""
+    from linkedin_mcp_server.drivers.cdp import stop_page_load
+
+    call.deadline.cancel()
+    driver = call.driver
+    if driver is not None:
+        stop_page_load(driver)
+
+
+def progress_reporter(
+    ctx: Optional[Context],
+) -> Callable[[float, Optional[float], Optional[str]], None]:
+    """
+    Build a callback that sends MCP progress notifications from a worker thread.
+
+    Must be called on the event loop; the returned callback may be called from
+    scraper work running under run_scraper.
+
+    Args:
+        ctx: FastMCP context of the tool call, None to discard progress
+
+    Returns:
+        Callable taking progress, total and message
+    """
+    loop = asyncio.get_running_loop()
+
+    def report(
+        progress: float, total: Optional[float] = None, message: Optional[str] = None
+    ) -> None:
+        if ctx is not None:
+            asyncio.run_coroutine_threadsafe(
+                ctx.report_progress(progress, total, message), loop
+            )
+
+    return report
+
+
+def mark_partial(result: Any, reason: str) -> Any:
+    """
+    Flag a dictionary result as partial.
+
+    Args:
+        result: Result assembled from the data extracted so far
+        reason: Why the call stopped early
+
+    Returns:
+        The result, with "partial" and "partial_reason" keys if it is a dict
+    """
+    if isinstance(result, dict):
+        result["partial"] = True
+        result["partial_reason"] = reason
+    return result
+
+
+async def run_scraper(
+    context: str,
+    work: Callable[["webdriver.Chrome"], T],
+    deadline: Optional[Deadline] = None,
+    partial: Optional[Callable[[], Optional[T]]] = None,
+) -> T:
+    """
+    Run blocking scraper work on a worker thread, bounded by a deadline.
+
+    Args:
+        context: Name of the tool, used for logging
+        work: Function receiving the leased driver and returning the tool result
+        deadline: Deadline of the call, None for no limit
+        partial: Function building a result from the data extracted so far,
+            used when the deadline passes before work completes
+
+    Returns:
+        The result of work, or the partial result if the deadline passed
+
+    Raises:
+        DeadlineExceededError: If the deadline passed and no partial result exists,
+            or the worker did not stop within WORKER_SETTLE_TIMEOUT
+        asyncio.CancelledError: If the client abandoned the call
+    """
+    from linkedin_mcp_server.flight_recorder import note_page
+
+    call = _Call(context, deadline or Deadline())
+    loop = asyncio.get_running_loop()
+    # Carry the request context into the worker so it can report progress
+    request_context = contextvars.copy_context()
+    future = loop.run_in_executor(
+        None, request_context.run, _run_with_lease, call, work
+    )
+    # The worker may outlive an abandoned call; don't leave its error unretrieved
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    try:
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(future), timeout=call.deadline.remaining()
+            )
+        except asyncio.TimeoutError:
+            logger.info("%s reached its deadline, stopping browser", context)
+            await loop.run_in_executor(None, _interrupt, call)
+            # Let the worker stop mutating the state partial reads
+            await asyncio.wait([future], timeout=WORKER_SETTLE_TIMEOUT)
+            if not future.done():
+                # The worker still holds the driver and the state partial would
+                # read; neither can be touched safely
+                logger.warning(
+                    "%s worker still running %.0fs after its deadline",
+                    context,
+                    WORKER_SETTLE_TIMEOUT,
+                )
+                raise DeadlineExceededError(
+                    f"{context} did not finish before its deadline and its "
+                    "worker did not stop"
+                )
+            elif not future.cancelled() and future.exception() is None:
+                # Finished just after the deadline; the full result is better
+                return future.result()
+        except asyncio.CancelledError:
+            # Client went away: free the browser without waiting for the scrape
+            logger.info("%s was cancelled, stopping browser", context)
+            loop.run_in_executor(None, _interrupt, call)
+            raise
+        except Exception:
+            # Running out of time surfaces as driver errors inside the scraper
+            if not call.deadline.expired():
+                raise
+            logger.info("%s failed after its deadline passed", context)
+    finally:
+        note_page(call.page)
+
+    result = partial() if partial else None
+    if result is None:
+        raise DeadlineExceededError(
+            f"{context} did not finish before its deadline and has no partial result"
+        )
+    return mark_partial(result, "deadline_exceeded")
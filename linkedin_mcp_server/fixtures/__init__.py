@@ -0,0 +1,11 @@
+# linkedin_mcp_server/fixtures/__init__.py
+"""
+Local LinkedIn stand-in with fixture pages for offline, repeatable runs.
+
+Start it with ``python -m linkedin_mcp_server.fixtures`` (or FixtureServer from
+a benchmark) and run the MCP server with --linkedin-base-url pointing at it.
+"""
+
+from linkedin_mcp_server.fixtures.server import FixtureServer, FixtureSettings
+
+__all__ = ["FixtureServer", "FixtureSettings"]
@@ -0,0 +1,6 @@
+# linkedin_mcp_server/fixtures/__main__.py
+"""Run the LinkedIn stand-in: python -m linkedin_mcp_server.fixtures."""
+
+from linkedin_mcp_server.fixtures.server import main
+
+main()
@@ -0,0 +1,406 @@
+# linkedin_mcp_server/fixtures/pages.py
+"""
+Fixture pages of the LinkedIn stand-in server.
+
+The pages follow the markup of recorded LinkedIn pages, cut down to the
+elements linkedin_scraper and this server's own scrapers read: top card and
+details lists of profiles, the company page and its About tab, people search
+results, job postings and job lists. Their content is generated from the
+profile name, company name, job id or search keywords, so every URL always
+renders the same page and any username or company name has a page.
+"""
+
+import random
+import zlib
+from html import escape
+from typing import Any, Dict, List
+from urllib.parse import quote
+
+# Employees listed per people search page
+PEOPLE_PER_PAGE = 10
+
+# Jobs per job search page, as on LinkedIn
+JOBS_PER_PAGE = 25
+
+_FIRST_NAMES = (
+    "Alex Sam Jordan Taylor Morgan Casey Riley Jamie Avery Quinn Robin Drew "
+    "Charlie Emerson Harper Kai Logan Parker Reese Rowan Sage Skyler Dana Jesse"
+).split()
+_LAST_NAMES = (
+    "Smith Johnson Lee Brown Garcia Miller Davis Martinez Lopez Wilson Anderson "
+    "Thomas Moore Jackson Martin Thompson White Harris Clark Lewis Walker Young"
+).split()
+_TITLES = (
+    "Software Engineer",
+    "Senior Software Engineer",
+    "Staff Engineer",
+    "Data Scientist",
+    "Product Manager",
+    "Engineering Manager",
+    "Site Reliability Engineer",
+    "Machine Learning Engineer",
+    "Frontend Developer",
+    "Backend Developer",
+)
+_COMPANY_WORDS = (
+    "acme globex initech umbrella hooli vandelay stark wayne wonka soylent "
+    "cyberdyne tyrell aperture monarch oscorp gringotts"
+).split()
+_INDUSTRIES = (
+    "Software Development",
+    "IT Services and IT Consulting",
+    "Financial Services",
+    "Internet Marketplace Platforms",
+    "Research Services",
+)
+_SIZES = ("11-50", "51-200", "201-500", "1,001-5,000", "10,001+")
+_CITIES = (
+    "San Francisco, California, United States",
+    "New York, New York, United States",
+    "London, England, United Kingdom",
+    "Berlin, Berlin, Germany",
+    "Toronto, Ontario, Canada",
+    "Remote",
+)
+_SCHOOLS = (
+    "State University",
+    "Institute of Technology",
+    "City College",
+    "Polytechnic University",
+)
+_DEGREES = (
+    "Bachelor of Science - BS, Computer Science",
+    "Master of Science - MS, Computer Science",
+    "Bachelor of Engineering - BE, Electrical Engineering",
+)
+_MONTHS = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
+_WORDS = (
+    "build scalable services with a small team that owns the platform end to "
+    "end design review deploy and operate distributed systems for customers "
+    "across the world python go kubernetes data pipelines latency reliability"
+).split()
+
+
+def _rng(*key: Any) -> random.Random:
+    """Random generator seeded by the page key, the same for every request."""
+    return random.Random(zlib.crc32("/".join(map(str, key)).encode("utf-8")))
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _display_name(slug: str) -> str:
+    return " ".join(part.capitalize() for part in slug.split("-") if part.isalpha())
+
+
+def company_slug(rng: random.Random) -> str:
+    return f"{rng.choice(_COMPANY_WORDS)}-{rng.choice(_COMPANY_WORDS)}"
+
+
+def person_slug(rng: random.Random) -> str:
+    first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+    return f"{first.lower()}-{last.lower()}-{rng.randrange(16**6):06x}"
+
+
+def layout(title: str, body: str, signed_in: bool = True) -> str:
+    """Wrap a page body in the document, with the global navigation when signed in."""
+    nav = (
+        '<header class="global-nav"><nav><ul>'
+        '<li><a class="global-nav__primary-link" href="/feed/">Home</a></li>'
+        '<li><a class="global-nav__primary-link" href="/mynetwork/">My Network</a></li>'
+        '<li><a class="global-nav__primary-link" href="/jobs/">Jobs</a></li>'
+        "</ul></nav></header>"
+        if signed_in
+        else ""
+    )
+    return (
+        "<!DOCTYPE html>\n"
+        f'<html lang="en"><head><meta charset="utf-8"><title>{escape(title)}</title></head>'
+        f"<body>{nav}{body}</body></html>\n"
+    )
+
+
+def profile(slug: str) -> str:
+    """Profile top card and About section of /in/<slug>/."""
+    rng = _rng("in", slug)
+    name = _display_name(slug) or slug
+    picture_title = name + (" #OPEN_TO_WORK" if rng.random() < 0.3 else "")
+    return layout(
+        f"{name} | LinkedIn",
+        "<main>"
+        '<section class="artdeco-card pv-top-card">'
+        f'<div class="pv-top-card-profile-picture"><img title="{escape(picture_title)}" alt=""></div>'
+        '<div class="mt2 relative">'
+        f"<div><h1>{escape(name)}</h1>"
+        f"<div>{escape(rng.choice(_TITLES))}</div></div>"
+        f'<div><span class="text-body-small inline t-black--light break-words">{escape(rng.choice(_CITIES))}</span></div>'
+        "</div></section>"
+        '<section class="artdeco-card"><div id="about"></div>'
+        f'<div class="display-flex"><span>{escape(_text(rng, 40))}</span></div>'
+        "</section></main>",
+    )
+
+
+def _entity(href: str, lines: List[str], description: str) -> str:
+    """One item of a profile details list."""
+    spans = "".join(f"<div><span>{escape(line)}</span></div>" for line in lines)
+    return (
+        '<li class="pvs-list__paged-list-item">'
+        '<div data-view-name="profile-component-entity">'
+        f'<div><a href="{escape(href)}"><img alt=""></a></div>'
+        f"<div><div><div>{spans}</div></div>"
+        f"<div><span>{escape(description)}</span></div></div>"
+        "</div></li>"
+    )
+
+
+def _details(title: str, items: List[str]) -> str:
+    return layout(
+        title,
+        f'<main><section><div class="pvs-list__container"><ul>{"".join(items)}</ul></div></section></main>',
+    )
+
+
+def experience(username: str) -> str:
+    """Experience list of /in/<username>/details/experience/."""
+    rng = _rng("in", username, "experience")
+    items = []
+    year = 2024
+    for index in range(rng.randint(2, 4)):
+        length = rng.randint(1, 4)
+        start = year - length
+        month = rng.choice(_MONTHS)
+        end = "Present" if index == 0 else f"{month} {year}"
+        slug = company_slug(rng)
+        items.append(
+            _entity(
+                f"/company/{slug}/",
+                [
+                    rng.choice(_TITLES),
+                    f"{_display_name(slug)} · Full-time",
+                    f"{month} {start} - {end} · {length} yrs",
+                    rng.choice(_CITIES),
+                ],
+                _text(rng, 20),
+            )
+        )
+        year = start
+    return _details("Experience | LinkedIn", items)
+
+
+def education(slug: str) -> str:
+    """Education list of /in/<slug>/details/education/."""
+    rng = _rng("in", slug, "education")
+    start = rng.randint(2005, 2015)
+    school = f"{rng.choice(_COMPANY_WORDS).capitalize()} {rng.choice(_SCHOOLS)}"
+    item = _entity(
+        f"/company/{quote(school.lower().replace(' ', '-'))}/",
+        [school, rng.choice(_DEGREES), f"{start} - {start + 4}"],
+        _text(rng, 12),
+    )
+    return _details("Education | LinkedIn", [item])
+
+
+def _headcount(company_id: str) -> int:
+    return _rng("people", company_id).randint(15, 120)
+
+
+def _company(slug: str) -> Dict[str, Any]:
+    company_id = str(1000 + zlib.crc32(slug.encode("utf-8")) % 9000000)
+    return {
+        "rng": _rng("company", slug),
+        "id": company_id,
+        "name": _display_name(slug) or slug,
+        "employees": _headcount(company_id),
+    }
+
+
+def company(slug: str) -> str:
+    """Company page /company/<slug>/ with its navigation and employee link."""
+    info = _company(slug)
+    search = f"/search/results/people/?currentCompany=%5B%22{info['id']}%22%5D"
+    return layout(
+        f"{info['name']} | LinkedIn",
+        '<main><div dir="ltr">'
+        f'<h1 class="org-top-card-summary__title">{escape(info["name"])}</h1>'
+        '<nav><ul class="org-page-navigation__items">'
+        f'<li><a href="/company/{slug}/">Home</a></li>'
+        f'<li><a data-control-name="page_member_main_nav_about_tab" href="/company/{slug}/about/">About</a></li>'
+        f'<li><a href="/company/{slug}/jobs/">Jobs</a></li>'
+        "</ul></nav>"
+        f'<a href="{search}">See all {info["employees"]} employees on LinkedIn</a>'
+        "</div></main>",
+    )
+
+
+def company_about(slug: str) -> str:
+    """About tab /company/<slug>/about/ with the overview and its details."""
+    info = _company(slug)
+    rng = info["rng"]
+    details = [
+        ("Website", f"https://www.{slug}.example"),
+        ("Industry", rng.choice(_INDUSTRIES)),
+        ("Company size", f"{rng.choice(_SIZES)} employees"),
+        ("Headquarters", rng.choice(_CITIES)),
+        ("Type", "Privately Held"),
+        ("Founded", str(rng.randint(1970, 2020))),
+        ("Specialties", ", ".join(rng.sample(_WORDS, 4))),
+    ]
+    rows = "".join(
+        f"<dt>{label}</dt><dd>{escape(value)}</dd>" for label, value in details
+    )
+    return layout(
+        f"{info['name']}: About | LinkedIn",
+        '<main><div dir="ltr">'
+        f'<section class="org-top-card"><h1 class="org-top-card-summary__title">{escape(info["name"])}</h1></section>'
+        '<section class="org-about"><div class="mt1">'
+        f"<span>See all {info['employees']} employees on LinkedIn</span></div></section>"
+        '<section class="artdeco-card org-page-details-module__card-spacing org-about-module__margin-bottom">'
+        f"<h2>Overview</h2><p>{escape(_text(rng, 30))}</p><dl>{rows}</dl></section>"
+        "</div></main>",
+    )
+
+
+def people_search(company_id: str, page: int) -> str:
+    """One page of /search/results/people/ for a company's employees."""
+    rng = _rng("people", company_id, "employees")
+    total = _headcount(company_id)
+    pages = (total + PEOPLE_PER_PAGE - 1) // PEOPLE_PER_PAGE
+    people = [(person_slug(rng), rng.choice(_TITLES)) for _ in range(total)]
+    start = (page - 1) * PEOPLE_PER_PAGE
+    items = "".join(
+        '<li class="reusable-search__result-container"><div class="entity-result">'
+        f'<a href="/in/{slug}/?miniProfileUrn=urn"><span aria-hidden="true">{escape(_display_name(slug))}</span>'
+        '<span class="visually-hidden">View profile</span></a>'
+        f'<div class="entity-result__primary-subtitle">{escape(title)}</div>'
+        "</div></li>"
+        for slug, title in people[start : start + PEOPLE_PER_PAGE]
+    )
+    disabled = "" if page < pages else " disabled"
+    return layout(
+        "People search | LinkedIn",
+        f'<main><ul class="reusable-search__entity-result-list">{items}</ul>'
+        f'<button aria-label="Next"{disabled}>Next</button></main>',
+    )
+
+
+def job(job_id: str) -> str:
+    """Job posting /jobs/view/<id>/."""
+    rng = _rng("job", job_id)
+    # Drawn in the order of the job cards, so card and posting agree
+    slug, title, city = company_slug(rng), rng.choice(_TITLES), rng.choice(_CITIES)
+    low = rng.randint(80, 160)
+    return layout(
+        f"{title} | LinkedIn",
+        "<main>"
+        f'<h1 class="job-details-jobs-unified-top-card__job-title">{escape(title)}</h1>'
+        '<div class="job-details-jobs-unified-top-card__company-name">'
+        f'<a href="/company/{slug}/life/">{escape(_display_name(slug))}</a></div>'
+        '<div class="job-details-jobs-unified-top-card__primary-description-container">'
+        f"<span>{escape(city)}</span><span>·</span>"
+        f"<span>{rng.choice(('On-site', 'Hybrid', 'Remote'))}</span>"
+        f"<span>{rng.randint(1, 27)} days ago</span></div>"
+        f'<span class="jobs-unified-top-card__applicant-count">{rng.randint(1, 200)} applicants</span>'
+        '<div class="jobs-description"><article>'
+        + "".join(f"<p>{escape(_text(rng, 30))}</p>" for _ in range(4))
+        + '</article><button type="button">See more</button></div>'
+        '<div class="jobs-unified-description__salary-main-rail-card">'
+        f"${low}K/yr - ${low + rng.randint(20, 80)}K/yr</div>"
+        "</main>",
+    )
+
+
+def _job_cards(key: str, start: int, item_class: str) -> str:
+    """Job cards of one result page, newest (highest id) first."""
+    rng = _rng("jobs", key)
+    total = rng.randint(40, 100)
+    first_id = 3900000000 + zlib.crc32(key.encode("utf-8")) % 90000000
+    cards = []
+    for index in range(start, min(start + JOBS_PER_PAGE, total)):
+        job_id = str(first_id - index)
+        card = _rng("job", job_id)
+        slug = company_slug(card)
+        cards.append(
+            f'<li class="{item_class}" data-occludable-job-id="{job_id}">'
+            '<div class="job-card-container">'
+            f'<a class="job-card-list__title" href="/jobs/view/{job_id}/">{escape(card.choice(_TITLES))}</a>'
+            f'<div class="artdeco-entity-lockup__subtitle">{escape(_display_name(slug))}</div>'
+            f'<div class="job-card-container__metadata-wrapper">{escape(card.choice(_CITIES))}</div>'
+            "</div></li>"
+        )
+    return "".join(cards)
+
+
+def job_search(keywords: str, start: int) -> str:
+    """Job search results /jobs/search/?keywords=...&start=..."""
+    return layout(
+        f"{keywords} Jobs | LinkedIn",
+        '<main><div class="scaffold-layout__list"><div class="jobs-search-results-list">'
+        f"<ul>{_job_cards(keywords.lower(), start, 'job-card-list')}</ul>"
+        "</div></div></main>",
+    )
+
+
+def recommended_jobs(start: int) -> str:
+    """Recommended jobs collection /jobs/collections/recommended/?start=..."""
+    return layout(
+        "Recommended jobs | LinkedIn",
+        '<main><div class="scaffold-layout__list"><div class="jobs-search-results-list">'
+        f"<ul>{_job_cards('recommended', start, 'job-card-list')}</ul>"
+        "</div></div></main>",
+    )
+
+
+def jobs_home() -> str:
+    """Jobs home /jobs/ with its recommended, still hiring and more jobs cards."""
+    areas = "".join(
+        f'<section class="artdeco-card"><h2>{title}</h2><ul>'
+        f"{_job_cards(key, 0, 'jobs-job-board-list__item')}</ul></section>"
+        for title, key in (
+            ("Top job picks for you", "recommended"),
+            ("Job collections", "collections"),
+            ("Still hiring", "still-hiring"),
+            ("More jobs for you", "more-jobs"),
+        )
+    )
+    return layout(
+        "Jobs | LinkedIn",
+        f'<main><div class="scaffold-finite-scroll__content">{areas}</div></main>',
+    )
+
+
+def feed() -> str:
+    return layout(
+        "Feed | LinkedIn", '<main><div class="feed-shared-update-v2"></div></main>'
+    )
+
+
+def login() -> str:
+    """Sign-in form, posting to the login-submit checkpoint like LinkedIn's."""
+    return layout(
+        "LinkedIn Login",
+        '<main><form method="post" action="/checkpoint/lg/login-submit">'
+        '<input id="username" name="session_key" type="text">'
+        '<input id="password" name="session_password" type="password">'
+        '<button type="submit">Sign in</button></form></main>',
+        signed_in=False,
+    )
+
+
+def checkpoint() -> str:
+    """Security verification page LinkedIn redirects suspicious sessions to."""
+    return layout(
+        "Security Verification | LinkedIn",
+        "<main><h1>Let's do a quick security check</h1>"
+        '<div id="captcha-internal"></div></main>',
+        signed_in=False,
+    )
+
+
+def error(status: int, reason: str) -> str:
+    return layout(
+        f"{status} {reason}",
+        f"<main><h1>{status}</h1><p>{escape(reason)}</p></main>",
+        signed_in=False,
+    )
@@ -0,0 +1,377 @@
+# linkedin_mcp_server/fixtures/server.py
+"""
+Local LinkedIn stand-in serving the fixture pages.
+
+Serves profiles, companies, people searches, job postings, job lists and the
+login and security checkpoint pages on a local port, so the tools can run
+offline and repeatably with --linkedin-base-url pointing at it. Latency,
+error responses and checkpoint redirects can be injected to exercise timeouts,
+retries and challenge handling.
+
+Usage:
+    python -m linkedin_mcp_server.fixtures [--port 8765] [--latency 0.2]
+        [--jitter 0.1] [--error-rate 0.05] [--checkpoint-rate 0.01]
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlsplit
+
+from linkedin_mcp_server.fixtures import pages
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+
+# Session cookie set by the login form when no --session-cookie is required
+DEFAULT_SESSION_COOKIE = "fixture-session"
+
+_REASONS = {
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+@dataclass
+class FixtureSettings:
+    """Latency, error injection and session handling of the stand-in."""
+
+    latency: float = 0.0  # Seconds added to every page response
+    jitter: float = 0.0  # Up to this many more seconds, uniformly random
+    error_rate: float = 0.0  # Share of page requests answered with an error
+    error_statuses: List[int] = field(default_factory=lambda: [429, 500, 503])
+    # Share of page requests redirected to the security checkpoint
+    checkpoint_rate: float = 0.0
+    # li_at value pages accept; None accepts any non-empty session cookie
+    session_cookie: Optional[str] = None
+    require_login: bool = True  # Redirect requests without a session to /login
+    seed: int = 0  # Seed of the latency, error and checkpoint draws
+
+
+_Route = Tuple["re.Pattern[str]", Callable[..., str]]
+
+# Pages that need a session, by path; handlers get the path groups and query
+_ROUTES: List[_Route] = [
+    (re.compile(r"^/feed/?$"), lambda query: pages.feed()),
+    (re.compile(r"^/in/([^/]+)/?$"), lambda query, slug: pages.profile(slug)),
+    (
+        re.compile(r"^/in/([^/]+)/details/experience/?$"),
+        lambda query, slug: pages.experience(slug),
+    ),
+    (
+        re.compile(r"^/in/([^/]+)/details/education/?$"),
+        lambda query, slug: pages.education(slug),
+    ),
+    (
+        re.compile(r"^/company/([^/]+)/about/?$"),
+        lambda query, slug: pages.company_about(slug),
+    ),
+    (
+        re.compile(r"^/company/([^/]+)(?:/[^/]*)?/?$"),
+        lambda query, slug: pages.company(slug),
+    ),
+    (
+        re.compile(r"^/search/results/people/?$"),
+        lambda query: pages.people_search(
+            re.sub(r"\D", "", _param(query, "currentCompany", "0")) or "0",
+            max(_int_param(query, "page", 1), 1),
+        ),
+    ),
+    (re.compile(r"^/jobs/?$"), lambda query: pages.jobs_home()),
+    (
+        re.compile(r"^/jobs/search/?$"),
+        lambda query: pages.job_search(
+            _param(query, "keywords", ""), max(_int_param(query, "start", 0), 0)
+        ),
+    ),
+    (
+        re.compile(r"^/jobs/collections/recommended/?$"),
+        lambda query: pages.recommended_jobs(max(_int_param(query, "start", 0), 0)),
+    ),
+    (re.compile(r"^/jobs/view/(\d+)/?$"), lambda query, job_id: pages.job(job_id)),
+]
+
+
+def _param(query: Dict[str, List[str]], name: str, default: str) -> str:
+    return query.get(name, [default])[0]
+
+
+def _int_param(query: Dict[str, List[str]], name: str, default: int) -> int:
+    try:
+        return int(_param(query, name, str(default)))
+    except ValueError:
+        return default
+
+
+class _FixtureHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], settings: FixtureSettings) -> None:
+        super().__init__(address, _FixtureHandler)
+        self.settings = settings
+        self.random = random.Random(settings.seed)
+        self.lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "pages": 0,
+            "errors_injected": 0,
+            "checkpoints_injected": 0,
+            "login_redirects": 0,
+            "not_found": 0,
+        }
+
+    def count(self, key: str) -> None:
+        with self.lock:
+            self.stats[key] += 1
+
+    def draw(self) -> Tuple[float, float, float]:
+        """Random numbers for the latency, error and checkpoint of one request."""
+        with self.lock:
+            return self.random.random(), self.random.random(), self.random.random()
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    """Routes requests to the fixture pages, injecting latency and errors."""
+
+    protocol_version = "HTTP/1.1"
+    server: _FixtureHTTPServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self) -> None:
+        self.server.count("requests")
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == "/_fixtures/stats":
+            with self.server.lock:
+                stats = dict(self.server.stats)
+            self._send(200, json.dumps(stats), "application/json")
+            return
+        if url.path in ("/login", "/login/", "/uas/login", "/authwall"):
+            self._send(200, pages.login())
+            return
+        if url.path.startswith("/checkpoint/challenge"):
+            self._send(200, pages.checkpoint())
+            return
+
+        for pattern, render in _ROUTES:
+            match = pattern.match(url.path)
+            if match is not None:
+                self._page(lambda: render(query, *match.groups()))
+                return
+
+        self.server.count("not_found")
+        self._send(404, pages.error(404, "Not Found"))
+
+    def do_POST(self) -> None:
+        self.server.count("requests")
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        if urlsplit(self.path).path != "/checkpoint/lg/login-submit":
+            self._send(404, pages.error(404, "Not Found"))
+            return
+        # Any credentials sign in
+        value = self.server.settings.session_cookie or DEFAULT_SESSION_COOKIE
+        self._redirect("/feed/", 303, {"Set-Cookie": f"li_at={value}; Path=/"})
+
+    def _page(self, render: Callable[[], str]) -> None:
+        settings = self.server.settings
+        latency, error, checkpoint = self.server.draw()
+        delay = settings.latency + settings.jitter * latency
+        if delay > 0:
+            time.sleep(delay)
+
+        if settings.require_login and not self._signed_in():
+            self.server.count("login_redirects")
+            self._redirect(f"/login?session_redirect={quote(self.path)}")
+            return
+        if error < settings.error_rate and settings.error_statuses:
+            self.server.count("errors_injected")
+            status = settings.error_statuses[
+                int(error / settings.error_rate * len(settings.error_statuses))
+            ]
+            reason = _REASONS.get(status, "Error")
+            headers = {"Retry-After": "1"} if status == 429 else {}
+            self._send(status, pages.error(status, reason), headers=headers)
+            return
+        if checkpoint < settings.checkpoint_rate:
+            self.server.count("checkpoints_injected")
+            self._redirect(
+                f"/checkpoint/challenge/fixture?original_referer={quote(self.path)}"
+            )
+            return
+
+        self.server.count("pages")
+        self._send(200, render())
+
+    def _signed_in(self) -> bool:
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        session = cookies.get("li_at")
+        if session is None or not session.value:
+            return False
+        expected = self.server.settings.session_cookie
+        return expected is None or session.value == expected
+
+    def _redirect(
+        self, location: str, status: int = 302, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        self._send(status, "", headers={"Location": location, **(headers or {})})
+
+    def _send(
+        self,
+        status: int,
+        body: str,
+        content_type: str = "text/html; charset=utf-8",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class FixtureServer:
+    """
+    The LinkedIn stand-in, served from a background thread.
+
+    Usable as a context manager; port 0 picks a free port.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[FixtureSettings] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.settings = settings or FixtureSettings()
+        self._httpd = _FixtureHTTPServer((host, port), self.settings)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass as --linkedin-base-url."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def stats(self) -> Dict[str, int]:
+        """Requests served, pages rendered and errors, checkpoints and redirects injected."""
+        with self._httpd.lock:
+            return dict(self._httpd.stats)
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def start(self) -> "FixtureServer":
+        """Serve from a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="linkedin-fixtures", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def parse_statuses(value: str) -> List[int]:
+    """Split a comma-separated list of HTTP status codes."""
+    return [int(status) for status in value.split(",") if status.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the stand-in in the foreground until interrupted."""
+    parser = argparse.ArgumentParser(
+        description="Local LinkedIn stand-in for offline runs"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help="Port to listen on"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every page"
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=0.0,
+        help="Random extra seconds, up to this many",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Share of pages answered with an error",
+    )
+    parser.add_argument(
+        "--error-status",
+        type=parse_statuses,
+        default=[429, 500, 503],
+        help="Comma-separated error statuses to inject (default: 429,500,503)",
+    )
+    parser.add_argument(
+        "--checkpoint-rate",
+        type=float,
+        default=0.0,
+        help="Share of pages redirected to the security checkpoint",
+    )
+    parser.add_argument(
+        "--session-cookie", help="Only accept this li_at session cookie"
+    )
+    parser.add_argument(
+        "--no-login", action="store_true", help="Serve pages without a session cookie"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed of the injected latency and errors"
+    )
+    parser.add_argument(
+        "--log-level", default="WARNING", help="Log level, DEBUG logs every request"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s %(message)s")
+    settings = FixtureSettings(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_statuses=args.error_status,
+        checkpoint_rate=args.checkpoint_rate,
+        session_cookie=args.session_cookie,
+        require_login=not args.no_login,
+        seed=args.seed,
+    )
+    server = FixtureServer(settings, args.host, args.port)
+    print(f"Serving LinkedIn fixtures at {server.url} with {asdict(settings)}")
+    print(f"Run the MCP server with --linkedin-base-url {server.url}")
+    server.serve_forever()
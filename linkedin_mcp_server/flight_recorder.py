@@ -0,0 +1,315 @@
+# linkedin_mcp_server/flight_recorder.py
+"""
+Flight recorder of recent slow, partial and failed tool calls.
+
+The server keeps the last N anomalous tool calls in a fixed-size ring buffer:
+their arguments, phase timings, error category, the URL the browser ended on
+and, optionally, a compressed snapshot of that page. The get_flight_records
+tool and the /debug/flight-recorder endpoint dump it, so a production slowdown
+can be looked at after the fact instead of being reproduced.
+
+Arguments are clipped and snapshots capped, so the buffer's memory is bounded
+by its size. In multi-worker mode the buffer lives in the browser-pool service:
+front-end workers forward their records to it, like their metrics.
+"""
+
+import asyncio
+import base64
+import contextvars
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from fastmcp import FastMCP
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.metrics import current_tool_error
+from linkedin_mcp_server.operations import (
+    get_pool_client,
+    register_operation,
+    run_operation,
+)
+from linkedin_mcp_server.tracing import current_timings
+
+logger = logging.getLogger(__name__)
+
+# Longest string kept of a tool argument
+MAX_ARGUMENT_CHARS = 1000
+
+# Items kept of a list argument
+MAX_ARGUMENT_ITEMS = 50
+
+# Largest page snapshot kept, compressed; larger pages are cut first
+MAX_SNAPSHOT_BYTES = 256 * 1024
+MAX_SNAPSHOT_CHARS = 2 * 1024 * 1024
+
+
+class FlightRecorder:
+    """Thread-safe ring buffer of the most recent anomalous tool calls."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._records: Deque[Dict[str, Any]] = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    def add(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._records.append(record)
+            self.recorded += 1
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Records, newest first."""
+        with self._lock:
+            return list(reversed(self._records))
+
+
+_recorder: Optional[FlightRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_flight_recorder() -> FlightRecorder:
+    """The process-wide flight recorder, sized from the configuration."""
+    global _recorder
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = FlightRecorder(max(get_config().server.flight_recorder_size, 1))
+        return _recorder
+
+
+def flight_recording() -> bool:
+    """Whether anomalous tool calls are recorded (--flight-recorder-size > 0)."""
+    return get_config().server.flight_recorder_size > 0
+
+
+def is_slow(seconds: float) -> bool:
+    """Whether a call that took this long counts as slow."""
+    return seconds >= get_config().server.slow_call_seconds
+
+
+def capture_page(driver: Any) -> Optional[Dict[str, Any]]:
+    """
+    Record the page a driver is on, for the flight record of its call.
+
+    Goes through DevTools directly, so it works from any thread and after the
+    call's deadline passed.
+
+    Args:
+        driver: Chrome WebDriver instance
+
+    Returns:
+        Optional[Dict[str, Any]]: "url" and, with --flight-recorder-snapshots,
+            the zlib-compressed, base64-encoded HTML as "snapshot"; None if the
+            recorder is off or the page could not be read
+    """
+    from linkedin_mcp_server.drivers.cdp import evaluate_in_page
+
+    server = get_config().server
+    if server.flight_recorder_size <= 0:
+        return None
+    try:
+        if not server.flight_recorder_snapshots:
+            return {"url": evaluate_in_page(driver, "location.href")}
+        url, html = evaluate_in_page(
+            driver, "[location.href, document.documentElement.outerHTML]"
+        )
+    except Exception as e:
+        logger.debug("Could not capture page for the flight recorder: %s", e)
+        return None
+
+    page: Dict[str, Any] = {"url": url}
+    compressed = zlib.compress(html[:MAX_SNAPSHOT_CHARS].encode("utf-8"))
+    if len(compressed) <= MAX_SNAPSHOT_BYTES:
+        page["snapshot"] = base64.b64encode(compressed).decode("ascii")
+        page["snapshot_truncated"] = len(html) > MAX_SNAPSHOT_CHARS
+    else:
+        page["snapshot_omitted"] = f"{len(compressed)} bytes compressed"
+    return page
+
+
+# Pages captured during the tool call running in this context
+_call_pages: contextvars.ContextVar[Optional[List[Dict[str, Any]]]] = (
+    contextvars.ContextVar("linkedin_mcp_call_pages", default=None)
+)
+
+
+def collect_pages() -> List[Dict[str, Any]]:
+    """Start collecting the pages captured in this context."""
+    slot: List[Dict[str, Any]] = []
+    _call_pages.set(slot)
+    return slot
+
+
+def note_page(page: Optional[Dict[str, Any]]) -> None:
+    """Attribute a captured page to the tool call running in this context."""
+    slot = _call_pages.get()
+    if slot is not None and page:
+        slot.append(page)
+
+
+def _clip(value: Any) -> Any:
+    if isinstance(value, str) and len(value) > MAX_ARGUMENT_CHARS:
+        return value[:MAX_ARGUMENT_CHARS] + f"... ({len(value)} chars)"
+    if isinstance(value, list):
+        return [_clip(item) for item in value[:MAX_ARGUMENT_ITEMS]]
+    if isinstance(value, dict):
+        return {key: _clip(item) for key, item in value.items()}
+    return value
+
+
+def record_flight(record: Dict[str, Any]) -> None:
+    """
+    Add a tool call to the flight recorder.
+
+    Operation record_flight; front-end workers send their records to the
+    browser-pool service with it.
+    """
+    get_flight_recorder().add(record)
+
+
+def flight_records(
+    limit: int = 20, snapshots: bool = False, max_snapshot_chars: int = 200000
+) -> Dict[str, Any]:
+    """
+    Operation flight_records: the recorded tool calls, newest first.
+
+    Args:
+        limit: Number of records returned
+        snapshots: Include page snapshots, decompressed, as "snapshot_html"
+        max_snapshot_chars: Longest snapshot returned
+
+    Returns:
+        Dict[str, Any]: Buffer size, calls recorded since start and the records
+    """
+    recorder = get_flight_recorder()
+    records = []
+    for record in recorder.records()[: max(limit, 0)]:
+        record = dict(record)
+        pages = []
+        for page in record.get("pages", []):
+            page = dict(page)
+            snapshot = page.pop("snapshot", None)
+            if snapshot is not None:
+                if snapshots:
+                    html = zlib.decompress(base64.b64decode(snapshot)).decode("utf-8")
+                    page["snapshot_html"] = html[:max_snapshot_chars]
+                else:
+                    page["snapshot_bytes"] = len(snapshot) * 3 // 4
+            pages.append(page)
+        record["pages"] = pages
+        records.append(record)
+    return {
+        "size": recorder.size,
+        "recorded": recorder.recorded,
+        "records": records,
+    }
+
+
+register_operation("record_flight", record_flight, needs_driver=False, inline=True)
+register_operation("flight_records", flight_records, needs_driver=False)
+
+
+# Records on their way to the browser-pool service
+_pending_records: Set["asyncio.Task[Any]"] = set()
+
+
+class FlightRecorderMiddleware(Middleware):
+    """FastMCP middleware recording slow, partial and failed tool calls."""
+
+    async def on_call_tool(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        if not flight_recording():
+            return await call_next(context)
+
+        slot: List[Dict[str, Any]] = []
+        token = _call_pages.set(slot)
+        started_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        result = None
+        exception: Optional[str] = None
+        try:
+            result = await call_next(context)
+            return result
+        except Exception as e:
+            exception = type(e).__name__
+            raise
+        finally:
+            _call_pages.reset(token)
+            seconds = time.perf_counter() - start
+            error = current_tool_error() or exception
+            structured = getattr(result, "structured_content", None)
+            partial = isinstance(structured, dict) and bool(structured.get("partial"))
+            if error or partial or is_slow(seconds):
+                _submit(
+                    {
+                        "tool": getattr(context.message, "name", "unknown"),
+                        "started_at": started_at.isoformat(timespec="milliseconds"),
+                        "duration_ms": round(seconds * 1000, 1),
+                        "outcome": "error"
+                        if error
+                        else "partial"
+                        if partial
+                        else "slow",
+                        "error": error,
+                        "arguments": _clip(
+                            getattr(context.message, "arguments", None) or {}
+                        ),
+                        "timings": current_timings(),
+                        "pages": slot,
+                        "worker_pid": os.getpid(),
+                    }
+                )
+
+
+def _submit(record: Dict[str, Any]) -> None:
+    if get_pool_client() is None:
+        record_flight(record)
+        return
+    # Don't hold the response for the round trip to the browser-pool service
+    task = asyncio.ensure_future(run_operation("record_flight", {"record": record}))
+    _pending_records.add(task)
+    task.add_done_callback(_submit_done)
+
+
+def _submit_done(task: "asyncio.Task[Any]") -> None:
+    _pending_records.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Could not send flight record: %s", task.exception())
+
+
+def register_flight_recorder_route(mcp: FastMCP) -> None:
+    """
+    Serve /debug/flight-recorder from the HTTP transport.
+
+    Query parameters: limit (default 20) and snapshots=1 to include page
+    snapshots.
+
+    Args:
+        mcp: The MCP server instance
+    """
+
+    @mcp.custom_route("/debug/flight-recorder", methods=["GET"])
+    async def flight_recorder(request: Request) -> JSONResponse:
+        try:
+            limit = int(request.query_params.get("limit", 20))
+        except ValueError:
+            return JSONResponse({"error": "limit must be an integer"}, status_code=400)
+        snapshots = request.query_params.get("snapshots") in ("1", "true", "yes")
+        try:
+            document = await run_operation(
+                "flight_records", {"limit": limit, "snapshots": snapshots}
+            )
+        except Exception as e:
+            return JSONResponse(
+                {"error": f"Browser-pool service unavailable: {e}"}, status_code=503
+            )
+        return JSONResponse(document, headers={"Cache-Control": "no-store"})
@@ -0,0 +1,117 @@
+# linkedin_mcp_server/frontend.py
+"""
+Multi-worker deployment of the streamable-http transport.
+
+With --workers N the server process keeps the browser pool, the saved-search
+scheduler, the crawls and the continuation store, and serves them through the
+browser-pool service on a Unix socket. Uvicorn starts N front-end processes
+that parse MCP requests, validate arguments, shape results and encode responses
+in parallel; every tool operation they receive is run by the service, so
+browser sessions and the pool's lease queue stay shared by all of them.
+
+Front-ends run the transport in stateless mode: any worker can answer any
+request, so the kernel is free to spread connections across them.
+"""
+
+import logging
+import os
+
+from starlette.applications import Starlette
+
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.config.loaders import EnvironmentKeys
+from linkedin_mcp_server.config.schema import AppConfig, ServerConfig
+from linkedin_mcp_server.flight_recorder import register_flight_recorder_route
+from linkedin_mcp_server.health import register_health_routes
+from linkedin_mcp_server.http_app import build_http_middleware, register_web_app_routes
+from linkedin_mcp_server.logging_config import configure_logging
+from linkedin_mcp_server.metrics import register_metrics_route
+from linkedin_mcp_server.operations import set_pool_client
+from linkedin_mcp_server.pool.client import PoolClient
+from linkedin_mcp_server.pool.server import PoolServer
+from linkedin_mcp_server.server import create_mcp_server
+from linkedin_mcp_server.tracing import configure_tracing
+
+logger = logging.getLogger(__name__)
+
+
+def pool_socket_path(server_config: ServerConfig) -> str:
+    """Unix socket of the browser-pool service."""
+    return server_config.pool_socket or os.path.join(
+        server_config.state_dir, "pool.sock"
+    )
+
+
+def create_worker_app() -> Starlette:
+    """
+    Build the ASGI app of one front-end worker (uvicorn app factory).
+
+    Returns:
+        Starlette: Stateless streamable-http app sending tool operations to the
+            browser-pool service
+    """
+    config = get_config()
+    configure_logging(
+        log_level=config.server.log_level,
+        json_format=not config.is_interactive and config.server.log_level != "DEBUG",
+        queue_size=config.server.log_queue_size if config.server.log_queue else 0,
+    )
+    configure_tracing(
+        config.server.trace_file,
+        config.server.trace_otlp_endpoint,
+        config.server.trace_timings,
+        record=config.server.flight_recorder_size > 0,
+    )
+
+    set_pool_client(PoolClient(pool_socket_path(config.server)))
+    mcp = create_mcp_server(background=False)
+    register_health_routes(mcp)
+    register_metrics_route(mcp)
+    register_flight_recorder_route(mcp)
+    if config.server.serve_web_app:
+        register_web_app_routes(mcp, config.server)
+
+    logger.info(f"Front-end worker {os.getpid()} ready")
+    return mcp.http_app(
+        path=config.server.path,
+        middleware=build_http_middleware(config.server),
+        stateless_http=True,
+    )
+
+
+def run_multi_worker_server(config: AppConfig) -> None:
+    """
+    Run the browser-pool service and the front-end workers until interrupted.
+
+    Args:
+        config: Application configuration with the HTTP and worker settings
+
+    Raises:
+        LinkedInMCPError: If the browser-pool service cannot listen on its socket
+    """
+    import uvicorn
+
+    from linkedin_mcp_server.searches.saved import list_saved_searches
+    from linkedin_mcp_server.searches.scheduler import start_scheduler
+
+    socket_path = pool_socket_path(config.server)
+    pool = PoolServer(socket_path)
+    pool.start()
+
+    # Scheduled searches use the browsers, so they run next to them
+    if list_saved_searches():
+        start_scheduler()
+
+    # Workers load their configuration themselves; make sure they find the socket
+    os.environ[EnvironmentKeys.POOL_SOCKET] = socket_path
+    try:
+        uvicorn.run(
+            "linkedin_mcp_server.frontend:create_worker_app",
+            factory=True,
+            host=config.server.host,
+            port=config.server.port,
+            workers=config.server.workers,
+            log_level=config.server.log_level.lower(),
+        )
+    finally:
+        pool.stop()
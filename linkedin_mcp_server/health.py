@@ -0,0 +1,163 @@
+# linkedin_mcp_server/health.py
+"""
+Health, readiness and status endpoints of the HTTP transport.
+
+Orchestrators and dashboards can check the server without an MCP session:
+
+- /healthz: the process is serving HTTP (liveness)
+- /readyz: tool calls can be served: a LinkedIn cookie is configured, the last
+  login did not fail and, for multi-worker servers, the browser-pool service
+  answers
+- /status: browser pool, authentication, cache and activity details
+
+The answers come from in-memory bookkeeping only. They never start or drive a
+browser, and they are computed on the event loop rather than on executor
+threads that long-running scrapes may be holding.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List
+
+from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.operations import (
+    get_pool_client,
+    register_operation,
+    run_operation,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds a front-end worker waits for the browser-pool service's status
+STATUS_TIMEOUT = 2.0
+
+_STARTED_AT = time.time()
+
+# Cache-Control of all health responses; they describe this instant only
+_NO_STORE = {"Cache-Control": "no-store"}
+
+
+def collect_status() -> Dict[str, Any]:
+    """
+    Describe the browser pool, authentication and caches of this process.
+
+    Operation server_status; runs in the browser-pool service in multi-worker
+    mode.
+
+    Returns:
+        Dict[str, Any]: Status document
+    """
+    from linkedin_mcp_server.drivers.chrome import get_pool_status
+    from linkedin_mcp_server.shaping import get_continuation_store
+
+    pool = get_pool_status()
+    last_login = pool.pop("last_login")
+    last_scrape = pool.pop("last_successful_scrape_at")
+    now = time.time()
+    return {
+        "pid": os.getpid(),
+        "uptime_seconds": round(now - _STARTED_AT, 1),
+        "browser_pool": pool,
+        "authentication": {
+            "cookie_configured": bool(get_config().linkedin.cookie),
+            # Unknown (None) until the first browser logs in
+            "valid": last_login["ok"] if last_login else None,
+            "checked_at": last_login["at"] if last_login else None,
+            "error": last_login["error"] if last_login else None,
+        },
+        "continuation_cache": get_continuation_store().stats(),
+        "last_successful_scrape": {
+            "at": last_scrape,
+            "seconds_ago": round(now - last_scrape, 1) if last_scrape else None,
+        },
+    }
+
+
+register_operation("server_status", collect_status, needs_driver=False, inline=True)
+
+
+def readiness_problems(status: Dict[str, Any]) -> List[str]:
+    """
+    Reasons tool calls cannot be served, empty when ready.
+
+    Args:
+        status: Status document from collect_status
+    """
+    problems = []
+    authentication = status["authentication"]
+    if not authentication["cookie_configured"]:
+        problems.append("No LinkedIn cookie configured")
+    if authentication["valid"] is False:
+        problems.append(f"Last LinkedIn login failed: {authentication['error']}")
+    return problems
+
+
+async def get_status() -> Dict[str, Any]:
+    """
+    Status of the server, from the browser-pool service in multi-worker mode.
+
+    Raises:
+        BrowserPoolUnavailableError: If the browser-pool service does not answer
+        asyncio.TimeoutError: If the service does not answer in STATUS_TIMEOUT
+    """
+    if get_pool_client() is None:
+        return collect_status()
+    status = await asyncio.wait_for(
+        run_operation("server_status", {}), timeout=STATUS_TIMEOUT
+    )
+    status["worker_pid"] = os.getpid()
+    return status
+
+
+def _unavailable(error: Exception) -> str:
+    return f"Browser-pool service unavailable: {str(error) or type(error).__name__}"
+
+
+def register_health_routes(mcp: FastMCP) -> None:
+    """
+    Serve /healthz, /readyz and /status from the HTTP transport.
+
+    Args:
+        mcp: The MCP server instance
+    """
+
+    @mcp.custom_route("/healthz", methods=["GET"])
+    async def healthz(request: Request) -> JSONResponse:
+        return JSONResponse({"status": "ok"}, headers=_NO_STORE)
+
+    @mcp.custom_route("/readyz", methods=["GET"])
+    async def readyz(request: Request) -> JSONResponse:
+        try:
+            problems = readiness_problems(await get_status())
+        except Exception as e:
+            problems = [_unavailable(e)]
+        if problems:
+            return JSONResponse(
+                {"status": "not_ready", "problems": problems},
+                status_code=503,
+                headers=_NO_STORE,
+            )
+        return JSONResponse({"status": "ready"}, headers=_NO_STORE)
+
+    @mcp.custom_route("/status", methods=["GET"])
+    async def status(request: Request) -> JSONResponse:
+        try:
+            document = await get_status()
+        except Exception as e:
+            return JSONResponse(
+                {
+                    "status": "error",
+                    "error": _unavailable(e),
+                    "worker_pid": os.getpid(),
+                },
+                status_code=503,
+                headers=_NO_STORE,
+            )
+        document["ready"] = not readiness_problems(document)
+        return JSONResponse(document, headers=_NO_STORE)
@@ -0,0 +1,138 @@
+# linkedin_mcp_server/http_app.py
+"""
+Browser access to the streamable-http transport.
+
+Adds CORS handling and response compression as ASGI middleware of the MCP HTTP
+app, and optionally serves the web frontend from the same server, so a browser
+talks to the MCP endpoint directly instead of through cors-proxy.py and a
+separate static file server.
+"""
+
+import logging
+import os
+from typing import List, Optional
+
+from fastmcp import FastMCP
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from linkedin_mcp_server.compression import CompressionMiddleware
+from linkedin_mcp_server.config.schema import ServerConfig
+
+logger = logging.getLogger(__name__)
+
+WEB_APP_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "linkedin-web-app.html",
+)
+
+# The web app reads its MCP endpoint from this tag. The default calls a server on
+# port 8000 across origins; when served here it is replaced with our own endpoint.
+_ENDPOINT_META = '<meta name="mcp-endpoint" content="http://localhost:8000/mcp/">'
+
+CORS_ALLOW_METHODS = ["GET", "POST", "DELETE", "OPTIONS"]
+CORS_ALLOW_HEADERS = [
+    "Content-Type",
+    "Accept",
+    "Authorization",
+    "Last-Event-ID",
+    "mcp-session-id",
+    "mcp-protocol-version",
+    "X-MCP-Session-ID",
+]
+CORS_EXPOSE_HEADERS = ["mcp-session-id"]
+CORS_MAX_AGE = 3600
+
+
+def endpoint_path(server_config: ServerConfig) -> str:
+    """MCP endpoint path with the trailing slash the transport mounts it at."""
+    return server_config.path.rstrip("/") + "/"
+
+
+def build_http_middleware(server_config: ServerConfig) -> List[Middleware]:
+    """
+    Build the ASGI middleware for the HTTP transport.
+
+    Args:
+        server_config: Server configuration with the CORS and compression settings
+
+    Returns:
+        List[Middleware]: Middleware to pass to mcp.run, outermost first
+    """
+    middleware = []
+
+    if server_config.cors_origins:
+        logger.info(
+            f"CORS enabled for origins: {', '.join(server_config.cors_origins)}"
+        )
+        middleware.append(
+            Middleware(
+                CORSMiddleware,
+                allow_origins=server_config.cors_origins,
+                allow_methods=CORS_ALLOW_METHODS,
+                allow_headers=CORS_ALLOW_HEADERS,
+                expose_headers=CORS_EXPOSE_HEADERS,
+                max_age=CORS_MAX_AGE,
+            )
+        )
+
+    if server_config.compression:
+        middleware.append(
+            Middleware(
+                CompressionMiddleware,
+                minimum_size=server_config.compression_min_size,
+            )
+        )
+
+    return middleware
+
+
+def load_web_app(path: str, mcp_endpoint: str) -> Optional[bytes]:
+    """
+    Read the web frontend and point it at the MCP endpoint of this server.
+
+    Args:
+        path: Path of the web app HTML file
+        mcp_endpoint: Endpoint path the web app should call
+
+    Returns:
+        Optional[bytes]: Page content, None if the file is missing
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+    except OSError as e:
+        logger.warning(f"Web app not served, cannot read {path}: {e}")
+        return None
+    html = html.replace(
+        _ENDPOINT_META, f'<meta name="mcp-endpoint" content="{mcp_endpoint}">'
+    )
+    return html.encode("utf-8")
+
+
+def register_web_app_routes(mcp: FastMCP, server_config: ServerConfig) -> None:
+    """
+    Serve the web frontend at / and /linkedin-web-app.html of the HTTP transport.
+
+    The page is read once at startup and served from memory.
+
+    Args:
+        mcp: The MCP server instance
+        server_config: Server configuration with the MCP endpoint path
+    """
+    content = load_web_app(WEB_APP_FILE, endpoint_path(server_config))
+    if content is None:
+        return
+
+    async def web_app(request: Request) -> Response:
+        return Response(
+            content,
+            media_type="text/html; charset=utf-8",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    mcp.custom_route("/", methods=["GET"])(web_app)
+    mcp.custom_route("/linkedin-web-app.html", methods=["GET"])(web_app)
+    logger.info("Serving web app at /")
@@ -0,0 +1,209 @@
+# linkedin_mcp_server/jsonutil.py
+"""
+JSON encoding with an optional fast backend.
+
+Tool results (large employee and job lists), JSON log records and browser-pool
+messages are encoded with orjson, or msgspec, when one of them is installed,
+and with the standard library otherwise. Every backend produces the same JSON
+document for the values this server handles (dicts, lists, strings, numbers,
+booleans and None); values JSON has no type for (datetimes, bytes, UUIDs,
+models, ...) are encoded as pydantic-core encodes them, see _default.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+import pydantic_core
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+def available_backends() -> List[str]:
+    """
+    JSON backends this installation can use, in order of preference.
+
+    Returns:
+        List[str]: Backend names, always ending with "json" (standard library)
+    """
+    backends = []
+    if orjson is not None:
+        backends.append("orjson")
+    if msgspec is not None:
+        backends.append("msgspec")
+    backends.append("json")
+    return backends
+
+
+BACKEND = available_backends()[0]
+
+
+def _default(value: Any) -> Any:
+    """Encode values JSON has no type for, as pydantic-core does."""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    try:
+        # bytes as UTF-8 text, timedeltas as ISO 8601 durations, and so on
+        return pydantic_core.to_jsonable_python(value, fallback=str)
+    except ValueError:
+        # e.g. bytes that are not UTF-8
+        return str(value)
+
+
+def _orjson_dumps(value: Any, indent: bool) -> bytes:
+    # UTC datetimes end in "Z", as pydantic-core writes them
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(value, default=_default, option=option)
+
+
+def _msgspec_dumps(value: Any, indent: bool) -> bytes:
+    data = msgspec.json.encode(value, enc_hook=_default)
+    return msgspec.json.format(data, indent=2) if indent else data
+
+
+# Reused: json.dumps builds a new encoder for every call with non-default options
+_JSON_COMPACT = json.JSONEncoder(
+    ensure_ascii=False, default=_default, separators=(",", ":")
+)
+_JSON_INDENTED = json.JSONEncoder(ensure_ascii=False, default=_default, indent=2)
+_JSON_ASCII = json.JSONEncoder(default=_default)
+
+
+def _json_dumps(value: Any, indent: bool) -> bytes:
+    encoder = _JSON_INDENTED if indent else _JSON_COMPACT
+    return encoder.encode(value).encode()
+
+
+_ENCODERS: Dict[str, Callable[[Any, bool], bytes]] = {
+    "orjson": _orjson_dumps,
+    "msgspec": _msgspec_dumps,
+    "json": _json_dumps,
+}
+
+
+def dumps_bytes(
+    value: Any, indent: bool = False, backend: Optional[str] = None
+) -> bytes:
+    """
+    Encode a value as UTF-8 JSON.
+
+    Args:
+        value: Value to encode
+        indent: Indent nested values by two spaces instead of encoding compactly
+        backend: Backend to use, default the fastest available one
+
+    Returns:
+        bytes: The JSON document; non-ASCII characters are not escaped
+    """
+    backend = backend or BACKEND
+    if backend != "json":
+        try:
+            return _ENCODERS[backend](value, indent)
+        except (TypeError, ValueError, OverflowError):
+            # e.g. integers beyond 64 bits; the standard library handles them
+            pass
+    return _json_dumps(value, indent)
+
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape(match: "re.Match[str]") -> str:
+    """JSON escape of a non-ASCII character, as json.dumps writes it."""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return "\\u%04x\\u%04x" % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return "\\u%04x" % code
+
+
+def dumps(
+    value: Any,
+    indent: bool = False,
+    ensure_ascii: bool = False,
+    backend: Optional[str] = None,
+) -> str:
+    """
+    Encode a value as JSON text.
+
+    Args:
+        value: Value to encode
+        indent: Indent nested values by two spaces instead of encoding compactly
+        ensure_ascii: Escape non-ASCII characters, as json.dumps does by default
+        backend: Backend to use, default the fastest available one
+
+    Returns:
+        str: The JSON document
+    """
+    backend = backend or BACKEND
+    if backend == "json" and ensure_ascii and not indent:
+        # What json.dumps writes by default
+        return _JSON_ASCII.encode(value)
+    text = dumps_bytes(value, indent, backend).decode()
+    if ensure_ascii and not text.isascii():
+        # Outside strings JSON is ASCII, so escaping characters is enough
+        text = _NON_ASCII.sub(_escape, text)
+    return text
+
+
+def loads(data: Any) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: JSON as bytes or str
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects a few documents json accepts (e.g. huge integers)
+            pass
+    elif msgspec is not None:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError:
+            pass
+    return json.loads(data)
+
+
+def serialize_tool_result(data: Any) -> str:
+    """
+    Serialize a tool result for MCP text content (FastMCP tool_serializer).
+
+    Produces the document FastMCP's default serializer (pydantic-core) does:
+    two-space indented JSON, unknown types as strings. With orjson installed it
+    encodes with orjson, which differs only on values tool results do not hold:
+    NaN and infinities become null rather than NaN/Infinity (which are not valid
+    JSON), None dict keys become "null" rather than "None", and float exponents
+    carry a sign ("1e+300"). benchmarks/bench_json.py checks these values.
+
+    Args:
+        data: Tool result
+
+    Returns:
+        str: Indented JSON text
+    """
+    if BACKEND != "orjson":
+        # pydantic-core is FastMCP's own encoder and faster than the json module;
+        # msgspec encodes bytes and timedeltas its own way, so it is not used
+        return pydantic_core.to_json(data, fallback=str, indent=2).decode()
+    return dumps_bytes(data, indent=True).decode()
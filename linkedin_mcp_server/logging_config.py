@@ -5,11 +5,22 @@ Logging configuration for LinkedIn MCP Server with format options.
 Provides JSON and compact logging formats for different deployment scenarios.
 JSON format for production MCP integration, compact format for development.
 Includes proper logger hierarchy and external library noise reduction.
+
+Optionally, records are handed to a listener thread through a bounded queue,
+so a slow log sink (a blocked stderr pipe, a busy terminal) never stalls the
+event loop or a scraping thread: records are formatted and written by the
+listener, and records arriving while the queue is full are dropped and counted.
 """
 
-import json
+import atexit
+import copy
 import logging
-from typing import Any, Dict
+import logging.handlers
+import queue
+import threading
+from typing import Any, Dict, Optional
+
+from linkedin_mcp_server.jsonutil import dumps
 
 
 class MCPJSONFormatter(logging.Formatter):
@@ -37,11 +48,13 @@ class MCPJSONFormatter(logging.Formatter):
         if hasattr(record, "error_details"):
             log_data["error_details"] = record.error_details
 
-        # Add exception info if present
+        # Add exception info if present; queued records carry it pre-rendered
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
 
-        return json.dumps(log_data)
+        return dumps(log_data, ensure_ascii=True)
 
 
 class CompactFormatter(logging.Formatter):
@@ -79,13 +92,117 @@ class CompactFormatter(logging.Formatter):
         return f"{record_copy.asctime} - {record_copy.name} - {record.levelname} - {record.getMessage()}"
 
 
-def configure_logging(log_level: str = "WARNING", json_format: bool = False) -> None:
+# Renders tracebacks of queued records; the handlers' formatters use exc_text
+_exception_formatter = logging.Formatter()
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that never blocks the logging thread.
+
+    Records are queued with their message and traceback already rendered, so
+    they keep no references to the caller's arguments or frames and show them
+    as they were when logged; only the handler's Formatter runs on the
+    listener thread. Records arriving while the queue is full are dropped and
+    counted.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[Any]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The caller may change its arguments before the listener gets to the
+        # record, and exc_info keeps the traceback's frames alive; render both
+        # now, on a copy so other handlers still see the original record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+class _ReportingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that logs how many records were dropped since the last report."""
+
+    def __init__(
+        self, log_queue: "queue.Queue[Any]", source: DroppingQueueHandler, *handlers
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self._source = source
+        self._reported = 0
+
+    def handle(self, record: logging.LogRecord) -> None:
+        self._report_drops()
+        super().handle(record)
+
+    def stop(self) -> None:
+        super().stop()
+        self._report_drops()
+
+    def enqueue_sentinel(self) -> None:
+        # Wait for room rather than fail on a full queue
+        self.queue.put(self._sentinel)
+
+    def _report_drops(self) -> None:
+        dropped = self._source.dropped
+        if dropped > self._reported:
+            notice = logging.LogRecord(
+                __name__,
+                logging.WARNING,
+                __file__,
+                0,
+                "Dropped %d log records: log queue full",
+                (dropped - self._reported,),
+                None,
+            )
+            self._reported = dropped
+            super().handle(notice)
+
+
+_listener: Optional[_ReportingQueueListener] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+
+
+def dropped_log_records() -> int:
+    """Number of log records dropped because the log queue was full."""
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def _stop_listener() -> None:
+    """Write out queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def configure_logging(
+    log_level: str = "WARNING", json_format: bool = False, queue_size: int = 0
+) -> None:
     """Configure logging for the LinkedIn MCP Server.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         json_format: Whether to use JSON formatting for logs
+        queue_size: Write logs from a listener thread, buffering up to this many
+            records before dropping new ones; 0 writes synchronously
     """
+    global _listener, _queue_handler
+
     # Convert string to logging level
     numeric_level = getattr(logging, log_level.upper(), logging.WARNING)
 
@@ -101,11 +218,20 @@ def configure_logging(log_level: str = "WARNING", json_format: bool = False) ->
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_listener()
+    _queue_handler = None
 
     # Add console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    if queue_size > 0:
+        log_queue: "queue.Queue[Any]" = queue.Queue(queue_size)
+        _queue_handler = DroppingQueueHandler(log_queue)
+        _listener = _ReportingQueueListener(log_queue, _queue_handler, console_handler)
+        _listener.start()
+        root_logger.addHandler(_queue_handler)
+    else:
+        root_logger.addHandler(console_handler)
 
     # Set specific loggers to reduce noise
     logging.getLogger("selenium").setLevel(logging.ERROR)
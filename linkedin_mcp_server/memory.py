@@ -0,0 +1,254 @@
+# linkedin_mcp_server/memory.py
+"""
+Memory usage of the server process and its browsers.
+
+Reports the resident size of this process and of each pooled browser (its
+ChromeDriver and Chrome processes), the size of the server's long-lived state
+(continuations, flight records, log handlers), the most numerous object types
+and, while tracemalloc traces allocations, the source lines holding the most
+memory. Object counts and allocation sites are also compared with a baseline
+taken on request, so a soak run (benchmarks/bench_tools.py --soak) can tell
+growth in Chrome, in state kept alive by MCP sessions and in logging apart.
+
+Start the server with PYTHONTRACEMALLOC=<frames> to trace allocations from the
+first import; without it only process sizes and object counts are reported.
+"""
+
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Allocations in these files are the tracing and this report themselves
+_UNTRACKED_FILES = frozenset(
+    {
+        tracemalloc.__file__,
+        __file__,
+        "<frozen importlib._bootstrap>",
+        "<frozen importlib._bootstrap_external>",
+        "<unknown>",
+    }
+)
+
+# Allocation site sizes and object type counts of the baseline report; plain
+# sizes rather than a tracemalloc.Snapshot, whose traces would show up as
+# objects in every later count
+_baseline_lock = threading.Lock()
+_baseline_sites: Optional[Dict[Tuple[str, int], Tuple[int, int]]] = None
+_baseline_types: Optional[Counter] = None
+_baseline_at: Optional[float] = None
+
+
+def _rss_mb(pid: int) -> Optional[float]:
+    """Resident size of a process, None where /proc is unavailable."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _descendants(root: int) -> List[int]:
+    """Process ids below a process, read from /proc."""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may hold spaces; fields resume after ")"
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    found: List[int] = []
+    pending = list(children.get(root, []))
+    while pending:
+        pid = pending.pop()
+        found.append(pid)
+        pending.extend(children.get(pid, []))
+    return found
+
+
+def _is_renderer(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return b"--type=renderer" in f.read()
+    except OSError:
+        return False
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Highest resident size this process reached, None on Windows."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes, but bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def browser_memory() -> Dict[str, Dict[str, Any]]:
+    """
+    Memory of each started browser of the pool.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: By pool slot, the resident MB of ChromeDriver
+            and its Chrome processes, the number of processes and of renderers;
+            empty off Linux
+    """
+    from linkedin_mcp_server.drivers.chrome import active_drivers
+
+    if not os.path.isdir("/proc"):
+        return {}
+    browsers = {}
+    for session_id, driver in list(active_drivers.items()):
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if process is None:
+            continue
+        pids = [process.pid, *_descendants(process.pid)]
+        browsers[session_id] = {
+            "rss_mb": round(sum(_rss_mb(pid) or 0.0 for pid in pids), 1),
+            "processes": len(pids),
+            "renderers": sum(_is_renderer(pid) for pid in pids),
+        }
+    return browsers
+
+
+def server_state() -> Dict[str, Any]:
+    """Sizes of the server state that lives as long as the process."""
+    from linkedin_mcp_server.flight_recorder import get_flight_recorder
+    from linkedin_mcp_server.logging_config import dropped_log_records
+    from linkedin_mcp_server.shaping import get_continuation_store
+
+    recorder = get_flight_recorder()
+    return {
+        "threads": threading.active_count(),
+        "continuations": get_continuation_store().stats(),
+        "flight_records": len(recorder.records()),
+        "log_handlers": sum(
+            len(each.handlers)
+            for each in [logging.root, *logging.root.manager.loggerDict.values()]
+            if isinstance(each, logging.Logger)
+        ),
+        "dropped_log_records": dropped_log_records(),
+        "gc_counts": list(gc.get_count()),
+    }
+
+
+def _type_counts() -> Counter:
+    return Counter(type(o).__name__ for o in gc.get_objects())
+
+
+def _site_sizes() -> Dict[Tuple[str, int], Tuple[int, int]]:
+    """Traced bytes and blocks by allocating source line."""
+    # Filtering the grouped lines is much faster than Snapshot.filter_traces
+    return {
+        (s.traceback[0].filename, s.traceback[0].lineno): (s.size, s.count)
+        for s in tracemalloc.take_snapshot().statistics("lineno")
+        if s.traceback[0].filename not in _UNTRACKED_FILES
+    }
+
+
+def _allocation_sites(
+    sites: Dict[Tuple[str, int], Tuple[int, int]],
+    baseline: Optional[Dict[Tuple[str, int], Tuple[int, int]]],
+    top: int,
+) -> List[Dict[str, Any]]:
+    """Source lines holding the most memory, or gaining the most since the baseline."""
+    rows = []
+    for site in sites.keys() | (baseline or {}).keys():
+        size, count = sites.get(site, (0, 0))
+        row: Dict[str, Any] = {
+            "site": f"{site[0]}:{site[1]}",
+            "size_kb": round(size / 1024, 1),
+            "count": count,
+        }
+        if baseline is not None:
+            old_size, old_count = baseline.get(site, (0, 0))
+            row["size_diff_kb"] = round((size - old_size) / 1024, 1)
+            row["count_diff"] = count - old_count
+        rows.append(row)
+    rows.sort(key=lambda row: row.get("size_diff_kb", row["size_kb"]), reverse=True)
+    return rows[:top]
+
+
+def memory_stats(top: int = 15, reset_baseline: bool = False) -> Dict[str, Any]:
+    """
+    Report the memory of the server and its browsers.
+
+    Args:
+        top: Allocation sites and object types listed (0 for sizes only, which
+            is much cheaper)
+        reset_baseline: Make this report the baseline later ones are compared with
+
+    Returns:
+        Dict[str, Any]: Resident and peak MB of this process, browser memory by
+            pool slot, server state sizes, tracemalloc totals and, with top > 0,
+            the top allocation sites and object types with their change since
+            the baseline
+    """
+    global _baseline_sites, _baseline_types, _baseline_at
+
+    browsers = browser_memory()
+    rss = _rss_mb(os.getpid())
+    report: Dict[str, Any] = {
+        "pid": os.getpid(),
+        "rss_mb": round(rss, 1) if rss is not None else None,
+        "peak_rss_mb": _peak_rss_mb(),
+        "browsers_mb": round(sum(b["rss_mb"] for b in browsers.values()), 1),
+        "browsers": browsers,
+        "state": server_state(),
+        "gc_objects": len(gc.get_objects()),
+        "tracing": tracemalloc.is_tracing(),
+    }
+
+    detailed = top > 0 or reset_baseline
+    # Counted before the snapshot, which is made of objects too
+    types = _type_counts() if detailed else None
+    sites = None
+    if tracemalloc.is_tracing():
+        traced, peak = tracemalloc.get_traced_memory()
+        report["traced_mb"] = round(traced / 1024 / 1024, 2)
+        report["traced_peak_mb"] = round(peak / 1024 / 1024, 2)
+        report["tracemalloc_overhead_mb"] = round(
+            tracemalloc.get_tracemalloc_memory() / 1024 / 1024, 2
+        )
+        if detailed:
+            sites = _site_sizes()
+
+    with _baseline_lock:
+        if top > 0:
+            if sites is not None:
+                report["allocation_sites"] = _allocation_sites(
+                    sites, _baseline_sites, top
+                )
+            assert types is not None
+            if _baseline_types is not None:
+                # Types that gained most objects since the baseline
+                report["object_types"] = [
+                    {"type": name, "count": types[name], "count_diff": growth}
+                    for name, growth in (types - _baseline_types).most_common(top)
+                ]
+            else:
+                report["object_types"] = [
+                    {"type": name, "count": count}
+                    for name, count in types.most_common(top)
+                ]
+        if reset_baseline:
+            _baseline_sites = sites
+            _baseline_types = types
+            _baseline_at = time.time()
+        report["baseline_at"] = _baseline_at
+    return report
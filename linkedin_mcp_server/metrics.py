@@ -0,0 +1,459 @@
+# linkedin_mcp_server/metrics.py
+"""
+Prometheus metrics of the server, served at /metrics of the HTTP transport.
+
+Covers tool calls (count, error category, latency), the browser pool (busy and
+idle time per browser, Chrome launch and login durations, time spent waiting
+for a free browser), page loads (with --perf-capture) and the continuation
+cache, for capacity planning of the browser fleet.
+
+Metrics are kept in-process by a small registry that writes the Prometheus
+text format itself, so no client library is needed and recording a value is a
+dict update under a lock. In multi-worker mode everything is recorded in the
+browser-pool service: front-end workers forward their tool call observations
+to it, and any worker's /metrics returns the service's metrics.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from fastmcp import FastMCP
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from starlette.requests import Request
+from starlette.responses import Response
+
+from linkedin_mcp_server.logging_config import dropped_log_records
+from linkedin_mcp_server.operations import (
+    get_pool_client,
+    register_operation,
+    run_operation,
+)
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram buckets in seconds
+TOOL_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+WAIT_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+BROWSER_START_BUCKETS = (0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60)
+PAGE_LOAD_BUCKETS = (0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60)
+# Page load size buckets
+PAGE_REQUEST_BUCKETS = (5, 10, 25, 50, 100, 200, 400, 800)
+PAGE_BYTE_BUCKETS = (1e5, 2.5e5, 5e5, 1e6, 2.5e6, 5e6, 1e7, 2.5e7)
+JS_HEAP_BUCKETS = (1e7, 2.5e7, 5e7, 1e8, 2e8, 4e8, 8e8)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = (
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        )
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class Registry:
+    """Set of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: List["_Metric"] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: "_Metric") -> None:
+        self._metrics.append(metric)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a function updating gauges right before every render."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    """A metric family with a fixed set of label names."""
+
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: Registry = REGISTRY,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        registry.register(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in sorted(values):
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels: str) -> None:
+        """Set the value of a count kept elsewhere (in a collector)."""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = TOOL_BUCKETS,
+        registry: Registry = REGISTRY,
+    ) -> None:
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket (non-cumulative) counts, the +Inf bucket last, sum
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        with self._lock:
+            values = [(key, (list(s[0]), s[1])) for key, s in self._values.items()]
+        names = self.labelnames + ("le",)
+        for key, (counts, total) in sorted(values):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+# Tool calls
+TOOL_CALLS = Counter(
+    "linkedin_mcp_tool_calls_total",
+    "Tool calls by tool and outcome (ok, partial, error).",
+    ("tool", "outcome"),
+)
+TOOL_ERRORS = Counter(
+    "linkedin_mcp_tool_errors_total",
+    "Failed tool calls by tool and error category.",
+    ("tool", "error"),
+)
+TOOL_DURATION = Histogram(
+    "linkedin_mcp_tool_duration_seconds",
+    "Tool call latency.",
+    ("tool",),
+    TOOL_BUCKETS,
+)
+
+# Browser pool
+BROWSER_BUSY = Counter(
+    "linkedin_mcp_browser_busy_seconds_total",
+    "Time browsers spent leased to a tool call, crawl or scheduled search.",
+    ("session",),
+)
+BROWSER_IDLE = Counter(
+    "linkedin_mcp_browser_idle_seconds_total",
+    "Time started browsers spent waiting for work, counted when leased again.",
+    ("session",),
+)
+BROWSER_LAUNCH = Histogram(
+    "linkedin_mcp_chrome_launch_seconds",
+    "Time to start a Chrome WebDriver session.",
+    buckets=BROWSER_START_BUCKETS,
+)
+BROWSER_LOGIN = Histogram(
+    "linkedin_mcp_login_seconds",
+    "Time to log a new browser in to LinkedIn, by outcome.",
+    ("outcome",),
+    BROWSER_START_BUCKETS,
+)
+QUEUE_WAIT = Histogram(
+    "linkedin_mcp_browser_queue_wait_seconds",
+    "Time callers waited for a free browser.",
+    buckets=WAIT_BUCKETS,
+)
+POOL_BROWSERS = Gauge(
+    "linkedin_mcp_browser_pool",
+    "Browsers of the pool by state (size, started, leased).",
+    ("state",),
+)
+POOL_WAITING = Gauge(
+    "linkedin_mcp_browser_queue_waiting",
+    "Callers currently waiting for a free browser.",
+)
+
+# Page loads, recorded with --perf-capture
+PAGE_REQUESTS = Histogram(
+    "linkedin_mcp_page_requests",
+    "Network requests made while loading a page, by page type.",
+    ("page",),
+    PAGE_REQUEST_BUCKETS,
+)
+PAGE_BYTES = Histogram(
+    "linkedin_mcp_page_transfer_bytes",
+    "Bytes transferred (encoded) while loading a page, by page type.",
+    ("page",),
+    PAGE_BYTE_BUCKETS,
+)
+PAGE_MAIN_THREAD = Histogram(
+    "linkedin_mcp_page_main_thread_seconds",
+    "Renderer main-thread task time while loading a page, by page type.",
+    ("page",),
+    PAGE_LOAD_BUCKETS,
+)
+PAGE_EVENT = Histogram(
+    "linkedin_mcp_page_event_seconds",
+    "Time from the document request to DOMContentLoaded and load, by page type.",
+    ("page", "event"),
+    PAGE_LOAD_BUCKETS,
+)
+PAGE_JS_HEAP = Histogram(
+    "linkedin_mcp_page_js_heap_bytes",
+    "Used JS heap after a page load, by page type.",
+    ("page",),
+    JS_HEAP_BUCKETS,
+)
+
+# Caches
+CACHE_REQUESTS = Counter(
+    "linkedin_mcp_cache_requests_total",
+    "Cache lookups by cache and result (hit, miss).",
+    ("cache", "result"),
+)
+CACHE_ENTRIES = Gauge(
+    "linkedin_mcp_cache_entries",
+    "Entries held by each cache.",
+    ("cache",),
+)
+
+
+# Logging
+LOG_RECORDS_DROPPED = Counter(
+    "linkedin_mcp_log_records_dropped_total",
+    "Log records dropped because the background log queue was full.",
+)
+
+
+def _collect_state() -> None:
+    from linkedin_mcp_server.drivers.chrome import get_pool_status
+    from linkedin_mcp_server.shaping import get_continuation_store
+
+    pool = get_pool_status()
+    for state in ("size", "started", "leased"):
+        POOL_BROWSERS.set(pool[state], state=state)
+    POOL_WAITING.set(pool["waiting"])
+    cache = get_continuation_store().stats()
+    CACHE_ENTRIES.set(cache["entries"], cache="continuation")
+    CACHE_REQUESTS.set_total(cache["hits"], cache="continuation", result="hit")
+    CACHE_REQUESTS.set_total(cache["misses"], cache="continuation", result="miss")
+    LOG_RECORDS_DROPPED.set_total(dropped_log_records())
+
+
+REGISTRY.add_collector(_collect_state)
+
+
+def record_tool_call(
+    tool: str, seconds: float, outcome: str, error: Optional[str] = None
+) -> None:
+    """
+    Record a finished tool call.
+
+    Operation record_tool_call; front-end workers send their observations to
+    the browser-pool service with it.
+
+    Args:
+        tool: Tool name
+        seconds: Call duration
+        outcome: "ok", "partial" or "error"
+        error: Error category of a failed call (the "error" key of its response)
+    """
+    TOOL_CALLS.inc(tool=tool, outcome=outcome)
+    TOOL_DURATION.observe(seconds, tool=tool)
+    if error is not None:
+        TOOL_ERRORS.inc(tool=tool, error=error)
+
+
+register_operation(
+    "record_tool_call", record_tool_call, needs_driver=False, inline=True
+)
+register_operation("render_metrics", REGISTRY.render, needs_driver=False, inline=True)
+
+
+# Error category of the tool call running in this context, set by the error handler
+_call_error: contextvars.ContextVar[Optional[Dict[str, Optional[str]]]] = (
+    contextvars.ContextVar("linkedin_mcp_call_error", default=None)
+)
+
+
+def note_tool_error(category: Optional[str]) -> None:
+    """Attribute an error category to the tool call running in this context."""
+    slot = _call_error.get()
+    if slot is not None:
+        slot["error"] = category or "unknown_error"
+
+
+def current_tool_error() -> Optional[str]:
+    """Error category of the tool call running in this context, None if none."""
+    slot = _call_error.get()
+    return slot.get("error") if slot is not None else None
+
+
+# Observations on their way to the browser-pool service
+_pending_reports: Set["asyncio.Task[Any]"] = set()
+
+
+class ToolMetricsMiddleware(Middleware):
+    """FastMCP middleware recording the count, outcome and latency of tool calls."""
+
+    async def on_call_tool(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        tool = getattr(context.message, "name", "unknown")
+        slot: Dict[str, Optional[str]] = {}
+        token = _call_error.set(slot)
+        start = time.perf_counter()
+        result = None
+        try:
+            result = await call_next(context)
+            return result
+        except Exception as e:
+            slot.setdefault("error", type(e).__name__)
+            raise
+        finally:
+            _call_error.reset(token)
+            seconds = time.perf_counter() - start
+            error = slot.get("error")
+            if error is not None:
+                outcome = "error"
+            else:
+                structured = getattr(result, "structured_content", None)
+                partial = isinstance(structured, dict) and structured.get("partial")
+                outcome = "partial" if partial else "ok"
+            _report(tool, seconds, outcome, error)
+
+
+def _report(tool: str, seconds: float, outcome: str, error: Optional[str]) -> None:
+    if get_pool_client() is None:
+        record_tool_call(tool, seconds, outcome, error)
+        return
+    # Don't hold the response for the round trip to the browser-pool service
+    task = asyncio.ensure_future(
+        run_operation(
+            "record_tool_call",
+            {"tool": tool, "seconds": seconds, "outcome": outcome, "error": error},
+        )
+    )
+    _pending_reports.add(task)
+    task.add_done_callback(_report_done)
+
+
+def _report_done(task: "asyncio.Task[Any]") -> None:
+    _pending_reports.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Could not record tool call metrics: %s", task.exception())
+
+
+async def render_metrics() -> str:
+    """Metrics of the server, from the browser-pool service in multi-worker mode."""
+    if get_pool_client() is None:
+        return REGISTRY.render()
+    return await run_operation("render_metrics", {})
+
+
+def register_metrics_route(mcp: FastMCP) -> None:
+    """
+    Serve /metrics from the HTTP transport.
+
+    Args:
+        mcp: The MCP server instance
+    """
+
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def metrics(request: Request) -> Response:
+        try:
+            body = await render_metrics()
+        except Exception as e:
+            return Response(
+                f"Browser-pool service unavailable: {e}\n",
+                status_code=503,
+                media_type="text/plain",
+            )
+        return Response(body, media_type=CONTENT_TYPE)
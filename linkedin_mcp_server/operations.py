@@ -0,0 +1,198 @@
+# linkedin_mcp_server/operations.py
+"""
+Named operations: the unit of work MCP tools hand to the browser pool.
+
+Tools describe their work as a registered operation (a name, a function run
+with a leased driver and, optionally, a function building a partial result)
+instead of a closure. The same call can then run in this process, or be sent
+by name to the browser-pool service that several stateless HTTP workers share
+(see linkedin_mcp_server.pool). Operations that touch shared server state but
+no browser (crawl control, saved searches, continuations) are registered with
+needs_driver=False so they run wherever that state lives.
+"""
+
+import asyncio
+import functools
+import logging
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from linkedin_mcp_server.deadline import Deadline
+from linkedin_mcp_server.exceptions import LinkedInMCPError
+from linkedin_mcp_server.execution import run_scraper
+from linkedin_mcp_server.profiling import note_profiles, profile_all_calls, profiled
+from linkedin_mcp_server.shaping import OutputShape, shape_list, shape_result
+from linkedin_mcp_server.tracing import span
+
+if TYPE_CHECKING:
+    from linkedin_mcp_server.pool.client import PoolClient
+
+logger = logging.getLogger(__name__)
+
+# Progress callback: progress, total, message
+ProgressCallback = Callable[[float, Optional[float], Optional[str]], None]
+
+
+@dataclass
+class Operation:
+    """A unit of tool work that can run locally or in the browser-pool service."""
+
+    name: str
+    # work(driver, state, report, **args) for driver operations, work(**args) otherwise
+    work: Callable[..., Any]
+    # partial(state) builds a result from what work stored in state so far
+    partial: Optional[Callable[[Dict[str, Any]], Any]] = None
+    # Output shaping kind of the result (a key of shaping.TRIM_STEPS)
+    result_kind: Optional[str] = None
+    needs_driver: bool = True
+    # Cheap, non-blocking work run directly on the event loop, so it is not
+    # queued behind scrapes holding executor threads
+    inline: bool = False
+
+
+_operations: Dict[str, Operation] = {}
+_pool_client: Optional["PoolClient"] = None
+
+
+def register_operation(
+    name: str,
+    work: Callable[..., Any],
+    partial: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    result_kind: Optional[str] = None,
+    needs_driver: bool = True,
+    inline: bool = False,
+) -> None:
+    """
+    Register a named operation.
+
+    Args:
+        name: Operation name, usually the name of the tool using it
+        work: Function doing the work; driver operations receive the leased
+            driver, a state dict shared with partial, a progress callback and
+            the call arguments, others only the call arguments
+        partial: Function building a partial result from the state dict when the
+            deadline passes
+        result_kind: Output shaping kind of the result, None if not shapeable
+        needs_driver: Whether the operation leases a browser
+        inline: Run work on the event loop; only for operations that never block
+    """
+    _operations[name] = Operation(
+        name, work, partial, result_kind, needs_driver, inline
+    )
+
+
+def get_operation(name: str) -> Operation:
+    """
+    Look up a registered operation.
+
+    Raises:
+        LinkedInMCPError: If no operation of that name is registered
+    """
+    try:
+        return _operations[name]
+    except KeyError:
+        raise LinkedInMCPError(f"Unknown operation: {name}") from None
+
+
+def set_pool_client(client: Optional["PoolClient"]) -> None:
+    """Send operations to a browser-pool service instead of running them here."""
+    global _pool_client
+    _pool_client = client
+
+
+def get_pool_client() -> Optional["PoolClient"]:
+    """The browser-pool service client, None when operations run in this process."""
+    return _pool_client
+
+
+def _no_progress(
+    progress: float, total: Optional[float] = None, message: Optional[str] = None
+) -> None:
+    pass
+
+
+async def run_operation(
+    name: str,
+    args: Dict[str, Any],
+    deadline: Optional[Deadline] = None,
+    report: Optional[ProgressCallback] = None,
+    shape: Optional[OutputShape] = None,
+    profile: bool = False,
+) -> Any:
+    """
+    Run a named operation, in the browser-pool service if one is configured.
+
+    Args:
+        name: Registered operation name
+        args: Keyword arguments of the operation (JSON-serializable)
+        deadline: Deadline of the call, None for no limit
+        report: Progress callback, may be called from a worker thread
+        shape: Output shaping of the result
+        profile: Profile the operation; profile ids go to the calling tool call
+
+    Returns:
+        The operation's result, shaped if requested
+
+    Raises:
+        DeadlineExceededError: If the deadline passed and no partial result exists
+        PoolOperationError: If the operation failed in the browser-pool service
+        BrowserPoolUnavailableError: If the browser-pool service cannot be reached
+    """
+    client = _pool_client
+    if client is not None:
+        shape_args = asdict(shape) if shape is not None and shape.active else None
+        return await client.call(name, args, deadline, report, shape_args, profile)
+    return await execute_operation(name, args, deadline, report, shape, profile)
+
+
+async def execute_operation(
+    name: str,
+    args: Dict[str, Any],
+    deadline: Optional[Deadline] = None,
+    report: Optional[ProgressCallback] = None,
+    shape: Optional[OutputShape] = None,
+    profile: bool = False,
+) -> Any:
+    """
+    Run a named operation in this process.
+
+    Args and return value as for run_operation.
+    """
+    operation = get_operation(name)
+    report = report or _no_progress
+    profile = (profile or profile_all_calls()) and not operation.inline
+    profile_ids: List[str] = []
+
+    try:
+        if operation.inline:
+            result = operation.work(**args)
+        elif operation.needs_driver:
+            state: Dict[str, Any] = {}
+            partial = operation.partial
+
+            def work(driver: Any) -> Any:
+                with span("extract", operation=name):
+                    return operation.work(driver, state, report, **args)
+
+            result = await run_scraper(
+                name,
+                profiled(name, work, profile_ids) if profile else work,
+                deadline,
+                (lambda: partial(state)) if partial else None,
+            )
+        else:
+            loop = asyncio.get_running_loop()
+            call = functools.partial(operation.work, **args)
+            with span("execute", operation=name):
+                result = await loop.run_in_executor(
+                    None, profiled(name, call, profile_ids) if profile else call
+                )
+    finally:
+        note_profiles(profile_ids)
+
+    if shape is not None and operation.result_kind:
+        with span("shape"):
+            if isinstance(result, list):
+                return shape_list(result, shape, operation.result_kind)
+            return shape_result(result, shape, operation.result_kind)
+    return result
@@ -0,0 +1,16 @@
+# linkedin_mcp_server/pool/__init__.py
+"""
+Browser-pool service shared by the workers of a multi-worker HTTP server.
+
+In multi-worker mode several stateless MCP front-end processes accept HTTP
+requests, and one process owns the Chrome sessions, the lease queue that
+limits concurrent browser use, the saved-search scheduler and the crawls.
+Front-ends send named operations (see linkedin_mcp_server.operations) to that
+process over a Unix socket, so request handling scales across CPU cores while
+browser sessions and LinkedIn traffic stay under a single budget.
+
+Key Components:
+- Newline-delimited JSON protocol with streamed progress frames
+- Asyncio Unix socket server running operations on the browser pool
+- Client used by front-end workers, cancelling operations on disconnect
+"""
@@ -0,0 +1,110 @@
+# linkedin_mcp_server/pool/client.py
+"""
+Client front-end workers use to run operations on the browser-pool service.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from linkedin_mcp_server.deadline import Deadline
+from linkedin_mcp_server.exceptions import (
+    BrowserPoolUnavailableError,
+    PoolOperationError,
+)
+from linkedin_mcp_server.flight_recorder import note_page
+from linkedin_mcp_server.pool.protocol import MAX_MESSAGE_BYTES, decode, encode
+from linkedin_mcp_server.profiling import note_profiles
+from linkedin_mcp_server.tracing import merge_remote, trace_context
+
+logger = logging.getLogger(__name__)
+
+
+class PoolClient:
+    """Sends operations to the browser-pool service over its Unix socket."""
+
+    def __init__(self, socket_path: str) -> None:
+        """
+        Args:
+            socket_path: Path of the service's Unix socket
+        """
+        self.socket_path = socket_path
+
+    async def call(
+        self,
+        name: str,
+        args: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        report: Optional[Any] = None,
+        shape: Optional[Dict[str, Any]] = None,
+        profile: bool = False,
+    ) -> Any:
+        """
+        Run an operation on the service and wait for its result.
+
+        Cancelling the call closes the connection, which cancels the operation
+        in the service.
+
+        Args:
+            name: Registered operation name
+            args: Keyword arguments of the operation
+            deadline: Deadline of the call, None for no limit
+            report: Progress callback receiving progress, total and message
+            shape: Output shaping options as a dict of OutputShape fields
+            profile: Profile the operation in the service
+
+        Returns:
+            The operation's result
+
+        Raises:
+            PoolOperationError: If the operation failed in the service
+            BrowserPoolUnavailableError: If the service cannot be reached
+        """
+        try:
+            reader, writer = await asyncio.open_unix_connection(
+                self.socket_path, limit=MAX_MESSAGE_BYTES
+            )
+        except OSError as e:
+            raise BrowserPoolUnavailableError(
+                f"Browser-pool service at {self.socket_path} is not reachable: {e}"
+            ) from e
+
+        try:
+            writer.write(
+                encode(
+                    {
+                        "op": name,
+                        "args": args,
+                        "deadline": deadline.remaining() if deadline else None,
+                        "shape": shape,
+                        "trace": trace_context(),
+                        "profile": profile,
+                    }
+                )
+            )
+            await writer.drain()
+
+            while True:
+                line = await reader.readline()
+                if not line:
+                    raise BrowserPoolUnavailableError(
+                        f"Browser-pool service closed the connection during {name}"
+                    )
+                message = decode(line)
+                if "progress" in message:
+                    if report is not None:
+                        report(*message["progress"])
+                    continue
+                merge_remote(message.get("trace"))
+                note_profiles(message.get("profile_ids"))
+                for page in message.get("pages", []):
+                    note_page(page)
+                if "error" in message:
+                    raise PoolOperationError(message["error"])
+                return message.get("result")
+        except ConnectionError as e:
+            raise BrowserPoolUnavailableError(
+                f"Lost connection to the browser-pool service during {name}: {e}"
+            ) from e
+        finally:
+            writer.close()
@@ -0,0 +1,43 @@
+# linkedin_mcp_server/pool/protocol.py
+"""
+Wire protocol between front-end workers and the browser-pool service.
+
+Each operation uses its own connection. The client sends one request line and
+reads response lines until a final one; closing the connection early cancels
+the operation. Every message is a JSON object on a single line:
+
+- request: {"op": name, "args": {...}, "deadline": seconds or null,
+  "shape": {...} or null, "trace": {"trace_id", "parent_id"} or null,
+  "profile": bool}
+- progress: {"progress": [progress, total, message]}
+- final: {"result": ...} or {"error": structured error response}, with
+  "trace": {"spans", "phases"} when the request carried a trace and
+  "profile_ids": [...] when the operation was profiled and "pages": [...]
+  when pages were captured for the flight recorder
+"""
+
+from typing import Any, Dict
+
+from linkedin_mcp_server.jsonutil import dumps_bytes, loads
+
+# Stream buffer limit for a single line; company profiles with employees and
+# job searches with full descriptions run to a few hundred KiB
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    """Serialize a message as one protocol line."""
+    return dumps_bytes(message) + b"\n"
+
+
+def decode(line: bytes) -> Dict[str, Any]:
+    """
+    Parse one protocol line.
+
+    Raises:
+        ValueError: If the line is not a JSON object
+    """
+    message = loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Protocol message is not a JSON object")
+    return message
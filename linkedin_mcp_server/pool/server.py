@@ -0,0 +1,196 @@
+# linkedin_mcp_server/pool/server.py
+"""
+Browser-pool service: runs operations sent by front-end workers.
+
+The service runs an asyncio event loop on a daemon thread of the process that
+owns the browser pool. Each connection carries one operation, which runs
+exactly as it would for a single-process server (execute_operation), with its
+progress forwarded to the client as it happens. A client closing its
+connection cancels the operation, stopping the browser like an abandoned tool
+call does.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Optional
+
+from linkedin_mcp_server.deadline import Deadline
+from linkedin_mcp_server.error_handler import convert_exception_to_response
+from linkedin_mcp_server.exceptions import LinkedInMCPError
+from linkedin_mcp_server.flight_recorder import collect_pages
+from linkedin_mcp_server.operations import execute_operation
+from linkedin_mcp_server.pool.protocol import MAX_MESSAGE_BYTES, decode, encode
+from linkedin_mcp_server.profiling import collect_profiles
+from linkedin_mcp_server.shaping import OutputShape
+from linkedin_mcp_server.tracing import continue_trace
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the service thread to start listening
+STARTUP_TIMEOUT = 10.0
+
+
+class PoolServer:
+    """Unix socket server running operations on this process's browser pool."""
+
+    def __init__(self, socket_path: str) -> None:
+        """
+        Args:
+            socket_path: Path of the Unix socket to listen on
+        """
+        self.socket_path = socket_path
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._startup_error: Optional[BaseException] = None
+
+    def start(self) -> None:
+        """
+        Start listening on the service thread.
+
+        Raises:
+            LinkedInMCPError: If the socket cannot be bound
+        """
+        self._thread = threading.Thread(
+            target=self._run, name="linkedin-browser-pool", daemon=True
+        )
+        self._thread.start()
+        if not self._ready.wait(STARTUP_TIMEOUT) or self._startup_error:
+            raise LinkedInMCPError(
+                f"Browser-pool service failed to listen on {self.socket_path}: "
+                f"{self._startup_error or 'timed out'}"
+            )
+        logger.info(f"Browser-pool service listening on {self.socket_path}")
+
+    def stop(self) -> None:
+        """Stop accepting connections, cancel running operations and remove the socket."""
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+    def _run(self) -> None:
+        """Service thread body."""
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        asyncio.set_event_loop(loop)
+        try:
+            # A socket left behind by a crashed server would fail the bind
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            os.makedirs(os.path.dirname(self.socket_path) or ".", exist_ok=True)
+            self._server = loop.run_until_complete(
+                asyncio.start_unix_server(
+                    self._handle, self.socket_path, limit=MAX_MESSAGE_BYTES
+                )
+            )
+            # Browser sessions act with the user's LinkedIn account
+            os.chmod(self.socket_path, 0o600)
+        except BaseException as e:
+            self._startup_error = e
+            self._ready.set()
+            loop.close()
+            return
+
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._server.close()
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+            self._loop = None
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Run the operation of one connection."""
+        loop = asyncio.get_running_loop()
+        try:
+            try:
+                request = decode(await reader.readline())
+                name = request["op"]
+                args = request.get("args") or {}
+                seconds = request.get("deadline")
+                shape = request.get("shape")
+                trace = continue_trace(request.get("trace"))
+                profile = bool(request.get("profile"))
+            except (ValueError, KeyError) as e:
+                error = LinkedInMCPError(f"Malformed browser-pool request: {e}")
+                writer.write(encode({"error": convert_exception_to_response(error)}))
+                await writer.drain()
+                return
+
+            def report(
+                progress: float,
+                total: Optional[float] = None,
+                message: Optional[str] = None,
+            ) -> None:
+                # Called from the scraper's worker thread
+                frame = encode({"progress": [progress, total, message]})
+                loop.call_soon_threadsafe(_write_progress, writer, frame)
+
+            profile_ids = collect_profiles()
+            pages = collect_pages()
+            operation = asyncio.ensure_future(
+                execute_operation(
+                    name,
+                    args,
+                    Deadline(seconds) if seconds is not None else None,
+                    report,
+                    OutputShape(**shape) if shape else None,
+                    profile,
+                )
+            )
+            # The client sends nothing after the request; any read returning
+            # means it went away
+            disconnect = asyncio.ensure_future(reader.read(1))
+            await asyncio.wait(
+                {operation, disconnect}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if not operation.done():
+                logger.info("Client of %s disconnected, cancelling it", name)
+                operation.cancel()
+                try:
+                    await operation
+                except BaseException:
+                    pass
+                return
+            disconnect.cancel()
+
+            try:
+                message = {"result": operation.result()}
+            except Exception as e:
+                message = {"error": convert_exception_to_response(e, name)}
+            if trace is not None:
+                # Spans of the operation, for the worker's trace
+                message["trace"] = trace.export()
+            if profile_ids:
+                message["profile_ids"] = profile_ids
+            if pages:
+                message["pages"] = pages
+            writer.write(encode(message))
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def _write_progress(writer: asyncio.StreamWriter, frame: bytes) -> None:
+    """Send a progress frame unless the client has gone away."""
+    # Scraper work can outlive its connection until the browser stops
+    if not writer.is_closing():
+        writer.write(frame)
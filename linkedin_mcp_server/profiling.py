@@ -0,0 +1,359 @@
+# linkedin_mcp_server/profiling.py
+"""
+On-demand CPU profiling of tool calls and of time windows.
+
+A profiled operation runs under cProfile while a sampler records the Python
+stacks of the thread doing its work. Only one cProfile profiler can be active
+per process, and it records every thread, so the .pstats of a call can include
+other threads' work; while one call is profiled, calls profiled at the same
+time are sampled only. A profiled window samples every
+thread of the process for a fixed time. Each profile is written to
+<profile_dir> (default <state_dir>/profiles/) as two files named after the time
+it started:
+
+- <id>.pstats: load with pstats or snakeviz (for windows and sampled-only
+  calls, built from the samples, so call counts are sample counts)
+- <id>.collapsed: one "frame;frame;frame count" line per distinct stack, the
+  input of flamegraph.pl, speedscope and inferno
+
+Nothing is installed or measured while no profile is requested.
+"""
+
+import contextvars
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from mcp.types import TextContent
+
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.exceptions import LinkedInMCPError
+from linkedin_mcp_server.jsonutil import dumps
+
+# Seconds between stack samples (200 Hz)
+SAMPLE_INTERVAL = 0.005
+
+# Longest window profile_window accepts, in seconds
+MAX_WINDOW_SECONDS = 600
+
+# Held while a cProfile profiler is enabled; only one can be active at a time
+_cprofile_lock = threading.Lock()
+
+# Frames of a sampled stack, outermost first: (filename, first line, function)
+Frame = Tuple[str, int, str]
+
+
+def get_profile_dir() -> str:
+    """Directory profiles are written to."""
+    server = get_config().server
+    return server.profile_dir or os.path.join(server.state_dir, "profiles")
+
+
+def profile_all_calls() -> bool:
+    """Whether every operation is profiled (--profile-calls)."""
+    return get_config().server.profile_calls
+
+
+class StackSampler:
+    """Samples the Python stacks of some or all threads on a background thread."""
+
+    def __init__(
+        self,
+        thread_ids: Optional[List[int]] = None,
+        interval: float = SAMPLE_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            thread_ids: Threads to sample, None for every thread but the sampler
+            interval: Seconds between samples
+        """
+        self.thread_ids = thread_ids
+        self.interval = interval
+        self.samples: "Counter[Tuple[Frame, ...]]" = Counter()
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="linkedin-profile-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.elapsed = time.perf_counter() - self._started
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                if self.thread_ids is not None and thread_id not in self.thread_ids:
+                    continue
+                stack: List[Frame] = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                if self.thread_ids is None:
+                    # Windows cover every thread; keep them apart in the graph
+                    if thread_id not in names:
+                        names = {t.ident: t.name for t in threading.enumerate()}
+                    stack.append(("<thread>", 0, names.get(thread_id, str(thread_id))))
+                self.samples[tuple(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Samples in the collapsed-stack format of flamegraph.pl."""
+        lines = [
+            ";".join(_frame_label(f) for f in stack) + f" {count}"
+            for stack, count in self.samples.most_common()
+        ]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def pstats_dict(self) -> Dict[Frame, Any]:
+        """
+        Samples as the stats dict cProfile dumps, with times estimated from the
+        sampling interval and call counts replaced by sample counts.
+        """
+        seconds = self.elapsed / max(sum(self.samples.values()), 1)
+        stats: Dict[Frame, List[Any]] = {}
+        for stack, count in self.samples.items():
+            spent = count * seconds
+            seen = set()
+            for depth, frame in enumerate(stack):
+                entry = stats.setdefault(frame, [0, 0, 0.0, 0.0, {}])
+                if frame not in seen:
+                    # Inclusive time counts once per sample, even when recursive
+                    seen.add(frame)
+                    entry[0] += count
+                    entry[1] += count
+                    entry[3] += spent
+                if depth:
+                    callers = entry[4]
+                    caller = stack[depth - 1]
+                    nc, cc, tt, ct = callers.get(caller, (0, 0, 0.0, 0.0))
+                    callers[caller] = (nc + count, cc + count, tt, ct + spent)
+            stats[stack[-1]][2] += spent
+        return {frame: tuple(entry) for frame, entry in stats.items()}
+
+
+def _frame_label(frame: Frame) -> str:
+    filename, line, function = frame
+    if filename == "<thread>":
+        return f"thread {function}"
+    # Last two path components keep labels short but unambiguous
+    short = "/".join(filename.replace("\\", "/").split("/")[-2:])
+    return f"{function} ({short}:{line})"
+
+
+def _new_profile_id(label: str) -> str:
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in label)
+    return f"{stamp}-{safe}-{uuid.uuid4().hex[:6]}"
+
+
+def _write_profile(profile_id: str, stats: Dict[Frame, Any], collapsed: str) -> None:
+    directory = get_profile_dir()
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f"{profile_id}.pstats"), "wb") as f:
+        marshal.dump(stats, f)
+    with open(os.path.join(directory, f"{profile_id}.collapsed"), "w") as f:
+        f.write(collapsed)
+
+
+def profiled(
+    label: str, work: Callable[..., Any], profile_ids: List[str]
+) -> Callable[..., Any]:
+    """
+    Wrap a function so each call is profiled in the thread running it.
+
+    Args:
+        label: Name included in the profile id (the operation name)
+        work: Function to profile
+        profile_ids: Receives the id of each profile written
+
+    Returns:
+        Function taking the same arguments as work
+    """
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        profile_id = _new_profile_id(label)
+        sampler = StackSampler([threading.get_ident()])
+        # cProfile is process-wide on 3.12 (sys.monitoring) and a second
+        # profiler cannot be enabled; other calls fall back to sampling
+        profiler = (
+            cProfile.Profile() if _cprofile_lock.acquire(blocking=False) else None
+        )
+        try:
+            sampler.start()
+            if profiler is not None:
+                profiler.enable()
+            try:
+                return work(*args, **kwargs)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+                sampler.stop()
+        finally:
+            if profiler is not None:
+                _cprofile_lock.release()
+                profiler.create_stats()
+                stats = profiler.stats
+            else:
+                stats = sampler.pstats_dict()
+            _write_profile(profile_id, stats, sampler.collapsed())
+            profile_ids.append(profile_id)
+
+    return run
+
+
+# Profile ids of the tool call running in this context, set by ProfilingMiddleware
+_call_profiles: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "linkedin_mcp_call_profiles", default=None
+)
+
+
+def collect_profiles() -> List[str]:
+    """Start collecting the ids of profiles taken in this context."""
+    slot: List[str] = []
+    _call_profiles.set(slot)
+    return slot
+
+
+def note_profiles(profile_ids: Optional[List[str]]) -> None:
+    """Attribute profiles to the tool call running in this context."""
+    slot = _call_profiles.get()
+    if slot is not None and profile_ids:
+        slot.extend(profile_ids)
+
+
+def profile_window(seconds: float = 10.0) -> Dict[str, Any]:
+    """
+    Operation profile_window: sample every thread of the process for a while.
+
+    Args:
+        seconds: Length of the window
+
+    Returns:
+        Dict[str, Any]: Description of the written profile, as in list_profiles
+
+    Raises:
+        LinkedInMCPError: If the window is not between 0 and MAX_WINDOW_SECONDS
+    """
+    if not 0 < seconds <= MAX_WINDOW_SECONDS:
+        raise LinkedInMCPError(
+            f"Profile window must be between 0 and {MAX_WINDOW_SECONDS} seconds"
+        )
+    profile_id = _new_profile_id("window")
+    sampler = StackSampler()
+    sampler.start()
+    time.sleep(seconds)
+    sampler.stop()
+    _write_profile(profile_id, sampler.pstats_dict(), sampler.collapsed())
+    return _describe(profile_id)
+
+
+def _describe(profile_id: str) -> Dict[str, Any]:
+    directory = get_profile_dir()
+    files = {
+        kind: os.path.join(directory, f"{profile_id}.{kind}")
+        for kind in ("pstats", "collapsed")
+    }
+    return {
+        "profile_id": profile_id,
+        "created_at": datetime.fromtimestamp(
+            os.path.getmtime(files["pstats"])
+        ).isoformat(timespec="seconds"),
+        "files": files,
+        "bytes": sum(os.path.getsize(p) for p in files.values() if os.path.exists(p)),
+    }
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    """Operation list_profiles: profiles on disk, newest first."""
+    directory = get_profile_dir()
+    if not os.path.isdir(directory):
+        return []
+    ids = sorted(
+        (n[: -len(".pstats")] for n in os.listdir(directory) if n.endswith(".pstats")),
+        reverse=True,
+    )
+    return [_describe(profile_id) for profile_id in ids]
+
+
+def read_profile(
+    profile_id: str, view: str = "summary", limit: int = 40, max_chars: int = 50000
+) -> Dict[str, Any]:
+    """
+    Operation read_profile: a profile as text.
+
+    Args:
+        profile_id: Id from list_profiles
+        view: "summary" (functions by cumulative time, from the pstats file)
+            or "collapsed" (the collapsed stacks, for a flame graph)
+        limit: Functions listed by the summary
+        max_chars: Longest text returned; collapsed stacks are cut at a line
+
+    Raises:
+        LinkedInMCPError: If the profile does not exist or the view is unknown
+    """
+    if os.path.basename(profile_id) != profile_id or not profile_id:
+        raise LinkedInMCPError(f"Invalid profile id {profile_id}")
+    base = os.path.join(get_profile_dir(), profile_id)
+    if not os.path.exists(f"{base}.pstats"):
+        raise LinkedInMCPError(f"Unknown profile {profile_id}; see list_profiles")
+
+    if view == "summary":
+        out = io.StringIO()
+        stats = pstats.Stats(f"{base}.pstats", stream=out)
+        stats.sort_stats("cumulative").print_stats(max(1, limit))
+        text = out.getvalue()
+    elif view == "collapsed":
+        with open(f"{base}.collapsed") as f:
+            text = f.read()
+    else:
+        raise LinkedInMCPError(f"Unknown profile view {view}; use summary or collapsed")
+
+    truncated = len(text) > max_chars
+    if truncated:
+        text = text[: text.rfind("\n", 0, max_chars) + 1 or max_chars]
+    return {**_describe(profile_id), "view": view, "text": text, "truncated": truncated}
+
+
+class ProfilingMiddleware(Middleware):
+    """FastMCP middleware returning the ids of profiles taken during a tool call."""
+
+    async def on_call_tool(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        slot: List[str] = []
+        token = _call_profiles.set(slot)
+        try:
+            result = await call_next(context)
+        finally:
+            _call_profiles.reset(token)
+        if slot and hasattr(result, "content"):
+            result.content.append(
+                TextContent(
+                    type="text",
+                    text=dumps({"profile_ids": slot}, indent=True),
+                )
+            )
+        return result
@@ -0,0 +1,14 @@
+# linkedin_mcp_server/searches/__init__.py
+"""
+Saved job searches monitored on a schedule.
+
+A saved search is a job search term (or the recommended jobs feed) that the server
+re-runs at a fixed interval. Each run records the job ids it saw and compares them
+with the previous run, so clients can ask for just the postings that appeared or
+disappeared instead of diffing full result lists themselves.
+
+Key Components:
+- Incremental job search scraper that stops at results seen in the previous run
+- Saved search definitions and run history in the server's state directory
+- Background scheduler running due searches on the browser pool
+"""
@@ -0,0 +1,321 @@
+# linkedin_mcp_server/searches/saved.py
+"""
+Saved search definitions, run history and new/removed posting tracking.
+
+Each saved search is one JSON document in <state_dir>/saved_searches/ holding its
+definition, the ids of the jobs it currently lists (newest first, capped) and the
+postings that appeared or disappeared since the client last fetched changes.
+
+Runs are incremental: a date-sorted search reads only until the first job seen in
+the previous run. Removed postings are detected in the part of the list that was
+re-read, and every ``full_scan_every`` runs the whole list (up to ``max_pages``)
+is read again to catch removals further down. The recommended jobs collection
+has no stable order, so its removals are only detected when a full scan read
+the whole list.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.crawl.checkpoints import CheckpointStore
+from linkedin_mcp_server.exceptions import LinkedInMCPError
+from linkedin_mcp_server.searches.scraper import ScanResult, scan_jobs
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+# Jobs remembered per saved search
+MAX_TRACKED_JOBS = 1000
+
+# Changes kept per saved search until the client fetches them
+MAX_PENDING_CHANGES = 500
+
+_NAME = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+_name_locks: Dict[str, threading.Lock] = {}
+_name_locks_lock = threading.Lock()
+
+
+@dataclass
+class SavedSearch:
+    """A saved search's definition and monitoring state."""
+
+    name: str
+    # Job search keywords, None for the recommended jobs collection
+    search_term: Optional[str] = None
+    interval_minutes: int = 60
+    max_pages: int = 5
+    full_scan_every: int = 24
+    created_at: Optional[float] = None
+    last_run_at: Optional[float] = None
+    next_run_at: Optional[float] = None
+    run_count: int = 0
+    last_error: Optional[str] = None
+    last_run_pages: int = 0
+    job_ids: List[str] = field(default_factory=list)
+    jobs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    new_jobs: List[Dict[str, Any]] = field(default_factory=list)
+    removed_jobs: List[Dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SavedSearch":
+        """Restore a saved search from its stored form, ignoring unknown keys."""
+        known = cls.__dataclass_fields__.keys()
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the saved search to its stored form."""
+        return asdict(self)
+
+    def summary(self) -> Dict[str, Any]:
+        """Definition and run state, without the tracked jobs."""
+        return {
+            "name": self.name,
+            "search_term": self.search_term,
+            "recommended": self.search_term is None,
+            "interval_minutes": self.interval_minutes,
+            "max_pages": self.max_pages,
+            "full_scan_every": self.full_scan_every,
+            "last_run_at": self.last_run_at,
+            "next_run_at": self.next_run_at,
+            "run_count": self.run_count,
+            "last_run_pages": self.last_run_pages,
+            "last_error": self.last_error,
+            "tracked_jobs": len(self.job_ids),
+            "pending_new": len(self.new_jobs),
+            "pending_removed": len(self.removed_jobs),
+        }
+
+
+def get_saved_search_store() -> CheckpointStore:
+    """Get the store of saved searches in the configured state directory."""
+    return CheckpointStore(
+        os.path.join(get_config().server.state_dir, "saved_searches")
+    )
+
+
+def _lock_for(name: str) -> threading.Lock:
+    """Lock serializing runs and updates of one saved search."""
+    with _name_locks_lock:
+        return _name_locks.setdefault(name, threading.Lock())
+
+
+def load_saved_search(name: str) -> SavedSearch:
+    """
+    Load a saved search.
+
+    Args:
+        name: Name of the saved search
+
+    Returns:
+        SavedSearch: The saved search
+
+    Raises:
+        LinkedInMCPError: If no saved search has this name
+    """
+    data = get_saved_search_store().load(name)
+    if data is None:
+        raise LinkedInMCPError(f"No saved search named {name!r}")
+    return SavedSearch.from_dict(data)
+
+
+def list_saved_searches() -> List[SavedSearch]:
+    """List all saved searches."""
+    store = get_saved_search_store()
+    searches = []
+    for key in store.keys():
+        data = store.load(key)
+        if data is not None:
+            searches.append(SavedSearch.from_dict(data))
+    return searches
+
+
+def save_search(
+    name: str,
+    search_term: Optional[str],
+    interval_minutes: int = 60,
+    max_pages: int = 5,
+    full_scan_every: int = 24,
+) -> SavedSearch:
+    """
+    Create or update a saved search. Updating keeps its tracked jobs.
+
+    Args:
+        name: Name of the saved search (letters, digits, '-' and '_')
+        search_term: Job search keywords, None for the recommended jobs collection
+        interval_minutes: Minutes between scheduled runs
+        max_pages: Maximum number of result pages read per run
+        full_scan_every: Read all max_pages every this many runs to catch removals
+
+    Returns:
+        SavedSearch: The saved search
+
+    Raises:
+        LinkedInMCPError: If the name or limits are invalid
+    """
+    if not _NAME.match(name):
+        raise LinkedInMCPError(
+            f"Invalid saved search name {name!r}: use letters, digits, '-' and '_'"
+        )
+    if interval_minutes < 1 or max_pages < 1 or full_scan_every < 1:
+        raise LinkedInMCPError(
+            "interval_minutes, max_pages and full_scan_every must be at least 1"
+        )
+
+    store = get_saved_search_store()
+    with _lock_for(name):
+        data = store.load(name)
+        if data is None:
+            search = SavedSearch(name=name, created_at=time.time())
+        else:
+            search = SavedSearch.from_dict(data)
+        if search.search_term != search_term:
+            # A different query lists different jobs; start a new baseline
+            search.run_count = 0
+            search.job_ids, search.jobs = [], {}
+            search.new_jobs, search.removed_jobs = [], []
+        search.search_term = search_term
+        search.interval_minutes = interval_minutes
+        search.max_pages = max_pages
+        search.full_scan_every = full_scan_every
+        search.next_run_at = time.time()
+        store.save(name, search.to_dict())
+    return search
+
+
+def delete_saved_search(name: str) -> None:
+    """
+    Delete a saved search and its history.
+
+    Args:
+        name: Name of the saved search
+
+    Raises:
+        LinkedInMCPError: If no saved search has this name
+    """
+    with _lock_for(name):
+        load_saved_search(name)
+        get_saved_search_store().delete(name)
+
+
+def _apply_scan(search: SavedSearch, scan: ScanResult, full_scan: bool) -> None:
+    """Update a saved search's tracked jobs and pending changes from a scan."""
+    previous = search.job_ids
+    previous_set = set(previous)
+    scanned_ids = [job["job_id"] for job in scan.jobs]
+    scanned_set = set(scanned_ids)
+
+    new_jobs = [job for job in scan.jobs if job["job_id"] not in previous_set]
+
+    # Jobs that should have been re-read but were not are gone from the list
+    last_known = next(
+        (job_id for job_id in reversed(scanned_ids) if job_id in previous_set), None
+    )
+    if full_scan and scan.exhausted:
+        expected = previous
+    elif last_known is not None and search.search_term is not None:
+        # Newest first: everything listed down to the last job read again would
+        # have been read again too if still listed. A full scan that stopped at
+        # max_pages covers the list down to the last known job it read.
+        expected = previous[: previous.index(last_known) + 1]
+    else:
+        expected = []
+    removed_ids = [job_id for job_id in expected if job_id not in scanned_set]
+    removed_set = set(removed_ids)
+
+    search.new_jobs = (search.new_jobs + new_jobs)[-MAX_PENDING_CHANGES:]
+    search.removed_jobs = (
+        search.removed_jobs
+        + [search.jobs.get(job_id, {"job_id": job_id}) for job_id in removed_ids]
+    )[-MAX_PENDING_CHANGES:]
+
+    job_ids = scanned_ids + [
+        job_id
+        for job_id in previous
+        if job_id not in scanned_set and job_id not in removed_set
+    ]
+    search.job_ids = job_ids[:MAX_TRACKED_JOBS]
+    jobs = {job["job_id"]: job for job in scan.jobs}
+    search.jobs = {
+        job_id: jobs.get(job_id) or search.jobs.get(job_id) or {"job_id": job_id}
+        for job_id in search.job_ids
+    }
+
+
+def run_saved_search(driver: "webdriver.Chrome", name: str) -> SavedSearch:
+    """
+    Run a saved search now and record what changed since its last run.
+
+    Args:
+        driver: Chrome WebDriver instance
+        name: Name of the saved search
+
+    Returns:
+        SavedSearch: The updated saved search
+
+    Raises:
+        LinkedInMCPError: If no saved search has this name
+    """
+    store = get_saved_search_store()
+    with _lock_for(name):
+        search = load_saved_search(name)
+        full_scan = search.run_count % search.full_scan_every == 0
+        logger.info(
+            f"Running saved search {name} ({'full' if full_scan else 'incremental'})"
+        )
+        try:
+            scan = scan_jobs(
+                driver,
+                search.search_term,
+                set() if full_scan else set(search.job_ids),
+                search.max_pages,
+                date_sorted=search.search_term is not None,
+            )
+        except Exception as e:
+            search.last_error = f"{type(e).__name__}: {e}"
+            search.next_run_at = time.time() + search.interval_minutes * 60
+            store.save(name, search.to_dict())
+            raise
+
+        _apply_scan(search, scan, full_scan)
+        search.run_count += 1
+        search.last_run_pages = scan.pages
+        search.last_error = None
+        search.last_run_at = time.time()
+        search.next_run_at = search.last_run_at + search.interval_minutes * 60
+        store.save(name, search.to_dict())
+    return search
+
+
+def take_changes(name: str, acknowledge: bool = True) -> Dict[str, Any]:
+    """
+    Get the postings that appeared or disappeared since changes were last taken.
+
+    Args:
+        name: Name of the saved search
+        acknowledge: Clear the returned changes so the next call only returns
+            changes found after this one
+
+    Returns:
+        Dict[str, Any]: Saved search summary with "new_jobs" and "removed_jobs"
+
+    Raises:
+        LinkedInMCPError: If no saved search has this name
+    """
+    with _lock_for(name):
+        search = load_saved_search(name)
+        result = search.summary()
+        result["new_jobs"] = search.new_jobs
+        result["removed_jobs"] = search.removed_jobs
+        if acknowledge and (search.new_jobs or search.removed_jobs):
+            search.new_jobs, search.removed_jobs = [], []
+            get_saved_search_store().save(name, search.to_dict())
+    return result
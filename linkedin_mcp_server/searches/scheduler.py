@@ -0,0 +1,102 @@
+# linkedin_mcp_server/searches/scheduler.py
+"""
+Background scheduler for saved searches.
+
+A single daemon thread wakes up periodically, runs every saved search whose next
+run is due, and goes back to sleep. Runs lease a browser from the pool like any
+tool call, so scheduled searches wait for a free browser instead of competing
+with interactive calls for the same one.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from linkedin_mcp_server.deadline import Deadline
+from linkedin_mcp_server.searches.saved import list_saved_searches, run_saved_search
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks for due searches
+SCHEDULER_POLL_INTERVAL = 30.0
+
+# Seconds a single scheduled run may take
+SCHEDULED_RUN_TIMEOUT = 300.0
+
+_thread: Optional[threading.Thread] = None
+_stop = threading.Event()
+_thread_lock = threading.Lock()
+# Deadline of the run in progress, cancelled on shutdown
+_current_run: Optional[Deadline] = None
+
+
+def _run_due_searches() -> None:
+    """Run every saved search whose next run time has passed."""
+    global _current_run
+    from linkedin_mcp_server.authentication import ensure_authentication
+    from linkedin_mcp_server.drivers.chrome import driver_lease
+
+    now = time.time()
+    due = [s for s in list_saved_searches() if (s.next_run_at or 0) <= now]
+    if not due:
+        return
+
+    authentication = ensure_authentication()
+    for search in sorted(due, key=lambda s: s.next_run_at or 0):
+        if _stop.is_set():
+            return
+        deadline = Deadline(SCHEDULED_RUN_TIMEOUT)
+        _current_run = deadline
+        try:
+            with driver_lease(authentication, deadline) as driver:
+                run_saved_search(driver, search.name)
+        except Exception as e:
+            # The error is recorded on the saved search; keep the schedule going
+            logger.warning(f"Scheduled run of saved search {search.name} failed: {e}")
+        finally:
+            _current_run = None
+
+
+def _scheduler_loop() -> None:
+    """Scheduler thread body."""
+    logger.info("Saved search scheduler started")
+    while not _stop.is_set():
+        try:
+            _run_due_searches()
+        except Exception as e:
+            logger.warning(f"Saved search scheduler error: {e}")
+        _stop.wait(SCHEDULER_POLL_INTERVAL)
+    logger.info("Saved search scheduler stopped")
+
+
+def start_scheduler() -> None:
+    """Start the scheduler thread if it is not running."""
+    global _thread
+    with _thread_lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        _stop.clear()
+        _thread = threading.Thread(
+            target=_scheduler_loop, name="saved-search-scheduler", daemon=True
+        )
+        _thread.start()
+
+
+def stop_scheduler(timeout: float = 10.0) -> None:
+    """
+    Stop the scheduler thread, interrupting the run in progress.
+
+    Args:
+        timeout: Seconds to wait for the thread to exit
+    """
+    global _thread
+    with _thread_lock:
+        thread, _thread = _thread, None
+    if thread is None:
+        return
+    _stop.set()
+    run = _current_run
+    if run is not None:
+        run.cancel()
+    thread.join(timeout)
@@ -0,0 +1,179 @@
+# linkedin_mcp_server/searches/scraper.py
+"""
+Incremental job list scraper for saved searches.
+
+Reads job search results sorted by date (or the recommended jobs collection)
+page by page through the ``start`` offset, and stops as soon as it reaches jobs
+seen in the previous run. For an hourly search that usually means a single page
+instead of a full search with fixed scroll-and-sleep steps. Each page is read
+with a few scripted scrolls of the result list and one script call per scroll
+position rather than one WebDriver call per job card.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from urllib.parse import urlencode
+
+from linkedin_mcp_server.crawl.employees import raise_if_challenged
+from linkedin_mcp_server.urls import linkedin_url
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+# LinkedIn shows 25 jobs per result page
+JOBS_PER_PAGE = 25
+
+# Seconds to wait for job cards to render on a page
+RESULTS_WAIT_TIMEOUT = 10
+
+# Scroll positions of the result list at which cards are read; LinkedIn only
+# renders the details of cards near the viewport
+_SCROLL_STEPS = (0.0, 0.35, 0.7, 1.0)
+_SCROLL_PAUSE = 0.3
+
+_EXTRACT_JOBS_JS = """
+const jobs = [];
+const seen = new Set();
+for (const card of document.querySelectorAll('[data-occludable-job-id], [data-job-id]')) {
+  const id = card.getAttribute('data-occludable-job-id') || card.getAttribute('data-job-id');
+  if (!id || seen.has(id)) continue;
+  seen.add(id);
+  const text = (selector) => {
+    const node = card.querySelector(selector);
+    return node ? node.innerText.split('\\n')[0].trim() || null : null;
+  };
+  jobs.push({
+    job_id: id,
+    job_title: text('.job-card-list__title, a[href*="/jobs/view/"]'),
+    company: text('.artdeco-entity-lockup__subtitle'),
+    location: text('.job-card-container__metadata-wrapper, .artdeco-entity-lockup__caption'),
+    linkedin_url: location.origin + '/jobs/view/' + id + '/',
+  });
+}
+return jobs;
+"""
+
+_SCROLL_LIST_JS = """
+const list = document.querySelector(
+  '.jobs-search-results-list, .scaffold-layout__list > div, .scaffold-layout__list'
+);
+if (list) list.scrollTop = (list.scrollHeight - list.clientHeight) * arguments[0];
+"""
+
+
+def search_url(search_term: Optional[str], start: int = 0) -> str:
+    """
+    Build the URL of one page of a job list.
+
+    Args:
+        search_term: Job search keywords, None for the recommended jobs collection
+        start: Offset of the first job on the page
+
+    Returns:
+        str: Page URL
+    """
+    if search_term is None:
+        return linkedin_url(f"jobs/collections/recommended/?start={start}")
+    # sortBy=DD lists the most recent postings first
+    query = urlencode({"keywords": search_term, "sortBy": "DD", "start": start})
+    return linkedin_url(f"jobs/search/?{query}")
+
+
+@dataclass
+class ScanResult:
+    """Jobs read by one incremental scan, in list order."""
+
+    jobs: List[Dict[str, Any]] = field(default_factory=list)
+    # Last already-known job on the page where the scan stopped; the scan
+    # covered the list down to this job
+    overlap_id: Optional[str] = None
+    # The list ended before the page limit, so every listed job was read
+    exhausted: bool = False
+    pages: int = 0
+
+
+def _cards_loaded(driver: "webdriver.Chrome") -> Any:
+    """WebDriverWait condition: the page's job cards once at least one rendered."""
+    jobs = driver.execute_script(_EXTRACT_JOBS_JS)
+    return jobs or False
+
+
+def _read_page(driver: "webdriver.Chrome") -> List[Dict[str, Any]]:
+    """Read all job cards of the loaded page, merging details across scrolls."""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        jobs = WebDriverWait(driver, RESULTS_WAIT_TIMEOUT).until(_cards_loaded)
+    except TimeoutException:
+        return []
+
+    by_id = {job["job_id"]: job for job in jobs}
+    for position in _SCROLL_STEPS[1:]:
+        driver.execute_script(_SCROLL_LIST_JS, position)
+        time.sleep(_SCROLL_PAUSE)
+        for job in driver.execute_script(_EXTRACT_JOBS_JS):
+            known = by_id.setdefault(job["job_id"], job)
+            for key, value in job.items():
+                if known.get(key) is None:
+                    known[key] = value
+    return list(by_id.values())
+
+
+def scan_jobs(
+    driver: "webdriver.Chrome",
+    search_term: Optional[str],
+    known_ids: Set[str],
+    max_pages: int,
+    date_sorted: bool = True,
+) -> ScanResult:
+    """
+    Read a job list until it reaches jobs seen before.
+
+    Args:
+        driver: Chrome WebDriver instance
+        search_term: Job search keywords, None for the recommended jobs collection
+        known_ids: Job ids seen in the previous run; empty for a full scan
+        max_pages: Maximum number of pages to read
+        date_sorted: The list is newest first, so the first known job means every
+            later one is known too. Otherwise the scan stops at the first page
+            without new jobs.
+
+    Returns:
+        ScanResult: Jobs read and why the scan stopped
+    """
+    result = ScanResult()
+    seen: Set[str] = set()
+
+    while result.pages < max_pages:
+        driver.get(search_url(search_term, result.pages * JOBS_PER_PAGE))
+        raise_if_challenged(driver)
+        page = [job for job in _read_page(driver) if job["job_id"] not in seen]
+        result.pages += 1
+
+        if not page:
+            result.exhausted = True
+            break
+
+        seen.update(job["job_id"] for job in page)
+        result.jobs.extend(page)
+
+        known = [job["job_id"] for job in page if job["job_id"] in known_ids]
+        if known and (date_sorted or len(known) == len(page)):
+            result.overlap_id = known[-1]
+            break
+        if len(page) < JOBS_PER_PAGE:
+            result.exhausted = True
+            break
+
+    logger.info(
+        "Scanned %d jobs on %d pages (%s)",
+        len(result.jobs),
+        result.pages,
+        "stopped at known job" if result.overlap_id else "no overlap",
+    )
+    return result
@@ -12,34 +12,85 @@ from typing import Any, Dict
 
 from fastmcp import FastMCP
 
+from linkedin_mcp_server.flight_recorder import FlightRecorderMiddleware
+from linkedin_mcp_server.jsonutil import serialize_tool_result
+from linkedin_mcp_server.metrics import ToolMetricsMiddleware
+from linkedin_mcp_server.operations import register_operation, run_operation
+from linkedin_mcp_server.profiling import ProfilingMiddleware
+from linkedin_mcp_server.searches.saved import list_saved_searches
+from linkedin_mcp_server.searches.scheduler import start_scheduler
 from linkedin_mcp_server.tools.company import register_company_tools
+from linkedin_mcp_server.tools.continuation import register_continuation_tools
+from linkedin_mcp_server.tools.crawl import register_crawl_tools
+from linkedin_mcp_server.tools.flight_recorder import register_flight_recorder_tools
 from linkedin_mcp_server.tools.job import register_job_tools
 from linkedin_mcp_server.tools.person import register_person_tools
+from linkedin_mcp_server.tools.profiling import register_profiling_tools
+from linkedin_mcp_server.tools.saved_search import register_saved_search_tools
+from linkedin_mcp_server.tracing import TracingMiddleware, traced_serializer
 
 logger = logging.getLogger(__name__)
 
 
-def create_mcp_server() -> FastMCP:
-    """Create and configure the MCP server with all LinkedIn tools."""
-    mcp = FastMCP("linkedin_scraper")
+def close_browser_sessions() -> Dict[str, Any]:
+    """
+    Operation close_session: quit every browser of the pool.
+
+    Browsers in use by other tool calls, crawls or scheduled searches are quit
+    when they are released rather than under them.
+    """
+    from linkedin_mcp_server.drivers.chrome import close_idle_drivers
+
+    sessions = close_idle_drivers()
+    message = "Successfully closed the browser session and cleaned up resources"
+    if sessions["deferred"]:
+        message = (
+            f"Closed {len(sessions['closed'])} idle browser(s); "
+            f"{len(sessions['deferred'])} in use will close when their work finishes"
+        )
+    return {"status": "success", "message": message, **sessions}
+
+
+register_operation("close_session", close_browser_sessions, needs_driver=False)
+
+
+def create_mcp_server(background: bool = True) -> FastMCP:
+    """
+    Create and configure the MCP server with all LinkedIn tools.
+
+    Args:
+        background: Resume the saved-search scheduler in this process; front-end
+            workers of a multi-worker server leave it to the browser-pool service
+    """
+    mcp = FastMCP(
+        "linkedin_scraper",
+        tool_serializer=traced_serializer(serialize_tool_result),
+    )
+    mcp.add_middleware(ToolMetricsMiddleware())
+    mcp.add_middleware(TracingMiddleware())
+    mcp.add_middleware(FlightRecorderMiddleware())
+    mcp.add_middleware(ProfilingMiddleware())
 
     # Register all tools
     register_person_tools(mcp)
     register_company_tools(mcp)
     register_job_tools(mcp)
+    register_crawl_tools(mcp)
+    register_saved_search_tools(mcp)
+    register_continuation_tools(mcp)
+    register_profiling_tools(mcp)
+    register_flight_recorder_tools(mcp)
+
+    # Resume monitoring of searches saved by previous runs
+    if background and list_saved_searches():
+        start_scheduler()
 
     # Register session management tool
     @mcp.tool()
     async def close_session() -> Dict[str, Any]:
         """Close the current browser session and clean up resources."""
-        from linkedin_mcp_server.drivers.chrome import close_all_drivers
-
         try:
-            close_all_drivers()
-            return {
-                "status": "success",
-                "message": "Successfully closed the browser session and cleaned up resources",
-            }
+            return await run_operation("close_session", {})
         except Exception as e:
             return {
                 "status": "error",
@@ -51,6 +102,10 @@ def create_mcp_server() -> FastMCP:
 
 def shutdown_handler() -> None:
     """Clean up resources on shutdown."""
+    from linkedin_mcp_server.crawl.engine import stop_all_crawls
     from linkedin_mcp_server.drivers.chrome import close_all_drivers
+    from linkedin_mcp_server.searches.scheduler import stop_scheduler
 
+    stop_scheduler()
+    stop_all_crawls()
     close_all_drivers()
@@ -0,0 +1,477 @@
+# linkedin_mcp_server/shaping.py
+"""
+Output shaping of tool results for LLM clients.
+
+Tool results carry every scraped field, including multi-KB free text (profile
+about sections, job descriptions). Three optional per-call controls make them
+smaller:
+
+- fields: projection onto dotted field paths ("name", "experiences.company")
+- max_field_chars: truncation of long text fields
+- max_tokens: an approximate token budget, met by trimming the least important
+  fields of each result kind first, then dropping trailing list items
+
+Nothing is lost: every truncated or removed value is kept in a bounded
+in-memory store, and the result lists a continuation handle for it under
+"truncated_fields" that the get_continuation tool reads back. When the
+per-field handles would not fit the token budget themselves, the result keeps
+the fields that fit and a single "_rest" handle to the whole unshaped result;
+budgets smaller than that handle (about 25 tokens) cannot be met.
+"""
+
+import copy
+import json
+import math
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Rough size of a token in characters of JSON text
+CHARS_PER_TOKEN = 4
+
+# Length text fields are cut to before they are dropped to meet a token budget
+BUDGET_FIELD_CHARS = 280
+
+# Keys kept by any projection
+ALWAYS_KEPT_FIELDS = ("partial", "partial_reason")
+
+# Key under "truncated_fields" of the handle to a whole result that was collapsed
+REST_FIELD = "_rest"
+
+# Trimming steps per result kind, least important first. "truncate" cuts text to
+# BUDGET_FIELD_CHARS; "drop" removes a field, or for lists the trailing items
+# that do not fit. "[]" applies the step to every element of a list.
+TRIM_STEPS: Dict[str, List[Tuple[str, str]]] = {
+    "person": [
+        ("contacts", "drop"),
+        ("accomplishments", "drop"),
+        ("interests", "drop"),
+        ("educations[].description", "truncate"),
+        ("experiences[].description", "truncate"),
+        ("about", "truncate"),
+        ("educations[].description", "drop"),
+        ("experiences[].description", "drop"),
+        ("educations", "drop"),
+        ("experiences", "drop"),
+        ("about", "drop"),
+    ],
+    "company": [
+        ("affiliated_companies", "drop"),
+        ("showcase_pages", "drop"),
+        ("specialties", "truncate"),
+        ("about_us", "truncate"),
+        ("employees", "drop"),
+        ("specialties", "drop"),
+        ("about_us", "drop"),
+    ],
+    "job": [
+        ("benefits", "truncate"),
+        ("job_description", "truncate"),
+        ("benefits", "drop"),
+        ("job_description", "drop"),
+    ],
+    "employees": [
+        ("employees", "drop"),
+    ],
+    "job_changes": [
+        ("removed_jobs", "drop"),
+        ("new_jobs", "drop"),
+    ],
+}
+
+
+class ContinuationStore:
+    """Bounded LRU store of text cut from tool results."""
+
+    def __init__(self, max_entries: int = 512, max_chars: int = 16_000_000):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._chars = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def put(self, text: str) -> str:
+        """Store text and return its handle."""
+        handle = uuid.uuid4().hex[:16]
+        with self._lock:
+            self._entries[handle] = text
+            self._chars += len(text)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._chars > self.max_chars
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._chars -= len(evicted)
+        return handle
+
+    def get(self, handle: str) -> Optional[str]:
+        """Text stored under a handle, None if unknown or evicted."""
+        with self._lock:
+            text = self._entries.get(handle)
+            if text is not None:
+                self._entries.move_to_end(handle)
+                self._hits += 1
+            else:
+                self._misses += 1
+            return text
+
+    def stats(self) -> Dict[str, int]:
+        """Stored continuations, their total length in characters and lookups."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "chars": self._chars,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+_store = ContinuationStore()
+
+
+def get_continuation_store() -> ContinuationStore:
+    """Get the process-wide continuation store."""
+    return _store
+
+
+@dataclass
+class OutputShape:
+    """Per-call output shaping options; all None leaves results unchanged."""
+
+    fields: Optional[List[str]] = None
+    max_field_chars: Optional[int] = None
+    max_tokens: Optional[int] = None
+
+    @property
+    def active(self) -> bool:
+        return bool(self.fields) or bool(self.max_field_chars) or bool(self.max_tokens)
+
+
+def _json_size(value: Any) -> int:
+    """Length of a value serialized as JSON."""
+    return len(json.dumps(value, ensure_ascii=False, default=str))
+
+
+def estimate_tokens(value: Any) -> int:
+    """Approximate number of tokens of a value serialized as JSON."""
+    return math.ceil(_json_size(value) / CHARS_PER_TOKEN)
+
+
+def _projection_tree(fields: List[str]) -> Dict[str, Any]:
+    """Turn dotted paths into a nested dict; True marks a whole subtree."""
+    tree: Dict[str, Any] = {}
+    for path in fields:
+        node = tree
+        parts = [part for part in path.strip().split(".") if part]
+        for index, part in enumerate(parts):
+            if index == len(parts) - 1:
+                node[part] = True
+            else:
+                child = node.get(part)
+                if child is True:
+                    break
+                node = node.setdefault(part, {})
+    return tree
+
+
+def _project(value: Any, tree: Dict[str, Any], top: bool = False) -> Any:
+    """Keep only the fields of a value named in a projection tree."""
+    if isinstance(value, list):
+        return [_project(item, tree, top) for item in value]
+    if not isinstance(value, dict):
+        return value
+    projected = {}
+    for key, item in value.items():
+        subtree = tree.get(key)
+        if subtree is True:
+            projected[key] = item
+        elif subtree is not None:
+            projected[key] = _project(item, subtree)
+        elif top and key in ALWAYS_KEPT_FIELDS:
+            projected[key] = item
+    return projected
+
+
+class _Shaper:
+    """
+    Applies truncation and budget steps to one result, recording what was cut.
+
+    Keeps a running count of how many characters its changes added to the
+    serialized result (negative when it shrank), so a budget can be checked
+    without serializing the whole result after every step.
+    """
+
+    def __init__(self, store: ContinuationStore):
+        self.store = store
+        self.truncated: Dict[str, Dict[str, Any]] = {}
+        self.delta = 0
+
+    def _record(self, path: str, full: Any, **info: Any) -> None:
+        text = full if isinstance(full, str) else json.dumps(full, default=str)
+        entry = {"continuation": self.store.put(text), "total_chars": len(text)}
+        entry.update(info)
+        if not self.truncated:
+            self.delta += _json_size({"truncated_fields": {}})
+        # The braces of {path: entry} stand in for the ", " separating entries
+        self.delta += _json_size({path: entry})
+        self.truncated[path] = entry
+
+    def truncate_text(self, container: Any, key: Any, path: str, limit: int) -> None:
+        text = container[key]
+        if not isinstance(text, str) or len(text) <= limit:
+            return
+        if path not in self.truncated:
+            self._record(path, text)
+        container[key] = text[:limit] + "…"
+        self.delta += _json_size(container[key]) - _json_size(text)
+
+    def truncate_all(self, value: Any, limit: int, path: str = "") -> None:
+        """Truncate every string longer than limit anywhere in a value."""
+        items = (
+            value.items()
+            if isinstance(value, dict)
+            else enumerate(value)
+            if isinstance(value, list)
+            else ()
+        )
+        for key, item in list(items):
+            item_path = (
+                f"{path}[{key}]" if isinstance(value, list) else _join(path, key)
+            )
+            if isinstance(item, str):
+                self.truncate_text(value, key, item_path, limit)
+            elif isinstance(item, (dict, list)):
+                self.truncate_all(item, limit, item_path)
+
+    def drop(self, container: Dict[str, Any], key: str, path: str) -> None:
+        full = container.pop(key)
+        self.delta -= _json_size({key: full})
+        if path in self.truncated:
+            # Keep the handle of the complete text recorded on truncation
+            self.truncated[path]["dropped"] = True
+            self.delta += len(', "dropped": true')
+        else:
+            self._record(path, full, dropped=True)
+
+    def shorten_list(
+        self, container: Dict[str, Any], key: str, path: str, excess: int
+    ) -> None:
+        """Remove trailing items of a list until excess characters are saved."""
+        items = container[key]
+        kept = len(items)
+        saved = 0
+        while kept > 0 and saved < excess:
+            kept -= 1
+            saved += _json_size(items[kept]) + 2
+        if kept == len(items):
+            return
+        container[key] = items[:kept]
+        self.delta -= saved
+        self._record(
+            path, items[kept:], omitted_items=len(items) - kept, kept_items=kept
+        )
+
+
+def _join(path: str, key: Any) -> str:
+    return f"{path}.{key}" if path else str(key)
+
+
+def _targets(value: Any, path: str) -> List[Tuple[Dict[str, Any], str, str]]:
+    """Resolve a step path like "experiences[].description" to (dict, key, path)."""
+    head, _, rest = path.partition(".")
+    if head.endswith("[]"):
+        name = head[:-2]
+        items = value.get(name) if isinstance(value, dict) else None
+        if not isinstance(items, list) or not rest:
+            return []
+        targets = []
+        for index, item in enumerate(items):
+            for container, key, item_path in _targets(item, rest):
+                targets.append((container, key, f"{name}[{index}].{item_path}"))
+        return targets
+    if not isinstance(value, dict) or head not in value:
+        return []
+    if rest:
+        return [
+            (container, key, f"{head}.{item_path}")
+            for container, key, item_path in _targets(value[head], rest)
+        ]
+    return [(value, head, head)]
+
+
+def _apply_step(
+    shaper: _Shaper,
+    result: Dict[str, Any],
+    path: str,
+    action: str,
+    excess: Callable[[], int],
+) -> None:
+    """Apply one trimming step, last list elements first, until nothing is in excess."""
+    for container, key, target_path in reversed(_targets(result, path)):
+        if excess() <= 0:
+            return
+        if container[key] in (None, "", [], {}):
+            continue
+        if action == "truncate":
+            shaper.truncate_text(container, key, target_path, BUDGET_FIELD_CHARS)
+        elif isinstance(container[key], list):
+            shaper.shorten_list(container, key, target_path, excess())
+            if not container[key]:
+                shaper.drop(container, key, target_path)
+        else:
+            shaper.drop(container, key, target_path)
+
+
+def _collapse(
+    full: Dict[str, Any], shaped: Dict[str, Any], budget: int, store: ContinuationStore
+) -> Dict[str, Any]:
+    """
+    Fit a result that is still over budget with one handle for everything cut.
+
+    Keeps the fields of the shaped result that fit, in their order, and lists a
+    single continuation of the full result under truncated_fields._rest instead
+    of one entry per cut field.
+    """
+    text = json.dumps(full, default=str)
+    rest = {REST_FIELD: {"continuation": store.put(text), "total_chars": len(text)}}
+    collapsed: Dict[str, Any] = {}
+    used = _json_size({"truncated_fields": rest})
+    for key, value in shaped.items():
+        # The braces of {key: value} stand in for the ", " after the field
+        size = _json_size({key: value})
+        if key in ALWAYS_KEPT_FIELDS or used + size <= budget:
+            collapsed[key] = value
+            used += size
+    collapsed["truncated_fields"] = rest
+    return collapsed
+
+
+def shape_result(
+    result: Dict[str, Any], shape: OutputShape, kind: str
+) -> Dict[str, Any]:
+    """
+    Apply output shaping to a dict tool result.
+
+    Args:
+        result: Tool result; error results are returned unchanged
+        shape: Shaping options of the call
+        kind: Result kind selecting the trimming order, a key of TRIM_STEPS
+
+    Returns:
+        Dict[str, Any]: Shaped result, with "truncated_fields" listing
+            continuation handles for everything that was cut
+    """
+    if not shape.active or not isinstance(result, dict) or "error" in result:
+        return result
+
+    # Results may share lists and dicts with scraper state such as checkpoints
+    result = copy.deepcopy(result)
+    if shape.fields:
+        result = _project(result, _projection_tree(shape.fields), top=True)
+
+    shaper = _Shaper(get_continuation_store())
+    full = copy.deepcopy(result) if shape.max_tokens else result
+    if shape.max_field_chars:
+        shaper.truncate_all(result, shape.max_field_chars)
+
+    if shape.max_tokens:
+        budget = shape.max_tokens * CHARS_PER_TOKEN
+        base = _json_size(result) - shaper.delta
+
+        def excess() -> int:
+            return base + shaper.delta - budget
+
+        for path, action in TRIM_STEPS.get(kind, []):
+            _apply_step(shaper, result, path, action, excess)
+        if excess() > 0:
+            shaper.truncate_all(result, BUDGET_FIELD_CHARS)
+        if excess() > 0:
+            return _collapse(full, result, budget, shaper.store)
+
+    if shaper.truncated:
+        result["truncated_fields"] = shaper.truncated
+    return result
+
+
+def shape_list(
+    results: List[Dict[str, Any]], shape: OutputShape, kind: str
+) -> List[Dict[str, Any]]:
+    """
+    Apply output shaping to a list tool result.
+
+    Projection and truncation apply to every item. A token budget is shared by
+    all items: the trimming steps run across the whole list, then trailing
+    items that still do not fit are replaced by a final
+    {"omitted_items": n, "continuation": handle} entry. The first item is
+    always kept, collapsed as by shape_result if it does not fit on its own.
+
+    Args:
+        results: Tool result items; an error list is returned unchanged
+        shape: Shaping options of the call
+        kind: Result kind of the items, a key of TRIM_STEPS
+
+    Returns:
+        List[Dict[str, Any]]: Shaped items
+    """
+    if not shape.active or any(
+        isinstance(item, dict) and "error" in item for item in results
+    ):
+        return results
+
+    results = copy.deepcopy(results)
+    if shape.fields:
+        tree = _projection_tree(shape.fields)
+        results = [_project(item, tree, top=True) for item in results]
+
+    shapers = [_Shaper(get_continuation_store()) for _ in results]
+    originals = copy.deepcopy(results) if shape.max_tokens else results
+    if shape.max_field_chars:
+        for item, shaper in zip(results, shapers):
+            shaper.truncate_all(item, shape.max_field_chars)
+
+    def items_with_metadata() -> List[Dict[str, Any]]:
+        return [
+            {**item, "truncated_fields": shaper.truncated} if shaper.truncated else item
+            for item, shaper in zip(results, shapers)
+        ]
+
+    if shape.max_tokens:
+        budget = shape.max_tokens * CHARS_PER_TOKEN
+        base = _json_size(results) - sum(shaper.delta for shaper in shapers)
+
+        def excess() -> int:
+            return base + sum(shaper.delta for shaper in shapers) - budget
+
+        # Trim the last items first, keeping the top results intact longest
+        for path, action in TRIM_STEPS.get(kind, []):
+            for item, shaper in reversed(list(zip(results, shapers))):
+                _apply_step(shaper, item, path, action, excess)
+
+        if excess() > 0 and len(results) > 1:
+            shaped = items_with_metadata()
+            # Room for the {"omitted_items": n, "continuation": handle} entry
+            used = _json_size({"omitted_items": len(shaped), "continuation": "0" * 16})
+            kept = 0
+            for item in shaped:
+                used += _json_size(item) + 2
+                if used > budget:
+                    break
+                kept += 1
+            head = shaped[:kept]
+            if not kept:
+                # Not even the first item fits; keep what fits of it
+                kept = 1
+                first_budget = budget - (used - _json_size(shaped[0]) - 2) - 4
+                head = [
+                    _collapse(originals[0], results[0], first_budget, shapers[0].store)
+                ]
+            tail = shaped[kept:]
+            if tail:
+                handle = get_continuation_store().put(json.dumps(tail, default=str))
+                return head + [{"omitted_items": len(tail), "continuation": handle}]
+            return head
+
+    return items_with_metadata()
@@ -7,16 +7,201 @@ insights from LinkedIn with configurable depth and comprehensive error handling.
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from fastmcp import FastMCP
-from linkedin_scraper import Company
+from fastmcp import Context, FastMCP
 
-from linkedin_mcp_server.error_handler import handle_tool_error, safe_get_driver
+from linkedin_mcp_server import urls
+from linkedin_mcp_server.crawl.checkpoints import get_checkpoint_store
+from linkedin_mcp_server.crawl.employees import (
+    EmployeeCheckpoint,
+    crawl_employees,
+    load_employee_checkpoint,
+)
+from linkedin_mcp_server.deadline import Deadline
+from linkedin_mcp_server.error_handler import handle_tool_error
+from linkedin_mcp_server.execution import progress_reporter
+from linkedin_mcp_server.operations import (
+    ProgressCallback,
+    register_operation,
+    run_operation,
+)
+from linkedin_mcp_server.shaping import OutputShape
+
+if TYPE_CHECKING:
+    from linkedin_scraper import Company
+    from selenium import webdriver
 
 logger = logging.getLogger(__name__)
 
 
+def company_to_dict(
+    company: "Company", employees: Optional[EmployeeCheckpoint] = None
+) -> Dict[str, Any]:
+    """
+    Convert a (possibly partially scraped) Company into the tool result format.
+
+    Args:
+        company: linkedin_scraper Company object
+        employees: Employee crawl checkpoint if employees were requested
+
+    Returns:
+        Dict[str, Any]: Structured data from the company's profile
+    """
+    # Convert showcase pages to structured dictionaries
+    showcase_pages: List[Dict[str, Any]] = [
+        {
+            "name": page.name,
+            "linkedin_url": page.linkedin_url,
+            "followers": page.followers,
+        }
+        for page in list(company.showcase_pages)
+    ]
+
+    # Convert affiliated companies to structured dictionaries
+    affiliated_companies: List[Dict[str, Any]] = [
+        {
+            "name": affiliated.name,
+            "linkedin_url": affiliated.linkedin_url,
+            "followers": affiliated.followers,
+        }
+        for affiliated in list(company.affiliated_companies)
+    ]
+
+    # Build the result dictionary
+    result: Dict[str, Any] = {
+        "name": company.name,
+        "about_us": company.about_us,
+        "website": company.website,
+        "phone": company.phone,
+        "headquarters": company.headquarters,
+        "founded": company.founded,
+        "industry": company.industry,
+        "company_type": company.company_type,
+        "company_size": company.company_size,
+        "specialties": company.specialties,
+        "showcase_pages": showcase_pages,
+        "affiliated_companies": affiliated_companies,
+        "headcount": getattr(company, "headcount", None),
+    }
+
+    # Add employees if requested, including a partially crawled list
+    if employees is not None:
+        result["employees"] = list(employees.employees)
+        result["employees_complete"] = employees.complete
+
+    return result
+
+
+def scrape_company_profile(
+    driver: "webdriver.Chrome",
+    state: Dict[str, Any],
+    report: ProgressCallback,
+    company_name: str,
+    get_employees: bool = False,
+) -> Dict[str, Any]:
+    """Operation get_company_profile: scrape a company with a leased driver."""
+    from linkedin_scraper import Company
+
+    # Construct clean LinkedIn URL from company name
+    linkedin_url = urls.linkedin_url(f"company/{company_name}/")
+    logger.info("Scraping company: %s", linkedin_url)
+    company = Company(
+        linkedin_url,
+        driver=driver,
+        scrape=False,
+        get_employees=False,
+        close_on_complete=False,
+    )
+    state["company"] = company
+    company.scrape(get_employees=False, close_on_complete=False)
+
+    if get_employees:
+        logger.info("Fetching employees may take a while...")
+        store = get_checkpoint_store("employees")
+        with store.claim(company_name):
+            checkpoint = load_employee_checkpoint(store, company_name)
+            state["employees"] = checkpoint
+            crawl_employees(
+                driver,
+                linkedin_url,
+                checkpoint,
+                store,
+                on_page=lambda cp, new: report(
+                    len(cp.employees), None, f"Page {cp.next_page - 1} read"
+                ),
+            )
+
+    return company_to_dict(company, state.get("employees"))
+
+
+def partial_company_profile(state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The sections of the company scraped before the deadline."""
+    company = state.get("company")
+    if company is None:
+        return None
+    return company_to_dict(company, state.get("employees"))
+
+
+def crawl_company_employees(
+    driver: "webdriver.Chrome",
+    state: Dict[str, Any],
+    report: ProgressCallback,
+    company_name: str,
+    max_pages: int = 5,
+    restart: bool = False,
+) -> Dict[str, Any]:
+    """Operation get_company_employees: read the next stage of the employee list."""
+    linkedin_url = urls.linkedin_url(f"company/{company_name}/")
+    store = get_checkpoint_store("employees")
+    with store.claim(company_name):
+        checkpoint = load_employee_checkpoint(store, company_name, restart=restart)
+        stage: List[Dict[str, Any]] = []
+        state.update(company=company_name, checkpoint=checkpoint, stage=stage)
+
+        def on_page(cp: EmployeeCheckpoint, new: List[Dict[str, Any]]) -> None:
+            stage.extend(new)
+            report(len(cp.employees), None, f"Page {cp.next_page - 1} read")
+
+        crawl_employees(
+            driver,
+            linkedin_url,
+            checkpoint,
+            store,
+            max_pages=max_pages,
+            on_page=on_page,
+        )
+    return employees_stage_result(state)
+
+
+def employees_stage_result(state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The employees found in this stage and the crawl's position."""
+    checkpoint = state.get("checkpoint")
+    if checkpoint is None:
+        return None
+    return {
+        "company": state["company"],
+        "employees": list(state["stage"]),
+        "collected": len(checkpoint.employees),
+        "next_page": checkpoint.next_page,
+        "complete": checkpoint.complete,
+    }
+
+
+register_operation(
+    "get_company_profile",
+    scrape_company_profile,
+    partial_company_profile,
+    result_kind="company",
+)
+register_operation(
+    "get_company_employees",
+    crawl_company_employees,
+    employees_stage_result,
+    result_kind="employees",
+)
+
+
 def register_company_tools(mcp: FastMCP) -> None:
     """
     Register all company-related tools with the MCP server.
@@ -27,76 +212,101 @@ def register_company_tools(mcp: FastMCP) -> None:
 
     @mcp.tool()
     async def get_company_profile(
-        company_name: str, get_employees: bool = False
+        company_name: str,
+        ctx: Context,
+        get_employees: bool = False,
+        deadline_seconds: Optional[float] = None,
+        fields: Optional[List[str]] = None,
+        max_field_chars: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        profile: bool = False,
     ) -> Dict[str, Any]:
         """
         Get a specific company's LinkedIn profile.
 
         Args:
             company_name (str): LinkedIn company name (e.g., "docker", "anthropic", "microsoft")
-            get_employees (bool): Whether to scrape the company's employees (slower)
+            get_employees (bool): Whether to scrape the company's employees (slower). The
+                employee crawl is checkpointed; if it is interrupted, the next call resumes
+                it and "employees_complete" tells whether the list is finished
+            deadline_seconds (float, optional): Stop after this many seconds and return
+                the sections scraped so far (marked with "partial": true)
+            fields (List[str], optional): Return only these fields, as dotted paths
+                (e.g. ["name", "industry", "employees.name"])
+            max_field_chars (int, optional): Cut text fields longer than this; the full
+                text is available through get_continuation
+            max_tokens (int, optional): Approximate token budget for the result; the
+                least important fields are trimmed first
+            profile (bool): Profile the call's CPU use; the profile id is returned
+                in an extra "profile_ids" block (see list_profiles)
 
         Returns:
             Dict[str, Any]: Structured data from the company's profile
         """
         try:
-            # Construct clean LinkedIn URL from company name
-            linkedin_url = f"https://www.linkedin.com/company/{company_name}/"
+            return await run_operation(
+                "get_company_profile",
+                {"company_name": company_name, "get_employees": get_employees},
+                Deadline(deadline_seconds),
+                progress_reporter(ctx),
+                OutputShape(fields, max_field_chars, max_tokens),
+                profile=profile,
+            )
+        except Exception as e:
+            return handle_tool_error(e, "get_company_profile")
 
-            driver = safe_get_driver()
+    @mcp.tool()
+    async def get_company_employees(
+        company_name: str,
+        ctx: Context,
+        max_pages: int = 5,
+        restart: bool = False,
+        deadline_seconds: Optional[float] = None,
+        fields: Optional[List[str]] = None,
+        max_field_chars: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        profile: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Crawl a company's employees in resumable stages.
 
-            logger.info(f"Scraping company: {linkedin_url}")
-            if get_employees:
-                logger.info("Fetching employees may take a while...")
+        Each call reads up to max_pages more pages of the employee list and saves its
+        position after every page. Call again with the same company_name to get the
+        next stage; a crawl interrupted by a crash, captcha or deadline resumes at the
+        first unread page.
 
-            company = Company(
-                linkedin_url,
-                driver=driver,
-                get_employees=get_employees,
-                close_on_complete=False,
-            )
+        Args:
+            company_name (str): LinkedIn company name (e.g., "docker", "anthropic", "microsoft")
+            max_pages (int): Maximum number of list pages to read in this stage
+            restart (bool): Discard the saved position and start from the first page
+            deadline_seconds (float, optional): Stop after this many seconds and return
+                the employees found so far (marked with "partial": true)
+            fields (List[str], optional): Return only these fields, as dotted paths
+                (e.g. ["employees.name", "complete"])
+            max_field_chars (int, optional): Cut text fields longer than this; the full
+                text is available through get_continuation
+            max_tokens (int, optional): Approximate token budget for the result; the
+                trailing employees that do not fit are moved to a continuation
+                listed under "truncated_fields"
+            profile (bool): Profile the call's CPU use; the profile id is returned
+                in an extra "profile_ids" block (see list_profiles)
 
-            # Convert showcase pages to structured dictionaries
-            showcase_pages: List[Dict[str, Any]] = [
-                {
-                    "name": page.name,
-                    "linkedin_url": page.linkedin_url,
-                    "followers": page.followers,
-                }
-                for page in company.showcase_pages
-            ]
-
-            # Convert affiliated companies to structured dictionaries
-            affiliated_companies: List[Dict[str, Any]] = [
+        Returns:
+            Dict[str, Any]: Employees found in this stage, the total collected so far,
+                the next page to read and whether the list is complete
+        """
+        try:
+            return await run_operation(
+                "get_company_employees",
                 {
-                    "name": affiliated.name,
-                    "linkedin_url": affiliated.linkedin_url,
-                    "followers": affiliated.followers,
-                }
-                for affiliated in company.affiliated_companies
-            ]
-
-            # Build the result dictionary
-            result: Dict[str, Any] = {
-                "name": company.name,
-                "about_us": company.about_us,
-                "website": company.website,
-                "phone": company.phone,
-                "headquarters": company.headquarters,
-                "founded": company.founded,
-                "industry": company.industry,
-                "company_type": company.company_type,
-                "company_size": company.company_size,
-                "specialties": company.specialties,
-                "showcase_pages": showcase_pages,
-                "affiliated_companies": affiliated_companies,
-                "headcount": company.headcount,
-            }
-
-            # Add employees if requested and available
-            if get_employees and company.employees:
-                result["employees"] = company.employees
-
-            return result
+                    "company_name": company_name,
+                    "max_pages": max_pages,
+                    "restart": restart,
+                },
+                Deadline(deadline_seconds),
+                progress_reporter(ctx),
+                OutputShape(fields, max_field_chars, max_tokens),
+                profile=profile,
+            )
         except Exception as e:
-            return handle_tool_error(e, "get_company_profile")
+            return handle_tool_error(e, "get_company_employees")
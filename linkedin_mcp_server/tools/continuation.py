@@ -0,0 +1,87 @@
+# src/linkedin_mcp_server/tools/continuation.py
+"""
+Continuation tool for shaped tool results.
+
+Tools called with fields, max_field_chars or max_tokens list the text they cut
+under "truncated_fields" with a continuation handle; this tool reads it back in
+pages.
+"""
+
+import logging
+from typing import Any, Dict
+
+from fastmcp import FastMCP
+
+from linkedin_mcp_server.error_handler import handle_tool_error
+from linkedin_mcp_server.exceptions import LinkedInMCPError
+from linkedin_mcp_server.operations import register_operation, run_operation
+from linkedin_mcp_server.shaping import get_continuation_store
+
+logger = logging.getLogger(__name__)
+
+
+def read_continuation(
+    handle: str, offset: int = 0, max_chars: int = 8000
+) -> Dict[str, Any]:
+    """
+    Operation get_continuation: read a page of a stored continuation.
+
+    Continuations live in the process that shaped the result, the browser-pool
+    service in multi-worker mode.
+
+    Raises:
+        LinkedInMCPError: If the handle is unknown or expired
+    """
+    text = get_continuation_store().get(handle)
+    if text is None:
+        raise LinkedInMCPError(
+            f"Unknown or expired continuation handle {handle}; call the "
+            "original tool again"
+        )
+    offset = max(0, offset)
+    end = min(len(text), offset + max(1, max_chars))
+    return {
+        "handle": handle,
+        "text": text[offset:end],
+        "offset": offset,
+        "next_offset": end if end < len(text) else None,
+        "total_chars": len(text),
+    }
+
+
+register_operation("get_continuation", read_continuation, needs_driver=False)
+
+
+def register_continuation_tools(mcp: FastMCP) -> None:
+    """
+    Register the continuation tool with the MCP server.
+
+    Args:
+        mcp (FastMCP): The MCP server instance
+    """
+
+    @mcp.tool()
+    async def get_continuation(
+        handle: str, offset: int = 0, max_chars: int = 8000
+    ) -> Dict[str, Any]:
+        """
+        Read text cut from an earlier tool result.
+
+        Args:
+            handle (str): Continuation handle from the result's "truncated_fields"
+                (or an "omitted_items" entry)
+            offset (int): Character offset to start reading at
+            max_chars (int): Maximum number of characters to return
+
+        Returns:
+            Dict[str, Any]: The text, its offset, "next_offset" to continue from
+                (None when complete) and the total length. Removed lists and
+                objects are returned as JSON text.
+        """
+        try:
+            return await run_operation(
+                "get_continuation",
+                {"handle": handle, "offset": offset, "max_chars": max_chars},
+            )
+        except Exception as e:
+            return handle_tool_error(e, "get_continuation")
@@ -0,0 +1,173 @@
+# src/linkedin_mcp_server/tools/crawl.py
+"""
+LinkedIn graph crawl tools for server-side company and people expansion.
+
+Provides MCP tools to start, monitor, stop and export background crawls that fan
+out from companies to their employees and from people to the companies they
+worked at, visiting every profile at most once.
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from fastmcp import FastMCP
+
+from linkedin_mcp_server.crawl.engine import CrawlSettings, get_crawl, start_crawl
+from linkedin_mcp_server.crawl.graph import export_graph
+from linkedin_mcp_server.error_handler import handle_tool_error
+from linkedin_mcp_server.operations import register_operation, run_operation
+from linkedin_mcp_server.urls import linkedin_url
+
+logger = logging.getLogger(__name__)
+
+
+def start_crawl_operation(
+    seeds: List[str], settings: Dict[str, Any], crawl_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Operation start_graph_crawl: start or resume a crawl in this process."""
+    crawl = start_crawl(seeds, CrawlSettings.from_dict(settings), crawl_id)
+    return crawl.status()
+
+
+def crawl_status(crawl_id: str) -> Dict[str, Any]:
+    """Operation get_graph_crawl_status."""
+    return get_crawl(crawl_id).status()
+
+
+def stop_crawl(crawl_id: str) -> Dict[str, Any]:
+    """Operation stop_graph_crawl: stop a crawl and wait for its workers."""
+    crawl = get_crawl(crawl_id)
+    crawl.stop()
+    crawl.join(30.0)
+    return crawl.status()
+
+
+def export_crawl(crawl_id: str, graph_format: str = "json") -> Dict[str, Any]:
+    """Operation export_graph_crawl: write the crawl's graph next to its frontier."""
+    crawl = get_crawl(crawl_id)
+    extension = "graphml" if graph_format == "graphml" else "json"
+    path = os.path.join(crawl.directory, f"graph.{extension}")
+    counts = export_graph(crawl.frontier, path, graph_format)
+    return {"crawl_id": crawl_id, "path": path, **counts}
+
+
+# Crawls run on threads of the process owning the browser pool
+register_operation("start_graph_crawl", start_crawl_operation, needs_driver=False)
+register_operation("get_graph_crawl_status", crawl_status, needs_driver=False)
+register_operation("stop_graph_crawl", stop_crawl, needs_driver=False)
+register_operation("export_graph_crawl", export_crawl, needs_driver=False)
+
+
+def register_crawl_tools(mcp: FastMCP) -> None:
+    """
+    Register all crawl-related tools with the MCP server.
+
+    Args:
+        mcp (FastMCP): The MCP server instance
+    """
+
+    @mcp.tool()
+    async def start_graph_crawl(
+        company_names: Optional[List[str]] = None,
+        linkedin_usernames: Optional[List[str]] = None,
+        max_depth: int = 2,
+        max_nodes: int = 500,
+        workers: int = 1,
+        employee_pages: int = 1,
+        delay_seconds: float = 2.0,
+        crawl_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Start a background crawl of companies, their employees and those people's companies.
+
+        The crawl runs on the server and returns immediately; poll get_graph_crawl_status
+        for progress. Each profile is scraped at most once. Pass the crawl_id of a stopped
+        or paused crawl to resume it (its original limits are kept).
+
+        Args:
+            company_names (List[str], optional): Seed LinkedIn company names (e.g., "docker")
+            linkedin_usernames (List[str], optional): Seed LinkedIn usernames (e.g., "stickerdaniel")
+            max_depth (int): Number of hops to expand from the seeds
+            max_nodes (int): Maximum number of profiles in the crawl
+            workers (int): Parallel browsers to use, capped by the browser pool size
+            employee_pages (int): Employee list pages to read per company
+            delay_seconds (float): Pause of each worker between profiles
+            crawl_id (str, optional): Id of an existing crawl to resume
+
+        Returns:
+            Dict[str, Any]: Crawl id and status
+        """
+        try:
+            seeds = [
+                linkedin_url(f"company/{name}/") for name in company_names or []
+            ] + [
+                linkedin_url(f"in/{username}/") for username in linkedin_usernames or []
+            ]
+            settings = {
+                "max_depth": max_depth,
+                "max_nodes": max_nodes,
+                "workers": workers,
+                "employee_pages": employee_pages,
+                "delay_seconds": delay_seconds,
+            }
+            return await run_operation(
+                "start_graph_crawl",
+                {"seeds": seeds, "settings": settings, "crawl_id": crawl_id},
+            )
+        except Exception as e:
+            return handle_tool_error(e, "start_graph_crawl")
+
+    @mcp.tool()
+    async def get_graph_crawl_status(crawl_id: str) -> Dict[str, Any]:
+        """
+        Get the progress of a graph crawl.
+
+        Args:
+            crawl_id (str): Id returned by start_graph_crawl
+
+        Returns:
+            Dict[str, Any]: State, node counts by status, edge count and limits
+        """
+        try:
+            return await run_operation("get_graph_crawl_status", {"crawl_id": crawl_id})
+        except Exception as e:
+            return handle_tool_error(e, "get_graph_crawl_status")
+
+    @mcp.tool()
+    async def stop_graph_crawl(crawl_id: str) -> Dict[str, Any]:
+        """
+        Stop a running graph crawl. It can be resumed later with start_graph_crawl.
+
+        Args:
+            crawl_id (str): Id returned by start_graph_crawl
+
+        Returns:
+            Dict[str, Any]: Crawl status after stopping
+        """
+        try:
+            return await run_operation("stop_graph_crawl", {"crawl_id": crawl_id})
+        except Exception as e:
+            return handle_tool_error(e, "stop_graph_crawl")
+
+    @mcp.tool()
+    async def export_graph_crawl(
+        crawl_id: str, graph_format: str = "json"
+    ) -> Dict[str, Any]:
+        """
+        Export the graph of a crawl to a file on the server.
+
+        Args:
+            crawl_id (str): Id returned by start_graph_crawl
+            graph_format (str): "json" (node-link JSON) or "graphml"
+
+        Returns:
+            Dict[str, Any]: Path of the export and number of nodes and edges written
+        """
+        try:
+            return await run_operation(
+                "export_graph_crawl",
+                {"crawl_id": crawl_id, "graph_format": graph_format},
+            )
+        except Exception as e:
+            return handle_tool_error(e, "export_graph_crawl")
@@ -0,0 +1,50 @@
+# src/linkedin_mcp_server/tools/flight_recorder.py
+"""
+Flight recorder tool: dump the recent slow, partial and failed tool calls.
+"""
+
+import logging
+from typing import Any, Dict
+
+from fastmcp import FastMCP
+
+from linkedin_mcp_server.error_handler import handle_tool_error
+from linkedin_mcp_server.operations import run_operation
+
+logger = logging.getLogger(__name__)
+
+
+def register_flight_recorder_tools(mcp: FastMCP) -> None:
+    """
+    Register the flight recorder tool with the MCP server.
+
+    Args:
+        mcp (FastMCP): The MCP server instance
+    """
+
+    @mcp.tool()
+    async def get_flight_records(
+        limit: int = 20, include_snapshots: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get the most recent slow, partial and failed tool calls.
+
+        Each record holds the call's arguments, duration, per-phase timings, error
+        category and the URL the browser ended on. Use it to find out why calls
+        were slow or failed without reproducing them.
+
+        Args:
+            limit (int): Number of records to return, newest first
+            include_snapshots (bool): Include the HTML of the page each call ended
+                on, if page snapshots are enabled (--flight-recorder-snapshots)
+
+        Returns:
+            Dict[str, Any]: Recorder size, number of calls recorded since start
+                and the records
+        """
+        try:
+            return await run_operation(
+                "flight_records", {"limit": limit, "snapshots": include_snapshots}
+            )
+        except Exception as e:
+            return handle_tool_error(e, "get_flight_records")
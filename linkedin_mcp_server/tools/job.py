@@ -7,20 +7,107 @@ with comprehensive filtering and structured data extraction.
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from fastmcp import FastMCP
-from linkedin_scraper import Job, JobSearch
 
+from linkedin_mcp_server.deadline import Deadline
 from linkedin_mcp_server.error_handler import (
     handle_tool_error,
     handle_tool_error_list,
-    safe_get_driver,
 )
+from linkedin_mcp_server.operations import (
+    ProgressCallback,
+    register_operation,
+    run_operation,
+)
+from linkedin_mcp_server.shaping import OutputShape
+from linkedin_mcp_server.urls import linkedin_url
+
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 logger = logging.getLogger(__name__)
 
 
+def scrape_job_details(
+    driver: "webdriver.Chrome",
+    state: Dict[str, Any],
+    report: ProgressCallback,
+    job_id: str,
+) -> Dict[str, Any]:
+    """Operation get_job_details: scrape a job posting with a leased driver."""
+    from linkedin_scraper import Job
+
+    # Construct clean LinkedIn URL from job ID
+    job_url = linkedin_url(f"jobs/view/{job_id}/")
+    logger.info("Scraping job: %s", job_url)
+    job = Job(job_url, driver=driver, close_on_complete=False, scrape=False)
+    state["job"] = job
+    job.scrape(close_on_complete=False)
+
+    # Convert job object to a dictionary
+    return job.to_dict()
+
+
+def partial_job_details(state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The fields of the job posting scraped before the deadline."""
+    job = state.get("job")
+    return job.to_dict() if job else None
+
+
+def scrape_job_search(
+    driver: "webdriver.Chrome",
+    state: Dict[str, Any],
+    report: ProgressCallback,
+    search_term: str,
+) -> List[Dict[str, Any]]:
+    """Operation search_jobs: run a job search with a leased driver."""
+    from linkedin_scraper import JobSearch
+
+    logger.info("Searching jobs: %s", search_term)
+    job_search = JobSearch(
+        driver=driver,
+        base_url=linkedin_url("jobs/"),
+        close_on_complete=False,
+        scrape=False,
+    )
+    jobs = job_search.search(search_term)
+
+    # Convert job objects to dictionaries
+    return [job.to_dict() for job in jobs]
+
+
+def scrape_recommended_jobs(
+    driver: "webdriver.Chrome",
+    state: Dict[str, Any],
+    report: ProgressCallback,
+) -> List[Dict[str, Any]]:
+    """Operation get_recommended_jobs: read the recommended jobs feed."""
+    from linkedin_scraper import JobSearch
+
+    logger.info("Getting recommended jobs")
+    job_search = JobSearch(
+        driver=driver,
+        base_url=linkedin_url("jobs/"),
+        close_on_complete=False,
+        scrape=True,  # Enable scraping to get recommended jobs
+        scrape_recommended_jobs=True,
+    )
+
+    if hasattr(job_search, "recommended_jobs") and job_search.recommended_jobs:
+        return [job.to_dict() for job in job_search.recommended_jobs]
+    else:
+        return []
+
+
+register_operation(
+    "get_job_details", scrape_job_details, partial_job_details, result_kind="job"
+)
+register_operation("search_jobs", scrape_job_search, result_kind="job")
+register_operation("get_recommended_jobs", scrape_recommended_jobs, result_kind="job")
+
+
 def register_job_tools(mcp: FastMCP) -> None:
     """
     Register all job-related tools with the MCP server.
@@ -30,76 +117,117 @@ def register_job_tools(mcp: FastMCP) -> None:
     """
 
     @mcp.tool()
-    async def get_job_details(job_id: str) -> Dict[str, Any]:
+    async def get_job_details(
+        job_id: str,
+        deadline_seconds: Optional[float] = None,
+        fields: Optional[List[str]] = None,
+        max_field_chars: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        profile: bool = False,
+    ) -> Dict[str, Any]:
         """
         Get job details for a specific job posting on LinkedIn
 
         Args:
             job_id (str): LinkedIn job ID (e.g., "4252026496", "3856789012")
+            deadline_seconds (float, optional): Stop after this many seconds and return
+                the fields scraped so far (marked with "partial": true)
+            fields (List[str], optional): Return only these fields, as dotted paths
+                (e.g. ["job_title", "company", "location"])
+            max_field_chars (int, optional): Cut text fields longer than this; the full
+                text is available through get_continuation
+            max_tokens (int, optional): Approximate token budget for the result; the
+                least important fields are trimmed first
+            profile (bool): Profile the call's CPU use; the profile id is returned
+                in an extra "profile_ids" block (see list_profiles)
 
         Returns:
             Dict[str, Any]: Structured job data including title, company, location, posting date,
                           application count, and job description (may be empty if content is protected)
         """
         try:
-            # Construct clean LinkedIn URL from job ID
-            job_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
-
-            driver = safe_get_driver()
-
-            logger.info(f"Scraping job: {job_url}")
-            job = Job(job_url, driver=driver, close_on_complete=False)
-
-            # Convert job object to a dictionary
-            return job.to_dict()
+            return await run_operation(
+                "get_job_details",
+                {"job_id": job_id},
+                Deadline(deadline_seconds),
+                shape=OutputShape(fields, max_field_chars, max_tokens),
+                profile=profile,
+            )
         except Exception as e:
             return handle_tool_error(e, "get_job_details")
 
     @mcp.tool()
-    async def search_jobs(search_term: str) -> List[Dict[str, Any]]:
+    async def search_jobs(
+        search_term: str,
+        deadline_seconds: Optional[float] = None,
+        fields: Optional[List[str]] = None,
+        max_field_chars: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        profile: bool = False,
+    ) -> List[Dict[str, Any]]:
         """
         Search for jobs on LinkedIn using a search term.
 
         Args:
             search_term (str): Search term to use for the job search.
+            deadline_seconds (float, optional): Give up after this many seconds
+            fields (List[str], optional): Return only these fields, as dotted paths
+                (e.g. ["job_title", "company", "linkedin_url"])
+            max_field_chars (int, optional): Cut text fields longer than this; the full
+                text is available through get_continuation
+            max_tokens (int, optional): Approximate token budget for the result; the
+                least important fields are trimmed first. Trailing jobs that do not
+                fit are replaced by an {"omitted_items": n, "continuation": handle} entry
+            profile (bool): Profile the call's CPU use; the profile id is returned
+                in an extra "profile_ids" block (see list_profiles)
 
         Returns:
             List[Dict[str, Any]]: List of job search results
         """
         try:
-            driver = safe_get_driver()
-
-            logger.info(f"Searching jobs: {search_term}")
-            job_search = JobSearch(driver=driver, close_on_complete=False, scrape=False)
-            jobs = job_search.search(search_term)
-
-            # Convert job objects to dictionaries
-            return [job.to_dict() for job in jobs]
+            return await run_operation(
+                "search_jobs",
+                {"search_term": search_term},
+                Deadline(deadline_seconds),
+                shape=OutputShape(fields, max_field_chars, max_tokens),
+                profile=profile,
+            )
         except Exception as e:
             return handle_tool_error_list(e, "search_jobs")
 
     @mcp.tool()
-    async def get_recommended_jobs() -> List[Dict[str, Any]]:
+    async def get_recommended_jobs(
+        deadline_seconds: Optional[float] = None,
+        fields: Optional[List[str]] = None,
+        max_field_chars: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        profile: bool = False,
+    ) -> List[Dict[str, Any]]:
         """
         Get your personalized recommended jobs from LinkedIn
 
+        Args:
+            deadline_seconds (float, optional): Give up after this many seconds
+            fields (List[str], optional): Return only these fields, as dotted paths
+                (e.g. ["job_title", "company", "linkedin_url"])
+            max_field_chars (int, optional): Cut text fields longer than this; the full
+                text is available through get_continuation
+            max_tokens (int, optional): Approximate token budget for the result; the
+                least important fields are trimmed first. Trailing jobs that do not
+                fit are replaced by an {"omitted_items": n, "continuation": handle} entry
+            profile (bool): Profile the call's CPU use; the profile id is returned
+                in an extra "profile_ids" block (see list_profiles)
+
         Returns:
             List[Dict[str, Any]]: List of recommended jobs
         """
         try:
-            driver = safe_get_driver()
-
-            logger.info("Getting recommended jobs")
-            job_search = JobSearch(
-                driver=driver,
-                close_on_complete=False,
-                scrape=True,  # Enable scraping to get recommended jobs
-                scrape_recommended_jobs=True,
+            return await run_operation(
+                "get_recommended_jobs",
+                {},
+                Deadline(deadline_seconds),
+                shape=OutputShape(fields, max_field_chars, max_tokens),
+                profile=profile,
             )
-
-            if hasattr(job_search, "recommended_jobs") and job_search.recommended_jobs:
-                return [job.to_dict() for job in job_search.recommended_jobs]
-            else:
-                return []
         except Exception as e:
             return handle_tool_error_list(e, "get_recommended_jobs")
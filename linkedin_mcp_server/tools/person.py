@@ -7,16 +7,129 @@ experience, education, skills, and contact details with proper error handling.
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from fastmcp import FastMCP
-from linkedin_scraper import Person
 
-from linkedin_mcp_server.error_handler import handle_tool_error, safe_get_driver
+from linkedin_mcp_server import urls
+from linkedin_mcp_server.deadline import Deadline
+from linkedin_mcp_server.error_handler import handle_tool_error
+from linkedin_mcp_server.operations import (
+    ProgressCallback,
+    register_operation,
+    run_operation,
+)
+from linkedin_mcp_server.shaping import OutputShape
+
+if TYPE_CHECKING:
+    from linkedin_scraper import Person
+    from selenium import webdriver
 
 logger = logging.getLogger(__name__)
 
 
+def person_to_dict(person: "Person") -> Dict[str, Any]:
+    """
+    Convert a (possibly partially scraped) Person into the tool result format.
+
+    Args:
+        person: linkedin_scraper Person object
+
+    Returns:
+        Dict[str, Any]: Structured data from the person's profile
+    """
+    # Convert experiences to structured dictionaries
+    experiences: List[Dict[str, Any]] = [
+        {
+            "position_title": exp.position_title,
+            "company": exp.institution_name,
+            "from_date": exp.from_date,
+            "to_date": exp.to_date,
+            "duration": exp.duration,
+            "location": exp.location,
+            "description": exp.description,
+        }
+        for exp in list(person.experiences)
+    ]
+
+    # Convert educations to structured dictionaries
+    educations: List[Dict[str, Any]] = [
+        {
+            "institution": edu.institution_name,
+            "degree": edu.degree,
+            "from_date": edu.from_date,
+            "to_date": edu.to_date,
+            "description": edu.description,
+        }
+        for edu in list(person.educations)
+    ]
+
+    # Convert interests to list of titles
+    interests: List[str] = [interest.title for interest in list(person.interests)]
+
+    # Convert accomplishments to structured dictionaries
+    accomplishments: List[Dict[str, str]] = [
+        {"category": acc.category, "title": acc.title}
+        for acc in list(person.accomplishments)
+    ]
+
+    # Convert contacts to structured dictionaries
+    contacts: List[Dict[str, str]] = [
+        {
+            "name": contact.name,
+            "occupation": contact.occupation,
+            "url": contact.url,
+        }
+        for contact in list(person.contacts)
+    ]
+
+    # Return the complete profile data
+    return {
+        "name": person.name,
+        "about": person.about,
+        "experiences": experiences,
+        "educations": educations,
+        "interests": interests,
+        "accomplishments": accomplishments,
+        "contacts": contacts,
+        "company": getattr(person, "company", None),
+        "job_title": getattr(person, "job_title", None),
+        "open_to_work": getattr(person, "open_to_work", False),
+    }
+
+
+def scrape_person_profile(
+    driver: "webdriver.Chrome",
+    state: Dict[str, Any],
+    report: ProgressCallback,
+    linkedin_username: str,
+) -> Dict[str, Any]:
+    """Operation get_person_profile: scrape a profile with a leased driver."""
+    from linkedin_scraper import Person
+
+    # Construct clean LinkedIn URL from username
+    linkedin_url = urls.linkedin_url(f"in/{linkedin_username}/")
+    logger.info("Scraping profile: %s", linkedin_url)
+    person = Person(linkedin_url, driver=driver, scrape=False, close_on_complete=False)
+    state["person"] = person
+    person.scrape(close_on_complete=False)
+    return person_to_dict(person)
+
+
+def partial_person_profile(state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The sections of the profile scraped before the deadline."""
+    person = state.get("person")
+    return person_to_dict(person) if person else None
+
+
+register_operation(
+    "get_person_profile",
+    scrape_person_profile,
+    partial_person_profile,
+    result_kind="person",
+)
+
+
 def register_person_tools(mcp: FastMCP) -> None:
     """
     Register all person-related tools with the MCP server.
@@ -26,82 +139,40 @@ def register_person_tools(mcp: FastMCP) -> None:
     """
 
     @mcp.tool()
-    async def get_person_profile(linkedin_username: str) -> Dict[str, Any]:
+    async def get_person_profile(
+        linkedin_username: str,
+        deadline_seconds: Optional[float] = None,
+        fields: Optional[List[str]] = None,
+        max_field_chars: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        profile: bool = False,
+    ) -> Dict[str, Any]:
         """
         Get a specific person's LinkedIn profile.
 
         Args:
             linkedin_username (str): LinkedIn username (e.g., "stickerdaniel", "anistji")
+            deadline_seconds (float, optional): Stop after this many seconds and return
+                the sections scraped so far (marked with "partial": true)
+            fields (List[str], optional): Return only these fields, as dotted paths
+                (e.g. ["name", "job_title", "experiences.company"])
+            max_field_chars (int, optional): Cut text fields longer than this; the full
+                text is available through get_continuation
+            max_tokens (int, optional): Approximate token budget for the result; the
+                least important fields are trimmed first
+            profile (bool): Profile the call's CPU use; the profile id is returned
+                in an extra "profile_ids" block (see list_profiles)
 
         Returns:
             Dict[str, Any]: Structured data from the person's profile
         """
         try:
-            # Construct clean LinkedIn URL from username
-            linkedin_url = f"https://www.linkedin.com/in/{linkedin_username}/"
-
-            driver = safe_get_driver()
-
-            logger.info(f"Scraping profile: {linkedin_url}")
-            person = Person(linkedin_url, driver=driver, close_on_complete=False)
-
-            # Convert experiences to structured dictionaries
-            experiences: List[Dict[str, Any]] = [
-                {
-                    "position_title": exp.position_title,
-                    "company": exp.institution_name,
-                    "from_date": exp.from_date,
-                    "to_date": exp.to_date,
-                    "duration": exp.duration,
-                    "location": exp.location,
-                    "description": exp.description,
-                }
-                for exp in person.experiences
-            ]
-
-            # Convert educations to structured dictionaries
-            educations: List[Dict[str, Any]] = [
-                {
-                    "institution": edu.institution_name,
-                    "degree": edu.degree,
-                    "from_date": edu.from_date,
-                    "to_date": edu.to_date,
-                    "description": edu.description,
-                }
-                for edu in person.educations
-            ]
-
-            # Convert interests to list of titles
-            interests: List[str] = [interest.title for interest in person.interests]
-
-            # Convert accomplishments to structured dictionaries
-            accomplishments: List[Dict[str, str]] = [
-                {"category": acc.category, "title": acc.title}
-                for acc in person.accomplishments
-            ]
-
-            # Convert contacts to structured dictionaries
-            contacts: List[Dict[str, str]] = [
-                {
-                    "name": contact.name,
-                    "occupation": contact.occupation,
-                    "url": contact.url,
-                }
-                for contact in person.contacts
-            ]
-
-            # Return the complete profile data
-            return {
-                "name": person.name,
-                "about": person.about,
-                "experiences": experiences,
-                "educations": educations,
-                "interests": interests,
-                "accomplishments": accomplishments,
-                "contacts": contacts,
-                "company": person.company,
-                "job_title": person.job_title,
-                "open_to_work": getattr(person, "open_to_work", False),
-            }
+            return await run_operation(
+                "get_person_profile",
+                {"linkedin_username": linkedin_username},
+                Deadline(deadline_seconds),
+                shape=OutputShape(fields, max_field_chars, max_tokens),
+                profile=profile,
+            )
         except Exception as e:
             return handle_tool_error(e, "get_person_profile")
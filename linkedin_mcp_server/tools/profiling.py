@@ -0,0 +1,125 @@
+# src/linkedin_mcp_server/tools/profiling.py
+"""
+Profiling tools: profile the server for a time window, read stored profiles and
+report memory usage.
+
+Single tool calls are profiled with their "profile" argument (or every call
+with --profile-calls); these tools list and fetch the resulting profiles.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from fastmcp import FastMCP
+
+from linkedin_mcp_server.error_handler import handle_tool_error, handle_tool_error_list
+from linkedin_mcp_server.memory import memory_stats
+from linkedin_mcp_server.operations import register_operation, run_operation
+from linkedin_mcp_server.profiling import list_profiles, profile_window, read_profile
+
+logger = logging.getLogger(__name__)
+
+register_operation("profile_window", profile_window, needs_driver=False)
+register_operation("list_profiles", list_profiles, needs_driver=False)
+register_operation("read_profile", read_profile, needs_driver=False)
+register_operation("memory_stats", memory_stats, needs_driver=False)
+
+
+def register_profiling_tools(mcp: FastMCP) -> None:
+    """
+    Register the profiling tools with the MCP server.
+
+    Args:
+        mcp (FastMCP): The MCP server instance
+    """
+
+    @mcp.tool()
+    async def profile_server(seconds: float = 10.0) -> Dict[str, Any]:
+        """
+        Sample what every thread of the server does for a while and save the profile.
+
+        Run it while slow calls or crawls are in progress to see where Python
+        spends its time.
+
+        Args:
+            seconds (float): Length of the profiled window (at most 600)
+
+        Returns:
+            Dict[str, Any]: Profile id, creation time and file paths
+        """
+        try:
+            return await run_operation("profile_window", {"seconds": seconds})
+        except Exception as e:
+            return handle_tool_error(e, "profile_server")
+
+    @mcp.tool()
+    async def list_profiles() -> List[Dict[str, Any]]:
+        """
+        List stored profiles, newest first.
+
+        Returns:
+            List[Dict[str, Any]]: Profile id, creation time, pstats and collapsed-stack
+                file paths and size of each profile
+        """
+        try:
+            return await run_operation("list_profiles", {})
+        except Exception as e:
+            return handle_tool_error_list(e, "list_profiles")
+
+    @mcp.tool()
+    async def get_profile(
+        profile_id: str, view: str = "summary", limit: int = 40, max_chars: int = 50000
+    ) -> Dict[str, Any]:
+        """
+        Read a stored profile.
+
+        Args:
+            profile_id (str): Profile id from list_profiles or a profiled tool call
+            view (str): "summary" for the functions with the most cumulative time,
+                "collapsed" for the collapsed stacks (flamegraph.pl / speedscope input)
+            limit (int): Number of functions in the summary
+            max_chars (int): Maximum length of the returned text
+
+        Returns:
+            Dict[str, Any]: The profile's description with its text
+        """
+        try:
+            return await run_operation(
+                "read_profile",
+                {
+                    "profile_id": profile_id,
+                    "view": view,
+                    "limit": limit,
+                    "max_chars": max_chars,
+                },
+            )
+        except Exception as e:
+            return handle_tool_error(e, "get_profile")
+
+    @mcp.tool()
+    async def get_memory_stats(
+        top: int = 15, reset_baseline: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Report the memory of the server process and its browsers.
+
+        Allocation sites are listed when the server runs with
+        PYTHONTRACEMALLOC=<frames>. Call it with reset_baseline once the server
+        is warm, then later to see what grew since.
+
+        Args:
+            top (int): Allocation sites and object types listed; 0 for sizes only
+            reset_baseline (bool): Compare later reports with this one
+
+        Returns:
+            Dict[str, Any]: Resident MB of the server, MB, processes and renderers
+                of each browser, sizes of long-lived server state, tracemalloc
+                totals and the top allocation sites and object types, with their
+                growth since the baseline
+        """
+        try:
+            return await run_operation(
+                "memory_stats", {"top": top, "reset_baseline": reset_baseline}
+            )
+        except Exception as e:
+            return handle_tool_error(e, "get_memory_stats")
@@ -0,0 +1,219 @@
+# src/linkedin_mcp_server/tools/saved_search.py
+"""
+LinkedIn saved job search tools with scheduled incremental monitoring.
+
+Provides MCP tools to define job searches (or recommended-jobs monitoring) that the
+server re-runs on a schedule, and to fetch only the postings that appeared or
+disappeared since the last fetch.
+"""
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from fastmcp import FastMCP
+
+from linkedin_mcp_server.deadline import Deadline
+from linkedin_mcp_server.error_handler import handle_tool_error, handle_tool_error_list
+from linkedin_mcp_server.operations import (
+    ProgressCallback,
+    register_operation,
+    run_operation,
+)
+from linkedin_mcp_server.searches.saved import (
+    delete_saved_search,
+    list_saved_searches,
+    load_saved_search,
+    run_saved_search,
+    save_search,
+    take_changes,
+)
+from linkedin_mcp_server.searches.scheduler import start_scheduler
+from linkedin_mcp_server.shaping import OutputShape
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+
+def store_job_search(
+    name: str,
+    search_term: Optional[str],
+    interval_minutes: int,
+    max_pages: int,
+    full_scan_every: int = 24,
+) -> Dict[str, Any]:
+    """Operation save_job_search: save the search and make sure it gets scheduled."""
+    search = save_search(
+        name, search_term, interval_minutes, max_pages, full_scan_every
+    )
+    start_scheduler()
+    return search.summary()
+
+
+def summarize_job_searches() -> List[Dict[str, Any]]:
+    """Operation list_job_searches."""
+    return [search.summary() for search in list_saved_searches()]
+
+
+def remove_job_search(name: str) -> Dict[str, Any]:
+    """Operation delete_job_search."""
+    delete_saved_search(name)
+    return {"status": "success", "message": f"Deleted saved search {name}"}
+
+
+def summarize_job_search(name: str) -> Dict[str, Any]:
+    """Operation load_saved_search: a saved search's definition and run state."""
+    return load_saved_search(name).summary()
+
+
+def refresh_saved_search(
+    driver: "webdriver.Chrome",
+    state: Dict[str, Any],
+    report: ProgressCallback,
+    name: str,
+) -> None:
+    """Operation run_saved_search: run a saved search now with a leased driver."""
+    run_saved_search(driver, name)
+
+
+register_operation("save_job_search", store_job_search, needs_driver=False)
+register_operation("list_job_searches", summarize_job_searches, needs_driver=False)
+register_operation("delete_job_search", remove_job_search, needs_driver=False)
+register_operation("load_saved_search", summarize_job_search, needs_driver=False)
+register_operation("run_saved_search", refresh_saved_search)
+register_operation(
+    "take_saved_search_changes",
+    take_changes,
+    result_kind="job_changes",
+    needs_driver=False,
+)
+
+
+def register_saved_search_tools(mcp: FastMCP) -> None:
+    """
+    Register all saved search tools with the MCP server.
+
+    Args:
+        mcp (FastMCP): The MCP server instance
+    """
+
+    @mcp.tool()
+    async def save_job_search(
+        name: str,
+        search_term: Optional[str] = None,
+        recommended: bool = False,
+        interval_minutes: int = 60,
+        max_pages: int = 5,
+        full_scan_every: int = 24,
+    ) -> Dict[str, Any]:
+        """
+        Save a job search that the server re-runs on a schedule.
+
+        Each run reads results newest first and stops at the first job seen in the
+        previous run. Every full_scan_every runs all max_pages are read again to
+        find postings removed further down. Fetch what changed with
+        get_saved_search_changes.
+
+        Args:
+            name (str): Name of the saved search (letters, digits, '-' and '_')
+            search_term (str, optional): Job search keywords
+            recommended (bool): Monitor your recommended jobs instead of a search
+            interval_minutes (int): Minutes between runs
+            max_pages (int): Maximum result pages (25 jobs each) read per run
+            full_scan_every (int): Read all max_pages every this many runs
+
+        Returns:
+            Dict[str, Any]: The saved search definition and run state
+        """
+        try:
+            if recommended == bool(search_term):
+                raise ValueError("Give either a search_term or recommended=True")
+            return await run_operation(
+                "save_job_search",
+                {
+                    "name": name,
+                    "search_term": None if recommended else search_term,
+                    "interval_minutes": interval_minutes,
+                    "max_pages": max_pages,
+                    "full_scan_every": full_scan_every,
+                },
+            )
+        except Exception as e:
+            return handle_tool_error(e, "save_job_search")
+
+    @mcp.tool()
+    async def list_job_searches() -> List[Dict[str, Any]]:
+        """
+        List saved job searches with their schedule and pending changes.
+
+        Returns:
+            List[Dict[str, Any]]: Saved search definitions and run state
+        """
+        try:
+            return await run_operation("list_job_searches", {})
+        except Exception as e:
+            return handle_tool_error_list(e, "list_job_searches")
+
+    @mcp.tool()
+    async def delete_job_search(name: str) -> Dict[str, Any]:
+        """
+        Delete a saved job search and its history.
+
+        Args:
+            name (str): Name of the saved search
+
+        Returns:
+            Dict[str, Any]: Status of the deletion
+        """
+        try:
+            return await run_operation("delete_job_search", {"name": name})
+        except Exception as e:
+            return handle_tool_error(e, "delete_job_search")
+
+    @mcp.tool()
+    async def get_saved_search_changes(
+        name: str,
+        run_now: bool = False,
+        acknowledge: bool = True,
+        deadline_seconds: Optional[float] = None,
+        fields: Optional[List[str]] = None,
+        max_field_chars: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the job postings that appeared or disappeared in a saved search.
+
+        Returns changes found by all runs since the last call (the first run reports
+        every job it found as new).
+
+        Args:
+            name (str): Name of the saved search
+            run_now (bool): Run the search before returning instead of waiting for
+                the schedule
+            acknowledge (bool): Clear the returned changes so they are not returned again
+            deadline_seconds (float, optional): Give up on run_now after this many seconds
+            fields (List[str], optional): Return only these fields, as dotted paths
+                (e.g. ["new_jobs.job_title", "new_jobs.linkedin_url"])
+            max_field_chars (int, optional): Cut text fields longer than this; the full
+                text is available through get_continuation
+            max_tokens (int, optional): Approximate token budget for the result; the
+                least important fields are trimmed first
+
+        Returns:
+            Dict[str, Any]: Saved search state with "new_jobs" and "removed_jobs"
+        """
+        try:
+            if run_now:
+                # Fail on an unknown name before waiting for a browser
+                await run_operation("load_saved_search", {"name": name})
+                await run_operation(
+                    "run_saved_search", {"name": name}, Deadline(deadline_seconds)
+                )
+            return await run_operation(
+                "take_saved_search_changes",
+                {"name": name, "acknowledge": acknowledge},
+                shape=OutputShape(fields, max_field_chars, max_tokens),
+            )
+        except Exception as e:
+            return handle_tool_error(e, "get_saved_search_changes")
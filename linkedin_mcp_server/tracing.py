@@ -0,0 +1,545 @@
+# linkedin_mcp_server/tracing.py
+"""
+Tracing of the phases of tool calls.
+
+Every tool call becomes a trace whose spans show where its time went:
+
+- driver.acquire: waiting for a free browser of the pool
+- browser.launch, login: starting and logging in a new browser
+- navigate: page loads (one span per navigation; with --perf-capture its
+  attributes hold the page's requests, bytes, main-thread time, JS heap and
+  load event times)
+- wait: element lookups, including implicit waits for missing sections
+  (accumulated on the enclosing span rather than a span per lookup)
+- extract: the scraper's remaining work, building the result
+- shape, serialize: output shaping and JSON encoding of the result
+- other: everything else (argument validation, MCP framing)
+
+Finished traces are written to a JSONL file and/or sent to an OTLP/HTTP
+collector by a background thread, and the per-phase breakdown of a call can be
+appended to its result. The breakdown counts the time of each span not spent
+in nested spans, so its phases add up to the call's duration.
+
+While tracing is off no trace is started, and each instrumentation point costs
+one context variable lookup.
+"""
+
+import contextvars
+import logging
+import os
+import queue
+import threading
+import time
+import urllib.request
+from typing import Any, Callable, Dict, List, Optional
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from mcp.types import TextContent
+
+from linkedin_mcp_server.jsonutil import dumps, dumps_bytes
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for an OTLP collector to accept a batch
+OTLP_TIMEOUT = 5.0
+
+# Traces buffered for export; further traces are dropped while it is full
+EXPORT_QUEUE_SIZE = 1000
+
+
+class Span:
+    """A timed phase of a traced call."""
+
+    __slots__ = (
+        "trace",
+        "name",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "error",
+        "child_seconds",
+        "phases",
+    )
+
+    def __init__(
+        self,
+        trace: "Trace",
+        name: str,
+        parent_id: Optional[str],
+        attributes: Dict[str, Any],
+    ) -> None:
+        self.trace = trace
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        # Time spent in nested spans and accumulated phases
+        self.child_seconds = 0.0
+        # Accumulated phases (e.g. wait): name -> [count, seconds]
+        self.phases: Dict[str, List[float]] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Span as exported and sent between processes."""
+        end_ns = self.end_ns or time.time_ns()
+        attributes = dict(self.attributes)
+        for phase, (count, seconds) in self.phases.items():
+            attributes[f"{phase}.count"] = int(count)
+            attributes[f"{phase}.ms"] = round(seconds * 1000, 3)
+        return {
+            "trace_id": self.trace.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": end_ns,
+            "duration_ms": round((end_ns - self.start_ns) / 1e6, 3),
+            "attributes": attributes,
+            "error": self.error,
+        }
+
+
+class Trace:
+    """The spans and per-phase totals of one tool call."""
+
+    def __init__(self, trace_id: Optional[str] = None) -> None:
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.spans: List[Dict[str, Any]] = []
+        # phase -> [count, seconds], time not spent in nested spans
+        self.phases: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def add_phase(self, phase: str, seconds: float, count: int = 1) -> None:
+        with self._lock:
+            totals = self.phases.setdefault(phase, [0, 0.0])
+            totals[0] += count
+            totals[1] += seconds
+
+    def finish(self, span: Span, parent: Optional[Span]) -> None:
+        """Record a span that just ended."""
+        seconds = (span.end_ns - span.start_ns) / 1e9
+        with self._lock:
+            if parent is not None and parent.trace is self:
+                parent.child_seconds += seconds
+            self.spans.append(span.to_dict())
+        # The root span's own time is framework overhead
+        name = span.name if parent is not None else "other"
+        self.add_phase(name, max(seconds - span.child_seconds, 0.0))
+
+    def merge(self, remote: Dict[str, Any], parent: Optional[Span]) -> None:
+        """
+        Add the spans and phases recorded for this trace in another process.
+
+        Args:
+            remote: Output of export() in the other process
+            parent: Local span the remote work ran under
+        """
+        with self._lock:
+            self.spans.extend(remote.get("spans", []))
+            if parent is not None:
+                parent.child_seconds += sum(
+                    s["duration_ms"] / 1000
+                    for s in remote.get("spans", [])
+                    if s["parent_id"] == parent.span_id
+                )
+        for phase, (count, seconds) in remote.get("phases", {}).items():
+            self.add_phase(phase, seconds, count)
+
+    def export(self) -> Dict[str, Any]:
+        """Spans and phase totals, JSON-serializable."""
+        with self._lock:
+            return {
+                "spans": list(self.spans),
+                "phases": {k: list(v) for k, v in self.phases.items()},
+            }
+
+    def timings(self) -> Dict[str, Any]:
+        """
+        Per-phase breakdown of the call.
+
+        Returns:
+            Dict[str, Any]: Trace id, total duration and, per phase, its time
+                not spent in nested phases and how often it occurred; with
+                --perf-capture also the performance summary of each page load
+        """
+        with self._lock:
+            pages = [
+                {
+                    "url": s["attributes"].get("url"),
+                    **{
+                        key[len("page.") :]: value
+                        for key, value in s["attributes"].items()
+                        if key.startswith("page.")
+                    },
+                }
+                for s in self.spans
+                if s["name"] == "navigate" and "page.requests" in s["attributes"]
+            ]
+            phases = {
+                phase: {"ms": round(seconds * 1000, 1), "count": int(count)}
+                for phase, (count, seconds) in sorted(
+                    self.phases.items(), key=lambda item: -item[1][1]
+                )
+            }
+            total = sum(seconds for _, seconds in self.phases.values())
+        timings = {
+            "trace_id": self.trace_id,
+            "total_ms": round(total * 1000, 1),
+            "phases": phases,
+        }
+        if pages:
+            timings["pages"] = pages
+        return timings
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "linkedin_mcp_span", default=None
+)
+
+
+class _SpanContext:
+    """Context manager of one span."""
+
+    __slots__ = ("_span", "_parent", "_token")
+
+    def __init__(
+        self, trace: Trace, name: str, parent: Optional[Span], attributes: Dict
+    ) -> None:
+        self._parent = parent
+        self._span = Span(trace, name, parent.span_id if parent else None, attributes)
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        span = self._span
+        span.end_ns = time.time_ns()
+        if exc_type is not None:
+            span.error = exc_type.__name__
+        _current_span.reset(self._token)
+        span.trace.finish(span, self._parent)
+
+
+class _NullContext:
+    """Context manager doing nothing, used while no trace is active."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        return None
+
+
+_NULL = _NullContext()
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """
+    Time a phase of the traced call running in this context.
+
+    Args:
+        name: Phase name (see module docstring)
+        **attributes: Span attributes, e.g. the URL of a navigation
+
+    Returns:
+        Context manager; does nothing when no call is being traced
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return _NULL
+    return _SpanContext(parent.trace, name, parent, attributes)
+
+
+class _PhaseContext:
+    """Context manager accumulating time into a phase of the current span."""
+
+    __slots__ = ("_span", "_phase", "_start")
+
+    def __init__(self, current: Span, phase: str) -> None:
+        self._span = current
+        self._phase = phase
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        seconds = time.perf_counter() - self._start
+        current = self._span
+        totals = current.phases.setdefault(self._phase, [0, 0.0])
+        totals[0] += 1
+        totals[1] += seconds
+        current.child_seconds += seconds
+        current.trace.add_phase(self._phase, seconds)
+
+
+def phase(name: str) -> Any:
+    """
+    Time a frequent, short phase without creating a span (e.g. element lookups).
+
+    Args:
+        name: Phase name
+
+    Returns:
+        Context manager; does nothing when no call is being traced
+    """
+    current = _current_span.get()
+    if current is None:
+        return _NULL
+    return _PhaseContext(current, name)
+
+
+def trace_context() -> Optional[Dict[str, str]]:
+    """Ids continuing the current trace in another process, None if untraced."""
+    current = _current_span.get()
+    if current is None:
+        return None
+    return {"trace_id": current.trace.trace_id, "parent_id": current.span_id}
+
+
+def continue_trace(context: Optional[Dict[str, str]]) -> Optional[Trace]:
+    """
+    Continue a trace started in another process, in the current context.
+
+    Spans started afterwards in this context belong to the returned trace; the
+    caller sends trace.export() back to the process that started it.
+
+    Args:
+        context: Output of trace_context() in the other process
+
+    Returns:
+        Optional[Trace]: The continued trace, None if context is None
+    """
+    if not context:
+        return None
+    trace = Trace(context["trace_id"])
+    remote_parent = Span(trace, "remote", None, {})
+    remote_parent.span_id = context["parent_id"]
+    _current_span.set(remote_parent)
+    return trace
+
+
+def current_timings() -> Optional[Dict[str, Any]]:
+    """Per-phase breakdown of the traced call running in this context so far."""
+    current = _current_span.get()
+    if current is None:
+        return None
+    return current.trace.timings()
+
+
+def merge_remote(remote: Optional[Dict[str, Any]]) -> None:
+    """Add spans recorded in another process to the current trace."""
+    current = _current_span.get()
+    if current is not None and remote:
+        current.trace.merge(remote, current)
+
+
+class _Exporter:
+    """Background thread writing finished traces to the configured sinks."""
+
+    def __init__(self, trace_file: Optional[str], otlp_endpoint: Optional[str]):
+        self.trace_file = trace_file
+        self.otlp_url: Optional[str] = None
+        if otlp_endpoint:
+            endpoint = otlp_endpoint.rstrip("/")
+            if not endpoint.endswith("/v1/traces"):
+                endpoint += "/v1/traces"
+            self.otlp_url = endpoint
+        self._queue: "queue.Queue[Trace]" = queue.Queue(EXPORT_QUEUE_SIZE)
+        self._otlp_failing = False
+        threading.Thread(
+            target=self._run, name="linkedin-trace-export", daemon=True
+        ).start()
+
+    def submit(self, trace: Trace) -> None:
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            logger.debug("Trace export queue full, dropping trace %s", trace.trace_id)
+
+    def _run(self) -> None:
+        while True:
+            traces = [self._queue.get()]
+            while len(traces) < 100:
+                try:
+                    traces.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            spans = [s for trace in traces for s in trace.export()["spans"]]
+            try:
+                if self.trace_file:
+                    self._write_file(spans)
+                if self.otlp_url:
+                    self._send_otlp(spans)
+            except Exception as e:
+                logger.warning(f"Trace export failed: {e}")
+
+    def _write_file(self, spans: List[Dict[str, Any]]) -> None:
+        data = b"".join(dumps_bytes(s) + b"\n" for s in spans)
+        # One O_APPEND write keeps lines whole with several worker processes
+        fd = os.open(self.trace_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def _send_otlp(self, spans: List[Dict[str, Any]]) -> None:
+        request = urllib.request.Request(
+            self.otlp_url,
+            data=dumps_bytes(otlp_payload(spans)),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=OTLP_TIMEOUT):
+                pass
+        except OSError as e:
+            # Log once per outage rather than once per batch
+            if not self._otlp_failing:
+                logger.warning(f"OTLP collector {self.otlp_url} unreachable: {e}")
+            self._otlp_failing = True
+            return
+        self._otlp_failing = False
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_payload(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Spans in the OTLP/HTTP JSON encoding (ExportTraceServiceRequest).
+
+    Args:
+        spans: Spans as produced by Span.to_dict
+
+    Returns:
+        Dict[str, Any]: Request body for <collector>/v1/traces
+    """
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {
+                            "key": "service.name",
+                            "value": {"stringValue": "linkedin-mcp-server"},
+                        }
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "linkedin_mcp_server"},
+                        "spans": [
+                            {
+                                "traceId": s["trace_id"],
+                                "spanId": s["span_id"],
+                                "parentSpanId": s["parent_id"] or "",
+                                "name": s["name"],
+                                "kind": 1,  # SPAN_KIND_INTERNAL
+                                "startTimeUnixNano": str(s["start_ns"]),
+                                "endTimeUnixNano": str(s["end_ns"]),
+                                "attributes": [
+                                    {"key": k, "value": _otlp_value(v)}
+                                    for k, v in s["attributes"].items()
+                                    if v is not None
+                                ],
+                                # STATUS_CODE_ERROR / STATUS_CODE_UNSET
+                                "status": (
+                                    {"code": 2, "message": s["error"]}
+                                    if s["error"]
+                                    else {}
+                                ),
+                            }
+                            for s in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+_exporter: Optional[_Exporter] = None
+_tracing = False
+_timings = False
+
+
+def configure_tracing(
+    trace_file: Optional[str] = None,
+    otlp_endpoint: Optional[str] = None,
+    timings: bool = False,
+    record: bool = False,
+) -> None:
+    """
+    Turn tracing of tool calls on for this process.
+
+    Tracing stays off unless a sink is given, timings are requested or the
+    flight recorder needs them.
+
+    Args:
+        trace_file: JSONL file to append finished spans to
+        otlp_endpoint: Base URL of an OTLP/HTTP collector
+        timings: Append the per-phase breakdown of each call to tool results
+        record: Trace calls for the flight recorder even without a sink
+    """
+    global _exporter, _tracing, _timings
+    if (trace_file or otlp_endpoint) and _exporter is None:
+        _exporter = _Exporter(trace_file, otlp_endpoint)
+    _timings = timings
+    _tracing = _exporter is not None or timings or record
+    if _tracing:
+        logger.info(
+            f"Tracing tool calls (file: {trace_file}, otlp: {otlp_endpoint}, "
+            f"timings in results: {timings})"
+        )
+
+
+def traced_serializer(serializer: Callable[[Any], str]) -> Callable[[Any], str]:
+    """Wrap a FastMCP tool_serializer so its time counts as the serialize phase."""
+
+    def serialize(data: Any) -> str:
+        with span("serialize"):
+            return serializer(data)
+
+    return serialize
+
+
+class TracingMiddleware(Middleware):
+    """FastMCP middleware tracing every tool call while tracing is on."""
+
+    async def on_call_tool(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        if not _tracing:
+            return await call_next(context)
+
+        tool = getattr(context.message, "name", "unknown")
+        trace = Trace()
+        root = _SpanContext(trace, f"tool {tool}", None, {"tool": tool})
+        try:
+            with root:
+                result = await call_next(context)
+        finally:
+            if _exporter is not None:
+                _exporter.submit(trace)
+
+        if _timings and hasattr(result, "content"):
+            result.content.append(
+                TextContent(
+                    type="text", text=dumps({"timings": trace.timings()}, indent=True)
+                )
+            )
+        return result
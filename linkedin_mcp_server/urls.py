@@ -0,0 +1,66 @@
+# linkedin_mcp_server/urls.py
+"""
+URLs of the LinkedIn pages the scrapers navigate.
+
+Every page URL is built on the configured base URL (--linkedin-base-url), so
+the tools can be pointed at a local fixture server (python -m
+linkedin_mcp_server.fixtures) for offline, repeatable runs instead of
+linkedin.com.
+"""
+
+from urllib.parse import urlsplit
+
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.config.schema import DEFAULT_LINKEDIN_BASE_URL
+
+
+def base_url() -> str:
+    """The configured LinkedIn base URL, without a trailing slash."""
+    return get_config().linkedin.base_url.rstrip("/")
+
+
+def is_live_linkedin() -> bool:
+    """Whether the scrapers navigate linkedin.com rather than a stand-in."""
+    return base_url() == DEFAULT_LINKEDIN_BASE_URL
+
+
+def linkedin_url(path: str) -> str:
+    """
+    Build the URL of a LinkedIn page.
+
+    Args:
+        path: Page path, e.g. "in/john-doe/"
+
+    Returns:
+        str: Absolute URL of the page on the configured site
+    """
+    return f"{base_url()}/{path.lstrip('/')}"
+
+
+def is_linkedin_host(netloc: str) -> bool:
+    """
+    Check whether a URL's host is LinkedIn or the configured stand-in.
+
+    Args:
+        netloc: Network location of the URL, with any userinfo and port
+
+    Returns:
+        bool: True for linkedin.com and its subdomains and the configured host
+
+    Examples:
+        >>> is_linkedin_host("de.linkedin.com:443")
+        True
+        >>> is_linkedin_host("evillinkedin.com")
+        False
+        >>> is_linkedin_host("linkedin.com@evil.example")
+        False
+    """
+    try:
+        host = urlsplit(f"//{netloc}").hostname or ""
+    except ValueError:
+        # Malformed, e.g. an unclosed IPv6 bracket or a bad port
+        return False
+    if host == "linkedin.com" or host.endswith(".linkedin.com"):
+        return True
+    configured = urlsplit(base_url()).netloc.lower()
+    return netloc.rpartition("@")[2].lower() == configured
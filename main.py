@@ -9,33 +9,25 @@ Implements a three-phase startup:
 
 """
 
+import functools
 import io
 import logging
 import sys
 from typing import Literal
 
-import inquirer  # type: ignore
-from linkedin_scraper.exceptions import (
-    CaptchaRequiredError,
-    InvalidCredentialsError,
-    LoginTimeoutError,
-    RateLimitError,
-    SecurityChallengeError,
-    TwoFactorAuthError,
-)
-
-from linkedin_mcp_server.cli import print_claude_config
 from linkedin_mcp_server.config import (
     check_keychain_data_exists,
     clear_all_keychain_data,
     get_config,
     get_keyring_name,
 )
-from linkedin_mcp_server.drivers.chrome import close_all_drivers, get_or_create_driver
 from linkedin_mcp_server.exceptions import CredentialsNotFoundError, LinkedInMCPError
 from linkedin_mcp_server.logging_config import configure_logging
-from linkedin_mcp_server.server import create_mcp_server, shutdown_handler
-from linkedin_mcp_server.setup import run_cookie_extraction_setup, run_interactive_setup
+
+# Everything else (fastmcp and the tool tree, selenium, linkedin_scraper,
+# inquirer) is imported where first needed: MCP clients start a stdio server
+# per conversation, and --help or --clear-keychain need none of it.
+# benchmarks/bench_startup.py keeps an eye on the import cost.
 
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
 
@@ -44,6 +36,8 @@ logger = logging.getLogger(__name__)
 
 def choose_transport_interactive() -> Literal["stdio", "streamable-http"]:
     """Prompt user for transport mode using inquirer."""
+    import inquirer  # type: ignore
+
     questions = [
         inquirer.List(
             "transport",
@@ -144,6 +138,8 @@ def clear_keychain_and_exit() -> None:
 
 def get_cookie_and_exit() -> None:
     """Get LinkedIn cookie and exit (for Docker setup)."""
+    from linkedin_mcp_server.setup import run_cookie_extraction_setup
+
     config = get_config()
 
     # Configure logging
@@ -238,6 +234,8 @@ def ensure_authentication_ready() -> str:
         )
 
     # Run interactive setup to get credentials and obtain cookie
+    from linkedin_mcp_server.setup import run_interactive_setup
+
     logger.info("Setting up LinkedIn authentication...")
     return run_interactive_setup()
 
@@ -260,6 +258,8 @@ def initialize_driver_with_auth(authentication: str) -> None:
         )
         return
 
+    from linkedin_mcp_server.drivers.chrome import get_or_create_driver
+
     logger.info("Initializing Chrome WebDriver and logging in...")
 
     try:
@@ -272,8 +272,70 @@ def initialize_driver_with_auth(authentication: str) -> None:
         raise e
 
 
+def initialize_driver_or_exit(authentication: str) -> None:
+    """
+    Phase 2 at startup: initialize the driver, exiting if that fails.
+
+    In interactive mode invalid credentials start the setup again instead.
+
+    Args:
+        authentication: LinkedIn session cookie
+    """
+    from linkedin_scraper.exceptions import (
+        CaptchaRequiredError,
+        InvalidCredentialsError,
+        LoginTimeoutError,
+        RateLimitError,
+        SecurityChallengeError,
+        TwoFactorAuthError,
+    )
+
+    config = get_config()
+
+    try:
+        initialize_driver_with_auth(authentication)
+    except InvalidCredentialsError as e:
+        logger.error(f"Driver initialization failed with invalid credentials: {e}")
+
+        # Cookie was already cleared in driver layer
+        # In interactive mode, try setup again
+        if config.is_interactive:
+            print(f"\n❌ {str(e)}")
+            print("🔄 Starting interactive setup for new authentication...")
+            try:
+                from linkedin_mcp_server.setup import run_interactive_setup
+
+                new_authentication = run_interactive_setup()
+                # Try again with new authentication
+                initialize_driver_with_auth(new_authentication)
+                logger.info("✅ Successfully authenticated with new credentials")
+            except Exception as setup_error:
+                logger.error(f"Setup failed: {setup_error}")
+                print(f"\n❌ Setup failed: {setup_error}")
+                sys.exit(1)
+        else:
+            print(f"\n❌ {str(e)}")
+            sys.exit(1)
+    except (
+        LinkedInMCPError,
+        CaptchaRequiredError,
+        SecurityChallengeError,
+        TwoFactorAuthError,
+        RateLimitError,
+        LoginTimeoutError,
+    ) as e:
+        logger.error(f"Driver initialization failed: {e}")
+        print(f"\n❌ {str(e)}")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Unexpected error during driver initialization: {e}")
+        print(f"\n❌ Driver initialization failed: {e}")
+        sys.exit(1)
+
+
+@functools.lru_cache(maxsize=None)
 def get_version() -> str:
-    """Get version from pyproject.toml."""
+    """Get version from pyproject.toml, read once per process."""
     try:
         import os
         import tomllib
@@ -296,6 +358,7 @@ def main() -> None:
     configure_logging(
         log_level=config.server.log_level,
         json_format=not config.is_interactive and config.server.log_level != "DEBUG",
+        queue_size=config.server.log_queue_size if config.server.log_queue else 0,
     )
 
     # Get version for logging/display
@@ -319,6 +382,15 @@ def main() -> None:
 
     logger.debug(f"Server configuration: {config}")
 
+    from linkedin_mcp_server.tracing import configure_tracing
+
+    configure_tracing(
+        config.server.trace_file,
+        config.server.trace_otlp_endpoint,
+        config.server.trace_timings,
+        record=config.server.flight_recorder_size > 0,
+    )
+
     # Phase 1: Ensure Authentication is Ready
     try:
         authentication = ensure_authentication_ready()
@@ -344,48 +416,21 @@ def main() -> None:
         sys.exit(1)
 
     # Phase 2: Initialize Driver (if not lazy)
-    try:
-        initialize_driver_with_auth(authentication)
-    except InvalidCredentialsError as e:
-        logger.error(f"Driver initialization failed with invalid credentials: {e}")
+    if config.server.background_init:
+        from linkedin_mcp_server.drivers.chrome import start_driver_warmup
 
-        # Cookie was already cleared in driver layer
-        # In interactive mode, try setup again
-        if config.is_interactive:
-            print(f"\n❌ {str(e)}")
-            print("🔄 Starting interactive setup for new authentication...")
-            try:
-                new_authentication = run_interactive_setup()
-                # Try again with new authentication
-                initialize_driver_with_auth(new_authentication)
-                logger.info("✅ Successfully authenticated with new credentials")
-            except Exception as setup_error:
-                logger.error(f"Setup failed: {setup_error}")
-                print(f"\n❌ Setup failed: {setup_error}")
-                sys.exit(1)
-        else:
-            print(f"\n❌ {str(e)}")
-            if not config.server.lazy_init:
-                sys.exit(1)
-    except (
-        LinkedInMCPError,
-        CaptchaRequiredError,
-        SecurityChallengeError,
-        TwoFactorAuthError,
-        RateLimitError,
-        LoginTimeoutError,
-    ) as e:
-        logger.error(f"Driver initialization failed: {e}")
-        print(f"\n❌ {str(e)}")
-        if not config.server.lazy_init:
-            sys.exit(1)
-    except Exception as e:
-        logger.error(f"Unexpected error during driver initialization: {e}")
-        print(f"\n❌ Driver initialization failed: {e}")
-        if not config.server.lazy_init:
-            sys.exit(1)
+        logger.info("Initializing Chrome WebDriver in the background...")
+        start_driver_warmup(authentication)
+    elif config.server.lazy_init:
+        logger.info(
+            "Using lazy initialization - driver will be created on first tool call"
+        )
+    else:
+        initialize_driver_or_exit(authentication)
 
     # Phase 3: Server Runtime
+    from linkedin_mcp_server.server import create_mcp_server
+
     try:
         # Decide transport using the new config system
         transport = config.server.transport
@@ -402,22 +447,55 @@ def main() -> None:
 
         # Print configuration for Claude if in interactive mode and using stdio transport
         if config.is_interactive and transport == "stdio":
+            from linkedin_mcp_server.cli import print_claude_config
+
             print_claude_config()
 
+        if transport == "streamable-http" and config.server.workers > 1:
+            from linkedin_mcp_server.frontend import run_multi_worker_server
+
+            print(
+                f"\n🚀 Running LinkedIn MCP server (STREAMABLE-HTTP mode, {config.server.workers} workers)..."
+            )
+            print(
+                f"📡 HTTP server will be available at http://{config.server.host}:{config.server.port}{config.server.path}"
+            )
+            run_multi_worker_server(config)
+            exit_gracefully(0)
+
         # Create and run the MCP server
         mcp = create_mcp_server()
 
         # Start server
         print(f"\n🚀 Running LinkedIn MCP server ({transport.upper()} mode)...")
         if transport == "streamable-http":
+            from linkedin_mcp_server.flight_recorder import (
+                register_flight_recorder_route,
+            )
+            from linkedin_mcp_server.health import register_health_routes
+            from linkedin_mcp_server.http_app import (
+                build_http_middleware,
+                register_web_app_routes,
+            )
+            from linkedin_mcp_server.metrics import register_metrics_route
+
             print(
                 f"📡 HTTP server will be available at http://{config.server.host}:{config.server.port}{config.server.path}"
             )
+            register_health_routes(mcp)
+            register_metrics_route(mcp)
+            register_flight_recorder_route(mcp)
+            if config.server.serve_web_app:
+                register_web_app_routes(mcp, config.server)
+                print(
+                    f"🌐 Web app will be available at http://{config.server.host}:{config.server.port}/"
+                )
             mcp.run(
                 transport=transport,
                 host=config.server.host,
                 port=config.server.port,
                 path=config.server.path,
+                middleware=build_http_middleware(config.server),
             )
         else:
             mcp.run(transport=transport)
@@ -433,6 +511,9 @@ def main() -> None:
 
 def exit_gracefully(exit_code: int = 0) -> None:
     """Exit the application gracefully, cleaning up resources."""
+    from linkedin_mcp_server.drivers.chrome import close_all_drivers
+    from linkedin_mcp_server.server import shutdown_handler
+
     print("👋 Shutting down LinkedIn MCP server...")
 
     # Clean up drivers
@@ -1,7 +1,7 @@
 #!/bin/bash
 
 # LinkedIn Apply Agent - Web Frontend Startup Script
-# This script starts all three required services for the web frontend
+# This script starts the MCP server, which also serves the web frontend
 
 set -e
 
@@ -56,17 +56,15 @@ cleanup() {
     echo ""
     echo "🛑 Stopping all services..."
     pkill -f "main.py --transport streamable-http" 2>/dev/null || true
-    pkill -f "cors-proxy.py" 2>/dev/null || true
-    pkill -f "python.*http.server.*3000" 2>/dev/null || true
     echo "✅ All services stopped"
 }
 
 # Setup cleanup trap
 trap cleanup EXIT INT TERM
 
-# Start MCP Server
-echo "📡 Starting MCP Server (port 8000)..."
-LINKEDIN_COOKIE="$LINKEDIN_COOKIE" uv run main.py --transport streamable-http --host 127.0.0.1 --port 8000 --path /mcp --log-level INFO --no-lazy-init > mcp-server.log 2>&1 &
+# Start MCP Server; it also serves the web app and handles CORS itself
+echo "📡 Starting MCP Server with web app (port 8000)..."
+LINKEDIN_COOKIE="$LINKEDIN_COOKIE" uv run main.py --transport streamable-http --host 127.0.0.1 --port 8000 --path /mcp --log-level INFO --no-lazy-init --serve-web-app > mcp-server.log 2>&1 &
 MCP_PID=$!
 
 # Wait a moment for MCP server to start
@@ -79,54 +77,20 @@ if ! kill -0 $MCP_PID 2>/dev/null; then
     exit 1
 fi
 
-# Start CORS Proxy
-echo "🔗 Starting CORS Proxy (port 9000)..."
-python3 cors-proxy.py > cors-proxy.log 2>&1 &
-CORS_PID=$!
-
-# Wait a moment for CORS proxy to start
-sleep 2
-
-# Check if CORS proxy started successfully
-if ! kill -0 $CORS_PID 2>/dev/null; then
-    echo "❌ Error: CORS Proxy failed to start"
-    echo "Check cors-proxy.log for details"
-    exit 1
-fi
-
-# Start Web Server
-echo "🌐 Starting Web Server (port 3000)..."
-python3 -m http.server 3000 > web-server.log 2>&1 &
-WEB_PID=$!
-
-# Wait a moment for web server to start
-sleep 2
-
-# Check if web server started successfully
-if ! kill -0 $WEB_PID 2>/dev/null; then
-    echo "❌ Error: Web Server failed to start"
-    echo "Check web-server.log for details"
-    exit 1
-fi
-
 echo ""
 echo "🎉 All services started successfully!"
 echo ""
-echo "📱 Web App: http://localhost:3000/linkedin-web-app.html"
+echo "📱 Web App: http://127.0.0.1:8000/"
 echo "📊 Server Status:"
 echo "  - MCP Server: http://127.0.0.1:8000/mcp"
-echo "  - CORS Proxy: http://localhost:9000"
-echo "  - Web Server: http://localhost:3000"
 echo ""
 echo "📋 Next Steps:"
-echo "  1. Open: http://localhost:3000/linkedin-web-app.html"
+echo "  1. Open: http://127.0.0.1:8000/"
 echo "  2. Click 'Connect to Server'"
 echo "  3. Try searching for 'software engineer'"
 echo ""
 echo "📄 Logs:"
 echo "  - MCP Server: tail -f mcp-server.log"
-echo "  - CORS Proxy: tail -f cors-proxy.log"
-echo "  - Web Server: tail -f web-server.log"
 echo ""
 echo "Press Ctrl+C to stop all services"
 
@@ -134,7 +98,7 @@ echo "Press Ctrl+C to stop all services"
 if command -v open &> /dev/null; then
     echo "🚀 Opening web app..."
     sleep 2
-    open http://localhost:3000/linkedin-web-app.html
+    open http://127.0.0.1:8000/
 fi
 
 # Keep script running to maintain background processes